@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Semantic diff of two ECUC ARXML files.
+
+Containers are matched by AUTOSAR path and DEFINITION-REF, identical
+subtrees are skipped by digest, and added / removed containers and
+changed parameters are reported per module. Indentation, element order
+and namespace prefixes are not differences.
+
+Exit status follows diff(1): 0 when the files are equivalent, 1 when
+they differ, 2 on error.
+
+Usage:
+    python -m tools.arxml_diff old.arxml new.arxml
+    python -m tools.arxml_diff old.arxml new.arxml --json -o changes.json
+"""
+import argparse
+import json
+import sys
+import time
+import xml.etree.ElementTree as ET
+
+from ui.arxml_diff import diff_files
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Semantic diff of two ECUC ARXML files")
+    parser.add_argument('old', help="Baseline ARXML")
+    parser.add_argument('new', help="Revised ARXML")
+    parser.add_argument('--json', action='store_true', help="Write the report as JSON")
+    parser.add_argument('--module', action='append',
+                        help="Only report this module (e.g. Dio); may be given more than once")
+    parser.add_argument('-o', '--output', help="Write the report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    try:
+        diff = diff_files(args.old, args.new)
+    except (OSError, ET.ParseError) as e:
+        print(f"arxml_diff: {e}", file=sys.stderr)
+        return 2
+    if args.module:
+        wanted = {name.lower() for name in args.module}
+        diff.modules = [m for m in diff.modules if m.name.lower() in wanted]
+
+    report = json.dumps(diff.to_dict(), indent=2) + "\n" if args.json else "\n".join(diff.lines()) + "\n"
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(report)
+    else:
+        sys.stdout.write(report)
+    print(f"Compared in {time.perf_counter() - started:.2f} s", file=sys.stderr)
+    return 1 if diff else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Three-way semantic merge of ECUC ARXML files.
+
+Merges at parameter granularity: containers are matched by AUTOSAR path
+and parameters by definition name, so indentation and ordering never
+conflict. Only a value changed differently on both sides is a conflict.
+Conflicts are listed on stderr and resolved toward ours unless --prefer
+says otherwise. The result is written re-indented, replacing OURS unless
+-o is given (as git merge-file does).
+
+Exit status: 0 on a clean merge (or with --prefer), 1 when conflicts
+were left to the default resolution, 2 on error. That fits git's merge
+driver protocol:
+
+    git config merge.arxml.driver "python -m tools.arxml_merge %O %A %B"
+    echo "*.arxml merge=arxml" >> .gitattributes
+
+Usage:
+    python -m tools.arxml_merge base.arxml ours.arxml theirs.arxml -o merged.arxml
+    python -m tools.arxml_merge base.arxml ours.arxml theirs.arxml --prefer theirs --report conflicts.json
+"""
+import argparse
+import json
+import sys
+import time
+import xml.etree.ElementTree as ET
+
+from ui.arxml_merge import OURS, THEIRS, merge_files
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Three-way semantic merge of ECUC ARXML files")
+    parser.add_argument('base', help="Common ancestor")
+    parser.add_argument('ours', help="Our version; overwritten with the result unless -o is given")
+    parser.add_argument('theirs', help="Their version")
+    parser.add_argument('-o', '--output', help="Write the merged ARXML here")
+    parser.add_argument('--prefer', choices=(OURS, THEIRS),
+                        help="Resolve conflicts toward this side and exit 0 (default: ours, exit 1)")
+    parser.add_argument('--report', help="Write the conflict report as JSON")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    try:
+        merge = merge_files(args.base, args.ours, args.theirs, args.prefer or OURS)
+        merge.write(args.output or args.ours)
+        if args.report:
+            with open(args.report, 'w', encoding='utf-8') as f:
+                json.dump(merge.to_dict(), f, indent=2)
+    except (OSError, ET.ParseError) as e:
+        print(f"arxml_merge: {e}", file=sys.stderr)
+        return 2
+
+    for line in merge.lines():
+        print(line, file=sys.stderr)
+    print(f"Merged in {time.perf_counter() - started:.2f} s", file=sys.stderr)
+    return 1 if merge.conflicts and args.prefer is None else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
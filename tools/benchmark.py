@@ -0,0 +1,453 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the parse / extract / generate / GUI sync hot paths.
+
+Synthetic inputs of each requested size are produced with
+tools.generate_arxml and every case is timed on each of them. Results
+(median and best time, throughput, peak RSS and the log-log scaling
+exponent per case) are written as JSON and can be compared against a
+stored baseline; any case slower than the baseline by more than the
+threshold fails the run. Differences below a noise floor (--min-delta,
+1 ms by default) are never reported, and a baseline comparison needs at
+least MIN_COMPARE_REPEAT repeats so the medians mean something.
+
+Tk-bound cases need a display. Panels are built inside a withdrawn root
+window, so the suite runs unattended (e.g. under xvfb-run in CI); without
+a display those cases are reported as skipped.
+
+Usage:
+    python -m tools.benchmark --sizes 100KB,1MB,10MB -o bench.json
+    python -m tools.benchmark --sizes 1MB --baseline bench.json --threshold 0.15
+"""
+import argparse
+import copy
+import json
+import math
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from tools.generate_arxml import SyntheticArxmlGenerator, parse_size
+
+# Medians of fewer runs are too noisy to gate on
+MIN_COMPARE_REPEAT = 3
+
+
+# -------------------- Measurement helpers --------------------
+def peak_rss_kb():
+    """Process-wide peak resident set size in KB (None where unsupported)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def scaling_exponent(points):
+    """Least-squares slope of log(time) over log(size): ~1 linear, ~2 quadratic"""
+    points = [(size, t) for size, t in points if size > 0 and t > 0]
+    if len(points) < 2:
+        return None
+    xs = [math.log(size) for size, _ in points]
+    ys = [math.log(t) for _, t in points]
+    mean_x, mean_y = statistics.fmean(xs), statistics.fmean(ys)
+    denom = sum((x - mean_x) ** 2 for x in xs)
+    if not denom:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / denom
+
+
+class _Skip(Exception):
+    pass
+
+
+# -------------------- Cases --------------------
+BUILD_PANELS = {
+    'dio': ('ui.build_edit.dio_build', 'ARXMLtoDIOConfigGUI', 'generate_dio_cfg_h'),
+    'adc': ('ui.build_edit.adc_build', 'ARXMLtoADCGenerator', 'generate_adc_cfg_h'),
+    'can': ('ui.build_edit.can_build', 'ARXMLtoCANGenerator', 'generate_can_cfg_h'),
+    'gpt': ('ui.build_edit.gpt_build', 'ARXMLtoGPTConfigGUI', 'generate_gpt_cfg_h'),
+    'spi': ('ui.build_edit.spi_build', 'ARXMLtoSPIGenerator', 'generate_spi_cfg_h'),
+    'wdg': ('ui.build_edit.wdg_build', 'ARXMLtoWDGGenerator', 'generate_wdg_cfg_h'),
+}
+
+EXPORTERS = {
+    'dio': ('ui.editor.peripheral_config.dio_config', 'DioArxmlExporter', 'DioAppModel'),
+    'adc': ('ui.editor.peripheral_config.adc_config', 'AdcArxmlExporter', 'AdcAppModel'),
+    'can': ('ui.editor.peripheral_config.can_config', 'ArxmlExporter', 'AppModel'),
+    'gpt': ('ui.editor.peripheral_config.gpt_config', 'GptArxmlExporter', 'GptAppModel'),
+    'spi': ('ui.editor.peripheral_config.spi_config', 'SpiArxmlExporter', 'SpiAppModel'),
+    'wdg': ('ui.editor.peripheral_config.wdg_config', 'WdgArxmlExporter', 'WdgAppModel'),
+}
+
+
+def _load(module_name, attr):
+    module = __import__(module_name, fromlist=[attr])
+    return getattr(module, attr)
+
+
+class BenchmarkSuite:
+    """Registry of timed cases; each case factory does its setup and returns the callable to time.
+
+    A factory may instead return (prepare, run): prepare() is called
+    untimed before every repeat and its result passed to run(), for cases
+    that consume or mutate their input.
+    """
+
+    def __init__(self, repeat=3):
+        self.repeat = repeat
+        self.scratch_dir = tempfile.mkdtemp(prefix='arxml_bench_out_')
+        self.tk_root = None
+        self.tk_error = None
+        self.cases = {'parse': self._case_parse}
+        for name in BUILD_PANELS:
+            self.cases[f'extract.{name}'] = lambda path, name=name: self._case_extract(path, name)
+            self.cases[f'generate.{name}'] = lambda path, name=name: self._case_generate(path, name)
+        self.cases['raw_xml.build_tree'] = self._case_build_tree
+        self.cases['raw_xml.serialize'] = self._case_serialize
+        self.cases['raw_xml.resync'] = self._case_resync
+        self.cases['merkle.index'] = self._case_merkle_index
+        self.cases['diff.arxml'] = self._case_diff
+        self.cases['merge.arxml'] = self._case_merge
+        self.cases['structure_view.populate_table'] = self._case_populate_table
+        for name in EXPORTERS:
+            self.cases[f'export.{name}'] = lambda path, name=name: self._case_export(name)
+        self.cases['startup.import'] = lambda path: self._case_startup_import()
+        self.cases['startup.editor_panel'] = lambda path: self._case_startup_editor_panel()
+
+    # ---------- Tk ----------
+    def tk(self):
+        if self.tk_root is None and self.tk_error is None:
+            import tkinter as tk
+            from tkinter import messagebox
+            try:
+                self.tk_root = tk.Tk()
+                self.tk_root.withdraw()
+            except tk.TclError as e:
+                self.tk_error = f"no display ({e})"
+            else:
+                # Dialogs must never block an unattended run
+                for name in ('showinfo', 'showwarning', 'showerror'):
+                    setattr(messagebox, name, lambda *args, **kwargs: 'ok')
+                for name in ('askyesno', 'askokcancel', 'askyesnocancel'):
+                    setattr(messagebox, name, lambda *args, **kwargs: True)
+        if self.tk_error:
+            raise _Skip(self.tk_error)
+        return self.tk_root
+
+    def _panel(self, name):
+        module_name, class_name, _ = BUILD_PANELS[name]
+        return _load(module_name, class_name)(self.tk())
+
+    # ---------- cases ----------
+    def _case_parse(self, path):
+        return lambda: ET.parse(path)
+
+    def _case_extract(self, path, name):
+        # Extraction strips namespaces in place and appends to config_data,
+        # so every repeat starts from a fresh tree and the initial config
+        panel = self._panel(name)
+        initial = copy.deepcopy(panel.config_data)
+
+        def prepare():
+            panel.config_data = copy.deepcopy(initial)
+            return ET.parse(path).getroot()
+        return prepare, panel.extract_config_from_arxml
+
+    def _case_generate(self, path, name):
+        panel = self._panel(name)
+        panel.arxml_file_path = path
+        panel.extract_config_from_arxml(ET.parse(path).getroot())
+        return getattr(panel, BUILD_PANELS[name][2])
+
+    def _raw_xml_panel(self, path):
+        from ui.editor.raw_xml import RawXmlPanel
+        panel = RawXmlPanel(self.tk())
+        with open(path, encoding='utf-8') as f:
+            content = f.read()
+        panel.suppress_text_events = True
+        panel.text_editor.insert("1.0", content)
+        return panel
+
+    def _case_build_tree(self, path):
+        panel = self._raw_xml_panel(path)
+        return panel.build_tree_from_content
+
+    def _case_serialize(self, path):
+        from ui.editor.raw_xml import RawXmlPanel
+        panel = RawXmlPanel(self.tk())
+        root = ET.parse(path).getroot()
+        return lambda: panel._serialize_xml_to_string(root)
+
+    def _case_resync(self, path):
+        # Edit one value and re-sync: only the changed subtree is re-created
+        panel = self._raw_xml_panel(path)
+        panel.build_tree_from_content()
+        content = panel.get_content()
+        start = content.index('<VALUE>', len(content) // 2) + len('<VALUE>')
+        state = {'end': content.index('<', start), 'value': 0}
+
+        def run():
+            state['value'] ^= 1
+            panel.text_editor.delete(f"1.0+{start}c", f"1.0+{state['end']}c")
+            panel.text_editor.insert(f"1.0+{start}c", str(state['value']))
+            state['end'] = start + 1
+            panel.sync_views_from_text()
+        return run
+
+    def _case_merkle_index(self, path):
+        from ui.merkle import MerkleIndex
+        root = ET.parse(path).getroot()
+        return lambda: MerkleIndex(root)
+
+    def _case_diff(self, path):
+        # The input against a copy with one value changed: both files are read in full
+        from ui.arxml_diff import diff_files
+        with open(path, encoding='utf-8') as f:
+            content = f.read()
+        start = content.index('<VALUE>', len(content) // 2) + len('<VALUE>')
+        changed = os.path.join(self.scratch_dir, 'diff_changed.arxml')
+        with open(changed, 'w', encoding='utf-8') as f:
+            f.write(content[:start] + 'changed' + content[content.index('<', start):])
+        return lambda: diff_files(path, changed)
+
+    def _case_merge(self, path):
+        # Each side changes one value; the merge edits the ours tree, so every run re-reads it
+        from ui.arxml_merge import merge_files
+        with open(path, encoding='utf-8') as f:
+            content = f.read()
+        sides = []
+        for name, offset in (('ours', len(content) // 3), ('theirs', 2 * len(content) // 3)):
+            start = content.index('<VALUE>', offset) + len('<VALUE>')
+            side = os.path.join(self.scratch_dir, f'merge_{name}.arxml')
+            with open(side, 'w', encoding='utf-8') as f:
+                f.write(content[:start] + name + content[content.index('<', start):])
+            sides.append(side)
+        return lambda: merge_files(path, *sides)
+
+    def _case_populate_table(self, path):
+        from ui.editor.structure_view import StructureViewPanel
+        panel = StructureViewPanel(self.tk())
+        root = ET.parse(path).getroot()
+
+        def run():
+            panel.clear_table()
+            panel.populate_table(root)
+        return run
+
+    def _case_export(self, name):
+        module_name, exporter_name, model_name = EXPORTERS[name]
+        exporter = _load(module_name, exporter_name)
+        model = _load(module_name, model_name)()
+        out_path = os.path.join(self.scratch_dir, f"export_{name}.arxml")
+        return lambda: exporter.export(model, out_path)
+
+    def _case_startup_import(self):
+        # Fresh interpreter, so the module cache of this process does not hide import cost
+        command = [sys.executable, '-c', 'import ui.main_window']
+        root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        return lambda: subprocess.run(command, cwd=root_dir, check=True)
+
+    def _case_startup_editor_panel(self):
+        from ui.editor_panel import EditorPanel
+        from ui.status_panel import StatusPanel
+        root = self.tk()
+
+        def run():
+            status = StatusPanel(root)
+            EditorPanel(root, status).frame.destroy()
+            status.frame.destroy()
+        return run
+
+    def close(self):
+        shutil.rmtree(self.scratch_dir, ignore_errors=True)
+        if self.tk_root is not None:
+            self.tk_root.destroy()
+
+    # ---------- running ----------
+    def run_case(self, case, path, size_bytes):
+        result = {'case': case, 'size_bytes': size_bytes}
+        try:
+            run = self.cases[case](path)
+        except _Skip as e:
+            result['skipped'] = str(e)
+            return result
+
+        prepare = None
+        if isinstance(run, tuple):
+            prepare, run = run
+        times = []
+        for _ in range(self.repeat):
+            args = (prepare(),) if prepare else ()
+            start = time.perf_counter()
+            run(*args)
+            times.append(time.perf_counter() - start)
+            if self.tk_root is not None:
+                self.tk_root.update_idletasks()
+
+        median = statistics.median(times)
+        result.update({
+            'times_s': times,
+            'median_s': median,
+            'min_s': min(times),
+            'throughput_mb_s': (size_bytes / 1024 ** 2) / median if median and size_bytes else None,
+            'peak_rss_kb': peak_rss_kb(),
+        })
+        return result
+
+
+def size_independent(case):
+    return case.startswith(('export.', 'startup.'))
+
+
+# -------------------- Inputs --------------------
+def ensure_inputs(sizes, seed, directory):
+    """Generate (or reuse) one synthetic ARXML per target size; return [(label, path, bytes)]"""
+    os.makedirs(directory, exist_ok=True)
+    inputs = []
+    for label in sizes:
+        path = os.path.join(directory, f"synthetic_{label}_seed{seed}.arxml")
+        if not os.path.exists(path):
+            SyntheticArxmlGenerator.for_size(parse_size(label), seed).write_file(path)
+        inputs.append((label, path, os.path.getsize(path)))
+    return inputs
+
+
+# -------------------- Baseline --------------------
+def compare_to_baseline(results, baseline, threshold, min_delta_s=0.001):
+    """Return regressions: cases whose median exceeds the baseline by more than threshold.
+
+    A slowdown smaller than `min_delta_s` is timer and scheduler noise on
+    sub-millisecond cases and is not a regression, whatever the ratio.
+    """
+    base = {(r['case'], r.get('size_label')): r for r in baseline.get('results', []) if 'median_s' in r}
+    regressions = []
+    for r in results:
+        old = base.get((r['case'], r.get('size_label')))
+        if old is None or 'median_s' not in r:
+            continue
+        ratio = r['median_s'] / old['median_s'] if old['median_s'] else float('inf')
+        r['baseline_ratio'] = ratio
+        if ratio > 1.0 + threshold and r['median_s'] - old['median_s'] >= min_delta_s:
+            regressions.append(f"{r['case']} @ {r.get('size_label')}: {old['median_s'] * 1e3:.2f} ms -> "
+                               f"{r['median_s'] * 1e3:.2f} ms ({ratio - 1:+.0%})")
+    return regressions
+
+
+# -------------------- CLI --------------------
+def _run_isolated(case, path, size_bytes, repeat):
+    """Run one case in a fresh interpreter so peak RSS belongs to that case alone"""
+    cmd = [sys.executable, '-m', 'tools.benchmark', '--single', case, path, str(size_bytes), '--repeat', str(repeat)]
+    completed = subprocess.run(cmd, capture_output=True, text=True)
+    if completed.returncode != 0:
+        lines = completed.stderr.strip().splitlines()
+        return {'case': case, 'size_bytes': size_bytes, 'skipped': lines[-1] if lines else 'failed'}
+    return json.loads(completed.stdout)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark parse/extract/generate/GUI hot paths")
+    parser.add_argument('--sizes', default='100KB,1MB,10MB', help="Comma-separated input sizes")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--cases', help="Comma-separated case name prefixes to run (default: all)")
+    parser.add_argument('--input-dir', default=os.path.join(tempfile.gettempdir(), 'arxml_bench'))
+    parser.add_argument('-o', '--output', help="Write results JSON here")
+    parser.add_argument('--baseline', help="Baseline results JSON to compare against")
+    parser.add_argument('--threshold', type=float, default=0.20, help="Allowed slowdown vs. baseline (0.2 = 20%%)")
+    parser.add_argument('--min-delta', type=float, default=1.0,
+                        help="Ignore slowdowns smaller than this many ms (noise floor)")
+    parser.add_argument('--isolate', action='store_true', help="Run every case in its own process (exact peak RSS)")
+    parser.add_argument('--single', nargs=3, metavar=('CASE', 'PATH', 'BYTES'), help=argparse.SUPPRESS)
+    parser.add_argument('--list', action='store_true', help="List the available cases")
+    args = parser.parse_args(argv)
+    if args.baseline and args.repeat < MIN_COMPARE_REPEAT:
+        parser.error(f"--baseline needs --repeat {MIN_COMPARE_REPEAT} or more")
+
+    suite = BenchmarkSuite(repeat=args.repeat)
+    if args.list:
+        print("\n".join(suite.cases))
+        return 0
+    if args.single:
+        case, path, size_bytes = args.single
+        print(json.dumps(suite.run_case(case, path, int(size_bytes))))
+        suite.close()
+        return 0
+
+    cases = list(suite.cases)
+    if args.cases:
+        prefixes = [p.strip() for p in args.cases.split(',') if p.strip()]
+        cases = [c for c in cases if any(c.startswith(p) for p in prefixes)]
+
+    inputs = ensure_inputs([s.strip() for s in args.sizes.split(',') if s.strip()], args.seed, args.input_dir)
+    results = []
+    for case in cases:
+        case_inputs = inputs[:1] if size_independent(case) else inputs
+        for label, path, size_bytes in case_inputs:
+            # Exporters serialize a fixed model, so input throughput does not apply
+            size_bytes = 0 if size_independent(case) else size_bytes
+            if args.isolate:
+                result = _run_isolated(case, path, size_bytes, args.repeat)
+            else:
+                result = suite.run_case(case, path, size_bytes)
+            result['size_label'] = 'n/a' if size_independent(case) else label
+            results.append(result)
+            if 'skipped' in result:
+                print(f"{case:<34} {result['size_label']:>8}  skipped: {result['skipped']}")
+            else:
+                throughput = result['throughput_mb_s']
+                throughput = f"{throughput:8.2f} MB/s" if throughput else f"{'-':>13}"
+                print(f"{case:<34} {result['size_label']:>8}  {result['median_s'] * 1e3:10.2f} ms"
+                      f"  {throughput}  peak RSS {result['peak_rss_kb']} KB")
+
+    suite.close()
+
+    scaling = {}
+    for case in cases:
+        points = [(r['size_bytes'], r['median_s']) for r in results if r['case'] == case and 'median_s' in r]
+        exponent = scaling_exponent(points)
+        if exponent is not None:
+            scaling[case] = exponent
+            print(f"scaling {case:<34} time ~ size^{exponent:.2f}")
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'seed': args.seed,
+            'repeat': args.repeat,
+            'inputs': [{'label': label, 'bytes': size_bytes} for label, _, size_bytes in inputs],
+        },
+        'results': results,
+        'scaling': scaling,
+    }
+
+    exit_code = 0
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            regressions = compare_to_baseline(results, json.load(f), args.threshold, args.min_delta / 1000)
+        report['regressions'] = regressions
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        exit_code = 1 if regressions else 0
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
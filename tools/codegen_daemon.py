@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Long-running code generation daemon with warm parsed documents.
+
+`serve` starts the daemon: generator panels are built once, ARXML files
+are read on first use and kept in memory, and every request re-reads a
+file only if its modification time or size changed. Requests are
+JSON-RPC 2.0, one JSON object per line:
+
+    {"jsonrpc": "2.0", "id": 1, "method": "generate",
+     "params": {"file": "ecu.arxml", "output": "build/mcal"}}
+
+Methods: generate {file, output, modules?, force?}, validate {file},
+query {file, path?}, status {}, shutdown {}.
+
+The other subcommands are a thin client for build scripts. The client
+imports nothing beyond the standard library, so a call costs one
+interpreter start plus the request itself.
+
+By default the daemon listens on a Unix socket only its user can open.
+With --port it listens on localhost TCP instead; every request must
+then carry a "token" member matching $MCAL_CODEGEN_TOKEN, or the token
+the daemon wrote to ~/.mcal_codegen_token (mode 0600) when the variable
+is unset. A connection is dropped at its first line that is not a
+JSON-RPC request, so other protocols (a browser's HTTP POST, say)
+never reach the generators.
+
+The daemon drives the build panels in a withdrawn Tk root (see
+tools.watch), so it needs a display or xvfb-run.
+
+Usage:
+    python -m tools.codegen_daemon serve
+    python -m tools.codegen_daemon generate ecu.arxml -o build/mcal
+    python -m tools.codegen_daemon query ecu.arxml /SyntheticEcuc/Dio/DioPort_0
+    python -m tools.codegen_daemon --port 8765 serve
+    python -m tools.codegen_daemon stop
+"""
+import argparse
+import getpass
+import hmac
+import json
+import os
+import secrets
+import socket
+import sys
+import tempfile
+import time
+
+DEFAULT_SOCKET = os.path.join(os.environ.get('XDG_RUNTIME_DIR') or tempfile.gettempdir(),
+                              f"mcal-codegen-{getpass.getuser()}.sock")
+TOKEN_ENV = 'MCAL_CODEGEN_TOKEN'
+TOKEN_FILE = os.path.expanduser("~/.mcal_codegen_token")
+READ_TIMEOUT = 60  # seconds a client connection may sit idle
+
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+SERVER_ERROR = -32000
+
+
+# -------------------- Server --------------------
+def serve(args):
+    import queue
+    import socketserver
+    import threading
+    import xml.etree.ElementTree as ET
+    from concurrent.futures import Future
+
+    from tools.watch import log, make_tk_root, panel_loader
+    from ui.codegen_service import CodegenService
+    from ui.editor_panel import BUILD_PANEL_REGISTRY
+
+    token = None
+    if args.port is not None:
+        token = os.environ.get(TOKEN_ENV) or write_token_file()
+
+    tk_root = make_tk_root()
+    if tk_root is None:
+        return 2
+    started = time.perf_counter()
+    get_panel = panel_loader(tk_root)
+    for name in BUILD_PANEL_REGISTRY.names():
+        get_panel(name)  # import the generators and build their panels up front
+    service = CodegenService(get_panel)
+    log(f"Generators ready in {(time.perf_counter() - started) * 1000:.0f} ms")
+
+    def handle(request):
+        """One JSON-RPC request object -> response object"""
+        request_id, method = request.get('id'), request['method']
+        t0 = time.perf_counter()
+        try:
+            if method == 'shutdown':
+                result = {'stopping': True}  # the client thread stops the loop once this is sent
+            else:
+                result = service.call(method, request.get('params') or {})
+        except LookupError:
+            return error_response(request_id, METHOD_NOT_FOUND, f"Unknown method: {method}")
+        except ValueError as e:
+            return error_response(request_id, INVALID_PARAMS, str(e))
+        except (OSError, ET.ParseError) as e:
+            log(f"{method}: {e}", "ERROR")
+            return error_response(request_id, SERVER_ERROR, str(e))
+        except Exception as e:
+            log(f"{method} failed: {e}", "ERROR")
+            return error_response(request_id, SERVER_ERROR, f"{type(e).__name__}: {e}")
+        elapsed = (time.perf_counter() - t0) * 1000
+        file = (request.get('params') or {}).get('file')
+        log(f"{method}{' ' + os.path.basename(str(file)) if file else ''} in {elapsed:.1f} ms", "DEBUG")
+        return {'jsonrpc': '2.0', 'id': request_id, 'result': result, 'elapsed_ms': round(elapsed, 1)}
+
+    # Each client gets a thread that reads its lines, but the generators are
+    # Tk widgets and not thread-safe: requests are queued to the main thread
+    jobs = queue.Queue()
+    stopped = threading.Event()
+
+    class Handler(socketserver.StreamRequestHandler):
+        timeout = READ_TIMEOUT
+
+        def handle(self):
+            try:
+                for line in self.rfile:
+                    if not line.strip():
+                        continue
+                    request = parse_request(line)
+                    if request is None:
+                        log("Dropped a connection that does not speak JSON-RPC", "WARNING")
+                        return
+                    # Compared as bytes: compare_digest rejects non-ASCII str
+                    given = str(request.pop('token', '')).encode('utf-8')
+                    if token is not None and not hmac.compare_digest(given, token.encode('utf-8')):
+                        log("Dropped a connection with a missing or wrong token", "WARNING")
+                        self.reply(error_response(request.get('id'), INVALID_REQUEST, "Invalid token"))
+                        return
+                    future = Future()
+                    jobs.put((request, future))
+                    self.reply(future.result())
+                    if request['method'] == 'shutdown':
+                        stopped.set()
+                        return
+            except TimeoutError:
+                pass  # idle client; its connection is closed
+
+        def reply(self, response):
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+
+    if args.port is None:
+        if os.path.exists(args.socket):
+            os.unlink(args.socket)  # left behind by a daemon that was killed
+        old_umask = os.umask(0o177)  # the socket is created mode 0600, with no window before a chmod
+        try:
+            server = socketserver.ThreadingUnixStreamServer(args.socket, Handler)
+        finally:
+            os.umask(old_umask)
+        where = args.socket
+    else:
+        socketserver.ThreadingTCPServer.allow_reuse_address = True
+        server = socketserver.ThreadingTCPServer(("127.0.0.1", args.port), Handler)
+        where = f"127.0.0.1:{args.port} (token required)"
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, kwargs={'poll_interval': 0.5}, daemon=True).start()
+    log(f"Listening on {where}; stop with: python -m tools.codegen_daemon stop")
+    try:
+        while not stopped.is_set():
+            try:
+                request, future = jobs.get(timeout=0.1)
+            except queue.Empty:
+                pass
+            else:
+                future.set_result(handle(request))
+            tk_root.update()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+        server.server_close()
+        if args.port is None and os.path.exists(args.socket):
+            os.unlink(args.socket)
+    log("Stopped")
+    return 0
+
+
+def parse_request(line):
+    """The request object on one line, or None when the line is not a JSON-RPC 2.0 request"""
+    try:
+        request = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(request, dict) or request.get('jsonrpc') != '2.0' or not isinstance(request.get('method'), str):
+        return None
+    return request
+
+
+def write_token_file():
+    """Create a random token readable only by this user; returns it"""
+    token = secrets.token_urlsafe(32)
+    fd = os.open(TOKEN_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    # The mode argument only applies on creation; an existing file may be world-readable
+    os.fchmod(fd, 0o600)
+    with open(fd, 'w') as f:
+        f.write(token + "\n")
+    return token
+
+
+def error_response(request_id, code, message):
+    return {'jsonrpc': '2.0', 'id': request_id, 'error': {'code': code, 'message': message}}
+
+
+# -------------------- Client --------------------
+def call(args, method, params=None):
+    """Send one request to the daemon; returns the response object"""
+    request = {'jsonrpc': '2.0', 'id': 1, 'method': method, 'params': params or {}}
+    if args.port is None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        address = args.socket
+    else:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        address = ("127.0.0.1", args.port)
+        request['token'] = read_token()
+    with sock:
+        sock.connect(address)
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        with sock.makefile('rb') as f:
+            line = f.readline()
+    if not line:
+        raise ConnectionError("the daemon closed the connection")
+    return json.loads(line)
+
+
+def read_token():
+    token = os.environ.get(TOKEN_ENV)
+    if token:
+        return token
+    try:
+        with open(TOKEN_FILE) as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        return ""
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Code generation daemon with warm parsed documents")
+    parser.add_argument('--socket', default=DEFAULT_SOCKET, help=f"Unix socket (default {DEFAULT_SOCKET})")
+    parser.add_argument('--port', type=int,
+                        help=f"Use this localhost TCP port instead of the socket; requests need the token "
+                             f"from ${TOKEN_ENV} or {TOKEN_FILE}")
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser('serve', help="Run the daemon")
+    generate = commands.add_parser('generate', help="Generate driver files")
+    generate.add_argument('file')
+    generate.add_argument('-o', '--output', required=True, help="Output directory; one folder per module")
+    generate.add_argument('--module', action='append', help="Only this module (e.g. Dio); may be repeated")
+    generate.add_argument('--force', action='store_true', help="Regenerate even if up to date")
+    validate = commands.add_parser('validate', help="Check the ECUC structure of a file")
+    validate.add_argument('file')
+    query = commands.add_parser('query', help="Show a node by AUTOSAR path")
+    query.add_argument('file')
+    query.add_argument('path', nargs='?', default="")
+    commands.add_parser('status', help="Show cached documents and counters")
+    commands.add_parser('stop', help="Shut the daemon down")
+    args = parser.parse_args(argv)
+    if args.port is None and not hasattr(socket, 'AF_UNIX'):
+        parser.error("Unix sockets are not available on this platform; use --port")
+
+    if args.command == 'serve':
+        return serve(args)
+
+    if args.command == 'generate':
+        params = {'file': os.path.abspath(args.file), 'output': os.path.abspath(args.output), 'force': args.force}
+        if args.module:
+            params['modules'] = args.module
+    elif args.command in ('validate', 'query'):
+        params = {'file': os.path.abspath(args.file)}
+        if args.command == 'query':
+            params['path'] = args.path
+    else:
+        params = {}
+    method = 'shutdown' if args.command == 'stop' else args.command
+
+    try:
+        response = call(args, method, params)
+    except (ConnectionError, FileNotFoundError) as e:
+        print(f"codegen_daemon: cannot reach the daemon ({e}); start it with: "
+              f"python -m tools.codegen_daemon serve", file=sys.stderr)
+        return 2
+    if 'error' in response:
+        print(f"codegen_daemon: {response['error']['message']}", file=sys.stderr)
+        return 1
+    print(json.dumps(response['result'], indent=2))
+    if args.command == 'validate' and not response['result']['valid']:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
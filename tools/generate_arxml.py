@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+"""
+Synthetic ECUC ARXML generator for load and performance testing.
+
+Builds Dio, Adc, Can, Gpt, Spi and Wdg module configurations with
+configurable instance counts and a deterministic seed. Output is written
+element by element to a buffered file, so files larger than RAM can be
+produced. Container and parameter names follow what the Edit & Build
+panels read, and the reference graph (CAN hardware object -> controller,
+SPI sequence -> job -> device / channel) uses real ECUC-REFERENCE-VALUEs.
+
+Usage:
+    python -m tools.generate_arxml -o corpus_100mb.arxml --size 100MB --seed 7
+    python -m tools.generate_arxml -o ecu.arxml --dio-channels 200 --can-hohs 64
+"""
+import argparse
+import io
+import random
+import sys
+from dataclasses import dataclass, fields, replace
+from xml.sax.saxutils import escape, quoteattr
+
+from ui.editor.peripheral_config.arxml_writer import AUTOSAR_NS
+
+PACKAGE_NAME = "SyntheticEcuc"
+MODULES = ('Dio', 'Adc', 'Can', 'Gpt', 'Spi', 'Wdg')
+
+_SIZE_UNITS = {'B': 1, 'KB': 1024, 'MB': 1024 ** 2, 'GB': 1024 ** 3}
+
+
+def parse_size(text):
+    """Parse '512KB', '10MB', '1GB' or a plain byte count"""
+    text = text.strip().upper()
+    for unit in ('KB', 'MB', 'GB', 'B'):
+        if text.endswith(unit):
+            return int(float(text[:-len(unit)]) * _SIZE_UNITS[unit])
+    return int(text)
+
+
+# -------------------- Profile --------------------
+@dataclass
+class SyntheticProfile:
+    """Instance counts per module; scaled() multiplies every count"""
+    dio_ports: int = 4
+    dio_channels: int = 64
+    dio_channel_groups: int = 8
+    adc_channels: int = 16
+    adc_groups: int = 8
+    can_controllers: int = 2
+    can_hohs: int = 32
+    can_filters_per_hoh: int = 2
+    gpt_channels: int = 8
+    spi_channels: int = 8
+    spi_devices: int = 4
+    spi_jobs: int = 16
+    spi_sequences: int = 4
+
+    def scaled(self, factor):
+        return replace(self, **{f.name: max(1, round(getattr(self, f.name) * factor)) for f in fields(self)
+                                if f.name != 'can_filters_per_hoh'})
+
+
+# -------------------- Streaming Writer --------------------
+class ArxmlStreamWriter:
+    """Indented XML written straight to a text stream; tracks bytes written"""
+
+    def __init__(self, stream, indent="  "):
+        self.stream = stream
+        self.indent = indent
+        self.depth = 0
+        self.bytes_written = 0
+
+    def _write(self, text):
+        self.stream.write(text)
+        self.bytes_written += len(text.encode('utf-8')) if not text.isascii() else len(text)
+
+    def declaration(self):
+        self._write('<?xml version="1.0" encoding="UTF-8"?>\n')
+
+    def start(self, tag, attrs=None):
+        self._write(f"{self.indent * self.depth}<{tag}{self._attrs(attrs)}>\n")
+        self.depth += 1
+
+    def end(self, tag):
+        self.depth -= 1
+        self._write(f"{self.indent * self.depth}</{tag}>\n")
+
+    def leaf(self, tag, text, attrs=None):
+        self._write(f"{self.indent * self.depth}<{tag}{self._attrs(attrs)}>{escape(str(text))}</{tag}>\n")
+
+    @staticmethod
+    def _attrs(attrs):
+        return "".join(f" {key}={quoteattr(str(value))}" for key, value in (attrs or {}).items())
+
+
+class _CountingSink:
+    """Text sink that only counts; used to size a profile without writing"""
+
+    def write(self, text):
+        return len(text)
+
+
+# -------------------- Generator --------------------
+class SyntheticArxmlGenerator:
+    """Emit ECUC module configurations for a profile, reproducibly from a seed"""
+
+    def __init__(self, profile=None, seed=0, modules=MODULES, definition_refs=False):
+        self.profile = profile or SyntheticProfile()
+        self.seed = seed
+        self.modules = [m for m in MODULES if m in modules]
+        # Parameters carry only SHORT-NAME/VALUE like ArxmlExporter output unless full refs are requested
+        self.definition_refs = definition_refs
+
+    def write(self, stream):
+        """Write the whole document to a text stream; return the byte count"""
+        self.rng = random.Random(self.seed)
+        self.out = ArxmlStreamWriter(stream)
+        self.out.declaration()
+        self.out.start("AUTOSAR", {"xmlns": AUTOSAR_NS})
+        self.out.start("AR-PACKAGES")
+        self.out.start("AR-PACKAGE")
+        self.out.leaf("SHORT-NAME", PACKAGE_NAME)
+        self.out.start("ELEMENTS")
+        for module in self.modules:
+            self.out.start("ECUC-MODULE-CONFIGURATION-VALUES")
+            self.out.leaf("SHORT-NAME", module)
+            self.out.leaf("DEFINITION-REF", f"/AUTOSAR/EcucDefs/{module}", {"DEST": "ECUC-MODULE-DEF"})
+            self.out.leaf("IMPLEMENTATION-CONFIG-VARIANT", "VARIANT-PRE-COMPILE")
+            self.out.start("CONTAINERS")
+            getattr(self, f"_write_{module.lower()}")()
+            self.out.end("CONTAINERS")
+            self.out.end("ECUC-MODULE-CONFIGURATION-VALUES")
+        self.out.end("ELEMENTS")
+        self.out.end("AR-PACKAGE")
+        self.out.end("AR-PACKAGES")
+        self.out.end("AUTOSAR")
+        return self.out.bytes_written
+
+    def write_file(self, path, buffer_size=1 << 20):
+        with open(path, 'w', encoding='utf-8', buffering=buffer_size, newline='\n') as f:
+            return self.write(f)
+
+    def to_string(self):
+        buffer = io.StringIO()
+        self.write(buffer)
+        return buffer.getvalue()
+
+    @classmethod
+    def for_size(cls, target_bytes, seed=0, modules=MODULES, base=None, definition_refs=False):
+        """Generator whose output is close to target_bytes.
+
+        Every module keeps at least one instance of each container, so output
+        never drops below about 6.5 KB per module (about 39 KB for all six).
+        """
+        base = base or SyntheticProfile()
+        one = cls(base, seed, modules, definition_refs).write(_CountingSink())
+        two = cls(base.scaled(2), seed, modules, definition_refs).write(_CountingSink())
+        per_unit = max(1, two - one)
+        fixed = max(0, one - per_unit)
+        factor = max(0.0, (target_bytes - fixed) / per_unit)
+        return cls(base.scaled(factor), seed, modules, definition_refs)
+
+    # ---------- container helpers ----------
+    def _container(self, module, short_name, definition, params=(), refs=(), sub_containers=None):
+        """params: (kind, name, value) with kind in num/bool/enum/text; refs: (name, target path)"""
+        self.out.start("ECUC-CONTAINER-VALUE")
+        self.out.leaf("SHORT-NAME", short_name)
+        self.out.leaf("DEFINITION-REF", f"/AUTOSAR/EcucDefs/{module}/{definition}",
+                      {"DEST": "ECUC-PARAM-CONF-CONTAINER-DEF"})
+        if params:
+            self.out.start("PARAMETER-VALUES")
+            for kind, name, value in params:
+                self._param(module, definition, kind, name, value)
+            self.out.end("PARAMETER-VALUES")
+        if refs:
+            self.out.start("REFERENCE-VALUES")
+            for name, target in refs:
+                self.out.start("ECUC-REFERENCE-VALUE")
+                self.out.leaf("DEFINITION-REF", f"/AUTOSAR/EcucDefs/{module}/{definition}/{name}",
+                              {"DEST": "ECUC-REFERENCE-DEF"})
+                self.out.leaf("VALUE-REF", target, {"DEST": "ECUC-CONTAINER-VALUE"})
+                self.out.end("ECUC-REFERENCE-VALUE")
+            self.out.end("REFERENCE-VALUES")
+        if sub_containers:
+            self.out.start("SUB-CONTAINERS")
+            sub_containers()
+            self.out.end("SUB-CONTAINERS")
+        self.out.end("ECUC-CONTAINER-VALUE")
+
+    _PARAM_TAGS = {
+        'num': ("ECUC-NUMERICAL-PARAM-VALUE", "ECUC-INTEGER-PARAM-DEF"),
+        'bool': ("ECUC-BOOLEAN-PARAM-VALUE", "ECUC-BOOLEAN-PARAM-DEF"),
+        'enum': ("ECUC-ENUMERATION-PARAM-VALUE", "ECUC-ENUMERATION-PARAM-DEF"),
+        'text': ("ECUC-TEXTUAL-PARAM-VALUE", "ECUC-STRING-PARAM-DEF"),
+    }
+
+    def _param(self, module, definition, kind, name, value):
+        tag, dest = self._PARAM_TAGS[kind]
+        if kind == 'bool':
+            value = 'true' if value else 'false'
+        self.out.start(tag)
+        self.out.leaf("SHORT-NAME", name)
+        if self.definition_refs:
+            self.out.leaf("DEFINITION-REF", f"/AUTOSAR/EcucDefs/{module}/{definition}/{name}", {"DEST": dest})
+        self.out.leaf("VALUE", value)
+        self.out.end(tag)
+
+    def _path(self, module, short_name):
+        return f"/{PACKAGE_NAME}/{module}/{short_name}"
+
+    def _flag(self, probability=0.5):
+        return self.rng.random() < probability
+
+    # ---------- modules ----------
+    def _write_dio(self):
+        p = self.profile
+        self._container('Dio', 'DioGeneral', 'DioGeneral', [
+            ('bool', 'DioDevErrorDetect', True), ('bool', 'DioVersionInfoApi', True),
+            ('bool', 'DioFlipChannelApi', self._flag()), ('bool', 'DioMaskedWritePortApi', self._flag())])
+        self._container('Dio', 'DioConfigSet', 'DioConfig', [('bool', 'IncludeDioConfigSet', True)])
+        for port in range(p.dio_ports):
+            self._container('Dio', f'DioPort_{port}', 'DioPort', [
+                ('num', 'DioPortId', port), ('text', 'DioPortSymbolicName', f'DIO_PORT_{port}')])
+        for channel in range(p.dio_channels):
+            self._container('Dio', f'DioChannel_{channel}', 'DioChannel', [
+                ('num', 'DioChannelId', channel), ('num', 'DioPortRef', (channel // 16) % p.dio_ports),
+                ('text', 'DioChannelSymbolicName', f'DIO_CHANNEL_{channel}')])
+        for group in range(p.dio_channel_groups):
+            offset = self.rng.randrange(0, 12)
+            width = self.rng.randrange(1, 16 - offset + 1)
+            self._container('Dio', f'DioChannelGroup_{group}', 'DioChannelGroup', [
+                ('num', 'DioPortMask', ((1 << width) - 1) << offset), ('num', 'DioPortOffset', offset),
+                ('num', 'DioPortRef', group % p.dio_ports),
+                ('text', 'DioChannelGroupIdentification', f'DIO_GROUP_{group}')])
+
+    def _write_adc(self):
+        p = self.profile
+        self._container('Adc', 'AdcGeneral', 'AdcGeneral', [
+            ('bool', 'AdcDeInitApi', True), ('bool', 'AdcDevErrorDetect', True),
+            ('bool', 'AdcEnableLimitCheck', self._flag()), ('bool', 'AdcEnableQueuing', self._flag()),
+            ('bool', 'AdcEnableStartStopGroupApi', True), ('bool', 'AdcGrpNotifCapability', True),
+            ('bool', 'AdcHwTriggerApi', True), ('bool', 'AdcReadGroupApi', True),
+            ('bool', 'AdcVersionInfoApi', True),
+            ('enum', 'AdcPriorityImplementation', 'ADC_PRIORITY_HW_SW'),
+            ('enum', 'AdcResultAlignment', 'ADC_ALIGN_RIGHT')])
+        self._container('Adc', 'AdcConfigSet', 'AdcConfigSet')
+        self._container('Adc', 'AdcHwUnit_0', 'AdcHwUnit', [('num', 'AdcHwUnitId', 0), ('num', 'AdcPrescale', 4)])
+        for channel in range(p.adc_channels):
+            self._container('Adc', f'AdcChannel_{channel}', 'AdcChannel', [
+                ('num', 'AdcChannelId', channel), ('num', 'AdcChannelConvTime', self.rng.choice((3, 15, 28, 56))),
+                ('num', 'AdcChannelResolution', self.rng.choice((8, 10, 12))),
+                ('num', 'AdcChannelSampTime', self.rng.choice((3, 15, 84, 480))),
+                ('num', 'AdcChannelHighLimit', 4095), ('num', 'AdcChannelLowLimit', 0),
+                ('bool', 'AdcChannelLimitCheck', self._flag(0.2)),
+                ('text', 'AdcChannelSymbolicName', f'ADC_CHANNEL_{channel}')])
+        for group in range(p.adc_groups):
+            streaming = self._flag(0.3)
+            members = self.rng.sample(range(p.adc_channels), self.rng.randint(1, min(8, p.adc_channels)))
+            params = [('num', 'AdcGroupId', group), ('num', 'AdcGroupPriority', self.rng.randrange(0, 8)),
+                      ('num', 'AdcStreamingNumSamples', self.rng.choice((2, 4, 8, 16)) if streaming else 1),
+                      ('bool', 'AdcNotification', self._flag()),
+                      ('enum', 'AdcGroupAccessMode',
+                       'ADC_ACCESS_MODE_STREAMING' if streaming else 'ADC_ACCESS_MODE_SINGLE'),
+                      ('enum', 'AdcGroupConversionMode',
+                       self.rng.choice(('ADC_CONV_MODE_ONESHOT', 'ADC_CONV_MODE_CONTINUOUS'))),
+                      ('enum', 'AdcGroupTriggSrc', self.rng.choice(('ADC_TRIGG_SRC_SW', 'ADC_TRIGG_SRC_HW'))),
+                      ('enum', 'AdcStreamingBufferMode',
+                       self.rng.choice(('ADC_STREAM_BUFFER_LINEAR', 'ADC_STREAM_BUFFER_CIRCULAR')))]
+            # The build panel reads AdcGroupDefinition as channel IDs, one value per member
+            params += [('num', 'AdcGroupDefinition', channel) for channel in sorted(members)]
+            self._container('Adc', f'AdcGroup_{group}', 'AdcGroup', params)
+
+    def _write_can(self):
+        p = self.profile
+        self._container('Can', 'CanGeneral', 'CanGeneral', [
+            ('bool', 'CanDevErrorDetect', True), ('bool', 'CanVersionInfoApi', True),
+            ('bool', 'CanSetBaudrateApi', self._flag()), ('num', 'CanIndex', 0),
+            ('num', 'CanMainFunctionBusoffPeriod', 10), ('num', 'CanMainFunctionModePeriod', 10),
+            ('num', 'CanMainFunctionWakeupPeriod', 10), ('num', 'CanTimeoutDuration', 100)])
+        self._container('Can', 'CanConfigSet', 'CanConfigSet')
+        for controller in range(p.can_controllers):
+            self._container('Can', f'CanController_{controller}', 'CanController', [
+                ('num', 'CanControllerId', controller), ('bool', 'CanControllerActivation', True),
+                ('num', 'CanControllerBaseAddress', 0x40006400 + controller * 0x400)])
+            self._container('Can', f'CanControllerBaudrateConfig_{controller}', 'CanControllerBaudrateConfig', [
+                ('num', 'CanControllerBaudRateConfigID', 0),
+                ('num', 'CanControllerBaudRate', self.rng.choice((125_000, 250_000, 500_000, 1_000_000))),
+                ('num', 'CanControllerPropSeg', 2), ('num', 'CanControllerSeg1', 11),
+                ('num', 'CanControllerSeg2', 2), ('num', 'CanControllerSyncJumpWidth', 1)],
+                refs=[('CanControllerRef', self._path('Can', f'CanController_{controller}'))])
+
+        for hoh in range(p.can_hohs):
+            receive = hoh % 2 == 0
+            id_type = self.rng.choice(('STANDARD', 'STANDARD', 'EXTENDED', 'MIXED'))
+            full = self._flag(0.25)
+            params = [('num', 'CanObjectId', hoh),
+                      ('enum', 'CanObjectType', 'RECEIVE' if receive else 'TRANSMIT'),
+                      ('enum', 'CanIdType', id_type), ('enum', 'CanHandleType', 'FULL' if full else 'BASIC'),
+                      ('num', 'CanHwObjectCount', 1)]
+            refs = [('CanControllerRef', self._path('Can', f'CanController_{hoh % p.can_controllers}'))]
+            filter_count = (1 if full else p.can_filters_per_hoh) if receive else 0
+            id_mask = 0x7FF if id_type == 'STANDARD' else 0x1FFFFFFF
+
+            def filters(hoh=hoh, count=filter_count, id_mask=id_mask, full=full):
+                for index in range(count):
+                    code = self.rng.randrange(0, id_mask + 1)
+                    mask = id_mask if full else id_mask & ~((1 << self.rng.randrange(0, 5)) - 1)
+                    self._container('Can', f'CanHwFilter_{hoh}_{index}', 'CanHwFilter', [
+                        ('num', 'CanHwFilterCode', code & mask), ('num', 'CanHwFilterMask', mask)])
+
+            self._container('Can', f'CanHardwareObject_{hoh}', 'CanHardwareObject', params, refs,
+                            filters if filter_count else None)
+
+    def _write_gpt(self):
+        p = self.profile
+        self._container('Gpt', 'GptDriverConfiguration', 'GptDriverConfiguration', [
+            ('bool', 'GptDevErrorDetect', True), ('bool', 'GptReportWakeupSource', self._flag()),
+            ('num', 'GptPredefTimer1usEnablingGrade', 0)])
+        self._container('Gpt', 'GptConfigurationOfOptApiServices', 'GptConfigurationOfOptApiServices', [
+            ('bool', 'GptDeinitApi', True), ('bool', 'GptEnableDisableNotificationApi', True),
+            ('bool', 'GptTimeElapsedApi', True), ('bool', 'GptTimeRemainingApi', True),
+            ('bool', 'GptVersionInfoApi', True), ('bool', 'GptWakeupFunctionalityApi', self._flag())])
+        self._container('Gpt', 'GptChannelConfigSet', 'GptChannelConfigSet')
+        for channel in range(p.gpt_channels):
+            self._container('Gpt', f'GptChannelConfiguration_{channel}', 'GptChannelConfiguration', [
+                ('num', 'GptChannelId', channel),
+                ('num', 'GptChannelTickFrequency', self.rng.choice((1000, 10000, 100000, 1000000))),
+                ('num', 'GptChannelTickValueMax', 65535),
+                ('bool', 'GptEnableWakeup', self._flag(0.2)),
+                ('text', 'GptNotification', f'Gpt_Notification_Channel{channel}'),
+                ('enum', 'GptChannelMode', self.rng.choice(('GPT_CH_MODE_CONTINUOUS', 'GPT_CH_MODE_ONESHOT')))])
+
+    def _write_spi(self):
+        p = self.profile
+        self._container('Spi', 'SpiGeneral', 'SpiGeneral', [
+            ('bool', 'SpiCancelApi', True), ('bool', 'SpiDevErrorDetect', True), ('bool', 'SpiHwStatusApi', True),
+            ('bool', 'SpiInterruptibleSeqAllowed', self._flag()), ('bool', 'SpiVersionInfoApi', True),
+            ('num', 'SpiChannelBuffersAllowed', 2), ('num', 'SpiLevelDelivered', 2),
+            ('num', 'SpiMainFunctionPeriod', 10)])
+        self._container('Spi', 'SpiDriver', 'SpiDriver', [
+            ('num', 'SpiMaxChannel', p.spi_channels), ('num', 'SpiMaxJob', p.spi_jobs),
+            ('num', 'SpiMaxSequence', p.spi_sequences), ('num', 'SpiMaxHwUnit', 3)])
+        for channel in range(p.spi_channels):
+            external = self._flag(0.3)
+            self._container('Spi', f'SpiChannel_{channel}', 'SpiChannel', [
+                ('num', 'SpiChannelId', channel), ('bool', 'SpiChannelType', external),
+                ('num', 'SpiDataWidth', self.rng.choice((8, 16))), ('num', 'SpiDefaultData', 0),
+                ('num', 'SpiEbMaxLength', self.rng.choice((16, 64, 256)) if external else 1),
+                ('num', 'SpiIbNBuffers', 1 if external else self.rng.choice((1, 4, 8))),
+                ('bool', 'SpiTransferStart', self._flag())])
+        for device in range(p.spi_devices):
+            self._container('Spi', f'SpiExternalDevice_{device}', 'SpiExternalDevice', [
+                ('num', 'SpiBaudrate', self.rng.choice((500000, 1000000, 4000000, 10000000))),
+                ('num', 'SpiTimeClk2Cs', 50), ('num', 'SpiTimeCs2Clk', 50), ('num', 'SpiTimeCs2Cs', 100),
+                ('bool', 'SpiEnableCs', True), ('text', 'SpiCsIdentifier', f'CS_{device}'),
+                ('enum', 'SpiHwUnit', f'CSIB{device % 3}'),
+                ('enum', 'SpiCsBehavior', self.rng.choice(('CS_KEEP_ASSERTED', 'CS_TOGGLE'))),
+                ('enum', 'SpiCsPolarity', 'LOW'), ('enum', 'SpiDataShiftEdge', 'LEADING'),
+                ('enum', 'SpiShiftClockIdleLevel', 'LOW')])
+        for job in range(p.spi_jobs):
+            channels = self.rng.sample(range(p.spi_channels), self.rng.randint(1, min(4, p.spi_channels)))
+
+            def channel_list(job=job, channels=channels):
+                for index, channel in enumerate(channels):
+                    self._container('Spi', f'SpiChannelList_{job}_{index}', 'SpiChannelList',
+                                    [('num', 'SpiChannelIndex', index)],
+                                    [('SpiChannelAssignment', self._path('Spi', f'SpiChannel_{channel}'))])
+
+            self._container('Spi', f'SpiJob_{job}', 'SpiJob', [
+                ('num', 'SpiJobId', job), ('num', 'SpiJobPriority', self.rng.randrange(0, 4)),
+                ('text', 'SpiJobEndNotification', f'Spi_JobEndNotification{job}')],
+                [('SpiDeviceAssignment', self._path('Spi', f'SpiExternalDevice_{job % p.spi_devices}'))],
+                channel_list)
+        for sequence in range(p.spi_sequences):
+            jobs = self.rng.sample(range(p.spi_jobs), self.rng.randint(1, min(6, p.spi_jobs)))
+            self._container('Spi', f'SpiSequence_{sequence}', 'SpiSequence', [
+                ('num', 'SpiSequenceId', sequence), ('bool', 'SpiInterruptibleSequence', self._flag()),
+                ('text', 'SpiSeqEndNotification', f'Spi_SeqEndNotification{sequence}')],
+                [('SpiJobAssignment', self._path('Spi', f'SpiJob_{job}')) for job in jobs])
+
+    def _write_wdg(self):
+        self._container('Wdg', 'WdgGeneral', 'WdgGeneral', [
+            ('bool', 'WdgDevErrorDetect', True), ('bool', 'WdgDisableAllowed', self._flag()),
+            ('num', 'WdgIndex', 0), ('num', 'WdgInitialTimeout', self.rng.choice((100, 500, 1000))),
+            ('num', 'WdgMaxTimeout', 65535), ('bool', 'WdgVersionInfoApi', True),
+            ('enum', 'WdgRunArea', 'ROM')])
+        self._container('Wdg', 'WdgSettingsConfig', 'WdgSettingsConfig', [
+            ('enum', 'WdgDefaultMode', 'WDGIF_SLOW_MODE'), ('bool', 'WdgSettingsFast', True),
+            ('bool', 'WdgSettingsOff', False), ('bool', 'WdgSettingsSlow', True)])
+        self._container('Wdg', 'WdgPublishedInformation', 'WdgPublishedInformation', [
+            ('enum', 'WdgTriggerMode', self.rng.choice(('WDG_TOGGLE', 'WDG_WINDOW', 'WDG_BOTH')))])
+
+
+# -------------------- CLI --------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate synthetic ECUC ARXML for load testing")
+    parser.add_argument('-o', '--output', required=True, help="Output .arxml path ('-' for stdout)")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed (same seed, same file)")
+    parser.add_argument('--size', help="Approximate output size, e.g. 1KB, 50MB, 1GB (scales all counts)")
+    parser.add_argument('--modules', default=",".join(MODULES),
+                        help=f"Comma-separated subset of {','.join(MODULES)}")
+    parser.add_argument('--definition-refs', action='store_true',
+                        help="Add a DEFINITION-REF to every parameter value (larger, schema-complete output)")
+    defaults = SyntheticProfile()
+    for f in fields(SyntheticProfile):
+        parser.add_argument(f"--{f.name.replace('_', '-')}", type=int, default=getattr(defaults, f.name))
+    args = parser.parse_args(argv)
+
+    modules = [m.strip().capitalize() for m in args.modules.split(',') if m.strip()]
+    unknown = [m for m in modules if m not in MODULES]
+    if unknown:
+        parser.error(f"unknown module(s): {', '.join(unknown)}")
+
+    profile = SyntheticProfile(**{f.name: getattr(args, f.name) for f in fields(SyntheticProfile)})
+    if args.size:
+        generator = SyntheticArxmlGenerator.for_size(parse_size(args.size), args.seed, modules, profile,
+                                                     args.definition_refs)
+    else:
+        generator = SyntheticArxmlGenerator(profile, args.seed, modules, args.definition_refs)
+
+    if args.output == '-':
+        written = generator.write(sys.stdout)
+    else:
+        written = generator.write_file(args.output)
+    print(f"Wrote {written} bytes ({generator.profile})", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
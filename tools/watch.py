@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Headless watch mode: regenerate MCAL driver outputs when ARXML sources change.
+
+The given ARXML files are polled, bursts of writes are debounced, and
+each settled change is re-read once. Only modules whose configuration
+digest changed are extracted and regenerated. Their files go to
+OUTPUT/<Module>/, e.g. OUTPUT/Dio/Dio_Cfg.h. Each cycle logs one line
+with parse / codegen / write timings.
+
+The generators are the build panels of the application, so a display
+is needed. They run in a withdrawn Tk root; use xvfb-run on headless
+machines. Dialogs the panels would raise are written to the log instead.
+
+Usage:
+    python -m tools.watch ecu_extract.arxml -o build/mcal
+    python -m tools.watch dio.arxml can.arxml -o build/mcal --debounce 2
+    python -m tools.watch ecu_extract.arxml -o build/mcal --once
+"""
+import argparse
+import sys
+import time
+from datetime import datetime
+
+from ui.editor_panel import BUILD_PANEL_REGISTRY
+from ui.watch import FileWatcher, WatchSession
+
+
+def log(message, level="INFO"):
+    stream = sys.stderr if level in ("WARNING", "ERROR") else sys.stdout
+    print(f"[{datetime.now():%H:%M:%S}] {level}: {message}", file=stream, flush=True)
+
+
+def make_tk_root():
+    """Withdrawn Tk root whose message boxes log instead of blocking; None without a display"""
+    import tkinter as tk
+    from tkinter import messagebox
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        log(f"no display ({e}); run under xvfb-run", "ERROR")
+        return None
+    root.withdraw()
+    levels = {'showinfo': "DEBUG", 'showwarning': "WARNING", 'showerror': "ERROR"}
+    for name, level in levels.items():
+        setattr(messagebox, name, lambda title, message="", level=level, **kwargs: log(f"{title}: {message}", level))
+    for name in ('askyesno', 'askokcancel', 'askyesnocancel'):
+        setattr(messagebox, name, lambda *args, **kwargs: True)
+    return root
+
+
+def panel_loader(tk_root):
+    """get_panel(name) for the build panel registry, building each panel once"""
+    panels = {}
+
+    def get_panel(name):
+        if name not in BUILD_PANEL_REGISTRY:
+            return None
+        if name not in panels:
+            panels[name] = BUILD_PANEL_REGISTRY.load(name)(tk_root)
+        return panels[name]
+    return get_panel
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Regenerate driver outputs when ARXML files change")
+    parser.add_argument('files', nargs='+', help="ARXML files to watch")
+    parser.add_argument('-o', '--output', required=True, help="Output directory; one folder per module")
+    parser.add_argument('--interval', type=float, default=0.5, help="Seconds between polls (default 0.5)")
+    parser.add_argument('--debounce', type=float, default=1.0,
+                        help="Seconds a file must stay unchanged before it is processed (default 1.0)")
+    parser.add_argument('--once', action='store_true', help="Generate once from the current files and exit")
+    args = parser.parse_args(argv)
+
+    tk_root = make_tk_root()
+    if tk_root is None:
+        return 2
+
+    session = WatchSession(args.output, panel_loader(tk_root), log)
+    watcher = FileWatcher(args.files, debounce=args.debounce)
+    if args.once:
+        session.run_cycle(watcher.paths)
+        return 0
+
+    log(f"Watching {len(watcher.paths)} file(s) -> {args.output}; Ctrl+C to stop")
+    try:
+        while True:
+            changed = watcher.poll()
+            if changed:
+                session.run_cycle(changed)
+            tk_root.update()
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        log("Stopped")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
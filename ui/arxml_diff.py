@@ -0,0 +1,186 @@
+# arxml_diff.py
+
+import os
+from dataclasses import dataclass, field
+
+from .ecuc_tree import read_ecuc_tree
+from .profiling import profiler
+
+ADDED = "added"
+REMOVED = "removed"
+CHANGED = "changed"
+MARKS = {ADDED: "+", REMOVED: "-", CHANGED: "~"}
+
+
+def format_param_value(value):
+    if value is None:
+        return ""
+    return ", ".join(value) if isinstance(value, tuple) else value
+
+
+@dataclass(slots=True)
+class ParameterChange:
+    name: str
+    old: object = None  # None: parameter added
+    new: object = None  # None: parameter removed
+
+    @property
+    def status(self):
+        return ADDED if self.old is None else REMOVED if self.new is None else CHANGED
+
+
+@dataclass(slots=True)
+class ContainerChange:
+    path: str
+    definition: str
+    status: str
+    parameters: list = field(default_factory=list)  # ParameterChanges, for changed containers
+    node: object = None  # the added / removed EcucNode
+
+
+@dataclass(slots=True)
+class ModuleDiff:
+    path: str
+    name: str  # module definition: Dio, Can, ...
+    status: str
+    containers: list = field(default_factory=list)
+
+    def counts(self):
+        """(containers added, containers removed, parameters changed)"""
+        added = sum(1 for c in self.containers if c.status == ADDED)
+        removed = sum(1 for c in self.containers if c.status == REMOVED)
+        return added, removed, sum(len(c.parameters) for c in self.containers)
+
+
+class ArxmlDiff:
+    """Semantic differences between two ECUC documents, grouped per module.
+
+    Containers are matched by AUTOSAR path (the SHORT-NAME chain) and must
+    also agree on DEFINITION-REF; one that changes definition is reported
+    as removed and added. Formatting, element order and namespace prefixes
+    do not count as changes.
+    """
+
+    def __init__(self, old_root, new_root):
+        self.modules = []
+        self._current = None
+        if old_root.digest != new_root.digest:
+            self._compare(old_root, new_root, "")
+
+    def __bool__(self):
+        return bool(self.modules)
+
+    # ---------- comparison ----------
+    def _compare(self, old, new, path):
+        """Both nodes exist at `path` with the same kind and definition"""
+        if old.digest == new.digest:
+            return  # identical subtree
+        if old.kind == "module":
+            self._current = ModuleDiff(path, new.definition or new.name, CHANGED)
+            self.modules.append(self._current)
+
+        if old.params != new.params:
+            changes = [ParameterChange(name, old.params.get(name), new.params.get(name))
+                       for name in dict.fromkeys([*old.params, *new.params])
+                       if old.params.get(name) != new.params.get(name)]
+            self._add(ContainerChange(path, new.definition, CHANGED, changes))
+
+        for name, old_child in old.children.items():
+            child_path = f"{path}/{name}"
+            new_child = new.children.get(name)
+            if new_child is None:
+                self._one_sided(old_child, child_path, REMOVED)
+            elif new_child.kind != old_child.kind or new_child.definition != old_child.definition:
+                self._one_sided(old_child, child_path, REMOVED)
+                self._one_sided(new_child, child_path, ADDED)
+            else:
+                self._compare(old_child, new_child, child_path)
+        for name, new_child in new.children.items():
+            if name not in old.children:
+                self._one_sided(new_child, f"{path}/{name}", ADDED)
+
+        if old.kind == "module":
+            self._current = None
+
+    def _one_sided(self, node, path, status):
+        """A subtree present in only one of the documents"""
+        if node.kind in ("package", "root"):
+            for module_path, module in node.modules(path):
+                self.modules.append(ModuleDiff(module_path, module.definition or module.name, status))
+        elif node.kind == "module":
+            self.modules.append(ModuleDiff(path, node.definition or node.name, status))
+        else:
+            self._add(ContainerChange(path, node.definition, status, node=node))
+
+    def _add(self, change):
+        if self._current is None:
+            # Containers are only valid inside a module configuration; list stray ones on their own
+            self.modules.append(ModuleDiff(change.path, change.definition, CHANGED, [change]))
+        else:
+            self._current.containers.append(change)
+
+    # ---------- reporting ----------
+    def summary(self):
+        if not self.modules:
+            return "No differences"
+        added = removed = params = 0
+        for module in self.modules:
+            a, r, p = module.counts()
+            added, removed, params = added + a, removed + r, params + p
+        count = len(self.modules)
+        return (f"{count} module{'s differ' if count != 1 else ' differs'}: "
+                f"{added} container{'s' if added != 1 else ''} added, {removed} removed, "
+                f"{params} parameter{'s' if params != 1 else ''} changed")
+
+    def lines(self):
+        """Human-readable report, one change per line"""
+        for module in self.modules:
+            yield f"{MARKS[module.status]} Module {module.name}  {module.path}"
+            for container in module.containers:
+                yield f"    {MARKS[container.status]} {container.path}  [{container.definition}]"
+                for param in container.parameters:
+                    if param.status == CHANGED:
+                        yield (f"        ~ {param.name}: {format_param_value(param.old)} -> "
+                               f"{format_param_value(param.new)}")
+                    elif param.status == ADDED:
+                        yield f"        + {param.name}: {format_param_value(param.new)}"
+                    else:
+                        yield f"        - {param.name}: {format_param_value(param.old)}"
+        yield self.summary()
+
+    def to_dict(self):
+        """JSON-ready form of the report"""
+        def value(v):
+            return list(v) if isinstance(v, tuple) else v
+
+        return {
+            "modules": [{
+                "path": module.path,
+                "module": module.name,
+                "status": module.status,
+                "containers": [{
+                    "path": container.path,
+                    "definition": container.definition,
+                    "status": container.status,
+                    "parameters": [{"name": p.name, "status": p.status, "old": value(p.old), "new": value(p.new)}
+                                   for p in container.parameters],
+                } for container in module.containers],
+            } for module in self.modules],
+            "summary": self.summary(),
+        }
+
+
+def load_ecuc(source, label=None, keep_elements=False):
+    """read_ecuc_tree() inside a profiler span named after the file"""
+    if label is None:
+        label = os.path.basename(source) if isinstance(source, str) else "<document>"
+    with profiler.span("parse.ecuc_tree", file=label):
+        return read_ecuc_tree(source, keep_elements)
+
+
+def diff_files(old_source, new_source):
+    """Compare two ARXML documents (paths or file objects); old first"""
+    old_root = load_ecuc(old_source)
+    new_root = load_ecuc(new_source)
+    with profiler.span("diff.arxml"):
+        return ArxmlDiff(old_root, new_root)
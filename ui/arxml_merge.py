@@ -0,0 +1,278 @@
+# arxml_merge.py
+
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+
+from .arxml_diff import format_param_value, load_ecuc
+from .atomic_file import replacing
+from .build_edit.arxml_namespace import strip_namespace
+from .ecuc_tree import VALUE_LISTS, read_value
+from .profiling import profiler
+
+OURS = "ours"
+THEIRS = "theirs"
+
+# Nodes replaced wholesale when only one side changed them. Packages and
+# the root also hold non-ECUC elements the digests do not cover, so those
+# are always merged child by child.
+REPLACEABLE_KINDS = ("module", "container")
+
+
+@dataclass(slots=True)
+class MergeConflict:
+    path: str
+    kind: str  # "parameter", "delete/modify" or "definition"
+    name: str = ""  # parameter name, for parameter conflicts
+    base: object = None
+    ours: object = None
+    theirs: object = None
+
+    def describe(self):
+        if self.kind == "parameter":
+            def side(value):
+                return "<absent>" if value is None else format_param_value(value)
+            return (f"{self.path}/{self.name}: base {side(self.base)}, ours {side(self.ours)}, "
+                    f"theirs {side(self.theirs)}")
+        if self.kind == "definition":
+            return f"{self.path}: ours is {self.ours}, theirs is {self.theirs}"
+        return f"{self.path}: {self.ours} in ours, {self.theirs} in theirs"
+
+
+class ArxmlMerge:
+    """Three-way merge of ECUC documents at parameter granularity.
+
+    Packages, module configurations and containers are matched by AUTOSAR
+    path, parameters by definition name. A value changed on one side only
+    is taken from that side; a value changed differently on both sides is
+    a conflict, resolved toward `prefer` and recorded in `conflicts`.
+    Subtrees whose digests agree are not descended into, so merge time
+    follows the size of the changes rather than of the documents.
+
+    The merge is applied to the ours element tree, so ordering and all
+    non-ECUC content follow ours; containers and values taken from theirs
+    are moved over from the theirs tree.
+    """
+
+    def __init__(self, base, ours, theirs, prefer=OURS):
+        # base: EcucNode tree; ours / theirs: EcucNode trees read with keep_elements
+        self.prefer = prefer
+        self.conflicts = []
+        self.parameters_taken = 0
+        self.containers_replaced = 0
+        self.containers_added = 0
+        self.containers_removed = 0
+        self.root = ours.element
+        self.namespace = strip_namespace(ours.element)
+        strip_namespace(theirs.element)  # moved elements must match the ours tags
+        self._merge(base, ours, theirs, "")
+
+    # ---------- merging ----------
+    def _merge(self, base, ours, theirs, path):
+        """Both nodes exist at `path` with the same kind and definition"""
+        if ours.digest == theirs.digest:
+            return
+        if base is not None and ours.kind in REPLACEABLE_KINDS:
+            if base.digest == ours.digest:
+                self._replace(ours, theirs)
+                self.containers_replaced += 1
+                return
+            if base.digest == theirs.digest:
+                return
+        self._merge_params(base, ours, theirs, path)
+        self._merge_children(base, ours, theirs, path)
+
+    def _merge_params(self, base, ours, theirs, path):
+        if ours.params == theirs.params:
+            return
+        base_params = base.params if base is not None else {}
+        taken = set()
+        for name in dict.fromkeys([*ours.params, *theirs.params]):
+            ours_value, theirs_value = ours.params.get(name), theirs.params.get(name)
+            if ours_value == theirs_value:
+                continue
+            base_value = base_params.get(name)
+            if ours_value == base_value:
+                taken.add(name)
+            elif theirs_value != base_value:
+                self.conflicts.append(MergeConflict(path, "parameter", name, base_value, ours_value, theirs_value))
+                if self.prefer == THEIRS:
+                    taken.add(name)
+        if taken:
+            self._take_params(ours.element, theirs.element, taken)
+            self.parameters_taken += len(taken)
+
+    def _merge_children(self, base, ours, theirs, path):
+        base_children = base.children if base is not None else {}
+        removed = set()
+        added = []
+        for name, ours_child in ours.children.items():
+            child_path = f"{path}/{name}"
+            theirs_child = theirs.children.get(name)
+            base_child = base_children.get(name)
+            if theirs_child is None:
+                if base_child is None:
+                    continue  # added in ours
+                if base_child.digest == ours_child.digest or self._deleted_conflict(
+                        child_path, "modified", "deleted"):
+                    removed.add(ours_child.element)
+            elif ours_child.kind != theirs_child.kind or ours_child.definition != theirs_child.definition:
+                if base_child is not None and base_child.digest == theirs_child.digest:
+                    continue
+                if base_child is None or base_child.digest != ours_child.digest:
+                    self.conflicts.append(MergeConflict(child_path, "definition", ours=ours_child.definition,
+                                                        theirs=theirs_child.definition))
+                    if self.prefer != THEIRS:
+                        continue
+                self._replace(ours_child, theirs_child)
+                self.containers_replaced += 1
+            else:
+                if base_child is not None and (base_child.kind != ours_child.kind
+                                               or base_child.definition != ours_child.definition):
+                    base_child = None
+                self._merge(base_child, ours_child, theirs_child, child_path)
+        for name, theirs_child in theirs.children.items():
+            if name in ours.children:
+                continue
+            base_child = base_children.get(name)
+            if base_child is None or (base_child.digest != theirs_child.digest and self._deleted_conflict(
+                    f"{path}/{name}", "deleted", "modified")):
+                added.append(theirs_child.element)
+        if removed:
+            self._remove_children(ours.element, removed)
+            self.containers_removed += len(removed)
+        if added:
+            self._add_children(ours.element, theirs.element, added)
+            self.containers_added += len(added)
+
+    def _deleted_conflict(self, path, ours_state, theirs_state):
+        """Record a delete/modify conflict; True when theirs wins it"""
+        self.conflicts.append(MergeConflict(path, "delete/modify", ours=ours_state, theirs=theirs_state))
+        return self.prefer == THEIRS
+
+    # ---------- element edits ----------
+    def _replace(self, ours, theirs):
+        """Give ours' element the content of theirs', keeping its place in the tree"""
+        elem, source = ours.element, theirs.element
+        tail = elem.tail
+        elem.clear()
+        elem.tag, elem.text, elem.tail = source.tag, source.text, tail
+        elem.attrib.update(source.attrib)
+        elem.extend(list(source))
+
+    def _take_params(self, elem, source, names):
+        """Swap the values of the named parameters in `elem` for those in `source`"""
+        incoming = {}
+        for wrapper in source:
+            if wrapper.tag in VALUE_LISTS:
+                for value_elem in wrapper:
+                    name = read_value(value_elem)[0]
+                    if name in names:
+                        incoming.setdefault(name, (wrapper.tag, []))[1].append(value_elem)
+        placed = set()
+        for wrapper in list(elem):
+            if wrapper.tag not in VALUE_LISTS:
+                continue
+            kept = []
+            for value_elem in wrapper:
+                name = read_value(value_elem)[0]
+                if name not in names:
+                    kept.append(value_elem)
+                elif name not in placed and name in incoming and incoming[name][0] == wrapper.tag:
+                    # Replace in place, where ours had the parameter
+                    kept.extend(incoming[name][1])
+                    placed.add(name)
+            self._set_children(elem, wrapper, kept)
+        for name, (tag, value_elems) in incoming.items():
+            if name not in placed:
+                self._wrapper(elem, source, tag).extend(value_elems)
+
+    def _remove_children(self, elem, removed):
+        for wrapper in list(elem):
+            if any(child in removed for child in wrapper):
+                self._set_children(elem, wrapper, [child for child in wrapper if child not in removed])
+
+    def _add_children(self, elem, source, added):
+        added = set(added)
+        for wrapper in source:
+            children = [child for child in wrapper if child in added]
+            if children:
+                self._wrapper(elem, source, wrapper.tag).extend(children)
+
+    @staticmethod
+    def _set_children(elem, wrapper, children):
+        if children:
+            wrapper[:] = children
+        else:
+            elem.remove(wrapper)  # no empty PARAMETER-VALUES / SUB-CONTAINERS left behind
+
+    @staticmethod
+    def _wrapper(elem, source, tag):
+        """`elem`'s child wrapper named `tag`, created where `source` has it if missing"""
+        for child in elem:
+            if child.tag == tag:
+                return child
+        # Keep schema order: insert after the last sibling that precedes `tag` in source
+        preceding = set()
+        for child in source:
+            if child.tag == tag:
+                break
+            preceding.add(child.tag)
+        index = 0
+        for position, child in enumerate(elem):
+            if child.tag in preceding:
+                index = position + 1
+        wrapper = ET.Element(tag)
+        elem.insert(index, wrapper)
+        return wrapper
+
+    # ---------- output ----------
+    def summary(self):
+        conflicts = len(self.conflicts)
+        return (f"From theirs: {self.parameters_taken} parameter{'s' if self.parameters_taken != 1 else ''}, "
+                f"{self.containers_replaced} container{'s' if self.containers_replaced != 1 else ''} replaced, "
+                f"{self.containers_added} added, {self.containers_removed} removed; "
+                f"{conflicts} conflict{'s' if conflicts != 1 else ''}")
+
+    def lines(self):
+        """Human-readable conflict report"""
+        for conflict in self.conflicts:
+            yield f"CONFLICT ({conflict.kind}) {conflict.describe()}"
+        yield self.summary()
+
+    def to_dict(self):
+        def value(v):
+            return list(v) if isinstance(v, tuple) else v
+
+        return {
+            "conflicts": [{
+                "path": c.path,
+                "kind": c.kind,
+                "name": c.name,
+                "base": value(c.base),
+                "ours": value(c.ours),
+                "theirs": value(c.theirs),
+            } for c in self.conflicts],
+            "resolved_to": self.prefer,
+            "summary": self.summary(),
+        }
+
+    def write(self, filepath):
+        """Write the merged document, indented two spaces, replacing `filepath` atomically.
+
+        Whitespace is regenerated, so the output does not depend on how
+        either input was formatted.
+        """
+        if self.namespace:
+            self.root.set('xmlns', self.namespace)
+        ET.indent(self.root, space="  ")
+        with replacing(filepath, 'wb') as f:
+            ET.ElementTree(self.root).write(f, encoding="utf-8", xml_declaration=True)
+
+
+def merge_files(base_source, ours_source, theirs_source, prefer=OURS):
+    """Three-way merge of ARXML documents (paths or file objects)"""
+    base = load_ecuc(base_source)
+    ours = load_ecuc(ours_source, keep_elements=True)
+    theirs = load_ecuc(theirs_source, keep_elements=True)
+    with profiler.span("merge.arxml"):
+        return ArxmlMerge(base, ours, theirs, prefer)
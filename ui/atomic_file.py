@@ -0,0 +1,57 @@
+# atomic_file.py
+
+import os
+import tempfile
+from contextlib import contextmanager
+
+# os.umask() can only be read by setting it, which is not safe once other
+# threads create files, so it is read once at import
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def file_mode(filepath):
+    """Mode a rewrite of `filepath` should get: the current file's, else 0666 minus the umask"""
+    try:
+        return os.stat(filepath).st_mode & 0o7777
+    except OSError:
+        return 0o666 & ~_UMASK
+
+
+def open_replacement(filepath, mode="w", **open_args):
+    """(file object, temp path) for a temporary file next to `filepath`.
+
+    Being in the same directory keeps the final rename on one filesystem.
+    """
+    directory = os.path.dirname(os.path.abspath(filepath))
+    fd, tmp_path = tempfile.mkstemp(prefix=".arxml-", suffix=".tmp", dir=directory)
+    try:
+        return open(fd, mode, **open_args), tmp_path
+    except BaseException:
+        os.close(fd)
+        os.unlink(tmp_path)
+        raise
+
+
+def commit_replacement(tmp_path, filepath):
+    """Rename a closed temporary file over `filepath`.
+
+    mkstemp creates files 0600; the file gets the mode a plain open() (or
+    the file it replaces) would have had first.
+    """
+    os.chmod(tmp_path, file_mode(filepath))
+    os.replace(tmp_path, filepath)
+
+
+@contextmanager
+def replacing(filepath, mode="w", **open_args):
+    """File object whose content replaces `filepath` on a clean exit; on error `filepath` is untouched"""
+    f, tmp_path = open_replacement(filepath, mode, **open_args)
+    try:
+        with f:
+            yield f
+        commit_replacement(tmp_path, filepath)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
@@ -6,6 +6,14 @@ import xml.etree.ElementTree as ET
 import os
 from datetime import datetime
 from .drivers.adc_code import ADC_H_TEMPLATE, ADC_C_TEMPLATE
+from .output_writer import OutputSetWriter
+from .arxml_namespace import strip_namespace
+from .records import AdcChannelRecord, AdcGroupRecord, AdcHwUnitRecord
+from ..profiling import profiler
+
+# Byte alignment of the static result pool and of every group slice in it (word/DMA aligned)
+ADC_RESULT_POOL_ALIGNMENT = 4
+ADC_RESULT_SAMPLE_BYTES = 2  # Adc_ValueGroupType is uint16
 
 class ARXMLtoADCGenerator(ttk.Frame):
     def __init__(self, parent):
@@ -15,6 +23,7 @@ class ARXMLtoADCGenerator(ttk.Frame):
         
         self.arxml_file_path = None
         self.status_var = tk.StringVar(value="Ready")
+        self.generation_warnings = []  # problems the last generation went ahead despite
         self.setup_ui()
 
     def get_default_config(self):
@@ -145,7 +154,8 @@ class ARXMLtoADCGenerator(ttk.Frame):
         try:
             self.status_var.set("Parsing ARXML...")
             self.config_data = self.get_default_config()
-            tree = ET.parse(self.arxml_file_path)
+            with profiler.span('parse.adc', file=os.path.basename(self.arxml_file_path)):
+                tree = ET.parse(self.arxml_file_path)
             root = tree.getroot()
             
             success = self.extract_config_from_arxml(root)
@@ -166,17 +176,23 @@ class ARXMLtoADCGenerator(ttk.Frame):
             self.status_var.set("Error occurred")
             messagebox.showerror("Error", f"An error occurred: {str(e)}")
 
+    def load_arxml_tree(self, tree):
+        """Extract, display and generate from an already parsed ARXML tree, without dialogs.
+
+        Used by watch mode; False when the tree holds no ADC configuration
+        or nothing was generated.
+        """
+        self.config_data = self.get_default_config()
+        if not self.extract_config_from_arxml(tree.getroot()):
+            return False
+        self.display_configuration()
+        return self.generate_adc_cfg_h(interactive=False)
+
+    @profiler.timed('extract.adc')
     def extract_config_from_arxml(self, root):
-        container_paths = [
-            './/ECUC-CONTAINER-VALUE',
-            './/{http://autosar.org/schema/r4.0}ECUC-CONTAINER-VALUE',
-        ]
-        
-        containers = []
-        for path in container_paths:
-            found = root.findall(path)
-            if found:
-                containers.extend(found)
+        strip_namespace(root)  # extraction matches bare AUTOSAR tag names
+        with profiler.span('index.adc'):
+            containers = root.findall('.//ECUC-CONTAINER-VALUE')
 
         config_found = False
         
@@ -279,18 +295,7 @@ class ARXMLtoADCGenerator(ttk.Frame):
         """Extract AdcChannel configuration"""
         channel_id = None
         channel_symbolic_name = None
-        channel_config = {
-            'conv_time': 100,
-            'high_limit': 4095,
-            'low_limit': 0,
-            'limit_check': False,
-            'range_select': 'ADC_RANGE_UNDER_LOW',
-            'ref_voltsrc_high': False,
-            'ref_voltsrc_low': False,
-            'resolution': 12,
-            'samp_time': 10,
-            'container_name': container_name
-        }
+        channel_config = AdcChannelRecord(container_name=container_name)
         
         # Extract numerical parameters
         for param in container.findall('.//ECUC-NUMERICAL-PARAM-VALUE'):
@@ -303,15 +308,15 @@ class ARXMLtoADCGenerator(ttk.Frame):
                     if param_name == 'AdcChannelId':
                         channel_id = value
                     elif param_name == 'AdcChannelConvTime':
-                        channel_config['conv_time'] = value
+                        channel_config.conv_time = value
                     elif param_name == 'AdcChannelHighLimit':
-                        channel_config['high_limit'] = value
+                        channel_config.high_limit = value
                     elif param_name == 'AdcChannelLowLimit':
-                        channel_config['low_limit'] = value
+                        channel_config.low_limit = value
                     elif param_name == 'AdcChannelResolution':
-                        channel_config['resolution'] = value
+                        channel_config.resolution = value
                     elif param_name == 'AdcChannelSampTime':
-                        channel_config['samp_time'] = value
+                        channel_config.samp_time = value
                 except ValueError:
                     continue
 
@@ -332,11 +337,11 @@ class ARXMLtoADCGenerator(ttk.Frame):
                 param_name = param_name_elem.text
                 value = value_elem.text.strip().lower() in ['true', '1', 'on', 'std_on']
                 if param_name == 'AdcChannelLimitCheck':
-                    channel_config['limit_check'] = value
+                    channel_config.limit_check = value
                 elif param_name == 'AdcChannelRefVoltsrcHigh':
-                    channel_config['ref_voltsrc_high'] = value
+                    channel_config.ref_voltsrc_high = value
                 elif param_name == 'AdcChannelRefVoltsrcLow':
-                    channel_config['ref_voltsrc_low'] = value
+                    channel_config.ref_voltsrc_low = value
 
         # Extract enumeration parameters
         for param in container.findall('.//ECUC-ENUMERATION-PARAM-VALUE'):
@@ -345,7 +350,7 @@ class ARXMLtoADCGenerator(ttk.Frame):
             if param_name_elem is not None and value_elem is not None:
                 param_name = param_name_elem.text
                 if param_name == 'AdcChannelRangeSelect':
-                    channel_config['range_select'] = value_elem.text
+                    channel_config.range_select = value_elem.text
 
         # If no channel ID found, try to extract from container name
         if channel_id is None:
@@ -354,29 +359,14 @@ class ARXMLtoADCGenerator(ttk.Frame):
             channel_id = int(match.group(1)) if match else len(self.config_data['channels'])
 
         if channel_id is not None:
-            channel_config.update({
-                'id': channel_id,
-                'symbolic_name': channel_symbolic_name or f'ADC_CHANNEL_{channel_id}'
-            })
+            channel_config.id = channel_id
+            channel_config.symbolic_name = channel_symbolic_name or f'ADC_CHANNEL_{channel_id}'
             self.config_data['channels'].append(channel_config)
 
     def _extract_group_config(self, container, container_name):
         """Extract AdcGroup configuration"""
         group_id = None
-        group_config = {
-            'access_mode': 'ADC_ACCESS_MODE_SINGLE',
-            'conversion_mode': 'ADC_CONV_MODE_ONESHOT',
-            'priority': 0,
-            'replacement': 'ADC_GROUP_REPL_ABORT_RESTART',
-            'trigg_src': 'ADC_TRIGG_SRC_SW',
-            'hw_trigg_signal': 'ADC_HW_TRIG_RISING_EDGE',
-            'hw_trigg_timer': 0,
-            'notification': False,
-            'streaming_buffer_mode': 'ADC_STREAM_BUFFER_LINEAR',
-            'streaming_num_samples': 1,
-            'group_definition': [],
-            'container_name': container_name
-        }
+        group_config = AdcGroupRecord(container_name=container_name)
         
         # Extract numerical parameters
         for param in container.findall('.//ECUC-NUMERICAL-PARAM-VALUE'):
@@ -389,13 +379,13 @@ class ARXMLtoADCGenerator(ttk.Frame):
                     if param_name == 'AdcGroupId':
                         group_id = value
                     elif param_name == 'AdcGroupPriority':
-                        group_config['priority'] = value
+                        group_config.priority = value
                     elif param_name == 'AdcStreamingNumSamples':
-                        group_config['streaming_num_samples'] = value
+                        group_config.streaming_num_samples = value
                     elif param_name == 'AdcHwTrigTimer':
-                        group_config['hw_trigg_timer'] = value
+                        group_config.hw_trigg_timer = value
                     elif param_name == 'AdcGroupDefinition':
-                        group_config['group_definition'].append(value)
+                        group_config.group_definition.append(value)
                 except ValueError:
                     continue
 
@@ -407,7 +397,7 @@ class ARXMLtoADCGenerator(ttk.Frame):
                 param_name = param_name_elem.text
                 value = value_elem.text.strip().lower() in ['true', '1', 'on', 'std_on']
                 if param_name == 'AdcNotification':
-                    group_config['notification'] = value
+                    group_config.notification = value
 
         # Extract enumeration parameters
         for param in container.findall('.//ECUC-ENUMERATION-PARAM-VALUE'):
@@ -425,7 +415,7 @@ class ARXMLtoADCGenerator(ttk.Frame):
                     'AdcStreamingBufferMode': 'streaming_buffer_mode'
                 }
                 if param_name in enum_mapping:
-                    group_config[enum_mapping[param_name]] = value
+                    setattr(group_config, enum_mapping[param_name], value)
 
         # If no group ID found, try to extract from container name
         if group_id is None:
@@ -434,7 +424,7 @@ class ARXMLtoADCGenerator(ttk.Frame):
             group_id = int(match.group(1)) if match else len(self.config_data['groups'])
 
         if group_id is not None:
-            group_config['id'] = group_id
+            group_config.id = group_id
             self.config_data['groups'].append(group_config)
 
     def _extract_published_information(self, container):
@@ -492,7 +482,7 @@ class ARXMLtoADCGenerator(ttk.Frame):
 
     def _extract_hw_unit_config(self, container, container_name):
         """Extract AdcHwUnit configuration"""
-        hw_unit_config = {'container_name': container_name}
+        hw_unit_config = AdcHwUnitRecord(container_name=container_name)
         
         # Extract boolean parameters
         for param in container.findall('.//ECUC-BOOLEAN-PARAM-VALUE'):
@@ -502,7 +492,7 @@ class ARXMLtoADCGenerator(ttk.Frame):
                 param_name = param_name_elem.text
                 value = value_elem.text.strip().lower() in ['true', '1', 'on', 'std_on']
                 if param_name == 'AdcClockSource':
-                    hw_unit_config['clock_source'] = value
+                    hw_unit_config.clock_source = value
         
         # Extract numerical parameters
         for param in container.findall('.//ECUC-NUMERICAL-PARAM-VALUE'):
@@ -513,9 +503,9 @@ class ARXMLtoADCGenerator(ttk.Frame):
                 try:
                     value = int(value_elem.text)
                     if param_name == 'AdcHwUnitId':
-                        hw_unit_config['hw_unit_id'] = value
+                        hw_unit_config.hw_unit_id = value
                     elif param_name == 'AdcPrescale':
-                        hw_unit_config['prescale'] = value
+                        hw_unit_config.prescale = value
                 except ValueError:
                     continue
         
@@ -534,6 +524,7 @@ class ARXMLtoADCGenerator(ttk.Frame):
         else:
             return str(value)
 
+    @profiler.timed('view.adc')
     def display_configuration(self):
         """Display extracted configuration in structured format"""
         config_text = "=" * 80 + "\n"
@@ -568,17 +559,17 @@ class ARXMLtoADCGenerator(ttk.Frame):
             config_text += f"ADC CHANNELS ({len(self.config_data['channels'])} found)\n"
             config_text += "-" * 40 + "\n"
             for channel in self.config_data['channels']:
-                config_text += f"  Channel {channel['id']}:\n"
-                config_text += f"    Symbolic Name: {channel['symbolic_name']}\n"
-                config_text += f"    Resolution: {channel['resolution']} bits\n"
-                config_text += f"    Conversion Time: {channel['conv_time']}\n"
-                config_text += f"    Sample Time: {channel['samp_time']}\n"
-                config_text += f"    High Limit: {channel['high_limit']}\n"
-                config_text += f"    Low Limit: {channel['low_limit']}\n"
-                config_text += f"    Limit Check: {self._format_value(channel['limit_check'])}\n"
-                config_text += f"    Range Select: {channel['range_select']}\n"
-                config_text += f"    Ref Volt Src High: {self._format_value(channel['ref_voltsrc_high'])}\n"
-                config_text += f"    Ref Volt Src Low: {self._format_value(channel['ref_voltsrc_low'])}\n"
+                config_text += f"  Channel {channel.id}:\n"
+                config_text += f"    Symbolic Name: {channel.symbolic_name}\n"
+                config_text += f"    Resolution: {channel.resolution} bits\n"
+                config_text += f"    Conversion Time: {channel.conv_time}\n"
+                config_text += f"    Sample Time: {channel.samp_time}\n"
+                config_text += f"    High Limit: {channel.high_limit}\n"
+                config_text += f"    Low Limit: {channel.low_limit}\n"
+                config_text += f"    Limit Check: {self._format_value(channel.limit_check)}\n"
+                config_text += f"    Range Select: {channel.range_select}\n"
+                config_text += f"    Ref Volt Src High: {self._format_value(channel.ref_voltsrc_high)}\n"
+                config_text += f"    Ref Volt Src Low: {self._format_value(channel.ref_voltsrc_low)}\n"
                 
             config_text += "\n"
         else:
@@ -588,23 +579,31 @@ class ARXMLtoADCGenerator(ttk.Frame):
         
         # ADC Groups
         if self.config_data['groups']:
+            layout = self.compute_result_layout()
             config_text += f"ADC GROUPS ({len(self.config_data['groups'])} found)\n"
             config_text += "-" * 40 + "\n"
             for group in self.config_data['groups']:
-                config_text += f"  Group {group['id']}:\n"
-                config_text += f"    Access Mode: {group['access_mode']}\n"
-                config_text += f"    Conversion Mode: {group['conversion_mode']}\n"
-                config_text += f"    Priority: {group['priority']}\n"
-                config_text += f"    Replacement: {group['replacement']}\n"
-                config_text += f"    Trigger Source: {group['trigg_src']}\n"
-                config_text += f"    HW Trigger Signal: {group['hw_trigg_signal']}\n"
-                config_text += f"    HW Trigger Timer: {group['hw_trigg_timer']}\n"
-                config_text += f"    Notification: {self._format_value(group['notification'])}\n"
-                config_text += f"    Streaming Buffer Mode: {group['streaming_buffer_mode']}\n"
-                config_text += f"    Streaming Num Samples: {group['streaming_num_samples']}\n"
-                if group['group_definition']:
-                    config_text += f"    Group Definition: {group['group_definition']}\n"
-                config_text += f"    Container: {group.get('container_name', 'Unknown')}\n"
+                config_text += f"  Group {group.id}:\n"
+                config_text += f"    Access Mode: {group.access_mode}\n"
+                config_text += f"    Conversion Mode: {group.conversion_mode}\n"
+                config_text += f"    Priority: {group.priority}\n"
+                config_text += f"    Replacement: {group.replacement}\n"
+                config_text += f"    Trigger Source: {group.trigg_src}\n"
+                config_text += f"    HW Trigger Signal: {group.hw_trigg_signal}\n"
+                config_text += f"    HW Trigger Timer: {group.hw_trigg_timer}\n"
+                config_text += f"    Notification: {self._format_value(group.notification)}\n"
+                config_text += f"    Streaming Buffer Mode: {group.streaming_buffer_mode}\n"
+                config_text += f"    Streaming Num Samples: {group.streaming_num_samples}\n"
+                if group.group_definition:
+                    config_text += f"    Group Definition: {group.group_definition}\n"
+                slot = layout['groups'].get(group.id)
+                if slot:
+                    config_text += f"    Result Buffer: offset {slot['offset']}, {slot['size']} sample(s) " \
+                                   f"({slot['num_channels']} ch x {slot['num_samples']})\n"
+                config_text += f"    Container: {group.container_name}\n"
+            config_text += f"  Result Pool: {layout['pool_size']} samples ({layout['pool_bytes']} bytes RAM)\n"
+            for warning in layout['warnings']:
+                config_text += f"  WARNING: {warning}\n"
             config_text += "\n"
         else:
             config_text += "ADC GROUPS\n"
@@ -639,13 +638,13 @@ class ARXMLtoADCGenerator(ttk.Frame):
             config_text += "-" * 40 + "\n"
             for i, hw_unit in enumerate(self.config_data['hw_units']):
                 config_text += f"  HW Unit {i}:\n"
-                if 'hw_unit_id' in hw_unit:
-                    config_text += f"    HW Unit ID: {hw_unit['hw_unit_id']}\n"
-                if 'clock_source' in hw_unit:
-                    config_text += f"    Clock Source: {self._format_value(hw_unit['clock_source'])}\n"
-                if 'prescale' in hw_unit:
-                    config_text += f"    Prescale: {hw_unit['prescale']}\n"
-                config_text += f"    Container: {hw_unit.get('container_name', 'Unknown')}\n"
+                if hw_unit.hw_unit_id is not None:
+                    config_text += f"    HW Unit ID: {hw_unit.hw_unit_id}\n"
+                if hw_unit.clock_source is not None:
+                    config_text += f"    Clock Source: {self._format_value(hw_unit.clock_source)}\n"
+                if hw_unit.prescale is not None:
+                    config_text += f"    Prescale: {hw_unit.prescale}\n"
+                config_text += f"    Container: {hw_unit.container_name}\n"
             config_text += "\n"
         
         # Validation Status
@@ -665,11 +664,109 @@ class ARXMLtoADCGenerator(ttk.Frame):
         self.config_text.insert(1.0, config_text)
         self.config_text.config(state='disabled')
 
-    def generate_adc_cfg_h(self):
-        """Generate ADC_CFG.H file content"""
+    def compute_result_layout(self):
+        """Size every group's result buffer and place it in one static pool
+
+        A group needs one sample per channel, times AdcStreamingNumSamples in
+        streaming access mode. Buffers are laid out channel-major as the
+        AUTOSAR result buffer requires (all samples of channel 0, then channel
+        1, ...) and each group slice starts on an ADC_RESULT_POOL_ALIGNMENT
+        boundary.
+        """
+        align_samples = max(1, ADC_RESULT_POOL_ALIGNMENT // ADC_RESULT_SAMPLE_BYTES)
+        channel_ids = {channel.id for channel in self.config_data['channels']}
+        groups = {}
+        warnings = []
+        offset = 0
+        for group in sorted(self.config_data['groups'], key=lambda g: g.id):
+            channels = list(group.group_definition)
+            if not channels:
+                warnings.append(f"Group {group.id} has no AdcGroupDefinition channels")
+            unknown = [ch for ch in channels if ch not in channel_ids]
+            if unknown:
+                warnings.append(f"Group {group.id} references unconfigured channel(s) {unknown}")
+            streaming = group.access_mode == 'ADC_ACCESS_MODE_STREAMING'
+            num_samples = max(1, group.streaming_num_samples) if streaming else 1
+            offset = -(-offset // align_samples) * align_samples
+            size = len(channels) * num_samples
+            groups[group.id] = {
+                'channels': channels,
+                'num_channels': len(channels),
+                'num_samples': num_samples,
+                'offset': offset,
+                'size': size,
+            }
+            offset += size
+
+        pool_size = -(-offset // align_samples) * align_samples
+        return {
+            'groups': groups,
+            'pool_size': pool_size,
+            'pool_bytes': pool_size * ADC_RESULT_SAMPLE_BYTES,
+            'descriptor_count': max(groups) + 1 if groups else 1,
+            'warnings': warnings,
+        }
+
+    def generate_adc_result_buffers(self):
+        """Generate the static result pool and const group descriptors emitted into Adc.c"""
+        layout = self.compute_result_layout()
+        groups = layout['groups']
+
+        content = """/*==================================================================================================
+*                              ADC RESULT BUFFERS
+==================================================================================================*/
+typedef struct {
+    uint16 ResultOffset;          /* first element of the group in Adc_ResultPool */
+    uint16 ResultSize;            /* NumChannels * NumSamples */
+    uint16 NumSamples;            /* samples per channel, 1 for single access */
+    uint8 NumChannels;
+    const uint8* Channels;        /* hardware channel per result row */
+} Adc_GroupDescriptorType;
+
+"""
+        for group_id, slot in groups.items():
+            if slot['channels']:
+                channel_list = ", ".join(f"{ch}U" for ch in slot['channels'])
+                content += f"static const uint8 Adc_Group{group_id}_Channels[{slot['num_channels']}U] = {{ {channel_list} }};\n"
+
+        content += f"""
+static Adc_ValueGroupType Adc_ResultPool[ADC_RESULT_POOL_SIZE] __attribute__((aligned(ADC_RESULT_POOL_ALIGNMENT)));
+
+/* Group ID -> result buffer slice; offsets and sizes are fixed at generation time */
+static const Adc_GroupDescriptorType Adc_GroupDescriptors[ADC_GROUP_DESCRIPTOR_COUNT] = {{
+"""
+        for group_id in range(layout['descriptor_count']):
+            slot = groups.get(group_id)
+            if not slot or not slot['channels']:
+                content += f"    {{ 0U, 0U, 0U, 0U, NULL_PTR }},   /* {group_id}: not configured */\n"
+            else:
+                content += (f"    {{ {slot['offset']}U, {slot['size']}U, {slot['num_samples']}U, {slot['num_channels']}U, "
+                            f"Adc_Group{group_id}_Channels }},   /* ADC_GROUP_{group_id} */\n")
+        content += """};
+
+/* Active result buffer per group; Adc_SetupResultBuffer may redirect it to an application buffer */
+static Adc_ValueGroupType* Adc_GroupResultPtr[ADC_GROUP_DESCRIPTOR_COUNT] = {
+"""
+        for group_id in range(layout['descriptor_count']):
+            slot = groups.get(group_id)
+            if not slot or not slot['channels']:
+                content += "    NULL_PTR,\n"
+            else:
+                content += f"    &Adc_ResultPool[{slot['offset']}U],\n"
+        content += """};
+
+/* Next sample index written per group (circular over NumSamples) */
+static uint16 Adc_GroupSampleIndex[ADC_GROUP_DESCRIPTOR_COUNT];
+"""
+        return content
+
+    @profiler.timed('codegen.adc')
+    def generate_adc_cfg_h(self, interactive=True):
+        """Generate ADC_CFG.H file content; False when there is nothing to generate"""
         if not self.config_data['channels'] and not self.config_data['groups']:
-            messagebox.showwarning("Warning", "No ADC configuration available.")
-            return
+            if interactive:
+                messagebox.showwarning("Warning", "No ADC configuration available.")
+            return False
 
         arxml_filename = os.path.basename(self.arxml_file_path) if self.arxml_file_path else 'Unknown'
         generation_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
@@ -745,7 +842,7 @@ class ARXMLtoADCGenerator(ttk.Frame):
 ==================================================================================================*/
 """
             for channel in self.config_data['channels']:
-                content += f"#define {channel['symbolic_name']:<40} ({channel['id']}U)\n"
+                content += f"#define {channel.symbolic_name:<40} ({channel.id}U)\n"
             
             content += """
 /*==================================================================================================
@@ -753,15 +850,15 @@ class ARXMLtoADCGenerator(ttk.Frame):
 ==================================================================================================*/
 """
             for channel in self.config_data['channels']:
-                content += f"#define {channel['symbolic_name']}_CONV_TIME        ({channel['conv_time']}U)\n"
-                content += f"#define {channel['symbolic_name']}_HIGH_LIMIT       ({channel['high_limit']}U)\n"
-                content += f"#define {channel['symbolic_name']}_LIMIT_CHECK      {'STD_ON' if channel['limit_check'] else 'STD_OFF'}\n"
-                content += f"#define {channel['symbolic_name']}_LOW_LIMIT        ({channel['low_limit']}U)\n"
-                content += f"#define {channel['symbolic_name']}_RANGE_SELECT     {channel['range_select']}\n"
-                content += f"#define {channel['symbolic_name']}_REF_VOLT_HIGH    {'STD_ON' if channel['ref_voltsrc_high'] else 'STD_OFF'}\n"
-                content += f"#define {channel['symbolic_name']}_REF_VOLT_LOW     {'STD_ON' if channel['ref_voltsrc_low'] else 'STD_OFF'}\n"
-                content += f"#define {channel['symbolic_name']}_RESOLUTION       ({channel['resolution']}U)\n"
-                content += f"#define {channel['symbolic_name']}_SAMP_TIME        ({channel['samp_time']}U)\n"
+                content += f"#define {channel.symbolic_name}_CONV_TIME        ({channel.conv_time}U)\n"
+                content += f"#define {channel.symbolic_name}_HIGH_LIMIT       ({channel.high_limit}U)\n"
+                content += f"#define {channel.symbolic_name}_LIMIT_CHECK      {'STD_ON' if channel.limit_check else 'STD_OFF'}\n"
+                content += f"#define {channel.symbolic_name}_LOW_LIMIT        ({channel.low_limit}U)\n"
+                content += f"#define {channel.symbolic_name}_RANGE_SELECT     {channel.range_select}\n"
+                content += f"#define {channel.symbolic_name}_REF_VOLT_HIGH    {'STD_ON' if channel.ref_voltsrc_high else 'STD_OFF'}\n"
+                content += f"#define {channel.symbolic_name}_REF_VOLT_LOW     {'STD_ON' if channel.ref_voltsrc_low else 'STD_OFF'}\n"
+                content += f"#define {channel.symbolic_name}_RESOLUTION       ({channel.resolution}U)\n"
+                content += f"#define {channel.symbolic_name}_SAMP_TIME        ({channel.samp_time}U)\n"
                 content += "\n"
 
         # Add Group Symbolic Names and Configuration
@@ -771,7 +868,7 @@ class ARXMLtoADCGenerator(ttk.Frame):
 ==================================================================================================*/
 """
             for group in self.config_data['groups']:
-                content += f"#define ADC_GROUP_{group['id']:<30} ({group['id']}U)\n"
+                content += f"#define ADC_GROUP_{group.id:<30} ({group.id}U)\n"
             
             content += """
 /*==================================================================================================
@@ -779,18 +876,33 @@ class ARXMLtoADCGenerator(ttk.Frame):
 ==================================================================================================*/
 """
             for group in self.config_data['groups']:
-                content += f"#define ADC_GROUP_{group['id']}_ACCESS_MODE          {group['access_mode']}\n"
-                content += f"#define ADC_GROUP_{group['id']}_CONVERSION_MODE      {group['conversion_mode']}\n"
-                content += f"#define ADC_GROUP_{group['id']}_PRIORITY             ({group['priority']}U)\n"
-                content += f"#define ADC_GROUP_{group['id']}_REPLACEMENT          {group['replacement']}\n"
-                content += f"#define ADC_GROUP_{group['id']}_TRIGGER_SRC          {group['trigg_src']}\n"
-                content += f"#define ADC_GROUP_{group['id']}_NUM_SAMPLES          ({group['streaming_num_samples']}U)\n"
-                content += f"#define ADC_GROUP_{group['id']}_HW_TRIGGER_SIGNAL    {group['hw_trigg_signal']}\n"
-                content += f"#define ADC_GROUP_{group['id']}_HW_TRIGGER_TIMER     ({group['hw_trigg_timer']}U)\n"
-                content += f"#define ADC_GROUP_{group['id']}_NOTIFICATION         {'STD_ON' if group['notification'] else 'STD_OFF'}\n"
-                content += f"#define ADC_GROUP_{group['id']}_STREAM_BUFFER_MODE   {group['streaming_buffer_mode']}\n"
+                content += f"#define ADC_GROUP_{group.id}_ACCESS_MODE          {group.access_mode}\n"
+                content += f"#define ADC_GROUP_{group.id}_CONVERSION_MODE      {group.conversion_mode}\n"
+                content += f"#define ADC_GROUP_{group.id}_PRIORITY             ({group.priority}U)\n"
+                content += f"#define ADC_GROUP_{group.id}_REPLACEMENT          {group.replacement}\n"
+                content += f"#define ADC_GROUP_{group.id}_TRIGGER_SRC          {group.trigg_src}\n"
+                content += f"#define ADC_GROUP_{group.id}_NUM_SAMPLES          ({group.streaming_num_samples}U)\n"
+                content += f"#define ADC_GROUP_{group.id}_HW_TRIGGER_SIGNAL    {group.hw_trigg_signal}\n"
+                content += f"#define ADC_GROUP_{group.id}_HW_TRIGGER_TIMER     ({group.hw_trigg_timer}U)\n"
+                content += f"#define ADC_GROUP_{group.id}_NOTIFICATION         {'STD_ON' if group.notification else 'STD_OFF'}\n"
+                content += f"#define ADC_GROUP_{group.id}_STREAM_BUFFER_MODE   {group.streaming_buffer_mode}\n"
                 content += "\n"
 
+        # Add Result Buffer Layout
+        layout = self.compute_result_layout()
+        content += f"""/*==================================================================================================
+*                              ADC RESULT BUFFER LAYOUT
+==================================================================================================*/
+#define ADC_RESULT_POOL_ALIGNMENT            ({ADC_RESULT_POOL_ALIGNMENT}U)
+#define ADC_RESULT_POOL_SIZE                 ({max(layout['pool_size'], 1)}U)   /* {layout['pool_bytes']} bytes */
+#define ADC_GROUP_DESCRIPTOR_COUNT           ({layout['descriptor_count']}U)
+"""
+        for group_id, slot in layout['groups'].items():
+            content += f"#define ADC_GROUP_{group_id}_NUM_CHANNELS         ({slot['num_channels']}U)\n"
+            content += f"#define ADC_GROUP_{group_id}_RESULT_OFFSET        ({slot['offset']}U)\n"
+            content += f"#define ADC_GROUP_{group_id}_RESULT_SIZE          ({slot['size']}U)\n"
+        content += "\n"
+
         # Add Published Information
         if self.config_data['published_information']:
             content += """/*==================================================================================================
@@ -812,12 +924,12 @@ class ARXMLtoADCGenerator(ttk.Frame):
 ==================================================================================================*/
 """
             for i, hw_unit in enumerate(self.config_data['hw_units']):
-                if 'hw_unit_id' in hw_unit:
-                    content += f"#define ADC_HW_UNIT_{i}_ID                   ({hw_unit['hw_unit_id']}U)\n"
-                if 'clock_source' in hw_unit:
-                    content += f"#define ADC_HW_UNIT_{i}_CLOCK_SOURCE         {'STD_ON' if hw_unit['clock_source'] else 'STD_OFF'}\n"
-                if 'prescale' in hw_unit:
-                    content += f"#define ADC_HW_UNIT_{i}_PRESCALE             ({hw_unit['prescale']}U)\n"
+                if hw_unit.hw_unit_id is not None:
+                    content += f"#define ADC_HW_UNIT_{i}_ID                   ({hw_unit.hw_unit_id}U)\n"
+                if hw_unit.clock_source is not None:
+                    content += f"#define ADC_HW_UNIT_{i}_CLOCK_SOURCE         {'STD_ON' if hw_unit.clock_source else 'STD_OFF'}\n"
+                if hw_unit.prescale is not None:
+                    content += f"#define ADC_HW_UNIT_{i}_PRESCALE             ({hw_unit.prescale}U)\n"
                 content += "\n"
 
         # Add DET Error Codes
@@ -920,36 +1032,29 @@ extern const Adc_ConfigType Adc_Config;
         
         self.code_text.delete(1.0, tk.END)
         self.code_text.insert(1.0, content)
-        self.status_var.set("ADC_CFG.H generated successfully")
+        self.generation_warnings = layout['warnings']
+        if layout['warnings']:
+            self.status_var.set(f"ADC_CFG.H generated with {len(layout['warnings'])} result buffer warning(s)")
+        else:
+            self.status_var.set(f"ADC_CFG.H generated successfully (result pool {layout['pool_bytes']} bytes)")
+        return True
+
+    def driver_files(self):
+        """(file name, content) of each ADC driver file, built around the generated Adc_Cfg.h"""
+        adc_cfg_h_content = self.code_text.get(1.0, tk.END)
+        generation_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        adc_h_content = ADC_H_TEMPLATE.replace('##GENERATION_TIME##', generation_time)
+        adc_c_content = ADC_C_TEMPLATE.replace('##GENERATION_TIME##', generation_time)
+        adc_c_content = adc_c_content.replace('##ADC_RESULT_BUFFERS##', self.generate_adc_result_buffers())
+        
+        files = [
+            ('Adc_Cfg.h', adc_cfg_h_content),
+            ('Adc.h', adc_h_content),
+            ('Adc.c', adc_c_content),
+        ]
 
-    def save_driver_files(self):
-        """Save all ADC driver files"""
-        if not self.code_text.get(1.0, tk.END).strip():
-            messagebox.showwarning("Warning", "Please generate the code first")
-            return
-            
-        directory_path = filedialog.askdirectory(title="Select Directory to Save Driver Files")
-        if not directory_path: 
-            return
-            
-        try:
-            adc_cfg_h_content = self.code_text.get(1.0, tk.END)
-            generation_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            adc_h_content = ADC_H_TEMPLATE.replace('##GENERATION_TIME##', generation_time)
-            adc_c_content = ADC_C_TEMPLATE.replace('##GENERATION_TIME##', generation_time)
-            
-            files_to_save = [
-                ('Adc_Cfg.h', adc_cfg_h_content),
-                ('Adc.h', adc_h_content),
-                ('Adc.c', adc_c_content),
-            ]
-
-            for filename, content in files_to_save:
-                with open(os.path.join(directory_path, filename), 'w', encoding='utf-8') as f:
-                    f.write(content)
-            
-            # Create README file
-            readme_content = f'''# AUTOSAR ADC Driver Files
+        # Create README file
+        readme_content = f'''# AUTOSAR ADC Driver Files
 
 Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 Source ARXML: {os.path.basename(self.arxml_file_path) if self.arxml_file_path else 'Unknown'}
@@ -963,13 +1068,13 @@ Source ARXML: {os.path.basename(self.arxml_file_path) if self.arxml_file_path el
 ## Configuration Summary:
 
 ### Channels: {len(self.config_data['channels'])}
-{chr(10).join([f"- {channel['symbolic_name']} (ID: {channel['id']}, Resolution: {channel['resolution']} bits)" for channel in self.config_data['channels']]) if self.config_data['channels'] else "- No channels configured"}
+{chr(10).join([f"- {channel.symbolic_name} (ID: {channel.id}, Resolution: {channel.resolution} bits)" for channel in self.config_data['channels']]) if self.config_data['channels'] else "- No channels configured"}
 
 ### Groups: {len(self.config_data['groups'])}
-{chr(10).join([f"- Group {group['id']} (Mode: {group['access_mode']}, Priority: {group['priority']})" for group in self.config_data['groups']]) if self.config_data['groups'] else "- No groups configured"}
+{chr(10).join([f"- Group {group.id} (Mode: {group.access_mode}, Priority: {group.priority})" for group in self.config_data['groups']]) if self.config_data['groups'] else "- No groups configured"}
 
 ### Hardware Units: {len(self.config_data['hw_units'])}
-{chr(10).join([f"- HW Unit {hw_unit.get('hw_unit_id', 'N/A')} (Prescale: {hw_unit.get('prescale', 'N/A')})" for hw_unit in self.config_data['hw_units']]) if self.config_data['hw_units'] else "- No hardware units configured"}
+{chr(10).join([f"- HW Unit {'N/A' if hw_unit.hw_unit_id is None else hw_unit.hw_unit_id} (Prescale: {'N/A' if hw_unit.prescale is None else hw_unit.prescale})" for hw_unit in self.config_data['hw_units']]) if self.config_data['hw_units'] else "- No hardware units configured"}
 
 ## API Features:
 - DEINIT_API: {'ENABLED' if self.config_data['adc_deinit_api'] else 'DISABLED'}
@@ -981,9 +1086,24 @@ Source ARXML: {os.path.basename(self.arxml_file_path) if self.arxml_file_path el
 - HW_TRIGGER_API: {'ENABLED' if self.config_data['adc_hw_trigger_api'] else 'DISABLED'}
 - VERSION_INFO_API: {'ENABLED' if self.config_data['adc_version_info_api'] else 'DISABLED'}
 '''
+        files.append(('README.md', readme_content))
+        return files
+
+    def save_driver_files(self):
+        """Save all ADC driver files"""
+        if not self.code_text.get(1.0, tk.END).strip():
+            messagebox.showwarning("Warning", "Please generate the code first")
+            return
             
-            with open(os.path.join(directory_path, 'README.md'), 'w', encoding='utf-8') as f:
-                f.write(readme_content)
+        directory_path = filedialog.askdirectory(title="Select Directory to Save Driver Files")
+        if not directory_path: 
+            return
+            
+        try:
+            writer = OutputSetWriter(directory_path)
+            for filename, content in self.driver_files():
+                writer.add(filename, content)
+            writer.commit()
 
             messagebox.showinfo("Success", f"ADC driver files saved successfully to:\n{directory_path}")
             self.status_var.set("Driver files saved successfully")
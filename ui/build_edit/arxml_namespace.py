@@ -0,0 +1,18 @@
+# arxml_namespace.py
+
+
+def strip_namespace(root):
+    """Remove '{uri}' prefixes from every tag under `root`, in place.
+
+    The extractors look elements up by bare AUTOSAR tag names, while ARXML
+    from tools (and from the configurators) declares the r4.0 default
+    namespace. Returns the namespace URI the root element had, or None.
+    """
+    namespace = None
+    if root.tag.startswith('{'):
+        namespace = root.tag[1:].split('}', 1)[0]
+    for elem in root.iter():
+        tag = elem.tag
+        if isinstance(tag, str) and tag.startswith('{'):
+            elem.tag = tag.split('}', 1)[1]
+    return namespace
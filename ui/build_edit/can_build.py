@@ -4,6 +4,13 @@ import xml.etree.ElementTree as ET
 import os
 from datetime import datetime
 from .drivers.can_code import CAN_H_TEMPLATE, CAN_C_TEMPLATE
+from .output_writer import OutputSetWriter
+from .can_lookup import CanRxLookupBuilder, CAN_ID_EXTENDED_FLAG
+from .can_filter_optimizer import CanFilterOptimizer, DEFAULT_FILTER_BANK_LIMIT
+from .arxml_namespace import strip_namespace
+from .records import CanControllerRecord, CanHardwareObjectRecord
+from ..atomic_file import replacing
+from ..profiling import profiler
 
 class ARXMLtoCANGenerator(ttk.Frame):
     def __init__(self, parent):
@@ -12,6 +19,10 @@ class ARXMLtoCANGenerator(ttk.Frame):
         self.config_data = self.get_default_config()
         
         self.arxml_file_path = None
+        self.arxml_tree = None
+        self.arxml_namespace = None
+        self.hw_object_containers = {}
+        self.hw_filter_containers = []
         self.status_var = tk.StringVar()
         self.setup_ui()
 
@@ -99,7 +110,10 @@ class ARXMLtoCANGenerator(ttk.Frame):
         self.generate_btn.pack(side=tk.LEFT, padx=(0, 10))
 
         self.save_btn = ttk.Button(buttons_frame, text="Save Driver Files", command=self.save_driver_files)
-        self.save_btn.pack(side=tk.LEFT)
+        self.save_btn.pack(side=tk.LEFT, padx=(0, 10))
+
+        self.optimize_btn = ttk.Button(buttons_frame, text="Optimize HW Filters", command=self.open_filter_optimizer)
+        self.optimize_btn.pack(side=tk.LEFT)
 
         code_frame = ttk.LabelFrame(right_frame, text="Generated Can_Cfg.h", padding="10")
         code_frame.grid(row=0, column=0, sticky='nsew')
@@ -142,7 +156,12 @@ class ARXMLtoCANGenerator(ttk.Frame):
         try:
             self.status_var.set("Parsing ARXML...")
             self.config_data = self.get_default_config()
-            tree = ET.parse(self.arxml_file_path)
+            self.hw_object_containers = {}
+            self.hw_filter_containers = []
+            with profiler.span('parse.can', file=os.path.basename(self.arxml_file_path)):
+                tree = ET.parse(self.arxml_file_path)
+            self.arxml_tree = tree
+            self.arxml_namespace = None
             root = tree.getroot()
             
             success = self.extract_config_from_arxml(root)
@@ -163,17 +182,32 @@ class ARXMLtoCANGenerator(ttk.Frame):
             self.status_var.set("Error occurred")
             messagebox.showerror("Error", f"An error occurred: {str(e)}")
 
+    def load_arxml_tree(self, tree):
+        """Extract, display and generate from an already parsed ARXML tree, without dialogs.
+
+        Used by watch mode; False when the tree holds no CAN configuration
+        or nothing was generated.
+        """
+        self.config_data = self.get_default_config()
+        self.hw_object_containers = {}
+        self.hw_filter_containers = []
+        self.arxml_tree = tree
+        self.arxml_namespace = None
+        if not self.extract_config_from_arxml(tree.getroot()):
+            return False
+        self.display_configuration()
+        return self.generate_can_cfg_h(interactive=False)
+
+    @profiler.timed('extract.can')
     def extract_config_from_arxml(self, root):
-        container_paths = [
-            './/ECUC-CONTAINER-VALUE',
-            './/{http://autosar.org/schema/r4.0}ECUC-CONTAINER-VALUE',
-        ]
-        
-        containers = []
-        for path in container_paths:
-            found = root.findall(path)
-            if found:
-                containers.extend(found)
+        # Extraction matches bare AUTOSAR tag names. The namespace is kept
+        # for saving; a tree stripped earlier (reload after an edit) has none left.
+        namespace = strip_namespace(root)
+        if namespace is not None:
+            self.arxml_namespace = namespace
+
+        with profiler.span('index.can'):
+            containers = root.findall('.//ECUC-CONTAINER-VALUE')
         
         config_found = False
         
@@ -257,10 +291,9 @@ class ARXMLtoCANGenerator(ttk.Frame):
         self.config_data['can_general'] = self._extract_params(container)
 
     def _extract_controller_config(self, container, container_name):
-        controller = self._extract_params(container)
-        controller['id'] = controller.get('CanControllerId', len(self.config_data['controllers']))
-        controller['baudrate_configs'] = []
-        controller['fd_baudrate_configs'] = []
+        params = self._extract_params(container)
+        controller = CanControllerRecord(id=params.get('CanControllerId', len(self.config_data['controllers'])),
+                                         params=params)
         self.config_data['controllers'].append(controller)
 
     def _extract_controller_baudrate_config(self, container, container_name):
@@ -270,13 +303,13 @@ class ARXMLtoCANGenerator(ttk.Frame):
         controller_ref = self._find_controller_reference(container)
         if controller_ref is not None:
             if controller_ref < len(self.config_data['controllers']):
-                self.config_data['controllers'][controller_ref]['baudrate_configs'].append(baudrate_config)
+                self.config_data['controllers'][controller_ref].baudrate_configs.append(baudrate_config)
         else:
             # If no specific controller reference found, add to the last controller or create a default one
             if not self.config_data['controllers']:
-                default_controller = {'id': 0, 'baudrate_configs': [], 'fd_baudrate_configs': []}
+                default_controller = CanControllerRecord()
                 self.config_data['controllers'].append(default_controller)
-            self.config_data['controllers'][-1]['baudrate_configs'].append(baudrate_config)
+            self.config_data['controllers'][-1].baudrate_configs.append(baudrate_config)
 
     def _extract_controller_fd_baudrate_config(self, container, container_name):
         """Extract standalone CanControllerFdBaudrateConfig containers"""
@@ -285,13 +318,13 @@ class ARXMLtoCANGenerator(ttk.Frame):
         controller_ref = self._find_controller_reference(container)
         if controller_ref is not None:
             if controller_ref < len(self.config_data['controllers']):
-                self.config_data['controllers'][controller_ref]['fd_baudrate_configs'].append(fd_baudrate_config)
+                self.config_data['controllers'][controller_ref].fd_baudrate_configs.append(fd_baudrate_config)
         else:
             # If no specific controller reference found, add to the last controller or create a default one
             if not self.config_data['controllers']:
-                default_controller = {'id': 0, 'baudrate_configs': [], 'fd_baudrate_configs': []}
+                default_controller = CanControllerRecord()
                 self.config_data['controllers'].append(default_controller)
-            self.config_data['controllers'][-1]['fd_baudrate_configs'].append(fd_baudrate_config)
+            self.config_data['controllers'][-1].fd_baudrate_configs.append(fd_baudrate_config)
 
     def _find_controller_reference(self, container):
         """Try to find controller reference in the container or its parent"""
@@ -331,12 +364,21 @@ class ARXMLtoCANGenerator(ttk.Frame):
             self.config_data['icom_signal_configs'].append(signal_config)
 
     def _extract_hw_object_config(self, container, container_name):
-        hw_object = self._extract_params(container)
-        hw_object['id'] = hw_object.get('CanObjectId', len(self.config_data['hw_objects']))
+        params = self._extract_params(container)
+        hw_object = CanHardwareObjectRecord(
+            id=params.get('CanObjectId', len(self.config_data['hw_objects'])),
+            params=params,
+            filters=[
+                self._extract_params(sub)
+                for sub in container.findall('.//ECUC-CONTAINER-VALUE')
+                if sub.findtext('SHORT-NAME', '').startswith('CanHwFilter')
+            ])
+        self.hw_object_containers[hw_object.id] = container
         self.config_data['hw_objects'].append(hw_object)
 
     def _extract_hw_filter_config(self, container):
         self.config_data['hw_filters'].append(self._extract_params(container))
+        self.hw_filter_containers.append(container)
 
     def _extract_main_function_rw_periods(self, container):
         self.config_data['main_function_rw_periods'].append(self._extract_params(container))
@@ -438,6 +480,7 @@ class ARXMLtoCANGenerator(ttk.Frame):
         
         return params
 
+    @profiler.timed('view.can')
     def display_configuration(self):
         config_text = "═" * 80 + "\n"
         config_text += "EXTRACTED CONFIGURATION FROM ARXML\n"
@@ -466,25 +509,24 @@ class ARXMLtoCANGenerator(ttk.Frame):
             config_text += f"CAN CONTROLLERS ({len(self.config_data['controllers'])} found)\n"
             # config_text += "─" * 40 + "\n"
             for i, controller in enumerate(self.config_data['controllers']):
-                config_text += f"  Controller {i} (ID: {controller.get('id', 'N/A')})\n"
-                for key, value in controller.items():
-                    if key not in ['baudrate_configs', 'fd_baudrate_configs', 'id']:
-                        formatted_value = self._format_value(value)
-                        config_text += f"    {key}: {formatted_value}\n"
+                config_text += f"  Controller {i} (ID: {controller.id})\n"
+                for key, value in controller.params.items():
+                    formatted_value = self._format_value(value)
+                    config_text += f"    {key}: {formatted_value}\n"
                 
                 # Baudrate Configurations
-                if controller.get('baudrate_configs'):
-                    config_text += f"    Baudrate Configs ({len(controller['baudrate_configs'])}):\n"
-                    for j, br_config in enumerate(controller['baudrate_configs']):
+                if controller.baudrate_configs:
+                    config_text += f"    Baudrate Configs ({len(controller.baudrate_configs)}):\n"
+                    for j, br_config in enumerate(controller.baudrate_configs):
                         config_text += f"      Config {j}:\n"
                         for br_key, br_value in br_config.items():
                             formatted_value = self._format_value(br_value)
                             config_text += f"        {br_key}: {formatted_value}\n"
                 
                 # FD Baudrate Configurations
-                if controller.get('fd_baudrate_configs'):
-                    config_text += f"    FD Baudrate Configs ({len(controller['fd_baudrate_configs'])}):\n"
-                    for j, fd_config in enumerate(controller['fd_baudrate_configs']):
+                if controller.fd_baudrate_configs:
+                    config_text += f"    FD Baudrate Configs ({len(controller.fd_baudrate_configs)}):\n"
+                    for j, fd_config in enumerate(controller.fd_baudrate_configs):
                         config_text += f"      FD Config {j}:\n"
                         for fd_key, fd_value in fd_config.items():
                             formatted_value = self._format_value(fd_value)
@@ -496,11 +538,10 @@ class ARXMLtoCANGenerator(ttk.Frame):
             config_text += f"HARDWARE OBJECTS ({len(self.config_data['hw_objects'])} found)\n"
             # config_text += "─" * 40 + "\n"
             for i, hw_obj in enumerate(self.config_data['hw_objects']):
-                config_text += f"  HW Object {i} (ID: {hw_obj.get('id', 'N/A')})\n"
-                for key, value in hw_obj.items():
-                    if key != 'id':
-                        formatted_value = self._format_value(value)
-                        config_text += f"    {key}: {formatted_value}\n"
+                config_text += f"  HW Object {i} (ID: {hw_obj.id})\n"
+                for key, value in hw_obj.params.items():
+                    formatted_value = self._format_value(value)
+                    config_text += f"    {key}: {formatted_value}\n"
                 config_text += "\n"
         
         # Hardware Filters
@@ -688,10 +729,12 @@ class ARXMLtoCANGenerator(ttk.Frame):
         else:
             return str(value)
 
-    def generate_can_cfg_h(self):
+    @profiler.timed('codegen.can')
+    def generate_can_cfg_h(self, interactive=True):
         if not self.config_data.get('controllers'):
-            messagebox.showwarning("Warning", "No CAN controllers configured.")
-            return
+            if interactive:
+                messagebox.showwarning("Warning", "No CAN controllers configured.")
+            return False
 
         arxml_filename = os.path.basename(self.arxml_file_path) if self.arxml_file_path else 'Unknown'
         generation_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
@@ -761,23 +804,22 @@ class ARXMLtoCANGenerator(ttk.Frame):
 
         # Add Controller-specific configurations
         for i, controller in enumerate(self.config_data['controllers']):
-            controller_id = controller.get('id', i)
+            controller_id = controller.id
             content += f"/* Controller {controller_id} Configuration */\n"
             
-            for key, value in controller.items():
-                if key not in ['baudrate_configs', 'fd_baudrate_configs', 'id']:
-                    if isinstance(value, bool):
-                        formatted_value = 'STD_ON' if value else 'STD_OFF'
-                    elif isinstance(value, int):
-                        formatted_value = f"({value}U)"
-                    else:
-                        formatted_value = str(value)
-                    content += f"#define CAN_CONTROLLER_{controller_id}_{key.upper()}    {formatted_value}\n"
+            for key, value in controller.params.items():
+                if isinstance(value, bool):
+                    formatted_value = 'STD_ON' if value else 'STD_OFF'
+                elif isinstance(value, int):
+                    formatted_value = f"({value}U)"
+                else:
+                    formatted_value = str(value)
+                content += f"#define CAN_CONTROLLER_{controller_id}_{key.upper()}    {formatted_value}\n"
             
             # Add Baudrate configurations
-            if controller.get('baudrate_configs'):
+            if controller.baudrate_configs:
                 content += f"\n/* Controller {controller_id} Baudrate Configurations */\n"
-                for j, br_config in enumerate(controller['baudrate_configs']):
+                for j, br_config in enumerate(controller.baudrate_configs):
                     br_id = br_config.get('CanControllerBaudRateConfigID', j)
                     for key, value in br_config.items():
                         if isinstance(value, (int, float)):
@@ -787,9 +829,9 @@ class ARXMLtoCANGenerator(ttk.Frame):
                         content += f"#define CAN_CTRL_{controller_id}_BR_{br_id}_{key.upper()}    {formatted_value}\n"
             
             # Add FD Baudrate configurations
-            if controller.get('fd_baudrate_configs'):
+            if controller.fd_baudrate_configs:
                 content += f"\n/* Controller {controller_id} FD Baudrate Configurations */\n"
-                for j, fd_config in enumerate(controller['fd_baudrate_configs']):
+                for j, fd_config in enumerate(controller.fd_baudrate_configs):
                     fd_id = fd_config.get('CanControllerFdBaudRateConfigID', j)
                     for key, value in fd_config.items():
                         if isinstance(value, bool):
@@ -808,17 +850,16 @@ class ARXMLtoCANGenerator(ttk.Frame):
 ==================================================================================================*/
 """
             for i, hw_obj in enumerate(self.config_data['hw_objects']):
-                obj_id = hw_obj.get('id', i)
+                obj_id = hw_obj.id
                 content += f"/* Hardware Object {obj_id} Configuration */\n"
-                for key, value in hw_obj.items():
-                    if key != 'id':
-                        if isinstance(value, bool):
-                            formatted_value = 'STD_ON' if value else 'STD_OFF'
-                        elif isinstance(value, int):
-                            formatted_value = f"({value}U)"
-                        else:
-                            formatted_value = str(value)
-                        content += f"#define CAN_HW_OBJ_{obj_id}_{key.upper()}    {formatted_value}\n"
+                for key, value in hw_obj.params.items():
+                    if isinstance(value, bool):
+                        formatted_value = 'STD_ON' if value else 'STD_OFF'
+                    elif isinstance(value, int):
+                        formatted_value = f"({value}U)"
+                    else:
+                        formatted_value = str(value)
+                    content += f"#define CAN_HW_OBJ_{obj_id}_{key.upper()}    {formatted_value}\n"
                 content += "\n"
 
         # Add Hardware Filter configurations
@@ -948,6 +989,221 @@ extern const Can_ConfigType Can_Config;
         self.code_text.delete(1.0, tk.END)
         self.code_text.insert(1.0, content)
         self.status_var.set("CAN_CFG.H generated successfully")
+        return True
+
+    def generate_can_rx_lookup_tables(self):
+        """Generate the sorted CAN ID -> HRH receive tables emitted into Can.c"""
+        lookup = CanRxLookupBuilder(self.config_data['hw_objects'], self.config_data['hw_filters']).build()
+        exact_count = len(lookup.exact_entries)
+        masked_count = len(lookup.masked_entries)
+
+        content = f"""#define CAN_RX_EXACT_COUNT          ({exact_count}U)
+#define CAN_RX_MASKED_COUNT         ({masked_count}U)
+#define CAN_RX_LOOKUP_MAX_STEPS     ({lookup.max_search_steps()}U)
+
+/* FULL-CAN receive objects, sorted by CAN ID for binary search */
+static const Can_RxExactEntryType Can_RxExactTable[{max(exact_count, 1)}U] = {{
+"""
+        for can_id, hrh in lookup.exact_entries:
+            kind = 'EXT' if can_id & CAN_ID_EXTENDED_FLAG else 'STD'
+            content += f"    {{ 0x{can_id:08X}UL, {hrh}U }},   /* {kind} 0x{can_id & ~CAN_ID_EXTENDED_FLAG:X} */\n"
+        if not exact_count:
+            content += "    { 0x00000000UL, CAN_HRH_INVALID },   /* no FULL-CAN receive objects */\n"
+        content += f"""}};
+
+/* Receive objects accepting an ID range (code/mask), FULL-CAN before BASIC-CAN */
+static const Can_RxMaskedEntryType Can_RxMaskedTable[{max(masked_count, 1)}U] = {{
+"""
+        for entry in lookup.masked_entries:
+            content += f"    {{ 0x{entry['code']:08X}UL, 0x{entry['mask']:08X}UL, {entry['hrh']}U }},\n"
+        if not masked_count:
+            content += "    { 0x00000000UL, 0xFFFFFFFFUL, CAN_HRH_INVALID },   /* no ranged receive objects */\n"
+        content += "};\n"
+
+        for can_id, kept_hrh, dropped_hrh in lookup.conflicts:
+            content += f"/* WARNING: CAN ID 0x{can_id:08X} also configured on HRH {dropped_hrh}; HRH {kept_hrh} wins */\n"
+
+        return content
+
+    def open_filter_optimizer(self):
+        """Ask for the CAN IDs of each BASIC receive object and synthesize its filters"""
+        if self.arxml_tree is None:
+            messagebox.showwarning("Warning", "Please parse an ARXML file first")
+            return
+
+        basic_objects = [
+            hw_obj for hw_obj in self.config_data['hw_objects']
+            if hw_obj.object_type == 'RECEIVE' and hw_obj.handle_type == 'BASIC'
+        ]
+        if not basic_objects:
+            messagebox.showwarning("Warning", "No BASIC-CAN receive hardware objects configured.")
+            return
+
+        dialog = tk.Toplevel(self)
+        dialog.title("Optimize CAN Hardware Filters")
+        dialog.transient(self)
+        dialog.grab_set()
+
+        main_frame = ttk.Frame(dialog, padding="10")
+        main_frame.pack(fill="both", expand=True)
+        main_frame.columnconfigure(1, weight=1)
+
+        ttk.Label(main_frame, text="Filter bank limit:").grid(row=0, column=0, padx=10, pady=5, sticky=tk.W)
+        limit_var = tk.StringVar(value=str(DEFAULT_FILTER_BANK_LIMIT))
+        ttk.Entry(main_frame, textvariable=limit_var, width=8).grid(row=0, column=1, padx=10, pady=5, sticky=tk.W)
+
+        ttk.Label(main_frame, text="Received CAN IDs per object (e.g. 0x100, 0x120-0x12F); leave empty to keep current filters") \
+            .grid(row=1, column=0, columnspan=2, padx=10, pady=(10, 5), sticky=tk.W)
+
+        id_vars = {}
+        for row, hw_obj in enumerate(basic_objects, start=2):
+            ttk.Label(main_frame, text=f"HRH {hw_obj.id} ({hw_obj.params.get('CanIdType', 'STANDARD')}):") \
+                .grid(row=row, column=0, padx=10, pady=2, sticky=tk.W)
+            id_vars[hw_obj.id] = tk.StringVar()
+            ttk.Entry(main_frame, textvariable=id_vars[hw_obj.id], width=50) \
+                .grid(row=row, column=1, padx=10, pady=2, sticky='ew')
+
+        def run_optimizer():
+            try:
+                limit = int(limit_var.get())
+                optimizer = CanFilterOptimizer()
+                for hw_obj in basic_objects:
+                    text = id_vars[hw_obj.id].get().strip()
+                    if text:
+                        extended = hw_obj.id_type != 'STANDARD'
+                        optimizer.add_object(hw_obj.id, self._parse_can_id_list(text), extended)
+                if not optimizer.objects:
+                    messagebox.showerror("Error", "Enter the CAN IDs of at least one hardware object", parent=dialog)
+                    return
+
+                # Filters kept by the other receive objects still occupy banks
+                lookup = CanRxLookupBuilder(self.config_data['hw_objects'], self.config_data['hw_filters'])
+                reserved = sum(len(filters) for hw_obj, filters in lookup.receive_objects_with_filters()
+                               if hw_obj.id not in optimizer.objects)
+                optimizer.filter_limit = limit - reserved
+
+                result = optimizer.optimize()
+            except ValueError as e:
+                messagebox.showerror("Error", str(e), parent=dialog)
+                return
+
+            report = optimizer.report(result)
+            if messagebox.askyesno("Filter Optimization",
+                                   f"{report}\n\nWrite these filters back into the ARXML file?", parent=dialog):
+                dialog.destroy()
+                self.write_filters_to_arxml(result, report)
+
+        button_frame = ttk.Frame(main_frame)
+        button_frame.grid(row=len(basic_objects) + 2, column=0, columnspan=2, pady=(15, 0))
+        ttk.Button(button_frame, text="Optimize", command=run_optimizer).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Cancel", command=dialog.destroy).pack(side=tk.LEFT, padx=5)
+
+    def _parse_can_id_list(self, text):
+        """Parse '0x100, 0x120-0x12F, 512' into a list of CAN IDs"""
+        ids = []
+        for token in text.replace(';', ',').split(','):
+            token = token.strip()
+            if not token:
+                continue
+            if '-' in token:
+                first, last = (int(part.strip(), 0) for part in token.split('-', 1))
+                ids.extend(range(first, last + 1))
+            else:
+                ids.append(int(token, 0))
+        return ids
+
+    def write_filters_to_arxml(self, result, report):
+        """Replace the CanHwFilter containers of the optimized objects and save the ARXML"""
+        root = self.arxml_tree.getroot()
+        parents = {child: parent for parent in root.iter() for child in parent}
+
+        # A flat ARXML pairs receive objects with top-level filters in order;
+        # nest those pairs first so every object owns its filters explicitly
+        receive_objects = [
+            hw_obj for hw_obj in self.config_data['hw_objects']
+            if hw_obj.object_type == 'RECEIVE'
+        ]
+        if not any(hw_obj.filters for hw_obj in receive_objects):
+            for hw_obj, filter_container in zip(receive_objects, self.hw_filter_containers):
+                parents[filter_container].remove(filter_container)
+                self._get_sub_containers(self.hw_object_containers[hw_obj.id]).append(filter_container)
+
+        for hrh, filters in result.items():
+            sub_containers = self._get_sub_containers(self.hw_object_containers[hrh])
+            for old in [c for c in sub_containers if c.findtext('SHORT-NAME', '').startswith('CanHwFilter')]:
+                sub_containers.remove(old)
+            for index, (code, mask) in enumerate(filters):
+                sub_containers.append(self._build_hw_filter_container(f"CanHwFilter_{hrh}_{index}", code, mask))
+
+        file_path = filedialog.asksaveasfilename(
+            title="Save Optimized ARXML",
+            initialfile=os.path.basename(self.arxml_file_path),
+            defaultextension=".arxml",
+            filetypes=[("ARXML files", "*.arxml"), ("XML files", "*.xml"), ("All files", "*.*")])
+        if not file_path:
+            # Drop the in-memory edits so the tree keeps matching the file on disk
+            self.arxml_tree = ET.parse(self.arxml_file_path)
+            self._reload_from_tree()
+            return
+
+        try:
+            if self.arxml_namespace:
+                # Tags were stripped for extraction; keep the file's default namespace
+                root.set('xmlns', self.arxml_namespace)
+            ET.indent(self.arxml_tree, space="  ")
+            # Write next to the target and rename, so a failed save never leaves a truncated ARXML
+            with replacing(file_path, 'wb') as f:
+                self.arxml_tree.write(f, encoding="utf-8", xml_declaration=True)
+        except OSError as e:
+            messagebox.showerror("Error", f"Failed to save ARXML: {str(e)}")
+            self.status_var.set("Error saving ARXML")
+            return
+
+        self.arxml_file_path = file_path
+        self.file_path_var.set(os.path.basename(file_path))
+        self._reload_from_tree()
+        messagebox.showinfo("Success", f"Optimized filters written to:\n{file_path}\n\n{report}")
+        self.status_var.set("Hardware filters optimized")
+
+    def _reload_from_tree(self):
+        self.config_data = self.get_default_config()
+        self.hw_object_containers = {}
+        self.hw_filter_containers = []
+        self.extract_config_from_arxml(self.arxml_tree.getroot())
+        self.display_configuration()
+        self.generate_can_cfg_h()
+
+    def _get_sub_containers(self, container):
+        sub_containers = container.find('SUB-CONTAINERS')
+        if sub_containers is None:
+            sub_containers = ET.SubElement(container, 'SUB-CONTAINERS')
+        return sub_containers
+
+    def _build_hw_filter_container(self, short_name, code, mask):
+        container = ET.Element('ECUC-CONTAINER-VALUE')
+        ET.SubElement(container, 'SHORT-NAME').text = short_name
+        ET.SubElement(container, 'DEFINITION-REF', {'DEST': 'ECUC-PARAM-CONF-CONTAINER-DEF'}).text = \
+            '/AUTOSAR/EcucDefs/Can/CanConfigSet/CanHardwareObject/CanHwFilter'
+        param_values = ET.SubElement(container, 'PARAMETER-VALUES')
+        for name, value in (('CanHwFilterCode', code), ('CanHwFilterMask', mask)):
+            param = ET.SubElement(param_values, 'ECUC-NUMERICAL-PARAM-VALUE')
+            ET.SubElement(param, 'SHORT-NAME').text = name
+            ET.SubElement(param, 'VALUE').text = str(value)
+        return container
+
+    def driver_files(self):
+        """(file name, content) of each CAN driver file, built around the generated Can_Cfg.h"""
+        can_cfg_h_content = self.code_text.get(1.0, tk.END)
+        generation_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        can_h_content = CAN_H_TEMPLATE.replace('##GENERATION_TIME##', generation_time)
+        can_c_content = CAN_C_TEMPLATE.replace('##GENERATION_TIME##', generation_time)
+        can_c_content = can_c_content.replace('##CAN_RX_LOOKUP_TABLES##', self.generate_can_rx_lookup_tables())
+        
+        return [
+            ('Can_Cfg.h', can_cfg_h_content),
+            ('Can.h', can_h_content),
+            ('Can.c', can_c_content),
+        ]
 
     def save_driver_files(self):
         if not self.code_text.get(1.0, tk.END).strip():
@@ -959,22 +1215,10 @@ extern const Can_ConfigType Can_Config;
             return
             
         try:
-            os.makedirs(directory_path, exist_ok=True) # Added this line
-            
-            can_cfg_h_content = self.code_text.get(1.0, tk.END)
-            generation_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            can_h_content = CAN_H_TEMPLATE.replace('##GENERATION_TIME##', generation_time)
-            can_c_content = CAN_C_TEMPLATE.replace('##GENERATION_TIME##', generation_time)
-            
-            files_to_save = [
-                ('Can_Cfg.h', can_cfg_h_content),
-                ('Can.h', can_h_content),
-                ('Can.c', can_c_content),
-            ]
-
-            for filename, content in files_to_save:
-                with open(os.path.join(directory_path, filename), 'w', encoding='utf-8') as f:
-                    f.write(content)
+            writer = OutputSetWriter(directory_path)
+            for filename, content in self.driver_files():
+                writer.add(filename, content)
+            writer.commit()
             
             messagebox.showinfo("Success", f"CAN driver files saved successfully to:\n{directory_path}")
             self.status_var.set("Driver files saved successfully")
@@ -0,0 +1,202 @@
+# can_filter_optimizer.py
+
+import heapq
+
+from .can_lookup import CAN_STANDARD_ID_MASK, CAN_EXTENDED_ID_MASK
+
+# bxCAN (STM32F407): CAN1 owns filter banks 0-13 by default, one 32-bit mask filter each
+DEFAULT_FILTER_BANK_LIMIT = 14
+
+
+class CanFilterOptimizer:
+    """Synthesize CanHwFilterCode/CanHwFilterMask pairs for BASIC-CAN objects.
+
+    Every wanted ID starts as an exact filter. Filters of the same hardware
+    object are then merged greedily, always taking the merge that lets through
+    the fewest IDs the object's filters do not accept yet, until the whole
+    controller fits within the filter bank limit. Candidate costs sit in a
+    heap; after a merge only the pairs with the new filter are costed again.
+    Merges that add no false accepts are always taken, so contiguous ID
+    blocks collapse into one filter even when banks are spare.
+    """
+
+    def __init__(self, filter_limit=DEFAULT_FILTER_BANK_LIMIT):
+        self.filter_limit = filter_limit
+        self.objects = {}
+
+    def add_object(self, hrh, wanted_ids, extended=False):
+        """Register the CAN IDs one BASIC receive object must accept"""
+        id_mask = CAN_EXTENDED_ID_MASK if extended else CAN_STANDARD_ID_MASK
+        ids = sorted({int(can_id) for can_id in wanted_ids})
+        if not ids:
+            raise ValueError(f"Hardware object {hrh} has no CAN IDs to receive")
+        out_of_range = [can_id for can_id in ids if can_id & ~id_mask]
+        if out_of_range:
+            raise ValueError(f"Hardware object {hrh}: ID 0x{out_of_range[0]:X} does not fit a "
+                             f"{'29' if extended else '11'}-bit identifier")
+        self.objects[hrh] = {'ids': ids, 'id_mask': id_mask}
+
+    def optimize(self):
+        """Return {hrh: [(code, mask), ...]} using at most filter_limit filters"""
+        if len(self.objects) > self.filter_limit:
+            raise ValueError(f"{len(self.objects)} hardware objects need at least one filter each, "
+                             f"but only {self.filter_limit} filter banks are available")
+
+        # filter slot -> (hrh, code, mask)
+        slots = {}
+        next_slot = 0
+        for hrh, obj in self.objects.items():
+            for can_id in obj['ids']:
+                slots[next_slot] = (hrh, can_id, obj['id_mask'])
+                next_slot += 1
+        # IDs the live filters of each object accept; a merge costs only the IDs it adds
+        self._accepted = {hrh: _AcceptedIds(hrh, obj['ids'], obj['id_mask']) for hrh, obj in self.objects.items()}
+
+        heap = []
+        by_object = {}
+        for slot, (hrh, _, _) in slots.items():
+            by_object.setdefault(hrh, []).append(slot)
+        for members in by_object.values():
+            for i, a in enumerate(members):
+                for b in members[i + 1:]:
+                    heap.append(self._merge_candidate(slots, a, b))
+        heapq.heapify(heap)
+
+        while heap:
+            cost, a, b, code, mask, version = heap[0]
+            if a not in slots or b not in slots:
+                heapq.heappop(heap)
+                continue
+            hrh = slots[a][0]
+            accepted = self._accepted[hrh]
+            if version != accepted.version:
+                # Another merge widened this object's filters since; the cost can only have dropped
+                heapq.heapreplace(heap, self._merge_candidate(slots, a, b))
+                continue
+            if cost > 0 and len(slots) <= self.filter_limit:
+                break
+            heapq.heappop(heap)
+
+            del slots[a], slots[b]
+            # The merged filter may swallow other filters of the same object
+            for other in [s for s, (h, c, m) in slots.items() if h == hrh and c & mask == code and m & mask == mask]:
+                del slots[other]
+            slots[next_slot] = (hrh, code, mask)
+            if cost:
+                accepted.add(code, mask)
+            for other, (other_hrh, _, _) in slots.items():
+                if other != next_slot and other_hrh == hrh:
+                    heapq.heappush(heap, self._merge_candidate(slots, other, next_slot))
+            next_slot += 1
+
+        result = {hrh: [] for hrh in self.objects}
+        for hrh, code, mask in slots.values():
+            result[hrh].append((code, mask))
+        for filters in result.values():
+            filters.sort()
+        return result
+
+    def report(self, result):
+        """Summarize accepted/false-accepted IDs and ISR entries avoided"""
+        lines = []
+        total_wanted = total_accepted = 0
+        accepted_by_space = {}
+        for hrh, filters in result.items():
+            obj = self.objects[hrh]
+            accepted = self.accepted_count(filters, obj['id_mask'])
+            wanted = len(obj['ids'])
+            total_wanted += wanted
+            total_accepted += accepted
+            accepted_by_space[obj['id_mask']] = accepted_by_space.get(obj['id_mask'], 0) + accepted
+            lines.append(f"HRH {hrh}: {wanted} IDs -> {len(filters)} filter(s), "
+                         f"{accepted} accepted, {accepted - wanted} false accept(s)")
+
+        filter_count = sum(len(filters) for filters in result.values())
+        false_rate = (total_accepted - total_wanted) / total_accepted if total_accepted else 0.0
+        lines.append(f"Filters used: {filter_count}/{self.filter_limit}")
+        lines.append(f"False-accept rate: {false_rate:.1%} of accepted IDs")
+        for id_mask, accepted in sorted(accepted_by_space.items()):
+            kind = 'standard' if id_mask == CAN_STANDARD_ID_MASK else 'extended'
+            saved = 1.0 - min(accepted, id_mask + 1) / (id_mask + 1)
+            lines.append(f"RX ISR entries avoided vs. accept-all ({kind} IDs, uniform traffic): {saved:.2%}")
+        return "\n".join(lines)
+
+    @staticmethod
+    def accepted_count(filters, id_mask):
+        """Number of distinct IDs accepted by a set of code/mask filters"""
+        if id_mask == CAN_STANDARD_ID_MASK:
+            return sum(1 for can_id in range(id_mask + 1)
+                       if any(can_id & mask == code for code, mask in filters))
+        # 29-bit space is too large to enumerate; filters of one object rarely
+        # overlap after merging, so the sum is a tight upper bound
+        return sum(1 << (bin(id_mask).count('1') - bin(mask & id_mask).count('1')) for _, mask in filters)
+
+    def _merge_candidate(self, slots, a, b):
+        hrh, code_a, mask_a = slots[a]
+        _, code_b, mask_b = slots[b]
+        accepted = self._accepted[hrh]
+        mask = mask_a & mask_b & ~(code_a ^ code_b) & accepted.id_mask
+        code = code_a & mask
+        return (accepted.new_ids(code, mask, slots), a, b, code, mask, accepted.version)
+
+
+class _AcceptedIds:
+    """The IDs one hardware object's live filters accept.
+
+    Standard IDs are kept as a 2048-bit set, so counting the IDs a filter
+    would add is a few big-int operations. The 29-bit space cannot be
+    enumerated; there the count is taken over the live filters themselves.
+    `version` changes whenever the set grows, which marks cost estimates
+    made before as stale.
+    """
+
+    def __init__(self, hrh, ids, id_mask):
+        self.hrh = hrh
+        self.id_mask = id_mask
+        self.version = 0
+        self.bits = sum(1 << can_id for can_id in ids) if id_mask == CAN_STANDARD_ID_MASK else None
+        self._filters = None  # extended IDs: (code, mask) of the live filters, per version
+        self._patterns = {}
+
+    def new_ids(self, code, mask, slots):
+        """Number of IDs matching code/mask that no live filter accepts yet"""
+        if self.bits is not None:
+            return (self._filter_bits(code, mask) & ~self.bits).bit_count()
+        if self._filters is None:
+            self._filters = [(c, m) for h, c, m in slots.values() if h == self.hrh]
+        return self._uncovered(code, mask, self._filters)
+
+    def add(self, code, mask):
+        """Record a merged filter that accepts new IDs"""
+        self.version += 1
+        if self.bits is not None:
+            self.bits |= self._filter_bits(code, mask)
+        else:
+            self._filters = None  # collected again from the live filters on next use
+
+    def _filter_bits(self, code, mask):
+        # Free bits and code bits never overlap, so a filter is its mask's
+        # code-0 pattern shifted up by the code
+        pattern = self._patterns.get(mask)
+        if pattern is None:
+            pattern = 1
+            free = self.id_mask & ~mask
+            while free:
+                bit = free & -free
+                pattern |= pattern << bit
+                free ^= bit
+            self._patterns[mask] = pattern
+        return pattern << code
+
+    def _uncovered(self, code, mask, filters):
+        """IDs matching code/mask outside every filter, splitting on one bit at a time"""
+        filters = [(c, m) for c, m in filters if (c ^ code) & m & mask == 0]
+        for c, m in filters:
+            if m & ~mask & self.id_mask == 0:
+                return 0  # covered entirely
+        if not filters:
+            return 1 << bin(self.id_mask & ~mask).count('1')
+        split = filters[0][1] & ~mask & self.id_mask
+        bit = split & -split
+        return (self._uncovered(code, mask | bit, filters)
+                + self._uncovered(code | bit, mask | bit, filters))
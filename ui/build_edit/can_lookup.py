@@ -0,0 +1,94 @@
+# can_lookup.py
+
+CAN_STANDARD_ID_MASK = 0x7FF
+CAN_EXTENDED_ID_MASK = 0x1FFFFFFF
+# Can_IdType convention: the most significant bit marks an extended identifier
+CAN_ID_EXTENDED_FLAG = 0x80000000
+
+
+class CanRxLookupBuilder:
+    """Build the CAN ID -> HRH receive lookup tables offline.
+
+    Receive hardware objects whose filter matches exactly one identifier
+    (FULL-CAN style) go into a table sorted by Can_IdType key, searched with
+    a bounded binary search. Objects with a partial mask (BASIC-CAN ranges)
+    go into a short code/mask list checked afterwards, so FULL-CAN objects
+    always win over BASIC ones as required by SWS_Can_00485.
+    """
+
+    def __init__(self, hw_objects, hw_filters=None):
+        self.hw_objects = hw_objects
+        self.hw_filters = hw_filters or []
+        self.exact_entries = []
+        self.masked_entries = []
+        self.conflicts = []
+
+    def build(self):
+        """Compute the sorted exact table and the masked fallback list"""
+        self.exact_entries = []
+        self.masked_entries = []
+        self.conflicts = []
+
+        exact = {}
+        receive_objects = sorted(
+            self.receive_objects_with_filters(),
+            key=lambda item: item[0].handle_type != 'FULL')
+        for hw_obj, filters in receive_objects:
+            hrh = int(hw_obj.id)
+            id_type = hw_obj.id_type
+            is_full = hw_obj.handle_type == 'FULL'
+
+            for code, mask in filters:
+                for extended in self._id_kinds(id_type):
+                    id_mask = CAN_EXTENDED_ID_MASK if extended else CAN_STANDARD_ID_MASK
+                    flag = CAN_ID_EXTENDED_FLAG if extended else 0
+                    if mask & id_mask == id_mask:
+                        key = (code & id_mask) | flag
+                        if key in exact and exact[key] != hrh:
+                            self.conflicts.append((key, exact[key], hrh))
+                            continue
+                        exact[key] = hrh
+                    else:
+                        self.masked_entries.append({
+                            'code': (code & mask & id_mask) | flag,
+                            'mask': (mask & id_mask) | CAN_ID_EXTENDED_FLAG,
+                            'hrh': hrh,
+                            'full': is_full,
+                        })
+
+        self.exact_entries = sorted(exact.items())
+        # FULL-CAN ranges first, then BASIC, each in configuration order
+        self.masked_entries.sort(key=lambda entry: not entry['full'])
+        return self
+
+    def max_search_steps(self):
+        """Worst-case number of binary search iterations over the exact table"""
+        return max(1, len(self.exact_entries)).bit_length()
+
+    def receive_objects_with_filters(self):
+        """Yield (receive hardware object, [(code, mask), ...]) pairs"""
+        receive_objects = [
+            hw_obj for hw_obj in self.hw_objects
+            if hw_obj.object_type == 'RECEIVE'
+        ]
+
+        # Nested CanHwFilter containers take precedence; a flat ARXML (as written
+        # by the configurator) pairs receive objects with filters in order.
+        if any(hw_obj.filters for hw_obj in receive_objects):
+            for hw_obj in receive_objects:
+                yield hw_obj, [self._filter_pair(f) for f in hw_obj.filters]
+        else:
+            for hw_obj, hw_filter in zip(receive_objects, self.hw_filters):
+                yield hw_obj, [self._filter_pair(hw_filter)]
+
+    @staticmethod
+    def _filter_pair(hw_filter):
+        return int(hw_filter.get('CanHwFilterCode', 0)), int(hw_filter.get('CanHwFilterMask', 0))
+
+    @staticmethod
+    def _id_kinds(id_type):
+        if id_type == 'EXTENDED':
+            return (True,)
+        if id_type == 'MIXED':
+            return (False, True)
+        return (False,)
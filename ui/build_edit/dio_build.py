@@ -5,7 +5,11 @@ import os
 from datetime import datetime
 # from ..channel_editor import ChannelEditor
 from .drivers.dio_code import DIO_H_TEMPLATE, DIO_C_TEMPLATE
+from .output_writer import OutputSetWriter
+from .arxml_namespace import strip_namespace
+from .records import DioChannelGroupRecord, DioChannelRecord, DioPortRecord
 from ..editor.peripheral_config.dio_config import DioAppModel
+from ..profiling import profiler
 
 class ARXMLtoDIOConfigGUI(ttk.Frame):
     def __init__(self, parent):
@@ -135,7 +139,8 @@ class ARXMLtoDIOConfigGUI(ttk.Frame):
 
         try:
             self.status_var.set("Parsing ARXML...")
-            tree = ET.parse(self.arxml_file_path)
+            with profiler.span('parse.dio', file=os.path.basename(self.arxml_file_path)):
+                tree = ET.parse(self.arxml_file_path)
             root = tree.getroot()
             
             success = self.extract_config_from_arxml(root)
@@ -156,7 +161,20 @@ class ARXMLtoDIOConfigGUI(ttk.Frame):
             self.status_var.set("Error occurred")
             messagebox.showerror("Error", f"An error occurred: {str(e)}")
 
+    def load_arxml_tree(self, tree):
+        """Extract, display and generate from an already parsed ARXML tree, without dialogs.
+
+        Used by watch mode; False when the tree holds no DIO configuration
+        or nothing was generated.
+        """
+        if not self.extract_config_from_arxml(tree.getroot()):
+            return False
+        self.display_configuration()
+        return self.generate_dio_cfg_h(interactive=False)
+
+    @profiler.timed('extract.dio')
     def extract_config_from_arxml(self, root):
+        strip_namespace(root)  # extraction matches bare AUTOSAR tag names
         # Reset configuration data
         self.config_data['channels'] = []
         self.config_data['ports'] = []
@@ -176,22 +194,20 @@ class ARXMLtoDIOConfigGUI(ttk.Frame):
         # Search for containers using multiple paths
         container_paths = [
             './/ECUC-CONTAINER-VALUE',
-            './/{http://autosar.org/schema/r4.0}ECUC-CONTAINER-VALUE',
             './/CONTAINER-VALUE',
             './/ECUC-CONTAINER'
         ]
         
         containers = []
-        for path in container_paths:
-            found = root.findall(path)
-            if found:
-                containers.extend(found)
+        with profiler.span('index.dio'):
+            for path in container_paths:
+                found = root.findall(path)
+                if found:
+                    containers.extend(found)
 
         # Process each container
         for container in containers:
             short_name_elem = container.find('SHORT-NAME')
-            if short_name_elem is None:
-                short_name_elem = container.find('.//{http://autosar.org/schema/r4.0}SHORT-NAME')
             if short_name_elem is None: 
                 continue
                 
@@ -217,8 +233,8 @@ class ARXMLtoDIOConfigGUI(ttk.Frame):
                 self._extract_dio_config(container)
 
         # Sort configurations by ID
-        self.config_data['ports'].sort(key=lambda x: x['id'])
-        self.config_data['channels'].sort(key=lambda x: x['id'])
+        self.config_data['ports'].sort(key=lambda x: x.id)
+        self.config_data['channels'].sort(key=lambda x: x.id)
         
         if self.channel_editor: 
             self.channel_editor.load_channels()
@@ -295,12 +311,12 @@ class ARXMLtoDIOConfigGUI(ttk.Frame):
             port_id = int(match.group(1)) if match else len(self.config_data['ports'])
         
         # Add port if not already exists
-        if port_id is not None and not any(p['id'] == port_id for p in self.config_data['ports']):
-            self.config_data['ports'].append({
-                'id': port_id, 
-                'symbolic_name': port_symbolic_name or f'DIO_PORT_{port_id}',
-                'container_name': container_name
-            })
+        if port_id is not None and not any(p.id == port_id for p in self.config_data['ports']):
+            self.config_data['ports'].append(DioPortRecord(
+                id=port_id,
+                symbolic_name=port_symbolic_name or f'DIO_PORT_{port_id}',
+                container_name=container_name
+            ))
 
     def _extract_channel_config(self, container, container_name):
         """Extract DioChannel configuration"""
@@ -338,13 +354,13 @@ class ARXMLtoDIOConfigGUI(ttk.Frame):
             channel_id = int(match.group(1)) if match else len(self.config_data['channels'])
         
         # Add channel if not already exists
-        if channel_id is not None and not any(c['id'] == channel_id for c in self.config_data['channels']):
-            self.config_data['channels'].append({
-                'id': channel_id, 
-                'port': port_ref, 
-                'symbolic_name': channel_symbolic_name or f'DIO_CHANNEL_{channel_id}',
-                'container_name': container_name
-            })
+        if channel_id is not None and not any(c.id == channel_id for c in self.config_data['channels']):
+            self.config_data['channels'].append(DioChannelRecord(
+                id=channel_id,
+                port=port_ref,
+                symbolic_name=channel_symbolic_name or f'DIO_CHANNEL_{channel_id}',
+                container_name=container_name
+            ))
 
     def _extract_channel_group_config(self, container, container_name):
         """Extract DioChannelGroup configuration"""
@@ -383,15 +399,15 @@ class ARXMLtoDIOConfigGUI(ttk.Frame):
                     group_id = value_elem.text
         
         # Add channel group if not already exists
-        if not any(g['id'] == group_id for g in self.config_data['channel_groups']):
-            self.config_data['channel_groups'].append({
-                'id': group_id,
-                'identification': group_identification, 
-                'mask': port_mask, 
-                'offset': port_offset, 
-                'port': port_ref,
-                'container_name': container_name
-            })
+        if not any(g.id == group_id for g in self.config_data['channel_groups']):
+            self.config_data['channel_groups'].append(DioChannelGroupRecord(
+                id=group_id,
+                identification=group_identification,
+                mask=port_mask,
+                offset=port_offset,
+                port=port_ref,
+                container_name=container_name
+            ))
 
     def _extract_dio_config(self, container):
         """Extract DioConfig configuration"""
@@ -404,6 +420,7 @@ class ARXMLtoDIOConfigGUI(ttk.Frame):
                 if 'DioConfig' in param_name:
                     self.config_data['dio_config'] = value
 
+    @profiler.timed('view.dio')
     def display_configuration(self):
         """Display extracted configuration in structured format"""
         config_text = "═" * 80 + "\n"
@@ -445,9 +462,9 @@ class ARXMLtoDIOConfigGUI(ttk.Frame):
             config_text += f"DIO PORTS ({len(self.config_data['ports'])} found)\n"
             # config_text += "─" * 40 + "\n"
             for port in self.config_data['ports']:
-                config_text += f"  Port {port['id']}:\n"
-                config_text += f"    Symbolic Name: {port['symbolic_name']}\n"
-                config_text += f"    Container: {port.get('container_name', 'Unknown')}\n"
+                config_text += f"  Port {port.id}:\n"
+                config_text += f"    Symbolic Name: {port.symbolic_name}\n"
+                config_text += f"    Container: {port.container_name}\n"
             config_text += "\n"
         else:
             config_text += "DIO PORTS\n"
@@ -459,10 +476,10 @@ class ARXMLtoDIOConfigGUI(ttk.Frame):
             config_text += f"DIO CHANNELS ({len(self.config_data['channels'])} found)\n"
             # config_text += "─" * 40 + "\n"
             for channel in self.config_data['channels']:
-                config_text += f"  Channel {channel['id']}:\n"
-                config_text += f"    Symbolic Name: {channel['symbolic_name']}\n"
-                config_text += f"    Port Reference: {channel['port']}\n"
-                config_text += f"    Container: {channel.get('container_name', 'Unknown')}\n"
+                config_text += f"  Channel {channel.id}:\n"
+                config_text += f"    Symbolic Name: {channel.symbolic_name}\n"
+                config_text += f"    Port Reference: {channel.port}\n"
+                config_text += f"    Container: {channel.container_name}\n"
             config_text += "\n"
         else:
             config_text += "DIO CHANNELS\n"
@@ -474,12 +491,12 @@ class ARXMLtoDIOConfigGUI(ttk.Frame):
             config_text += f"DIO CHANNEL GROUPS ({len(self.config_data['channel_groups'])} found)\n"
             # config_text += "─" * 40 + "\n"
             for group in self.config_data['channel_groups']:
-                config_text += f"  Channel Group: {group['id']}\n"
-                config_text += f"    Identification: {group.get('identification', group['id'])}\n"
-                config_text += f"    Port Reference: {group['port']}\n"
-                config_text += f"    Port Mask: 0x{group['mask']:04X} ({group['mask']})\n"
-                config_text += f"    Port Offset: {group['offset']}\n"
-                config_text += f"    Container: {group.get('container_name', 'Unknown')}\n"
+                config_text += f"  Channel Group: {group.id}\n"
+                config_text += f"    Identification: {group.identification}\n"
+                config_text += f"    Port Reference: {group.port}\n"
+                config_text += f"    Port Mask: 0x{group.mask:04X} ({group.mask})\n"
+                config_text += f"    Port Offset: {group.offset}\n"
+                config_text += f"    Container: {group.container_name}\n"
             config_text += "\n"
         else:
             config_text += "DIO CHANNEL GROUPS\n"
@@ -511,11 +528,13 @@ class ARXMLtoDIOConfigGUI(ttk.Frame):
         if self.channel_editor: 
             self.channel_editor.load_channels()
 
-    def generate_dio_cfg_h(self):
-        """Generate DIO_CFG.H file content"""
+    @profiler.timed('codegen.dio')
+    def generate_dio_cfg_h(self, interactive=True):
+        """Generate DIO_CFG.H file content; False when there is nothing to generate"""
         if not self.config_data['channels'] and not self.config_data['ports']:
-            messagebox.showwarning("Warning", "No DIO configuration available.")
-            return
+            if interactive:
+                messagebox.showwarning("Warning", "No DIO configuration available.")
+            return False
             
         arxml_filename = os.path.basename(self.arxml_file_path) if self.arxml_file_path else 'Unknown'
         generation_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
@@ -579,7 +598,7 @@ class ARXMLtoDIOConfigGUI(ttk.Frame):
 ==================================================================================================*/
 """
             for port in self.config_data['ports']:
-                content += f"#define {port['symbolic_name']:<40} ({port['id']}U)\n"
+                content += f"#define {port.symbolic_name:<40} ({port.id}U)\n"
             content += "\n"
 
         # Add Channel Symbolic Names
@@ -589,7 +608,7 @@ class ARXMLtoDIOConfigGUI(ttk.Frame):
 ==================================================================================================*/
 """
             for channel in self.config_data['channels']:
-                content += f"#define {channel['symbolic_name']:<40} ({channel['id']}U)\n"
+                content += f"#define {channel.symbolic_name:<40} ({channel.id}U)\n"
             content += "\n"
 
         # Add Channel Group Symbolic Names
@@ -599,10 +618,10 @@ class ARXMLtoDIOConfigGUI(ttk.Frame):
 ==================================================================================================*/
 """
             for group in self.config_data['channel_groups']:
-                content += f"#define {group['id']:<40} ({group['port']}U)\n"
-                content += f"#define {group['id']}_MASK{' ':<31} (0x{group['mask']:04X}U)\n"
-                content += f"#define {group['id']}_OFFSET{' ':<28} ({group['offset']}U)\n"
-                content += f"#define {group['id']}_IDENTIFICATION{' ':<20} \"{group.get('identification', group['id'])}\"\n"
+                content += f"#define {group.id:<40} ({group.port}U)\n"
+                content += f"#define {group.id}_MASK{' ':<31} (0x{group.mask:04X}U)\n"
+                content += f"#define {group.id}_OFFSET{' ':<28} ({group.offset}U)\n"
+                content += f"#define {group.id}_IDENTIFICATION{' ':<20} \"{group.identification}\"\n"
                 content += "\n"
 
         content += """/*==================================================================================================
@@ -616,42 +635,84 @@ extern const Dio_ConfigType Dio_Config;
         self.code_text.delete(1.0, tk.END)
         self.code_text.insert(1.0, content)
         self.status_var.set("DIO_CFG.H generated successfully")
+        return True
+
+    def generate_dio_lookup_tables(self):
+        """Generate the const port/channel/group lookup tables emitted into Dio.c
+
+        Port n maps to the GPIO block at GPIOA_BASE + n * 0x400 and a channel
+        drives pin (ChannelId % 16) of its referenced port. The channel table
+        is indexed directly by ChannelId; IDs without a configured channel get
+        an empty mask so reads return STD_LOW and writes are no-ops.
+        """
+        channels = self.config_data['channels']
+        groups = self.config_data['channel_groups']
+
+        port_ids = [port.id for port in self.config_data['ports']]
+        port_ids += [channel.port for channel in channels]
+        port_ids += [group.port for group in groups]
+        port_map_size = max(port_ids) + 1 if port_ids else 1
+        channel_map_size = max(channel.id for channel in channels) + 1 if channels else 1
+
+        port_names = {port.id: port.symbolic_name for port in self.config_data['ports']}
+        channels_by_id = {channel.id: channel for channel in channels}
+
+        content = f"""/*==================================================================================================
+*                              DIO LOOKUP TABLES
+==================================================================================================*/
+#define DIO_PORT_MAP_SIZE                    ({port_map_size}U)
+#define DIO_CHANNEL_MAP_SIZE                 ({channel_map_size}U)
+#define DIO_CHANNEL_GROUP_MAP_SIZE           ({max(len(groups), 1)}U)
 
-    def save_driver_files(self):
-        """Save all DIO driver files"""
-        if not self.code_text.get(1.0, tk.END).strip():
-            messagebox.showwarning("Warning", "Please generate the code first")
-            return
-            
-        directory_path = filedialog.askdirectory(title="Select Directory to Save Driver Files")
-        if not directory_path: 
-            return
-            
-        try:
-            os.makedirs(directory_path, exist_ok=True) # Added this line
-            
-            dio_cfg_h_content = self.code_text.get(1.0, tk.END)
-            generation_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            dio_h_content = DIO_H_TEMPLATE.replace('##GENERATION_TIME##', generation_time)
-            dio_c_content = DIO_C_TEMPLATE.replace('##GENERATION_TIME##', generation_time)
-            
-            files_to_save = [
-                ('Dio_Cfg.h', dio_cfg_h_content),
-                ('Dio.h', dio_h_content),
-                ('Dio.c', dio_c_content),
-            ]
+#define DIO_GPIO_PORT(n)                     ((GPIO_TypeDef *)(GPIOA_BASE + ((n) * 0x400U)))
 
-            for filename, content in files_to_save:
-                try:
-                    with open(os.path.join(directory_path, filename), 'w', encoding='utf-8') as f:
-                        f.write(content)
-                except Exception as e:
-                    messagebox.showerror("Error", f"Failed to save file '{filename}': {str(e)}")
-                    self.status_var.set(f"Error saving {filename}")
-                    return # Stop saving other files if one fails
-            
-            # Create README file
-            readme_content = f'''# AUTOSAR DIO Driver Files
+/* Port ID -> GPIO register block */
+GPIO_TypeDef * const Dio_PortMap[DIO_PORT_MAP_SIZE] = {{
+"""
+        for port_id in range(port_map_size):
+            content += f"    DIO_GPIO_PORT({port_id}U),   /* {port_names.get(port_id, f'Port {port_id}')} */\n"
+        content += """};
+
+/* Channel ID -> (port register block, pin mask) */
+const Dio_ChannelMapType Dio_ChannelMap[DIO_CHANNEL_MAP_SIZE] = {
+"""
+        for channel_id in range(channel_map_size):
+            channel = channels_by_id.get(channel_id)
+            if channel is None:
+                content += f"    {{ DIO_GPIO_PORT(0U), 0x0000U }},   /* {channel_id}: not configured */\n"
+            else:
+                mask = 1 << (channel_id % 16)
+                content += f"    {{ DIO_GPIO_PORT({channel.port}U), 0x{mask:04X}U }},   /* {channel_id}: {channel.symbolic_name} */\n"
+        content += """};
+
+/* Channel group -> (mask, offset, port) */
+const Dio_ChannelGroupType Dio_ChannelGroupConfig[DIO_CHANNEL_GROUP_MAP_SIZE] = {
+"""
+        if groups:
+            for group in groups:
+                content += f"    {{ 0x{group.mask:04X}U, {group.offset}U, {group.port}U }},   /* {group.id} */\n"
+        else:
+            content += "    { 0x0000U, 0U, 0U },   /* no channel groups configured */\n"
+        content += "};\n"
+
+        return content
+
+    def driver_files(self):
+        """(file name, content) of each DIO driver file, built around the generated Dio_Cfg.h"""
+        dio_cfg_h_content = self.code_text.get(1.0, tk.END)
+        generation_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        dio_h_content = DIO_H_TEMPLATE.replace('##GENERATION_TIME##', generation_time)
+        dio_c_content = DIO_C_TEMPLATE.replace('##GENERATION_TIME##', generation_time)
+        dio_c_content = dio_c_content.replace('##DIO_LOOKUP_TABLES##', self.generate_dio_lookup_tables())
+        
+        files = [
+            ('Dio_Cfg.h', dio_cfg_h_content),
+            ('Dio.h', dio_h_content),
+            ('Dio.c', dio_c_content),
+        ]
+
+        # Create README file
+        readme_content = f'''# AUTOSAR DIO Driver Files
 
 Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 Source ARXML: {os.path.basename(self.arxml_file_path) if self.arxml_file_path else 'Unknown'}
@@ -665,13 +726,13 @@ Source ARXML: {os.path.basename(self.arxml_file_path) if self.arxml_file_path el
 ## Configuration Summary:
 
 ### Ports: {len(self.config_data['ports'])}
-{chr(10).join([f"- {port['symbolic_name']} (ID: {port['id']})" for port in self.config_data['ports']]) if self.config_data['ports'] else "- No ports configured"}
+{chr(10).join([f"- {port.symbolic_name} (ID: {port.id})" for port in self.config_data['ports']]) if self.config_data['ports'] else "- No ports configured"}
 
 ### Channels: {len(self.config_data['channels'])}
-{chr(10).join([f"- {channel['symbolic_name']} (ID: {channel['id']}, Port: {channel['port']})" for channel in self.config_data['channels']]) if self.config_data['channels'] else "- No channels configured"}
+{chr(10).join([f"- {channel.symbolic_name} (ID: {channel.id}, Port: {channel.port})" for channel in self.config_data['channels']]) if self.config_data['channels'] else "- No channels configured"}
 
 ### Channel Groups: {len(self.config_data['channel_groups'])}
-{chr(10).join([f"- {group['id']} (Port: {group['port']}, Mask: 0x{group['mask']:04X}, Offset: {group['offset']})" for group in self.config_data['channel_groups']]) if self.config_data['channel_groups'] else "- No channel groups configured"}
+{chr(10).join([f"- {group.id} (Port: {group.port}, Mask: 0x{group.mask:04X}, Offset: {group.offset})" for group in self.config_data['channel_groups']]) if self.config_data['channel_groups'] else "- No channel groups configured"}
 
 ## API Features:
 - DEV_ERROR_DETECT: {'ENABLED'} if self.config_data['dev_error_detect'] else {'DISABLED'}
@@ -679,9 +740,24 @@ Source ARXML: {os.path.basename(self.arxml_file_path) if self.arxml_file_path el
 - FLIP_CHANNEL_API: {'ENABLED'} if self.config_data['flip_channel_api'] else {'DISABLED'}
 - MASKED_WRITE_PORT_API: {'ENABLED'} if self.config_data['masked_write_port_api'] else {'DISABLED'}
 '''
+        files.append(('README.md', readme_content))
+        return files
+
+    def save_driver_files(self):
+        """Save all DIO driver files"""
+        if not self.code_text.get(1.0, tk.END).strip():
+            messagebox.showwarning("Warning", "Please generate the code first")
+            return
             
-            with open(os.path.join(directory_path, 'README.md'), 'w', encoding='utf-8') as f:
-                f.write(readme_content)
+        directory_path = filedialog.askdirectory(title="Select Directory to Save Driver Files")
+        if not directory_path: 
+            return
+            
+        try:
+            writer = OutputSetWriter(directory_path)
+            for filename, content in self.driver_files():
+                writer.add(filename, content)
+            writer.commit()
 
             messagebox.showinfo("Success", f"DIO driver files saved successfully to:\n{directory_path}")
             self.status_var.set("Driver files saved successfully")
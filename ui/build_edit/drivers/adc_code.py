@@ -238,6 +238,8 @@ static const Adc_ConfigType* Adc_ConfigPtr = NULL_PTR;
 static boolean Adc_Initialized = FALSE;
 static uint8 Adc_CurrentPowerState = 0U;
 
+##ADC_RESULT_BUFFERS##
+
 /* ============================ */
 /*        API DEFINITIONS       */
 /* ============================ */
@@ -254,6 +256,9 @@ void Adc_Init(const Adc_ConfigType* ConfigPtr)
 
     /* Example: Set sample time for channel 0 */
     ADC1_SMPR2 |= (0x7 << 0);  // 480 cycles for channel 0
+
+    Adc_ConfigPtr = ConfigPtr;
+    Adc_Initialized = TRUE;
 }
 
 /* Start conversion on a group (simulate group as channel 0) */
@@ -268,11 +273,34 @@ Std_ReturnType Adc_StartGroupConversion(Adc_GroupType Group)
     return E_OK;
 }
 
-/* Read conversion result */
+/* Convert every channel of the group into its result buffer and return the latest samples */
 Std_ReturnType Adc_ReadGroup(Adc_GroupType Group, Adc_ValueGroupType* DataBufferPtr)
 {
-    while (!(ADC1_SR & ADC_SR_EOC)) ;  // Wait for conversion
-    DataBufferPtr[0] = (uint16)ADC1_DR;
+    const Adc_GroupDescriptorType* GroupCfg;
+    Adc_ValueGroupType* Sample;
+    uint8 Ch;
+
+    if ((Group >= ADC_GROUP_DESCRIPTOR_COUNT) || (Adc_GroupDescriptors[Group].ResultSize == 0U)) {
+#if (ADC_DEV_ERROR_DETECT == STD_ON)
+        Det_ReportError(ADC_MODULE_ID, ADC_INSTANCE_ID, ADC_READ_GROUP_ID, ADC_E_PARAM_GROUP);
+#endif
+        return E_NOT_OK;
+    }
+
+    GroupCfg = &Adc_GroupDescriptors[Group];
+    Sample = &Adc_GroupResultPtr[Group][Adc_GroupSampleIndex[Group]];
+    for (Ch = 0U; Ch < GroupCfg->NumChannels; Ch++) {
+        ADC1_SQR3 = GroupCfg->Channels[Ch];
+        ADC1_CR2 |= ADC_CR2_SWSTART;
+        while (!(ADC1_SR & ADC_SR_EOC)) ;  // Wait for conversion
+        *Sample = (uint16)ADC1_DR;
+        DataBufferPtr[Ch] = *Sample;
+        Sample += GroupCfg->NumSamples;  /* next channel row of the channel-major buffer */
+    }
+
+    if (++Adc_GroupSampleIndex[Group] >= GroupCfg->NumSamples) {
+        Adc_GroupSampleIndex[Group] = 0U;
+    }
     return E_OK;
 }
 
@@ -294,7 +322,19 @@ Std_ReturnType Adc_SetupResultBuffer(uint16 Group, uint16* BufferPtr)
 #endif
         return E_NOT_OK;
     }
-    /* TODO: assign buffer for group */
+    if ((Group >= ADC_GROUP_DESCRIPTOR_COUNT) || (Adc_GroupDescriptors[Group].ResultSize == 0U)) {
+#if (ADC_DEV_ERROR_DETECT == STD_ON)
+        Det_ReportError(ADC_MODULE_ID, ADC_INSTANCE_ID, ADC_SETUP_RESULT_BUFFER_ID, ADC_E_PARAM_GROUP);
+#endif
+        return E_NOT_OK;
+    }
+    /* The application buffer must hold ResultSize samples; NULL_PTR restores the static pool slice */
+    if (BufferPtr == NULL_PTR) {
+        Adc_GroupResultPtr[Group] = &Adc_ResultPool[Adc_GroupDescriptors[Group].ResultOffset];
+    } else {
+        Adc_GroupResultPtr[Group] = BufferPtr;
+    }
+    Adc_GroupSampleIndex[Group] = 0U;
     return E_OK;
 }
 
@@ -352,6 +352,50 @@ static Can_ControllerStateType Can_ControllerState[CAN_CONTROLLER_MAX_COUNT];
 static uint8_t Can_InterruptDisableCount[CAN_CONTROLLER_MAX_COUNT] = {0};
 static Can_TimeStampType Can_SystemTimestamp = 0; /* Simple timestamp counter */
 
+/* Receive lookup: CAN ID (Can_IdType, MSB set for extended IDs) -> HRH */
+#define CAN_ID_EXTENDED_FLAG  (0x80000000UL)
+#define CAN_HRH_INVALID       ((Can_HwHandleType)0xFFFFU)
+
+typedef struct {
+    Can_IdType       CanId;
+    Can_HwHandleType Hrh;
+} Can_RxExactEntryType;
+
+typedef struct {
+    Can_IdType       Code;
+    Can_IdType       Mask;
+    Can_HwHandleType Hrh;
+} Can_RxMaskedEntryType;
+
+##CAN_RX_LOOKUP_TABLES##
+
+/* Bounded-time HRH lookup: binary search over the sorted FULL-CAN table
+ * (at most CAN_RX_LOOKUP_MAX_STEPS iterations), then the short code/mask list */
+static Can_HwHandleType Can_LookupHrh(Can_IdType CanId) {
+    uint32_t low = 0U;
+    uint32_t high = CAN_RX_EXACT_COUNT;
+    uint32_t i;
+
+    while (low < high) {
+        uint32_t mid = low + ((high - low) >> 1);
+        if (Can_RxExactTable[mid].CanId < CanId) {
+            low = mid + 1U;
+        } else {
+            high = mid;
+        }
+    }
+    if ((low < CAN_RX_EXACT_COUNT) && (Can_RxExactTable[low].CanId == CanId)) {
+        return Can_RxExactTable[low].Hrh;
+    }
+
+    for (i = 0U; i < CAN_RX_MASKED_COUNT; i++) {
+        if ((CanId & Can_RxMaskedTable[i].Mask) == Can_RxMaskedTable[i].Code) {
+            return Can_RxMaskedTable[i].Hrh;
+        }
+    }
+    return CAN_HRH_INVALID;
+}
+
 /*
  * =================================================================================================
  * Section 4: AUTOSAR CAN Driver API Implementation
@@ -675,9 +719,16 @@ void Can_MainFunction_Write(void) {
     /* In polling mode, this function would check TX status and call CanIf_TxConfirmation */
 }
 
+static void Can_ReceiveFifo0(void);
+
 void Can_MainFunction_Read(void) { 
     /* Per SWS_Can_00108, polls for RX indication if configured */
-    /* In polling mode, this function would check RX FIFO and call CanIf_RxIndication */
+    /* Only poll while the FIFO 0 message pending interrupt (FMPIE0) is disabled */
+    if ((Can_GlobalConfig != NULL) && ((CAN1->IER & (1U << 1)) == 0U)) {
+        while ((CAN1->RF0R & 0x3) > 0) {
+            Can_ReceiveFifo0();
+        }
+    }
 }
 
 void Can_MainFunction_BusOff(void) { 
@@ -722,33 +773,45 @@ void CAN1_TX_IRQHandler(void) {
     }
 }
 
-void CAN1_RX0_IRQHandler(void) {
-    if ((CAN1->RF0R & 0x3) > 0) { /* Check if message is pending in FIFO 0 */
-        Can_HwType mailbox;
-        PduInfoType pduInfo;
-        uint8_t rx_data[8];
-
-        mailbox.ControllerId = 0;
-        mailbox.Hoh = CanHardwareObject_Rx_Hrh;
-        mailbox.CanId = (CAN1->sFIFOMailBox[0].RIR >> 21);
-
-        pduInfo.SduLength = (CAN1->sFIFOMailBox[0].RDTR & 0xF);
-        pduInfo.SduDataPtr = rx_data;
-
-        uint32_t data_low = CAN1->sFIFOMailBox[0].RDLR;
-        uint32_t data_high = CAN1->sFIFOMailBox[0].RDHR;
-        rx_data[0] = (data_low >> 0) & 0xFF;
-        rx_data[1] = (data_low >> 8) & 0xFF;
-        rx_data[2] = (data_low >> 16) & 0xFF;
-        rx_data[3] = (data_low >> 24) & 0xFF;
-        rx_data[4] = (data_high >> 0) & 0xFF;
-        rx_data[5] = (data_high >> 8) & 0xFF;
-        rx_data[6] = (data_high >> 16) & 0xFF;
-        rx_data[7] = (data_high >> 24) & 0xFF;
-
-        CAN1->RF0R |= (1 << 5); /* RFOM0 = 1: Release FIFO 0 output mailbox */
+static void Can_ReceiveFifo0(void) {
+    Can_HwType mailbox;
+    PduInfoType pduInfo;
+    uint8_t rx_data[8];
+    uint32_t rir = CAN1->sFIFOMailBox[0].RIR;
 
+    mailbox.ControllerId = 0;
+    if (rir & (1U << 2)) { /* IDE: extended identifier */
+        mailbox.CanId = (rir >> 3) | CAN_ID_EXTENDED_FLAG;
+    } else {
+        mailbox.CanId = (rir >> 21);
+    }
+    mailbox.Hoh = Can_LookupHrh(mailbox.CanId);
+
+    pduInfo.SduLength = (CAN1->sFIFOMailBox[0].RDTR & 0xF);
+    pduInfo.SduDataPtr = rx_data;
+
+    uint32_t data_low = CAN1->sFIFOMailBox[0].RDLR;
+    uint32_t data_high = CAN1->sFIFOMailBox[0].RDHR;
+    rx_data[0] = (data_low >> 0) & 0xFF;
+    rx_data[1] = (data_low >> 8) & 0xFF;
+    rx_data[2] = (data_low >> 16) & 0xFF;
+    rx_data[3] = (data_low >> 24) & 0xFF;
+    rx_data[4] = (data_high >> 0) & 0xFF;
+    rx_data[5] = (data_high >> 8) & 0xFF;
+    rx_data[6] = (data_high >> 16) & 0xFF;
+    rx_data[7] = (data_high >> 24) & 0xFF;
+
+    CAN1->RF0R |= (1 << 5); /* RFOM0 = 1: Release FIFO 0 output mailbox */
+
+    /* Frames that match no configured receive object are dropped */
+    if (mailbox.Hoh != CAN_HRH_INVALID) {
         CanIf_RxIndication(&mailbox, &pduInfo);
     }
 }
+
+void CAN1_RX0_IRQHandler(void) {
+    if ((CAN1->RF0R & 0x3) > 0) { /* Check if message is pending in FIFO 0 */
+        Can_ReceiveFifo0();
+    }
+}
 '''
@@ -68,6 +68,17 @@ typedef struct {
 
 #define RCC_AHB1ENR   (*(volatile uint32_t *)(RCC_BASE + 0x30U))
 
+/* Channel lookup entry: GPIO register block and pin bit mask */
+typedef struct {
+    GPIO_TypeDef *port;
+    uint16_t mask;
+} Dio_ChannelMapType;
+
+/* Lookup tables generated from the ARXML configuration (Dio.c) */
+extern GPIO_TypeDef * const Dio_PortMap[];
+extern const Dio_ChannelMapType Dio_ChannelMap[];
+extern const Dio_ChannelGroupType Dio_ChannelGroupConfig[];
+
 /* Function prototypes */
 Dio_LevelType Dio_ReadChannel(Dio_ChannelType ChannelId);
 void Dio_WriteChannel(Dio_ChannelType ChannelId, Dio_LevelType Level);
@@ -99,7 +110,9 @@ DIO_C_TEMPLATE = '''
  */
 
 #include "Dio.h"
-#include "Dio_cfg.h"
+#include "Dio_Cfg.h"
+
+##DIO_LOOKUP_TABLES##
 
 /* Hardware initialization for STM32F407VGT6 Discovery Board */
 void Dio_InitHardware(void)
@@ -128,77 +141,54 @@ void Dio_InitHardware(void)
 
 Dio_LevelType Dio_ReadChannel(Dio_ChannelType ChannelId)
 {
-    GPIO_TypeDef *GPIOx;
-    uint8_t pin;
-
-    /* Map channel ID to GPIO port and pin for F407VGT6 Discovery */
-    switch(ChannelId) {
-        case 0: GPIOx = GPIOD; pin = 12; break;  /* Green LED */
-        case 1: GPIOx = GPIOD; pin = 13; break;  /* Orange LED */
-        case 2: GPIOx = GPIOD; pin = 14; break;  /* Red LED */
-        case 3: GPIOx = GPIOD; pin = 15; break;  /* Blue LED */
-        default: return STD_LOW;
-    }
+    const Dio_ChannelMapType *channel;
 
-    /* Read pin state */
-    if (GPIOx->IDR & (1U << pin)) {
-        return STD_HIGH;
-    } else {
+#if (DIO_DEV_ERROR_DETECT == STD_ON)
+    if (ChannelId >= DIO_CHANNEL_MAP_SIZE) {
         return STD_LOW;
     }
+#endif
+
+    /* O(1) table lookup; unconfigured IDs have an empty mask and read STD_LOW */
+    channel = &Dio_ChannelMap[ChannelId];
+    return (Dio_LevelType)((channel->port->IDR & channel->mask) != 0U);
 }
 
 void Dio_WriteChannel(Dio_ChannelType ChannelId, Dio_LevelType Level)
 {
-    GPIO_TypeDef *GPIOx;
-    uint8_t pin;
-
-    /* Map channel ID to GPIO port and pin for F407VGT6 Discovery */
-    switch(ChannelId) {
-        case 0: GPIOx = GPIOD; pin = 12; break;  /* Green LED */
-        case 1: GPIOx = GPIOD; pin = 13; break;  /* Orange LED */
-        case 2: GPIOx = GPIOD; pin = 14; break;  /* Red LED */
-        case 3: GPIOx = GPIOD; pin = 15; break;  /* Blue LED */
-        default: return;
-    }
+    const Dio_ChannelMapType *channel;
 
-    /* Write pin state using BSRR register for atomic operation */
-    if (Level == STD_HIGH) {
-        GPIOx->BSRR = (1U << pin);          /* Set bit */
-    } else {
-        GPIOx->BSRR = (1U << (pin + 16));   /* Reset bit */
+#if (DIO_DEV_ERROR_DETECT == STD_ON)
+    if (ChannelId >= DIO_CHANNEL_MAP_SIZE) {
+        return;
     }
+#endif
+
+    /* BSRR: low half sets, high half resets - select the half from Level */
+    channel = &Dio_ChannelMap[ChannelId];
+    channel->port->BSRR = (uint32_t)channel->mask << ((((uint32_t)Level & 1U) ^ 1U) << 4);
 }
 
-/* Keep your other functions as they were, but replace the GPIO function calls */
 Dio_PortLevelType Dio_ReadPort(Dio_PortType PortId)
 {
-    GPIO_TypeDef *GPIOx;
-
-    switch (PortId) {
-        case 0: GPIOx = GPIOA; break;
-        case 1: GPIOx = GPIOB; break;
-        case 2: GPIOx = GPIOC; break;
-        case 3: GPIOx = GPIOD; break;
-        default: return 0;
+#if (DIO_DEV_ERROR_DETECT == STD_ON)
+    if (PortId >= DIO_PORT_MAP_SIZE) {
+        return 0;
     }
+#endif
 
-    return (Dio_PortLevelType)(GPIOx->IDR & 0xFFFF);
+    return (Dio_PortLevelType)(Dio_PortMap[PortId]->IDR & 0xFFFF);
 }
 
 void Dio_WritePort(Dio_PortType PortId, Dio_PortLevelType Level)
 {
-    GPIO_TypeDef *GPIOx;
-
-    switch (PortId) {
-        case 0: GPIOx = GPIOA; break;
-        case 1: GPIOx = GPIOB; break;
-        case 2: GPIOx = GPIOC; break;
-        case 3: GPIOx = GPIOD; break;
-        default: return;
+#if (DIO_DEV_ERROR_DETECT == STD_ON)
+    if (PortId >= DIO_PORT_MAP_SIZE) {
+        return;
     }
+#endif
 
-    GPIOx->ODR = (uint32_t)Level;
+    Dio_PortMap[PortId]->ODR = (uint32_t)Level;
 }
 
 /* Add other functions following the same pattern... */
@@ -223,34 +213,24 @@ Dio_LevelType Dio_FlipChannel(Dio_ChannelType ChannelId)
 
 Dio_PortLevelType Dio_ReadChannelGroup(const Dio_ChannelGroupType *ChannelGroupIdPtr)
 {
-    GPIO_TypeDef *GPIOx;
     Dio_PortLevelType portValue;
-    Dio_PortLevelType maskedValue;
 
     /* Check for null pointer */
     if (ChannelGroupIdPtr == NULL) {
         return 0;
     }
 
-    /* Map port ID to GPIO port */
-    switch (ChannelGroupIdPtr->port) {
-        case 0: GPIOx = GPIOA; break;
-        case 1: GPIOx = GPIOB; break;
-        case 2: GPIOx = GPIOC; break;
-        case 3: GPIOx = GPIOD; break;
-        default: return 0;
+#if (DIO_DEV_ERROR_DETECT == STD_ON)
+    if (ChannelGroupIdPtr->port >= DIO_PORT_MAP_SIZE) {
+        return 0;
     }
+#endif
 
-    /* Read entire port */
-    portValue = (Dio_PortLevelType)(GPIOx->IDR & 0xFFFF);
-
-    /* Apply mask to get only the channel group bits */
-    maskedValue = portValue & ChannelGroupIdPtr->mask;
-
-    /* Shift right to align to LSB based on offset */
-    maskedValue = maskedValue >> ChannelGroupIdPtr->offset;
+    /* Read entire port through the port table */
+    portValue = (Dio_PortLevelType)(Dio_PortMap[ChannelGroupIdPtr->port]->IDR & 0xFFFF);
 
-    return maskedValue;
+    /* Apply mask and shift right to align to LSB based on offset */
+    return (Dio_PortLevelType)((portValue & ChannelGroupIdPtr->mask) >> ChannelGroupIdPtr->offset);
 }
 
 void Dio_WriteChannelGroup(const Dio_ChannelGroupType *ChannelGroupIdPtr, Dio_PortLevelType Level)
@@ -265,14 +245,13 @@ void Dio_WriteChannelGroup(const Dio_ChannelGroupType *ChannelGroupIdPtr, Dio_Po
         return;
     }
 
-    /* Map port ID to GPIO port */
-    switch (ChannelGroupIdPtr->port) {
-        case 0: GPIOx = GPIOA; break;
-        case 1: GPIOx = GPIOB; break;
-        case 2: GPIOx = GPIOC; break;
-        case 3: GPIOx = GPIOD; break;
-        default: return;
+#if (DIO_DEV_ERROR_DETECT == STD_ON)
+    if (ChannelGroupIdPtr->port >= DIO_PORT_MAP_SIZE) {
+        return;
     }
+#endif
+
+    GPIOx = Dio_PortMap[ChannelGroupIdPtr->port];
 
     /* Read current port value */
     currentPortValue = (Dio_PortLevelType)(GPIOx->ODR & 0xFFFF);
@@ -296,14 +275,13 @@ void Dio_MaskedWritePort(Dio_PortType PortId, Dio_PortLevelType Level, Dio_PortL
     Dio_PortLevelType currentPortValue;
     Dio_PortLevelType newPortValue;
 
-    /* Map port ID to GPIO port */
-    switch (PortId) {
-        case 0: GPIOx = GPIOA; break;
-        case 1: GPIOx = GPIOB; break;
-        case 2: GPIOx = GPIOC; break;
-        case 3: GPIOx = GPIOD; break;
-        default: return;
+#if (DIO_DEV_ERROR_DETECT == STD_ON)
+    if (PortId >= DIO_PORT_MAP_SIZE) {
+        return;
     }
+#endif
+
+    GPIOx = Dio_PortMap[PortId];
 
     /* Read current port value */
     currentPortValue = (Dio_PortLevelType)(GPIOx->ODR & 0xFFFF);
@@ -2,8 +2,13 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import xml.etree.ElementTree as ET
 import os
+import re
 from datetime import datetime
 # from .drivers.gpt_code import GPT_H_TEMPLATE, GPT_C_TEMPLATE
+from .gpt_tick_solver import GptTickSolver, parse_periods, DEFAULT_TIMER_CLOCK_HZ
+from .arxml_namespace import strip_namespace
+from .records import GptChannelRecord
+from ..profiling import profiler
 
 class ARXMLtoGPTConfigGUI(ttk.Frame):
     def __init__(self, parent):
@@ -12,6 +17,7 @@ class ARXMLtoGPTConfigGUI(ttk.Frame):
         
         
         self.status_var = tk.StringVar(value="Ready")
+        self.generation_warnings = []  # problems the last generation went ahead despite
         
 
         self.config_data = {
@@ -49,6 +55,9 @@ class ARXMLtoGPTConfigGUI(ttk.Frame):
         }
         
         self.arxml_file_path = None
+        # Required timeout periods per channel id and the solver settings used to check them
+        self.timing_requirements = {}
+        self.timing_settings = {'timer_clock_hz': DEFAULT_TIMER_CLOCK_HZ, 'counter_bits': 16, 'tolerance': 0.001}
         self.setup_ui()
 
     def setup_ui(self):
@@ -104,7 +113,10 @@ class ARXMLtoGPTConfigGUI(ttk.Frame):
         self.generate_btn.pack(side=tk.LEFT, padx=(0, 10))
 
         self.save_btn = ttk.Button(buttons_frame, text="Save GPT_CFG.H", command=self.save_gpt_cfg_h)
-        self.save_btn.pack(side=tk.LEFT)
+        self.save_btn.pack(side=tk.LEFT, padx=(0, 10))
+
+        self.timing_btn = ttk.Button(buttons_frame, text="Timing Requirements", command=self.open_tick_solver)
+        self.timing_btn.pack(side=tk.LEFT)
 
         code_frame = ttk.LabelFrame(right_frame, text="Generated Gpt_Cfg.h", padding="10")
         code_frame.grid(row=0, column=0, sticky='nsew')
@@ -138,7 +150,8 @@ class ARXMLtoGPTConfigGUI(ttk.Frame):
             return
 
         try:
-            tree = ET.parse(self.arxml_file_path)
+            with profiler.span('parse.gpt', file=os.path.basename(self.arxml_file_path)):
+                tree = ET.parse(self.arxml_file_path)
             root = tree.getroot()
             
             # Extract configuration
@@ -153,7 +166,19 @@ class ARXMLtoGPTConfigGUI(ttk.Frame):
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred: {str(e)}")
 
+    def load_arxml_tree(self, tree):
+        """Extract, display and generate from an already parsed ARXML tree, without dialogs.
+
+        Used by watch mode; False when nothing was generated. Timing
+        violations are left in generation_warnings.
+        """
+        self.extract_config_from_arxml(tree.getroot())
+        self.display_configuration()
+        return self.generate_gpt_cfg_h(interactive=False)
+
+    @profiler.timed('extract.gpt')
     def extract_config_from_arxml(self, root):
+        strip_namespace(root)  # extraction matches bare AUTOSAR tag names
         # Clear existing data
         self.config_data['clock_reference_points'] = []
         self.config_data['channel_config_sets'] = []
@@ -161,14 +186,16 @@ class ARXMLtoGPTConfigGUI(ttk.Frame):
         self.config_data['wakeup_configurations'] = []
 
         # Find all containers
-        containers = root.findall('.//ECUC-CONTAINER-VALUE')
+        with profiler.span('index.gpt'):
+            containers = root.findall('.//ECUC-CONTAINER-VALUE')
         
         for container in containers:
             short_name_elem = container.find('SHORT-NAME')
             if short_name_elem is None:
                 continue
 
-            short_name = short_name_elem.text
+            # Multi-instance containers carry an index suffix (SpiJob_3, GptChannelConfiguration_0)
+            short_name = re.sub(r'(_\d+)+$', '', short_name_elem.text or '')
 
             if short_name == 'Gpt':
                 self.extract_main_gpt_container(container)
@@ -278,15 +305,7 @@ class ARXMLtoGPTConfigGUI(ttk.Frame):
 
     def extract_gpt_channel_configuration(self, container):
         """Extract GptChannelConfiguration"""
-        channel_config = {
-            'channel_id': 0,
-            'channel_mode': 'GPT_CH_MODE_ONESHOT',
-            'channel_tick_frequency': 0.0,
-            'channel_tick_value_max': 0,
-            'enable_wakeup': False,
-            'notification': '',
-            'channel_clk_src_ref': False
-        }
+        channel_config = GptChannelRecord()
         
         bool_params = container.findall('.//ECUC-BOOLEAN-PARAM-VALUE')
         num_params = container.findall('.//ECUC-NUMERICAL-PARAM-VALUE')
@@ -298,34 +317,34 @@ class ARXMLtoGPTConfigGUI(ttk.Frame):
             value = self.get_bool_value(param)
             
             if param_name == 'GptEnableWakeup':
-                channel_config['enable_wakeup'] = value
+                channel_config.enable_wakeup = value
             elif param_name == 'GptChannelClkSrcRef':
-                channel_config['channel_clk_src_ref'] = value
+                channel_config.channel_clk_src_ref = value
         
         for param in num_params:
             param_name = self.get_param_name(param)
             value = self.get_num_value(param)
             
             if param_name == 'GptChannelId':
-                channel_config['channel_id'] = value
+                channel_config.channel_id = value
             elif param_name == 'GptChannelTickFrequency':
-                channel_config['channel_tick_frequency'] = value
+                channel_config.channel_tick_frequency = value
             elif param_name == 'GptChannelTickValueMax':
-                channel_config['channel_tick_value_max'] = value
+                channel_config.channel_tick_value_max = value
         
         for param in text_params:
             param_name = self.get_param_name(param)
             value = self.get_text_value(param)
             
             if param_name == 'GptNotification':
-                channel_config['notification'] = value
+                channel_config.notification = value
         
         for param in enum_params:
             param_name = self.get_param_name(param)
             value = self.get_text_value(param)
             
             if param_name == 'GptChannelMode':
-                channel_config['channel_mode'] = value
+                channel_config.channel_mode = value
         
         self.config_data['channel_configurations'].append(channel_config)
 
@@ -376,6 +395,7 @@ class ARXMLtoGPTConfigGUI(ttk.Frame):
         value_elem = param.find('VALUE')
         return value_elem.text if value_elem is not None else ''
 
+    @profiler.timed('view.gpt')
     def display_configuration(self):
         """Display extracted configuration"""
         config_text = f"Extracted Configuration from ARXML:\n"
@@ -410,10 +430,10 @@ class ARXMLtoGPTConfigGUI(ttk.Frame):
         
         config_text += f"\nChannel Configurations ({len(self.config_data['channel_configurations'])}):\n"
         for i, ch in enumerate(self.config_data['channel_configurations']):
-            config_text += f"- Channel {i}: ID={ch['channel_id']}, Mode={ch['channel_mode']}, "
-            config_text += f"Freq={ch['channel_tick_frequency']}, Max={ch['channel_tick_value_max']}\n"
-            if ch['notification']:
-                config_text += f"  Notification: {ch['notification']}\n"
+            config_text += f"- Channel {i}: ID={ch.channel_id}, Mode={ch.channel_mode}, "
+            config_text += f"Freq={ch.channel_tick_frequency}, Max={ch.channel_tick_value_max}\n"
+            if ch.notification:
+                config_text += f"  Notification: {ch.notification}\n"
         
         config_text += f"\nWakeup Configurations ({len(self.config_data['wakeup_configurations'])}):\n"
         for i, wakeup in enumerate(self.config_data['wakeup_configurations']):
@@ -424,29 +444,149 @@ class ARXMLtoGPTConfigGUI(ttk.Frame):
         self.config_text.insert(1.0, config_text)
         self.config_text.config(state='disabled')
 
-    def generate_gpt_cfg_h(self):
-        """Generate the GPT_CFG.H file content"""
+    def open_tick_solver(self):
+        """Enter required timeout periods per channel and solve prescaler/tick settings"""
+        channels = self.config_data['channel_configurations']
+        if not channels:
+            messagebox.showwarning("Warning", "No GPT channels configured. Please parse an ARXML file first.")
+            return
+
+        dialog = tk.Toplevel(self)
+        dialog.title("GPT Timing Requirements")
+        dialog.transient(self)
+        dialog.grab_set()
+
+        main_frame = ttk.Frame(dialog, padding="10")
+        main_frame.pack(fill="both", expand=True)
+        main_frame.columnconfigure(1, weight=1)
+
+        settings = self.timing_settings
+        setting_vars = {
+            'timer_clock_hz': tk.StringVar(value=str(settings['timer_clock_hz'])),
+            'counter_bits': tk.StringVar(value=str(settings['counter_bits'])),
+            'tolerance': tk.StringVar(value=str(settings['tolerance'] * 100)),
+        }
+        labels = {'timer_clock_hz': "Timer clock (Hz):", 'counter_bits': "Counter width (bits):",
+                  'tolerance': "Period tolerance (%):"}
+        for row, (key, var) in enumerate(setting_vars.items()):
+            ttk.Label(main_frame, text=labels[key]).grid(row=row, column=0, padx=10, pady=2, sticky=tk.W)
+            ttk.Entry(main_frame, textvariable=var, width=14).grid(row=row, column=1, padx=10, pady=2, sticky=tk.W)
+
+        ttk.Label(main_frame, text="Required periods per channel (e.g. 1ms, 250us, 2s; bare numbers are ms)") \
+            .grid(row=3, column=0, columnspan=2, padx=10, pady=(10, 5), sticky=tk.W)
+
+        period_vars = {}
+        for row, channel in enumerate(channels, start=4):
+            channel_id = channel.channel_id
+            ttk.Label(main_frame, text=f"Channel {channel_id}:").grid(row=row, column=0, padx=10, pady=2, sticky=tk.W)
+            existing = self.timing_requirements.get(channel_id, [])
+            period_vars[channel_id] = tk.StringVar(value=", ".join(f"{p * 1e3:g}ms" for p in existing))
+            ttk.Entry(main_frame, textvariable=period_vars[channel_id], width=40) \
+                .grid(row=row, column=1, padx=10, pady=2, sticky='ew')
+
+        result_text = scrolledtext.ScrolledText(main_frame, height=10, width=80, font=('Courier', 9))
+        result_text.grid(row=len(channels) + 4, column=0, columnspan=2, padx=10, pady=(10, 0), sticky='nsew')
+
+        solved = {}
+
+        def solve():
+            try:
+                self.timing_settings = {
+                    'timer_clock_hz': int(float(setting_vars['timer_clock_hz'].get())),
+                    'counter_bits': int(setting_vars['counter_bits'].get()),
+                    'tolerance': float(setting_vars['tolerance'].get()) / 100.0,
+                }
+                requirements = {}
+                for channel_id, var in period_vars.items():
+                    periods = parse_periods(var.get())
+                    if periods:
+                        requirements[channel_id] = periods
+            except ValueError as e:
+                messagebox.showerror("Error", f"Invalid input: {str(e)}", parent=dialog)
+                return False
+
+            self.timing_requirements = requirements
+            solver = GptTickSolver(**self.timing_settings)
+            solved.clear()
+            solved.update(solver.solve(requirements))
+
+            result_text.delete(1.0, tk.END)
+            for channel_id, result in solved.items():
+                result_text.insert(tk.END, f"Channel {channel_id}: prescaler {result['prescaler']}, "
+                                           f"tick {result['tick_frequency']:g} Hz, max {result['tick_value_max']}, "
+                                           f"ticks {result['ticks']}, worst error {result['max_error'] * 100:.3g}%\n")
+                for violation in result['violations']:
+                    result_text.insert(tk.END, f"    VIOLATION {violation}\n")
+            return True
+
+        def apply():
+            # Re-solve so edits made after the last Solve are not dropped
+            if not solve():
+                return
+            for channel in channels:
+                result = solved.get(channel.channel_id)
+                if result:
+                    channel.prescaler = result['prescaler']
+                    channel.channel_tick_frequency = result['tick_frequency']
+                    channel.channel_tick_value_max = result['tick_value_max']
+            dialog.destroy()
+            self.display_configuration()
+            self.generate_gpt_cfg_h()
+
+        button_frame = ttk.Frame(main_frame)
+        button_frame.grid(row=len(channels) + 5, column=0, columnspan=2, pady=(10, 0))
+        ttk.Button(button_frame, text="Solve", command=solve).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Apply to Channels", command=apply).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Cancel", command=dialog.destroy).pack(side=tk.LEFT, padx=5)
+
+    def check_timing_requirements(self):
+        """Return violations of the required periods by the current channel settings"""
+        solver = GptTickSolver(**self.timing_settings)
+        violations = []
+        for channel in self.config_data['channel_configurations']:
+            periods = self.timing_requirements.get(channel.channel_id)
+            if not periods:
+                continue
+            for violation in solver.check_channel(channel.channel_tick_frequency,
+                                                  channel.channel_tick_value_max, periods):
+                violations.append(f"Channel {channel.channel_id}: {violation}")
+        return violations
+
+    @profiler.timed('codegen.gpt')
+    def generate_gpt_cfg_h(self, interactive=True):
+        """Generate the GPT_CFG.H file content; False when the user declined to after timing violations"""
+        violations = self.check_timing_requirements()
+        self.generation_warnings = violations
+        if violations:
+            self.status_var.set("Timing requirement violations found")
+            if interactive and not messagebox.askyesno("Timing Violations",
+                                       "The channel settings cannot meet the required periods:\n\n"
+                                       + "\n".join(violations) + "\n\nGenerate GPT_CFG.H anyway?"):
+                return False
+
         content = f"#ifndef GPT_CFG_H_\n#define GPT_CFG_H_\n\n/*\n * Developer Aruvi B and Auroshaa from CreamCollar\n * Generated GPT Configuration Header\n * Generated from ARXML: {os.path.basename(self.arxml_file_path) if self.arxml_file_path else 'Unknown'}\n * Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n */\n\n/* Module identification */\n#define GPT_VENDOR_ID                    ({self.config_data['vendor_id']}U)\n#define GPT_MODULE_ID                    ({self.config_data['module_id']}U)\n#define GPT_INSTANCE_ID                  ({self.config_data['instance_id']}U)\n\n/* Module version information */\n#define GPT_SW_MAJOR_VERSION             ({self.config_data['sw_major_version']}U)\n#define GPT_SW_MINOR_VERSION             ({self.config_data['sw_minor_version']}U)\n#define GPT_SW_PATCH_VERSION             ({self.config_data['sw_patch_version']}U)\n\n/* GPT Driver Configuration */\n#define GPT_DEV_ERROR_DETECT             {'STD_ON' if self.config_data['dev_error_detect'] else 'STD_OFF'}\n#define GPT_PREDEF_TIMER_100US_32BIT_ENABLE {'STD_ON' if self.config_data['predef_timer_100us_32bit_enable'] else 'STD_OFF'}\n#define GPT_PREDEF_TIMER_1US_ENABLING_GRADE ({self.config_data['predef_timer_1us_enabling_grade']})\n#define GPT_REPORT_WAKEUP_SOURCE         {'STD_ON' if self.config_data['report_wakeup_source'] else 'STD_OFF'}\n\n/* GPT Optional API Services */\n#define GPT_DEINIT_API                   {'STD_ON' if self.config_data['deinit_api'] else 'STD_OFF'}\n#define GPT_ENABLE_DISABLE_NOTIFICATION_API {'STD_ON' if self.config_data['enable_disable_notification_api'] else 'STD_OFF'}\n#define GPT_TIME_ELAPSED_API             {'STD_ON' if self.config_data['time_elapsed_api'] else 'STD_OFF'}\n#define GPT_TIME_REMAINING_API           {'STD_ON' if self.config_data['time_remaining_api'] else 'STD_OFF'}\n#define GPT_VERSION_INFO_API             {'STD_ON' if self.config_data['version_info_api'] else 'STD_OFF'}\n#define GPT_WAKEUP_FUNCTIONALITY_API     {'STD_ON' if self.config_data['wakeup_functionality_api'] else 'STD_OFF'}\n\n/* GPT Predef Timer 1us Enabling Grade Options */\n#define GPT_PREDEF_TIMER_1US_16BIT_ENABLED          (0x01U)\n#define GPT_PREDEF_TIMER_1US_16_24BIT_ENABLED       (0x02U)\n#define GPT_PREDEF_TIMER_1US_16_24_32BIT_ENABLED    (0x03U)\n#define GPT_PREDEF_TIMER_1US_DISABLED               (0x00U)\n\n/* GPT Error Codes */\n#define GPT_E_UNINIT                     (0x0AU)\n#define GPT_E_BUSY                       (0x0BU)\n#define GPT_E_MODE                       (0x0CU)\n#define GPT_E_PARAM_CHANNEL              (0x14U)\n#define GPT_E_PARAM_VALUE                (0x15U)\n#define GPT_E_PARAM_POINTER              (0x16U)\n#define GPT_E_PARAM_PREDEF_TIMER         (0x17U)\n#define GPT_E_PARAM_MODE                 (0x1FU)\n\n/* Service IDs */\n#define GPT_INIT_SID                     (0x01U)\n#define GPT_DEINIT_SID                   (0x02U)\n#define GPT_GET_TIME_ELAPSED_SID         (0x03U)\n#define GPT_GET_TIME_REMAINING_SID       (0x04U)\n#define GPT_START_TIMER_SID              (0x05U)\n#define GPT_STOP_TIMER_SID               (0x06U)\n#define GPT_ENABLE_NOTIFICATION_SID      (0x07U)\n#define GPT_DISABLE_NOTIFICATION_SID     (0x08U)\n#define GPT_SET_MODE_SID                 (0x09U)\n#define GPT_DISABLE_WAKEUP_SID           (0x0AU)\n#define GPT_ENABLE_WAKEUP_SID            (0x0BU)\n#define GPT_CHECK_WAKEUP_SID             (0x0CU)\n#define GPT_GET_VERSION_INFO_SID         (0x00U)\n#define GPT_GET_PREDEF_TIMER_VALUE_SID   (0x0DU)\n\n/* GPT Channel Mode */\n#define GPT_CH_MODE_CONTINUOUS           (0x00U)\n#define GPT_CH_MODE_ONESHOT              (0x01U)\n\n/* GPT Mode Type */\n#define GPT_MODE_NORMAL                  (0x00U)\n#define GPT_MODE_SLEEP                   (0x01U)\n\n/* GPT Predef Timer Type */\n#define GPT_PREDEF_TIMER_1US_16BIT       (0x00U)\n#define GPT_PREDEF_TIMER_1US_24BIT       (0x01U)\n#define GPT_PREDEF_TIMER_1US_32BIT       (0x02U)\n#define GPT_PREDEF_TIMER_100US_32BIT     (0x03U)\n"
 
         # Add Channel definitions
         if self.config_data['channel_configurations']:
             content += "/* GPT Channel Symbolic Names */\n"
             for i, channel in enumerate(self.config_data['channel_configurations']):
-                content += f"#define GptConf_GptChannelConfiguration_Channel_{channel['channel_id']}    ({channel['channel_id']}U)\n"
+                content += f"#define GptConf_GptChannelConfiguration_Channel_{channel.channel_id}    ({channel.channel_id}U)\n"
             
             content += "\n/* GPT Channel Configuration */\n"
             for i, channel in enumerate(self.config_data['channel_configurations']):
-                content += f"#define GPT_CHANNEL_{channel['channel_id']}_MODE                     ({channel['channel_mode']})\n"
-                content += f"#define GPT_CHANNEL_{channel['channel_id']}_TICK_FREQUENCY           ({channel['channel_tick_frequency']}f)\n"
-                content += f"#define GPT_CHANNEL_{channel['channel_id']}_TICK_VALUE_MAX           ({channel['channel_tick_value_max']}U)\n"
-                content += f"#define GPT_CHANNEL_{channel['channel_id']}_ENABLE_WAKEUP            ({'STD_ON' if channel['enable_wakeup'] else 'STD_OFF'})\n"
-                content += f"#define GPT_CHANNEL_{channel['channel_id']}_CLK_SRC_REF              ({'STD_ON' if channel['channel_clk_src_ref'] else 'STD_OFF'})\n"
+                content += f"#define GPT_CHANNEL_{channel.channel_id}_MODE                     ({channel.channel_mode})\n"
+                content += f"#define GPT_CHANNEL_{channel.channel_id}_TICK_FREQUENCY           ({channel.channel_tick_frequency}f)\n"
+                content += f"#define GPT_CHANNEL_{channel.channel_id}_TICK_VALUE_MAX           ({channel.channel_tick_value_max}U)\n"
+                if channel.prescaler is not None:
+                    content += f"#define GPT_CHANNEL_{channel.channel_id}_PRESCALER                ({channel.prescaler}U)\n"
+                content += f"#define GPT_CHANNEL_{channel.channel_id}_ENABLE_WAKEUP            ({'STD_ON' if channel.enable_wakeup else 'STD_OFF'})\n"
+                content += f"#define GPT_CHANNEL_{channel.channel_id}_CLK_SRC_REF              ({'STD_ON' if channel.channel_clk_src_ref else 'STD_OFF'})\n"
                 
-                if channel['notification']:
-                    content += f"#define GPT_CHANNEL_{channel['channel_id']}_NOTIFICATION             {channel['notification']}\n"
-                    content += f"#define GPT_CHANNEL_{channel['channel_id']}_NOTIFICATION_ENABLED     (STD_ON)\n"
+                if channel.notification:
+                    content += f"#define GPT_CHANNEL_{channel.channel_id}_NOTIFICATION             {channel.notification}\n"
+                    content += f"#define GPT_CHANNEL_{channel.channel_id}_NOTIFICATION_ENABLED     (STD_ON)\n"
                 else:
-                    content += f"#define GPT_CHANNEL_{channel['channel_id']}_NOTIFICATION_ENABLED     (STD_OFF)\n"
+                    content += f"#define GPT_CHANNEL_{channel.channel_id}_NOTIFICATION_ENABLED     (STD_OFF)\n"
                 content += "\n"
 
         # Add configuration counts
@@ -458,7 +598,7 @@ class ARXMLtoGPTConfigGUI(ttk.Frame):
 
         # Add maximum channel ID
         if self.config_data['channel_configurations']:
-            max_channel_id = max(ch['channel_id'] for ch in self.config_data['channel_configurations'])
+            max_channel_id = max(ch.channel_id for ch in self.config_data['channel_configurations'])
             content += f"#define GPT_MAX_CHANNEL_ID                   ({max_channel_id}U)\n"
         else:
             content += f"#define GPT_MAX_CHANNEL_ID                   (0U)\n"
@@ -466,8 +606,8 @@ class ARXMLtoGPTConfigGUI(ttk.Frame):
         # Add channel notification function declarations if notifications are defined
         notification_functions = []
         for channel in self.config_data['channel_configurations']:
-            if channel['notification']:
-                notification_functions.append(channel['notification'])
+            if channel.notification:
+                notification_functions.append(channel.notification)
         
         if notification_functions:
             content += f"\n/* GPT Channel Notification Function Declarations */\n"
@@ -489,9 +629,9 @@ class ARXMLtoGPTConfigGUI(ttk.Frame):
 
         # Add channel array size definitions
         content += f"\n/* GPT Channel Array Sizes */\n"
-        continuous_channels = [ch for ch in self.config_data['channel_configurations'] if ch['channel_mode'] == 'GPT_CH_MODE_CONTINUOUS']
-        oneshot_channels = [ch for ch in self.config_data['channel_configurations'] if ch['channel_mode'] == 'GPT_CH_MODE_ONESHOT']
-        wakeup_channels = [ch for ch in self.config_data['channel_configurations'] if ch['enable_wakeup']]
+        continuous_channels = [ch for ch in self.config_data['channel_configurations'] if ch.channel_mode == 'GPT_CH_MODE_CONTINUOUS']
+        oneshot_channels = [ch for ch in self.config_data['channel_configurations'] if ch.channel_mode == 'GPT_CH_MODE_ONESHOT']
+        wakeup_channels = [ch for ch in self.config_data['channel_configurations'] if ch.enable_wakeup]
         
         content += f"#define GPT_CONTINUOUS_CHANNELS_COUNT        ({len(continuous_channels)}U)\n"
         content += f"#define GPT_ONESHOT_CHANNELS_COUNT           ({len(oneshot_channels)}U)\n"
@@ -501,17 +641,17 @@ class ARXMLtoGPTConfigGUI(ttk.Frame):
         if continuous_channels:
             content += f"\n/* GPT Continuous Mode Channels */\n"
             for i, ch in enumerate(continuous_channels):
-                content += f"#define GPT_CONTINUOUS_CHANNEL_{i}           ({ch['channel_id']}U)\n"
+                content += f"#define GPT_CONTINUOUS_CHANNEL_{i}           ({ch.channel_id}U)\n"
         
         if oneshot_channels:
             content += f"\n/* GPT One-Shot Mode Channels */\n"
             for i, ch in enumerate(oneshot_channels):
-                content += f"#define GPT_ONESHOT_CHANNEL_{i}              ({ch['channel_id']}U)\n"
+                content += f"#define GPT_ONESHOT_CHANNEL_{i}              ({ch.channel_id}U)\n"
         
         if wakeup_channels:
             content += f"\n/* GPT Wakeup Enabled Channels */\n"
             for i, ch in enumerate(wakeup_channels):
-                content += f"#define GPT_WAKEUP_CHANNEL_{i}               ({ch['channel_id']}U)\n"
+                content += f"#define GPT_WAKEUP_CHANNEL_{i}               ({ch.channel_id}U)\n"
 
         # Add clock reference configuration
         if self.config_data['clock_reference_points']:
@@ -561,9 +701,9 @@ class ARXMLtoGPTConfigGUI(ttk.Frame):
         if self.config_data['channel_configurations']:
             content += f"\n/* GPT Channel Frequency Calculations */\n"
             for channel in self.config_data['channel_configurations']:
-                if channel['channel_tick_frequency'] > 0:
-                    period_us = 1000000 / channel['channel_tick_frequency']
-                    content += f"#define GPT_CHANNEL_{channel['channel_id']}_PERIOD_US            ({period_us:.2f}f)\n"
+                if channel.channel_tick_frequency > 0:
+                    period_us = 1000000 / channel.channel_tick_frequency
+                    content += f"#define GPT_CHANNEL_{channel.channel_id}_PERIOD_US            ({period_us:.2f}f)\n"
 
         # Add configuration structure forward declarations
         content += f"\n/* GPT Configuration Structure Forward Declarations */\n"
@@ -601,9 +741,14 @@ class ARXMLtoGPTConfigGUI(ttk.Frame):
         # Display generated code
         self.code_text.delete(1.0, tk.END)
         self.code_text.insert(1.0, content)
+        return True
         
         # messagebox.showinfo("Success", "GPT_CFG.H generated successfully!")
 
+    def driver_files(self):
+        """(file name, content) of each GPT output file: the generated Gpt_Cfg.h"""
+        return [('Gpt_Cfg.h', self.code_text.get(1.0, tk.END))]
+
     def save_gpt_cfg_h(self):
         if not self.code_text.get(1.0, tk.END).strip():
             messagebox.showwarning("Warning", "Please generate the code first")
@@ -618,7 +763,8 @@ class ARXMLtoGPTConfigGUI(ttk.Frame):
         
         if file_path:
             try:
-                with open(file_path, 'w', encoding='utf-8') as f:
+                with profiler.span('write.gpt', file=os.path.basename(file_path)), \
+                        open(file_path, 'w', encoding='utf-8') as f:
                     f.write(self.code_text.get(1.0, tk.END))
                 messagebox.showinfo("Success", f"GPT_CFG.H saved successfully!\n\nLocation: {file_path}")
             except Exception as e:
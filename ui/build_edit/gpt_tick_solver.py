@@ -0,0 +1,142 @@
+# gpt_tick_solver.py
+
+import math
+
+# STM32F407: APB1 timer kernel clock and 16-bit PSC register
+DEFAULT_TIMER_CLOCK_HZ = 84_000_000
+DEFAULT_PRESCALER_MAX = 65536
+
+_UNITS = {'s': 1.0, 'ms': 1e-3, 'us': 1e-6, 'ns': 1e-9}
+
+
+def parse_periods(text):
+    """Parse '1ms, 250us, 2s' into seconds; bare numbers are milliseconds"""
+    periods = []
+    for token in text.replace(';', ',').split(','):
+        token = token.strip().lower()
+        if not token:
+            continue
+        for unit in ('ms', 'us', 'ns', 's'):
+            if token.endswith(unit):
+                value = float(token[:-len(unit)].strip()) * _UNITS[unit]
+                break
+        else:
+            value = float(token) * 1e-3
+        if value <= 0:
+            raise ValueError(f"Period must be positive: {token}")
+        periods.append(value)
+    return periods
+
+
+def format_period(seconds):
+    for unit in ('s', 'ms', 'us'):
+        if seconds >= _UNITS[unit]:
+            return f"{seconds / _UNITS[unit]:g}{unit}"
+    return f"{seconds / _UNITS['ns']:g}ns"
+
+
+class GptTickSolver:
+    """Pick prescaler, tick frequency and max tick value for every GPT channel.
+
+    For each channel the smallest prescaler whose counter still holds the
+    longest required period is preferred (finest resolution); if a required
+    period then quantizes worse than the tolerance, larger prescalers are
+    tried and the one with the lowest worst-case error wins. Only prescalers
+    at which the shortest period can land within tolerance of a whole tick
+    count are tried, so the search is bounded by that period's tick count
+    rather than by the prescaler range.
+    """
+
+    def __init__(self, timer_clock_hz=DEFAULT_TIMER_CLOCK_HZ, counter_bits=16,
+                 prescaler_max=DEFAULT_PRESCALER_MAX, tolerance=0.001):
+        self.timer_clock_hz = timer_clock_hz
+        self.counter_max = (1 << counter_bits) - 1
+        self.prescaler_max = prescaler_max
+        self.tolerance = tolerance
+
+    def solve(self, requirements):
+        """requirements: {channel_id: [period_s, ...]} -> {channel_id: result dict}"""
+        return {channel_id: self.solve_channel(periods) for channel_id, periods in requirements.items()}
+
+    def solve_channel(self, periods):
+        longest = max(periods)
+        # Smallest prescaler that keeps the longest period within the counter
+        first = max(1, math.ceil(longest * self.timer_clock_hz / self.counter_max))
+        if first > self.prescaler_max:
+            return self._result(self.prescaler_max, periods, [
+                f"overflow: {format_period(longest)} exceeds the counter even at prescaler {self.prescaler_max} "
+                f"(max {format_period(self.counter_max * self.prescaler_max / self.timer_clock_hz)})"])
+
+        best = (first, self._worst_error(first, periods))
+        if best[1] > self.tolerance:
+            for prescaler in self._candidates(first, min(periods)):
+                worst = self._worst_error(prescaler, periods)
+                if worst < best[1]:
+                    best = (prescaler, worst)
+                if worst <= self.tolerance:
+                    break
+
+        prescaler, worst = best
+        violations = []
+        for period in periods:
+            ticks = round(period * self.timer_clock_hz / prescaler)
+            if ticks < 1:
+                violations.append(f"resolution: {format_period(period)} is shorter than one tick")
+            elif self._error(prescaler, period) > self.tolerance:
+                violations.append(f"resolution: {format_period(period)} quantizes to {ticks} ticks "
+                                  f"({self._error(prescaler, period) * 100:.3g}% error, "
+                                  f"tolerance {self.tolerance * 100:.3g}%)")
+        return self._result(prescaler, periods, violations)
+
+    def _candidates(self, first, period):
+        """Prescalers from `first` up, in order, at which `period` is within tolerance of whole ticks.
+
+        `period` lands within tolerance of t ticks only for prescalers in
+        period * clock * (1 -/+ tolerance) / t; walking t down from the tick
+        count at `first` visits those windows in increasing prescaler order.
+        """
+        exact = period * self.timer_clock_hz
+        last = first - 1
+        for ticks in range(math.ceil(exact / first), 0, -1):
+            # Widened by one on each side against float rounding at the edges
+            low = max(last + 1, math.floor(exact * (1 - self.tolerance) / ticks))
+            high = min(self.prescaler_max, math.ceil(exact * (1 + self.tolerance) / ticks))
+            yield from range(low, high + 1)
+            last = max(last, high)
+            if last >= self.prescaler_max:
+                return
+
+    def check_channel(self, tick_frequency, tick_value_max, periods):
+        """Violations of an existing GptChannelTickFrequency / GptChannelTickValueMax setting"""
+        violations = []
+        if tick_frequency <= 0:
+            return ["GptChannelTickFrequency is not set"]
+        for period in periods:
+            ticks = round(period * tick_frequency)
+            if ticks > tick_value_max:
+                violations.append(f"overflow: {format_period(period)} needs {ticks} ticks, "
+                                  f"GptChannelTickValueMax is {tick_value_max}")
+            elif ticks < 1:
+                violations.append(f"resolution: {format_period(period)} is shorter than one tick")
+            elif abs(ticks / tick_frequency - period) / period > self.tolerance:
+                violations.append(f"resolution: {format_period(period)} quantizes to {ticks} ticks")
+        return violations
+
+    def _result(self, prescaler, periods, violations):
+        tick_frequency = self.timer_clock_hz / prescaler
+        return {
+            'prescaler': prescaler,
+            'tick_frequency': tick_frequency,
+            'tick_value_max': self.counter_max,
+            'ticks': [round(period * tick_frequency) for period in periods],
+            'max_error': self._worst_error(prescaler, periods),
+            'violations': violations,
+        }
+
+    def _worst_error(self, prescaler, periods):
+        return max(self._error(prescaler, period) for period in periods)
+
+    def _error(self, prescaler, period):
+        tick_frequency = self.timer_clock_hz / prescaler
+        ticks = max(1, round(period * tick_frequency))
+        return abs(ticks / tick_frequency - period) / period
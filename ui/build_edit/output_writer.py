@@ -0,0 +1,104 @@
+# output_writer.py
+
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+from ..profiling import profiler
+
+
+class OutputSetWriter:
+    """Stage the files of one generation run and move them into place.
+
+    Files are written concurrently into a hidden staging directory created
+    inside the target directory (so the final renames stay on one filesystem),
+    flushed to disk, and only then renamed over the existing outputs.
+
+    The guarantee is per file: every output is either the old or the new
+    version, never a partial write. The set as a whole is not swapped
+    atomically - the target directory is shared with other files, so it
+    cannot be renamed - and a reader during the rename phase can see new
+    and old files side by side. If anything fails before that phase the
+    target directory is untouched; if a rename fails, the files already
+    replaced are restored from backup. The directory entries are flushed
+    with a single directory fsync once all renames are done.
+    """
+
+    def __init__(self, directory, max_workers=8):
+        self.directory = directory
+        self.max_workers = max_workers
+        self.files = {}
+
+    def add(self, filename, content):
+        """Queue a file for this output set"""
+        if os.path.basename(filename) != filename:
+            raise ValueError(f"Output file name must not contain a path: {filename}")
+        self.files[filename] = content
+
+    @profiler.timed('write.commit')
+    def commit(self):
+        """Write every queued file and rename each one into place"""
+        if not self.files:
+            return []
+
+        os.makedirs(self.directory, exist_ok=True)
+        staging_dir = tempfile.mkdtemp(prefix='.staging-', dir=self.directory)
+        try:
+            workers = max(1, min(self.max_workers, len(self.files)))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                # list() re-raises the first write error, if any
+                list(pool.map(lambda item: self._stage_file(staging_dir, *item), self.files.items()))
+
+            self._swap_into_place(staging_dir)
+            self._fsync_directory(self.directory)
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
+        return [os.path.join(self.directory, name) for name in self.files]
+
+    def _stage_file(self, staging_dir, filename, content):
+        """Write and fsync one file inside the staging directory"""
+        with profiler.span('write.stage', file=filename), open(os.path.join(staging_dir, filename), 'w', encoding='utf-8') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _swap_into_place(self, staging_dir):
+        """Rename staged files over the targets one by one, rolling back on failure"""
+        backup_dir = os.path.join(staging_dir, '.backup')
+        os.mkdir(backup_dir)
+        replaced = []
+        try:
+            for filename in self.files:
+                target = os.path.join(self.directory, filename)
+                backup = os.path.join(backup_dir, filename)
+                had_original = os.path.exists(target)
+                if had_original:
+                    os.replace(target, backup)
+                replaced.append((target, backup, had_original))
+                os.replace(os.path.join(staging_dir, filename), target)
+        except OSError:
+            for target, backup, had_original in reversed(replaced):
+                try:
+                    if had_original:
+                        os.replace(backup, target)
+                    elif os.path.exists(target):
+                        os.remove(target)
+                except OSError:
+                    pass
+            raise
+
+    @staticmethod
+    def _fsync_directory(directory):
+        """Persist the directory entries (not supported on every platform)"""
+        try:
+            fd = os.open(directory, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
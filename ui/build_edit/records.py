@@ -0,0 +1,183 @@
+# records.py
+#
+# Typed records the build panels extract from ARXML and generate code from.
+# Slotted dataclasses: no per-instance __dict__, so a record costs a fixed
+# handful of pointers, and attribute reads in the generation loops are
+# plain slot loads instead of string-keyed dict lookups. Field names match
+# the keys the panels used before, so channel['id'] became channel.id.
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+# -------------------- DIO --------------------
+@dataclass(slots=True)
+class DioPortRecord:
+    id: int
+    symbolic_name: str
+    container_name: str = ''
+
+
+@dataclass(slots=True)
+class DioChannelRecord:
+    id: int
+    port: int
+    symbolic_name: str
+    container_name: str = ''
+
+
+@dataclass(slots=True)
+class DioChannelGroupRecord:
+    id: str
+    identification: str
+    mask: int = 0xFF
+    offset: int = 0
+    port: int = 0
+    container_name: str = ''
+
+
+# -------------------- ADC --------------------
+@dataclass(slots=True)
+class AdcChannelRecord:
+    id: int = 0
+    symbolic_name: str = ''
+    conv_time: int = 100
+    high_limit: int = 4095
+    low_limit: int = 0
+    limit_check: bool = False
+    range_select: str = 'ADC_RANGE_UNDER_LOW'
+    ref_voltsrc_high: bool = False
+    ref_voltsrc_low: bool = False
+    resolution: int = 12
+    samp_time: int = 10
+    container_name: str = ''
+
+
+@dataclass(slots=True)
+class AdcGroupRecord:
+    id: int = 0
+    access_mode: str = 'ADC_ACCESS_MODE_SINGLE'
+    conversion_mode: str = 'ADC_CONV_MODE_ONESHOT'
+    priority: int = 0
+    replacement: str = 'ADC_GROUP_REPL_ABORT_RESTART'
+    trigg_src: str = 'ADC_TRIGG_SRC_SW'
+    hw_trigg_signal: str = 'ADC_HW_TRIG_RISING_EDGE'
+    hw_trigg_timer: int = 0
+    notification: bool = False
+    streaming_buffer_mode: str = 'ADC_STREAM_BUFFER_LINEAR'
+    streaming_num_samples: int = 1
+    group_definition: list = field(default_factory=list)  # channel ids
+    container_name: str = ''
+
+
+@dataclass(slots=True)
+class AdcHwUnitRecord:
+    # None: parameter absent from the ARXML
+    hw_unit_id: Optional[int] = None
+    clock_source: Optional[bool] = None
+    prescale: Optional[int] = None
+    container_name: str = ''
+
+
+# -------------------- GPT --------------------
+@dataclass(slots=True)
+class GptChannelRecord:
+    channel_id: int = 0
+    channel_mode: str = 'GPT_CH_MODE_ONESHOT'
+    channel_tick_frequency: float = 0.0
+    channel_tick_value_max: int = 0
+    enable_wakeup: bool = False
+    notification: str = ''
+    channel_clk_src_ref: bool = False
+    prescaler: Optional[int] = None  # set by the tick solver
+
+
+# -------------------- SPI --------------------
+@dataclass(slots=True)
+class SpiSequenceRecord:
+    sequence_id: int = 0
+    interruptible_sequence: bool = False
+    seq_end_notification: bool = False
+    job_assignment: bool = False
+    short_name: str = ''
+    job_refs: list = field(default_factory=list)  # job short names
+
+
+@dataclass(slots=True)
+class SpiChannelRecord:
+    channel_id: int = 0
+    channel_type: bool = False  # True: external buffer
+    data_width: int = 8
+    default_data: int = 0
+    eb_max_length: int = 1
+    ib_n_buffers: int = 1
+    transfer_start: bool = False
+    short_name: str = ''
+
+
+@dataclass(slots=True)
+class SpiChannelListRecord:
+    channel_index: int = 0
+    channel_assignment: bool = False
+    channel_refs: list = field(default_factory=list)  # channel short names
+
+
+@dataclass(slots=True)
+class SpiJobRecord:
+    job_id: int = 0
+    job_priority: int = 0
+    hw_unit_synchronous: str = 'ASYNCHRONOUS'
+    job_end_notification: bool = False
+    device_assignment: bool = False
+    short_name: str = ''
+    device_refs: list = field(default_factory=list)  # external device short names
+    channel_refs: list = field(default_factory=list)  # channel short names, in SpiChannelIndex order
+
+
+@dataclass(slots=True)
+class SpiExternalDeviceRecord:
+    baudrate: int = 1000000
+    cs_identifier: str = ''
+    cs_polarity: str = 'HIGH'
+    cs_selection: str = 'CS_VIA_GPIO'
+    data_shift_edge: str = 'LEADING'
+    enable_cs: bool = True
+    hw_unit: str = 'CSIB0'
+    shift_clock_idle_level: str = 'HIGH'
+    time_clk2cs: int = 0
+    cs_behavior: str = 'CS_KEEP_ASSERTED'
+    time_cs2clk: int = 0
+    time_cs2cs: int = 0
+    short_name: str = ''
+
+
+# -------------------- CAN --------------------
+# CAN generation emits every ECUC parameter of a controller / hardware
+# object, in document order, so those stay in `params`; the values the
+# generators branch on are exposed as typed properties.
+
+@dataclass(slots=True)
+class CanControllerRecord:
+    id: int = 0
+    params: dict = field(default_factory=dict)  # ECUC parameter name -> value
+    baudrate_configs: list = field(default_factory=list)
+    fd_baudrate_configs: list = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class CanHardwareObjectRecord:
+    id: int = 0
+    params: dict = field(default_factory=dict)  # ECUC parameter name -> value
+    filters: list = field(default_factory=list)  # parameter dicts of nested CanHwFilter containers
+
+    @property
+    def object_type(self):
+        return str(self.params.get('CanObjectType', 'RECEIVE')).upper()
+
+    @property
+    def handle_type(self):
+        return str(self.params.get('CanHandleType', 'BASIC')).upper()
+
+    @property
+    def id_type(self):
+        return str(self.params.get('CanIdType', 'STANDARD')).upper()
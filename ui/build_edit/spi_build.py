@@ -2,8 +2,15 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import xml.etree.ElementTree as ET
 import os
+import re
 from datetime import datetime
 # from .drivers.spi_code import SPI_H_TEMPLATE, SPI_C_TEMPLATE
+from .output_writer import OutputSetWriter
+from .spi_schedule import SpiScheduleAnalyzer
+from .arxml_namespace import strip_namespace
+from .records import (SpiChannelListRecord, SpiChannelRecord, SpiExternalDeviceRecord,
+                      SpiJobRecord, SpiSequenceRecord)
+from ..profiling import profiler
 
 class ARXMLtoSPIGenerator(ttk.Frame):
     def __init__(self, parent):
@@ -139,11 +146,14 @@ class ARXMLtoSPIGenerator(ttk.Frame):
             return
 
         try:
-            tree = ET.parse(self.arxml_file_path)
+            with profiler.span('parse.spi', file=os.path.basename(self.arxml_file_path)):
+                tree = ET.parse(self.arxml_file_path)
             root = tree.getroot()
             
             # Extract configuration
-            self.extract_config_from_arxml(root)
+            if not self.extract_config_from_arxml(root):
+                messagebox.showwarning("Warning", "ARXML parsed but no SPI configuration found. Please verify the file structure.")
+                return
             self.display_configuration()
             
             messagebox.showinfo("Success", "ARXML parsed successfully!")
@@ -154,7 +164,21 @@ class ARXMLtoSPIGenerator(ttk.Frame):
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred: {str(e)}")
 
+    def load_arxml_tree(self, tree):
+        """Extract, display and generate from an already parsed ARXML tree, without dialogs.
+
+        Used by watch mode; False when the tree holds no SPI configuration
+        or nothing was generated.
+        """
+        if not self.extract_config_from_arxml(tree.getroot()):
+            return False
+        self.display_configuration()
+        return self.generate_spi_cfg_h()
+
+    @profiler.timed('extract.spi')
     def extract_config_from_arxml(self, root):
+        """Read the Spi containers under `root`; False when there are none"""
+        strip_namespace(root)  # extraction matches bare AUTOSAR tag names
         # Clear existing data
         self.config_data['sequences'] = []
         self.config_data['channels'] = []
@@ -164,34 +188,48 @@ class ARXMLtoSPIGenerator(ttk.Frame):
         self.config_data['dem_events'] = []
 
         # Find all containers
-        containers = root.findall('.//ECUC-CONTAINER-VALUE')
+        with profiler.span('index.spi'):
+            containers = root.findall('.//ECUC-CONTAINER-VALUE')
         
+        config_found = False
         for container in containers:
             short_name_elem = container.find('SHORT-NAME')
             if short_name_elem is None:
                 continue
 
-            short_name = short_name_elem.text
+            # Multi-instance containers carry an index suffix (SpiJob_3, GptChannelConfiguration_0)
+            short_name = re.sub(r'(_\d+)+$', '', short_name_elem.text or '')
 
             if short_name == 'SpiGeneral':
+                config_found = True
                 self.extract_spi_general(container)
             elif short_name == 'SpiDriver':
+                config_found = True
                 self.extract_spi_driver(container)
             elif short_name == 'SpiPublishedInformation':
+                config_found = True
                 self.extract_spi_published_info(container)
             elif short_name == 'SpiSequence':
+                config_found = True
                 self.extract_spi_sequence(container)
             elif short_name == 'SpiChannel':
+                config_found = True
                 self.extract_spi_channel(container)
             elif short_name == 'SpiChannelList':
+                config_found = True
                 self.extract_spi_channel_list(container)
             elif short_name == 'SpiJob':
+                config_found = True
                 self.extract_spi_job(container)
             elif short_name == 'SpiExternalDevice':
+                config_found = True
                 self.extract_spi_external_device(container)
             elif short_name == 'SpiDemEventParameterRefs':
+                config_found = True
                 self.extract_dem_events(container)
 
+        return config_found
+
     def extract_spi_general(self, container):
         """Extract SpiGeneral configuration"""
         bool_params = container.findall('.//ECUC-BOOLEAN-PARAM-VALUE')
@@ -261,12 +299,10 @@ class ARXMLtoSPIGenerator(ttk.Frame):
 
     def extract_spi_sequence(self, container):
         """Extract SpiSequence configuration"""
-        sequence = {
-            'interruptible_sequence': False,
-            'seq_end_notification': False,
-            'sequence_id': 0,
-            'job_assignment': False
-        }
+        sequence = SpiSequenceRecord(
+            short_name=self.get_param_name(container),
+            job_refs=self.get_reference_targets(container, 'SpiJobAssignment')
+        )
         
         bool_params = container.findall('.//ECUC-BOOLEAN-PARAM-VALUE')
         num_params = container.findall('.//ECUC-NUMERICAL-PARAM-VALUE')
@@ -276,32 +312,24 @@ class ARXMLtoSPIGenerator(ttk.Frame):
             value = self.get_bool_value(param)
             
             if param_name == 'SpiInterruptibleSequence':
-                sequence['interruptible_sequence'] = value
+                sequence.interruptible_sequence = value
             elif param_name == 'SpiSeqEndNotification':
-                sequence['seq_end_notification'] = value
+                sequence.seq_end_notification = value
             elif param_name == 'SpiJobAssignment':
-                sequence['job_assignment'] = value
+                sequence.job_assignment = value
         
         for param in num_params:
             param_name = self.get_param_name(param)
             value = self.get_num_value(param)
             
             if param_name == 'SpiSequenceId':
-                sequence['sequence_id'] = value
+                sequence.sequence_id = value
         
         self.config_data['sequences'].append(sequence)
 
     def extract_spi_channel(self, container):
         """Extract SpiChannel configuration"""
-        channel = {
-            'channel_id': 0,
-            'channel_type': False,
-            'data_width': 8,
-            'default_data': 0,
-            'eb_max_length': 1,
-            'ib_n_buffers': 1,
-            'transfer_start': False
-        }
+        channel = SpiChannelRecord(short_name=self.get_param_name(container))
         
         bool_params = container.findall('.//ECUC-BOOLEAN-PARAM-VALUE')
         num_params = container.findall('.//ECUC-NUMERICAL-PARAM-VALUE')
@@ -311,33 +339,32 @@ class ARXMLtoSPIGenerator(ttk.Frame):
             value = self.get_bool_value(param)
             
             if param_name == 'SpiChannelType':
-                channel['channel_type'] = value
+                channel.channel_type = value
             elif param_name == 'SpiTransferStart':
-                channel['transfer_start'] = value
+                channel.transfer_start = value
         
         for param in num_params:
             param_name = self.get_param_name(param)
             value = self.get_num_value(param)
             
             if param_name == 'SpiChannelId':
-                channel['channel_id'] = value
+                channel.channel_id = value
             elif param_name == 'SpiDataWidth':
-                channel['data_width'] = value
+                channel.data_width = value
             elif param_name == 'SpiDefaultData':
-                channel['default_data'] = value
+                channel.default_data = value
             elif param_name == 'SpiEbMaxLength':
-                channel['eb_max_length'] = value
+                channel.eb_max_length = value
             elif param_name == 'SpiIbNBuffers':
-                channel['ib_n_buffers'] = value
+                channel.ib_n_buffers = value
         
         self.config_data['channels'].append(channel)
 
     def extract_spi_channel_list(self, container):
         """Extract SpiChannelList configuration"""
-        channel_list = {
-            'channel_index': 0,
-            'channel_assignment': False
-        }
+        channel_list = SpiChannelListRecord(
+            channel_refs=self.get_reference_targets(container, 'SpiChannelAssignment')
+        )
         
         bool_params = container.findall('.//ECUC-BOOLEAN-PARAM-VALUE')
         num_params = container.findall('.//ECUC-NUMERICAL-PARAM-VALUE')
@@ -347,26 +374,24 @@ class ARXMLtoSPIGenerator(ttk.Frame):
             value = self.get_bool_value(param)
             
             if param_name == 'SpiChannelAssignment':
-                channel_list['channel_assignment'] = value
+                channel_list.channel_assignment = value
         
         for param in num_params:
             param_name = self.get_param_name(param)
             value = self.get_num_value(param)
             
             if param_name == 'SpiChannelIndex':
-                channel_list['channel_index'] = value
+                channel_list.channel_index = value
         
         self.config_data['channel_lists'].append(channel_list)
 
     def extract_spi_job(self, container):
         """Extract SpiJob configuration"""
-        job = {
-            'hw_unit_synchronous': 'ASYNCHRONOUS',
-            'job_end_notification': False,
-            'job_id': 0,
-            'job_priority': 0,
-            'device_assignment': False
-        }
+        job = SpiJobRecord(
+            short_name=self.get_param_name(container),
+            device_refs=self.get_reference_targets(container, 'SpiDeviceAssignment'),
+            channel_refs=self.get_job_channel_refs(container)
+        )
         
         bool_params = container.findall('.//ECUC-BOOLEAN-PARAM-VALUE')
         num_params = container.findall('.//ECUC-NUMERICAL-PARAM-VALUE')
@@ -377,44 +402,31 @@ class ARXMLtoSPIGenerator(ttk.Frame):
             value = self.get_bool_value(param)
             
             if param_name == 'SpiJobEndNotification':
-                job['job_end_notification'] = value
+                job.job_end_notification = value
             elif param_name == 'SpiDeviceAssignment':
-                job['device_assignment'] = value
+                job.device_assignment = value
         
         for param in num_params:
             param_name = self.get_param_name(param)
             value = self.get_num_value(param)
             
             if param_name == 'SpiJobId':
-                job['job_id'] = value
+                job.job_id = value
             elif param_name == 'SpiJobPriority':
-                job['job_priority'] = value
+                job.job_priority = value
         
         for param in enum_params:
             param_name = self.get_param_name(param)
             value = self.get_text_value(param)
             
             if param_name == 'SpiHwUnitSynchronous':
-                job['hw_unit_synchronous'] = value
+                job.hw_unit_synchronous = value
         
         self.config_data['jobs'].append(job)
 
     def extract_spi_external_device(self, container):
         """Extract SpiExternalDevice configuration"""
-        device = {
-            'baudrate': 1000000,
-            'cs_identifier': '',
-            'cs_polarity': 'HIGH',
-            'cs_selection': 'CS_VIA_GPIO',
-            'data_shift_edge': 'LEADING',
-            'enable_cs': True,
-            'hw_unit': 'CSIB0',
-            'shift_clock_idle_level': 'HIGH',
-            'time_clk2cs': 0,
-            'cs_behavior': 'CS_KEEP_ASSERTED',
-            'time_cs2clk': 0,
-            'time_cs2cs': 0
-        }
+        device = SpiExternalDeviceRecord(short_name=self.get_param_name(container))
         
         bool_params = container.findall('.//ECUC-BOOLEAN-PARAM-VALUE')
         num_params = container.findall('.//ECUC-NUMERICAL-PARAM-VALUE')
@@ -426,44 +438,44 @@ class ARXMLtoSPIGenerator(ttk.Frame):
             value = self.get_bool_value(param)
             
             if param_name == 'SpiEnableCs':
-                device['enable_cs'] = value
+                device.enable_cs = value
         
         for param in num_params:
             param_name = self.get_param_name(param)
             value = self.get_num_value(param)
             
             if param_name == 'SpiBaudrate':
-                device['baudrate'] = value
+                device.baudrate = value
             elif param_name == 'SpiTimeClk2Cs':
-                device['time_clk2cs'] = value
+                device.time_clk2cs = value
             elif param_name == 'SpiTimeCs2Clk':
-                device['time_cs2clk'] = value
+                device.time_cs2clk = value
             elif param_name == 'SpiTimeCs2Cs':
-                device['time_cs2cs'] = value
+                device.time_cs2cs = value
         
         for param in text_params:
             param_name = self.get_param_name(param)
             value = self.get_text_value(param)
             
             if param_name == 'SpiCsIdentifier':
-                device['cs_identifier'] = value
+                device.cs_identifier = value
         
         for param in enum_params:
             param_name = self.get_param_name(param)
             value = self.get_text_value(param)
             
             if param_name == 'SpiCsPolarity':
-                device['cs_polarity'] = value
+                device.cs_polarity = value
             elif param_name == 'SpiCsSelection':
-                device['cs_selection'] = value
+                device.cs_selection = value
             elif param_name == 'SpiDataShiftEdge':
-                device['data_shift_edge'] = value
+                device.data_shift_edge = value
             elif param_name == 'SpiHwUnit':
-                device['hw_unit'] = value
+                device.hw_unit = value
             elif param_name == 'SpiShiftClockIdleLevel':
-                device['shift_clock_idle_level'] = value
+                device.shift_clock_idle_level = value
             elif param_name == 'SpiCsBehavior':
-                device['cs_behavior'] = value
+                device.cs_behavior = value
         
         self.config_data['external_devices'].append(device)
 
@@ -481,6 +493,33 @@ class ARXMLtoSPIGenerator(ttk.Frame):
                     'enabled': value
                 })
 
+    def get_reference_targets(self, container, ref_name):
+        """Return the target short names of a container's own reference values"""
+        targets = []
+        param_values = container.find('REFERENCE-VALUES')
+        if param_values is None:
+            return targets
+        for ref in param_values.findall('ECUC-REFERENCE-VALUE'):
+            definition = ref.findtext('DEFINITION-REF', '')
+            value_ref = ref.findtext('VALUE-REF', '')
+            if definition.rstrip('/').endswith('/' + ref_name) and value_ref:
+                targets.append(value_ref.rstrip('/').split('/')[-1])
+        return targets
+
+    def get_job_channel_refs(self, container):
+        """Return the channel short names of a job's nested SpiChannelList, in SpiChannelIndex order"""
+        channel_list = []
+        for sub in container.findall('.//ECUC-CONTAINER-VALUE'):
+            if not self.get_param_name(sub).startswith('SpiChannelList'):
+                continue
+            index = 0
+            for param in sub.findall('.//ECUC-NUMERICAL-PARAM-VALUE'):
+                if self.get_param_name(param) == 'SpiChannelIndex':
+                    index = self.get_num_value(param)
+            for target in self.get_reference_targets(sub, 'SpiChannelAssignment'):
+                channel_list.append((index, target))
+        return [target for _, target in sorted(channel_list, key=lambda item: item[0])]
+
     def get_param_name(self, param):
         """Helper method to get parameter name"""
         param_name_elem = param.find('SHORT-NAME')
@@ -511,6 +550,7 @@ class ARXMLtoSPIGenerator(ttk.Frame):
         value_elem = param.find('VALUE')
         return value_elem.text if value_elem is not None else ''
 
+    @profiler.timed('view.spi')
     def display_configuration(self):
         """Display extracted configuration"""
         config_text = f"Extracted Configuration from ARXML:\n"
@@ -538,25 +578,37 @@ class ARXMLtoSPIGenerator(ttk.Frame):
         
         config_text += f"Sequences ({len(self.config_data.get('sequences', []))}):\n"
         for i, seq in enumerate(self.config_data.get('sequences', [])):
-            config_text += f"- Sequence {i}: ID={seq.get('sequence_id', 0)}, Interruptible={seq.get('interruptible_sequence', False)}\n"
+            config_text += f"- Sequence {i}: ID={seq.sequence_id}, Interruptible={seq.interruptible_sequence}\n"
         
         config_text += f"\nChannels ({len(self.config_data.get('channels', []))}):\n"
         for i, ch in enumerate(self.config_data.get('channels', [])):
-            config_text += f"- Channel {i}: ID={ch.get('channel_id', 0)}, Width={ch.get('data_width', 0)}, Type={'EB' if ch.get('channel_type') else 'IB'}\n"
+            config_text += f"- Channel {i}: ID={ch.channel_id}, Width={ch.data_width}, Type={'EB' if ch.channel_type else 'IB'}\n"
         
         config_text += f"\nJobs ({len(self.config_data.get('jobs', []))}):\n"
         for i, job in enumerate(self.config_data.get('jobs', [])):
-            config_text += f"- Job {i}: ID={job.get('job_id', 0)}, Priority={job.get('job_priority', 0)}, Sync={job.get('hw_unit_synchronous', 'ASYNCHRONOUS')}\n"
+            config_text += f"- Job {i}: ID={job.job_id}, Priority={job.job_priority}, Sync={job.hw_unit_synchronous}\n"
         
         config_text += f"\nExternal Devices ({len(self.config_data.get('external_devices', []))}):\n"
         for i, dev in enumerate(self.config_data.get('external_devices', [])):
-            config_text += f"- Device {i}: Baudrate={dev.get('baudrate', 0)}, HW Unit={dev.get('hw_unit', 'CSIB0')}, CS={dev.get('cs_polarity', 'HIGH')}, Behavior={dev.get('cs_behavior', 'CS_KEEP_ASSERTED')}\n"
+            config_text += f"- Device {i}: Baudrate={dev.baudrate}, HW Unit={dev.hw_unit}, CS={dev.cs_polarity}, Behavior={dev.cs_behavior}\n"
+        
+        schedule = SpiScheduleAnalyzer(self.config_data).analyze()
+        config_text += f"\nSchedule Analysis:\n"
+        for job in schedule.jobs:
+            config_text += f"- Job {job['job_id']}: HW Unit={job['hw_unit']}, Channels={job['channels']}, Transfer={job['transfer_time_ns'] / 1000:.2f} us\n"
+        for seq in schedule.sequences:
+            config_text += f"- Sequence {seq['sequence_id']}: Jobs={[job['job_id'] for job in seq['jobs']]}\n"
+        for unit, (sequence_id, latency) in schedule.worst_case_latency().items():
+            config_text += f"- Worst-case latency on {unit}: {latency / 1000:.2f} us (Sequence {sequence_id})\n"
+        for warning in schedule.warnings:
+            config_text += f"- Warning: {warning}\n"
         
         self.config_text.config(state='normal')
         self.config_text.delete(1.0, tk.END)
         self.config_text.insert(1.0, config_text)
         self.config_text.config(state='disabled')
 
+    @profiler.timed('codegen.spi')
     def generate_spi_cfg_h(self):
         """Generate the SPI_CFG.H file content"""
         content = f"""#ifndef SPI_CFG_H_
@@ -569,6 +621,8 @@ class ARXMLtoSPIGenerator(ttk.Frame):
  * Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
  */
 
+#include "Std_Types.h"
+
 /* Module identification */
 #define SPI_VENDOR_ID                    ({self.config_data['vendor_id']}U)
 #define SPI_MODULE_ID                    ({self.config_data['module_id']}U)
@@ -665,59 +719,59 @@ class ARXMLtoSPIGenerator(ttk.Frame):
         if self.config_data['channels']:
             content += "/* SPI Channel Symbolic Names */\n"
             for i, channel in enumerate(self.config_data['channels']):
-                content += f"#define SpiConf_SpiChannel_Channel_{channel['channel_id']}     ({channel['channel_id']}U)\n"
+                content += f"#define SpiConf_SpiChannel_Channel_{channel.channel_id}     ({channel.channel_id}U)\n"
             
             content += "\n/* SPI Channel Configuration */\n"
             for i, channel in enumerate(self.config_data['channels']):
-                content += f"#define SPI_CHANNEL_{channel['channel_id']}_DATA_WIDTH          ({channel['data_width']}U)\n"
-                content += f"#define SPI_CHANNEL_{channel['channel_id']}_DEFAULT_DATA        (0x{channel['default_data']:04X}U)\n"
-                content += f"#define SPI_CHANNEL_{channel['channel_id']}_EB_MAX_LENGTH       ({channel['eb_max_length']}U)\n"
-                content += f"#define SPI_CHANNEL_{channel['channel_id']}_IB_N_BUFFERS        ({channel['ib_n_buffers']}U)\n"
-                content += f"#define SPI_CHANNEL_{channel['channel_id']}_TYPE                ({'SPI_EB' if channel['channel_type'] else 'SPI_IB'})\n\n"
+                content += f"#define SPI_CHANNEL_{channel.channel_id}_DATA_WIDTH          ({channel.data_width}U)\n"
+                content += f"#define SPI_CHANNEL_{channel.channel_id}_DEFAULT_DATA        (0x{channel.default_data:04X}U)\n"
+                content += f"#define SPI_CHANNEL_{channel.channel_id}_EB_MAX_LENGTH       ({channel.eb_max_length}U)\n"
+                content += f"#define SPI_CHANNEL_{channel.channel_id}_IB_N_BUFFERS        ({channel.ib_n_buffers}U)\n"
+                content += f"#define SPI_CHANNEL_{channel.channel_id}_TYPE                ({'SPI_EB' if channel.channel_type else 'SPI_IB'})\n\n"
 
         # Add Job definitions
         if self.config_data['jobs']:
             content += "/* SPI Job Symbolic Names */\n"
             for i, job in enumerate(self.config_data['jobs']):
-                content += f"#define SpiConf_SpiJob_Job_{job['job_id']}                ({job['job_id']}U)\n"
+                content += f"#define SpiConf_SpiJob_Job_{job.job_id}                ({job.job_id}U)\n"
             
             content += "\n/* SPI Job Configuration */\n"
             for i, job in enumerate(self.config_data['jobs']):
-                content += f"#define SPI_JOB_{job['job_id']}_PRIORITY                    ({job['job_priority']}U)\n"
-                content += f"#define SPI_JOB_{job['job_id']}_HW_UNIT_SYNC                (SPI_{job['hw_unit_synchronous']})\n"
-                if job['job_end_notification']:
-                    content += f"#define SPI_JOB_{job['job_id']}_END_NOTIFICATION            (STD_ON)\n"
+                content += f"#define SPI_JOB_{job.job_id}_PRIORITY                    ({job.job_priority}U)\n"
+                content += f"#define SPI_JOB_{job.job_id}_HW_UNIT_SYNC                (SPI_{job.hw_unit_synchronous})\n"
+                if job.job_end_notification:
+                    content += f"#define SPI_JOB_{job.job_id}_END_NOTIFICATION            (STD_ON)\n"
                 content += "\n"
 
         # Add Sequence definitions
         if self.config_data['sequences']:
             content += "/* SPI Sequence Symbolic Names */\n"
             for i, seq in enumerate(self.config_data['sequences']):
-                content += f"#define SpiConf_SpiSequence_Sequence_{seq['sequence_id']}   ({seq['sequence_id']}U)\n"
+                content += f"#define SpiConf_SpiSequence_Sequence_{seq.sequence_id}   ({seq.sequence_id}U)\n"
             
             content += "\n/* SPI Sequence Configuration */\n"
             for i, seq in enumerate(self.config_data['sequences']):
-                content += f"#define SPI_SEQUENCE_{seq['sequence_id']}_INTERRUPTIBLE          ({'STD_ON' if seq['interruptible_sequence'] else 'STD_OFF'})\n"
-                if seq['seq_end_notification']:
-                    content += f"#define SPI_SEQUENCE_{seq['sequence_id']}_END_NOTIFICATION      (STD_ON)\n"
+                content += f"#define SPI_SEQUENCE_{seq.sequence_id}_INTERRUPTIBLE          ({'STD_ON' if seq.interruptible_sequence else 'STD_OFF'})\n"
+                if seq.seq_end_notification:
+                    content += f"#define SPI_SEQUENCE_{seq.sequence_id}_END_NOTIFICATION      (STD_ON)\n"
                 content += "\n"
 
         # Add External Device definitions
         if self.config_data['external_devices']:
             content += "/* SPI External Device Configuration */\n"
             for i, dev in enumerate(self.config_data['external_devices']):
-                content += f"#define SPI_EXTERNAL_DEVICE_{i}_BAUDRATE            ({dev['baudrate']}U)\n"
-                content += f"#define SPI_EXTERNAL_DEVICE_{i}_CS_BEHAVIOR         (SPI_{dev['cs_behavior']})\n"
-                content += f"#define SPI_EXTERNAL_DEVICE_{i}_CS_POLARITY         (SPI_CS_{dev['cs_polarity']})\n"
-                content += f"#define SPI_EXTERNAL_DEVICE_{i}_CS_SELECTION        (SPI_{dev['cs_selection']})\n"
-                content += f"#define SPI_EXTERNAL_DEVICE_{i}_DATA_SHIFT_EDGE     (SPI_{dev['data_shift_edge']})\n"
-                content += f"#define SPI_EXTERNAL_DEVICE_{i}_HW_UNIT             (SPI_{dev['hw_unit']})\n"
-                content += f"#define SPI_EXTERNAL_DEVICE_{i}_SHIFT_CLOCK_IDLE    (SPI_{dev['shift_clock_idle_level']})\n"
-                content += f"#define SPI_EXTERNAL_DEVICE_{i}_TIME_CLK2CS         ({dev['time_clk2cs']}U)\n"
-                content += f"#define SPI_EXTERNAL_DEVICE_{i}_TIME_CS2CLK         ({dev['time_cs2clk']}U)\n"
-                content += f"#define SPI_EXTERNAL_DEVICE_{i}_TIME_CS2CS          ({dev['time_cs2cs']}U)\n"
-                if dev['cs_identifier']:
-                    content += f"#define SPI_EXTERNAL_DEVICE_{i}_CS_IDENTIFIER       \"{dev['cs_identifier']}\"\n"
+                content += f"#define SPI_EXTERNAL_DEVICE_{i}_BAUDRATE            ({dev.baudrate}U)\n"
+                content += f"#define SPI_EXTERNAL_DEVICE_{i}_CS_BEHAVIOR         (SPI_{dev.cs_behavior})\n"
+                content += f"#define SPI_EXTERNAL_DEVICE_{i}_CS_POLARITY         (SPI_CS_{dev.cs_polarity})\n"
+                content += f"#define SPI_EXTERNAL_DEVICE_{i}_CS_SELECTION        (SPI_{dev.cs_selection})\n"
+                content += f"#define SPI_EXTERNAL_DEVICE_{i}_DATA_SHIFT_EDGE     (SPI_{dev.data_shift_edge})\n"
+                content += f"#define SPI_EXTERNAL_DEVICE_{i}_HW_UNIT             (SPI_{dev.hw_unit})\n"
+                content += f"#define SPI_EXTERNAL_DEVICE_{i}_SHIFT_CLOCK_IDLE    (SPI_{dev.shift_clock_idle_level})\n"
+                content += f"#define SPI_EXTERNAL_DEVICE_{i}_TIME_CLK2CS         ({dev.time_clk2cs}U)\n"
+                content += f"#define SPI_EXTERNAL_DEVICE_{i}_TIME_CS2CLK         ({dev.time_cs2clk}U)\n"
+                content += f"#define SPI_EXTERNAL_DEVICE_{i}_TIME_CS2CS          ({dev.time_cs2cs}U)\n"
+                if dev.cs_identifier:
+                    content += f"#define SPI_EXTERNAL_DEVICE_{i}_CS_IDENTIFIER       \"{dev.cs_identifier}\"\n"
                 content += "\n"
 
         # Add HW Unit definitions
@@ -753,6 +807,8 @@ class ARXMLtoSPIGenerator(ttk.Frame):
 
 """
 
+        content += self.generate_spi_schedule_tables()
+
         # Add configuration counts
         content += f"/* Configuration Counts */\n"
         content += f"#define SPI_CONFIG_CHANNELS_COUNT        ({len(self.config_data['channels'])}U)\n"
@@ -771,9 +827,78 @@ class ARXMLtoSPIGenerator(ttk.Frame):
         # Display generated code
         self.code_text.delete(1.0, tk.END)
         self.code_text.insert(1.0, content)
+        return True
         
         # messagebox.showinfo("Success", "SPI_CFG.H generated successfully!")
 
+    def generate_spi_schedule_tables(self):
+        """Generate job transfer times, priority-sorted job queues and sequence latencies.
+
+        The header only declares the job tables; generate_spi_cfg_c defines them.
+        """
+        schedule = SpiScheduleAnalyzer(self.config_data).analyze()
+        if not schedule.jobs:
+            return ""
+
+        content = "/* SPI Job Transfer Times (ns, including CS timing) */\n"
+        for job in schedule.jobs:
+            content += f"#define SPI_JOB_{job['job_id']}_TRANSFER_TIME_NS         ({job['transfer_time_ns']}U)\n"
+
+        content += "\n/* SPI Job Queues per HW Unit (highest priority first) */\n"
+        for unit, jobs in schedule.job_queues().items():
+            job_ids = ", ".join(f"{job['job_id']}U" for job in jobs)
+            content += f"#define SPI_{unit}_JOB_QUEUE_LENGTH              ({len(jobs)}U)\n"
+            content += f"extern const uint16 Spi_{unit}_JobQueue[{len(jobs)}U];\n"
+
+        if schedule.sequences:
+            content += "\n/* SPI Sequence Job Lists (transmission order) */\n"
+            for seq in schedule.sequences:
+                if not seq['jobs']:
+                    continue
+                content += f"#define SPI_SEQUENCE_{seq['sequence_id']}_JOB_COUNT            ({len(seq['jobs'])}U)\n"
+                content += f"extern const uint16 Spi_Sequence_{seq['sequence_id']}_Jobs[{len(seq['jobs'])}U];\n"
+
+        latencies = schedule.worst_case_latency()
+        if latencies:
+            content += "\n/* SPI Worst-Case Sequence Latency per HW Unit (ns) */\n"
+            for unit, (sequence_id, latency) in latencies.items():
+                content += f"#define SPI_{unit}_WORST_SEQ_LATENCY_NS       ({latency}U)   /* Sequence {sequence_id} */\n"
+
+        for warning in schedule.warnings:
+            content += f"/* NOTE: {warning} */\n"
+        return content + "\n"
+
+    def generate_spi_cfg_c(self):
+        """Spi_Cfg.c: definitions of the job tables Spi_Cfg.h declares"""
+        schedule = SpiScheduleAnalyzer(self.config_data).analyze()
+        content = f"""/*
+ * Generated SPI Configuration Source
+ * Generated from ARXML: {os.path.basename(self.arxml_file_path) if self.arxml_file_path else 'Unknown'}
+ * Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+ */
+
+#include "Spi_Cfg.h"
+"""
+        queues = schedule.job_queues() if schedule.jobs else {}
+        if queues:
+            content += "\n/* SPI Job Queues per HW Unit (highest priority first) */\n"
+            for unit, jobs in queues.items():
+                job_ids = ", ".join(f"{job['job_id']}U" for job in jobs)
+                content += f"const uint16 Spi_{unit}_JobQueue[{len(jobs)}U] = {{ {job_ids} }};\n"
+
+        sequences = [seq for seq in schedule.sequences if seq['jobs']] if schedule.jobs else []
+        if sequences:
+            content += "\n/* SPI Sequence Job Lists (transmission order) */\n"
+            for seq in sequences:
+                job_ids = ", ".join(f"{job['job_id']}U" for job in seq['jobs'])
+                content += f"const uint16 Spi_Sequence_{seq['sequence_id']}_Jobs[{len(seq['jobs'])}U] = {{ {job_ids} }};\n"
+        return content
+
+    def driver_files(self):
+        """(file name, content) of each SPI output file: Spi_Cfg.h and the Spi_Cfg.c it declares tables of"""
+        return [('Spi_Cfg.h', self.code_text.get(1.0, tk.END)),
+                ('Spi_Cfg.c', self.generate_spi_cfg_c())]
+
     def save_spi_cfg_h(self):
         if not self.code_text.get(1.0, tk.END).strip():
             messagebox.showwarning("Warning", "Please generate the code first")
@@ -788,9 +913,13 @@ class ARXMLtoSPIGenerator(ttk.Frame):
         
         if file_path:
             try:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(self.code_text.get(1.0, tk.END))
-                messagebox.showinfo("Success", f"SPI_CFG.H saved successfully!\n\nLocation: {file_path}")
+                # Spi_Cfg.c holds the tables the header declares, so it goes next to it
+                writer = OutputSetWriter(os.path.dirname(os.path.abspath(file_path)))
+                writer.add(os.path.basename(file_path), self.code_text.get(1.0, tk.END))
+                writer.add('Spi_Cfg.c', self.generate_spi_cfg_c())
+                with profiler.span('write.spi', file=os.path.basename(file_path)):
+                    writer.commit()
+                messagebox.showinfo("Success", f"SPI_CFG.H and Spi_Cfg.c saved successfully!\n\nLocation: {file_path}")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to save file: {str(e)}")
 
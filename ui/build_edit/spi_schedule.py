@@ -0,0 +1,137 @@
+# spi_schedule.py
+
+# SpiTimeClk2Cs / SpiTimeCs2Clk / SpiTimeCs2Cs are configured in nanoseconds
+_NS_PER_S = 1_000_000_000
+
+
+class SpiScheduleAnalyzer:
+    """Resolve sequence -> job -> channel -> external device links and time them.
+
+    References are taken from the ECUC reference values when the ARXML has
+    them. Flat configurator output only carries SpiJobAssignment /
+    SpiDeviceAssignment / SpiChannelAssignment flags, so for those the
+    analyzer falls back to: every sequence runs every job, every job uses
+    every channel and the first external device. Each fallback is reported
+    in `warnings`.
+    """
+
+    def __init__(self, config_data):
+        self.config_data = config_data
+        self.warnings = []
+        self.jobs = []
+        self.sequences = []
+
+    def analyze(self):
+        """Resolve links, compute job transfer times and per-HW-unit latencies"""
+        self.warnings = []
+        channels = self.config_data.get('channels', [])
+        devices = self.config_data.get('external_devices', [])
+        jobs = self.config_data.get('jobs', [])
+
+        channels_by_name = {ch.short_name: ch for ch in channels}
+        devices_by_name = {dev.short_name: dev for dev in devices}
+        jobs_by_name = {job.short_name: job for job in jobs}
+
+        self.jobs = []
+        for job in jobs:
+            job_channels = self._resolve(job.channel_refs, channels_by_name, channels,
+                                         f"job {job.job_id}", 'channels')
+            device = self._resolve(job.device_refs, devices_by_name, devices[:1],
+                                   f"job {job.job_id}", 'external device')
+            device = device[0] if device else None
+            self.jobs.append({
+                'job_id': job.job_id,
+                'priority': job.job_priority,
+                'hw_unit': device.hw_unit if device else 'CSIB0',
+                'channels': [ch.channel_id for ch in job_channels],
+                'transfer_time_ns': self.job_transfer_time_ns(job_channels, device),
+            })
+
+        jobs_by_id = {job['job_id']: job for job in self.jobs}
+        self.sequences = []
+        for seq in self.config_data.get('sequences', []):
+            seq_jobs = self._resolve(seq.job_refs, jobs_by_name, jobs,
+                                     f"sequence {seq.sequence_id}", 'jobs')
+            resolved = [jobs_by_id[job.job_id] for job in seq_jobs]
+            self.sequences.append({
+                'sequence_id': seq.sequence_id,
+                'interruptible': seq.interruptible_sequence,
+                # SWS_Spi_00093: jobs of a sequence are transmitted in priority order
+                'jobs': self.priority_sorted(resolved),
+            })
+        return self
+
+    def job_transfer_time_ns(self, channels, device):
+        """Bus time of one job: CS setup, all channel frames, CS hold and CS idle"""
+        if device is None or not device.baudrate:
+            return 0
+        frames = 0
+        bits = 0
+        for ch in channels:
+            # SpiChannelType True = external buffer (EB), False = internal buffer (IB)
+            count = ch.eb_max_length if ch.channel_type else ch.ib_n_buffers
+            frames += count
+            bits += count * ch.data_width
+
+        time_ns = bits * _NS_PER_S / device.baudrate
+        cs_setup = device.time_cs2clk
+        cs_hold = device.time_clk2cs
+        cs_idle = device.time_cs2cs
+        time_ns += cs_setup + cs_hold + cs_idle
+        if device.cs_behavior == 'CS_TOGGLE' and frames > 1:
+            time_ns += (frames - 1) * (cs_hold + cs_idle + cs_setup)
+        return int(round(time_ns))
+
+    def job_queues(self):
+        """{hw_unit: [job, ...]} with the highest priority first"""
+        queues = {}
+        for job in self.jobs:
+            queues.setdefault(job['hw_unit'], []).append(job)
+        return {unit: self.priority_sorted(unit_jobs) for unit, unit_jobs in sorted(queues.items())}
+
+    def worst_case_latency(self):
+        """{hw_unit: (sequence_id, latency_ns)} for the slowest sequence on each unit.
+
+        Jobs are not preempted, so a sequence can first be blocked by
+        whatever is already on the bus: the longest job of another
+        sequence, or all of the jobs a non-interruptible sequence still has
+        to run on that unit once it has started. An interruptible sequence
+        can additionally be delayed by every higher-priority job of other
+        sequences between its own jobs.
+        """
+        worst = {}
+        for seq in self.sequences:
+            own_ids = {job['job_id'] for job in seq['jobs']}
+            for unit in {job['hw_unit'] for job in seq['jobs']}:
+                own = [job for job in seq['jobs'] if job['hw_unit'] == unit]
+                others = [job for job in self.jobs if job['hw_unit'] == unit and job['job_id'] not in own_ids]
+                blocking = max((job['transfer_time_ns'] for job in others), default=0)
+                for other in self.sequences:
+                    if other is seq or other['interruptible']:
+                        continue
+                    run = sum(job['transfer_time_ns'] for job in other['jobs']
+                              if job['hw_unit'] == unit and job['job_id'] not in own_ids)
+                    blocking = max(blocking, run)
+                latency = blocking + sum(job['transfer_time_ns'] for job in own)
+                if seq['interruptible']:
+                    lowest = min(job['priority'] for job in own)
+                    latency += sum(job['transfer_time_ns'] for job in others if job['priority'] > lowest)
+                if unit not in worst or latency > worst[unit][1]:
+                    worst[unit] = (seq['sequence_id'], latency)
+        return dict(sorted(worst.items()))
+
+    @staticmethod
+    def priority_sorted(jobs):
+        # SpiJobPriority: 0 is the lowest, 3 the highest
+        return sorted(jobs, key=lambda job: (-job['priority'], job['job_id']))
+
+    def _resolve(self, refs, by_name, fallback, owner, what):
+        if refs:
+            resolved = [by_name[ref] for ref in refs if ref in by_name]
+            missing = [ref for ref in refs if ref not in by_name]
+            if missing:
+                self.warnings.append(f"{owner}: unresolved {what} reference(s) {', '.join(missing)}")
+            return resolved
+        if fallback:
+            self.warnings.append(f"{owner}: no {what} reference, defaulting to {len(fallback)} configured {what}")
+        return list(fallback)
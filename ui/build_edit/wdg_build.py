@@ -4,6 +4,10 @@ import xml.etree.ElementTree as ET
 import os
 from datetime import datetime
 # from .drivers.wdg_code import WDG_H_TEMPLATE, WDG_C_TEMPLATE
+from .wdg_timing import (WdgTimingSolver, DEFAULT_WDG_CLOCK_HZ, DEFAULT_WDG_PRESCALERS, DEFAULT_WDG_COUNTER_BITS,
+                         DEFAULT_WDG_WINDOWED)
+from .arxml_namespace import strip_namespace
+from ..profiling import profiler
 
 class ARXMLtoWDGGenerator(ttk.Frame):
     def __init__(self, parent):
@@ -40,6 +44,17 @@ class ARXMLtoWDGGenerator(ttk.Frame):
         
         self.arxml_file_path = None
         self.status_var = tk.StringVar(value="Ready")
+        self.generation_warnings = []  # problems the last generation went ahead despite
+        # Desired mode timeouts (ms); reload constants are only emitted once these are set
+        self.timeout_settings = {
+            'clock_hz': DEFAULT_WDG_CLOCK_HZ,
+            'prescalers': DEFAULT_WDG_PRESCALERS,
+            'counter_bits': DEFAULT_WDG_COUNTER_BITS,
+            'windowed': DEFAULT_WDG_WINDOWED,
+            'slow_timeout_ms': None,
+            'fast_timeout_ms': None,
+            'window_open_percent': 0.0,
+        }
         self.setup_ui()
 
     def setup_ui(self):
@@ -95,7 +110,10 @@ class ARXMLtoWDGGenerator(ttk.Frame):
         self.generate_btn.pack(side=tk.LEFT, padx=(0, 10))
 
         self.save_btn = ttk.Button(buttons_frame, text="Save WDG_CFG.H", command=self.save_wdg_cfg_h)
-        self.save_btn.pack(side=tk.LEFT)
+        self.save_btn.pack(side=tk.LEFT, padx=(0, 10))
+
+        self.timeout_btn = ttk.Button(buttons_frame, text="Timeout Calculator", command=self.open_timeout_calculator)
+        self.timeout_btn.pack(side=tk.LEFT)
         
         code_frame = ttk.LabelFrame(right_frame, text="Generated Wdg_Cfg.h", padding="10")
         code_frame.grid(row=0, column=0, sticky='nsew')
@@ -130,7 +148,8 @@ class ARXMLtoWDGGenerator(ttk.Frame):
             return
 
         try:
-            tree = ET.parse(self.arxml_file_path)
+            with profiler.span('parse.wdg', file=os.path.basename(self.arxml_file_path)):
+                tree = ET.parse(self.arxml_file_path)
             root = tree.getroot()
             
             # Extract configuration
@@ -145,9 +164,22 @@ class ARXMLtoWDGGenerator(ttk.Frame):
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred: {str(e)}")
 
+    def load_arxml_tree(self, tree):
+        """Extract, display and generate from an already parsed ARXML tree, without dialogs.
+
+        Used by watch mode; False when nothing was generated. Infeasible
+        timeouts are left in generation_warnings.
+        """
+        self.extract_config_from_arxml(tree.getroot())
+        self.display_configuration()
+        return self.generate_wdg_cfg_h(interactive=False)
+
+    @profiler.timed('extract.wdg')
     def extract_config_from_arxml(self, root):
+        strip_namespace(root)  # extraction matches bare AUTOSAR tag names
         # Find all containers
-        containers = root.findall('.//ECUC-CONTAINER-VALUE')
+        with profiler.span('index.wdg'):
+            containers = root.findall('.//ECUC-CONTAINER-VALUE')
         
         for container in containers:
             short_name_elem = container.find('SHORT-NAME')
@@ -264,6 +296,7 @@ class ARXMLtoWDGGenerator(ttk.Frame):
         value_elem = param.find('VALUE')
         return value_elem.text if value_elem is not None else ''
 
+    @profiler.timed('view.wdg')
     def display_configuration(self):
         """Display extracted configuration"""
         config_text = f"Extracted Configuration from ARXML:\n"
@@ -293,8 +326,141 @@ class ARXMLtoWDGGenerator(ttk.Frame):
         self.config_text.insert(1.0, config_text)
         self.config_text.config(state='disabled')
 
-    def generate_wdg_cfg_h(self):
-        """Generate the WDG_CFG.H file content"""
+    def open_timeout_calculator(self):
+        """Enter watchdog clock and mode timeouts and solve reload/window values"""
+        dialog = tk.Toplevel(self)
+        dialog.title("WDG Timeout Calculator")
+        dialog.transient(self)
+        dialog.grab_set()
+
+        main_frame = ttk.Frame(dialog, padding="10")
+        main_frame.pack(fill="both", expand=True)
+        main_frame.columnconfigure(1, weight=1)
+
+        settings = self.timeout_settings
+        default_slow = settings['slow_timeout_ms'] or self.config_data['initial_timeout']
+        default_fast = settings['fast_timeout_ms'] or max(1, default_slow // 10)
+        setting_vars = {
+            'clock_hz': tk.StringVar(value=str(settings['clock_hz'])),
+            'prescalers': tk.StringVar(value=", ".join(str(p) for p in settings['prescalers'])),
+            'counter_bits': tk.StringVar(value=str(settings['counter_bits'])),
+            'slow_timeout_ms': tk.StringVar(value=f"{default_slow:g}"),
+            'fast_timeout_ms': tk.StringVar(value=f"{default_fast:g}"),
+            'window_open_percent': tk.StringVar(value=f"{settings['window_open_percent']:g}"),
+        }
+        labels = {'clock_hz': "Watchdog clock (Hz):", 'prescalers': "Prescaler options:",
+                  'counter_bits': "Reload counter width (bits):", 'slow_timeout_ms': "Slow mode timeout (ms):",
+                  'fast_timeout_ms': "Fast mode timeout (ms):",
+                  'window_open_percent': "Window closed for first (%):"}
+        for row, (key, var) in enumerate(setting_vars.items()):
+            ttk.Label(main_frame, text=labels[key]).grid(row=row, column=0, padx=10, pady=2, sticky=tk.W)
+            ttk.Entry(main_frame, textvariable=var, width=30).grid(row=row, column=1, padx=10, pady=2, sticky=tk.W)
+
+        windowed_var = tk.BooleanVar(value=settings['windowed'])
+        ttk.Checkbutton(main_frame, text="Watchdog has a trigger window (e.g. WWDG; the IWDG has none)",
+                        variable=windowed_var) \
+            .grid(row=len(setting_vars), column=0, columnspan=2, padx=10, pady=2, sticky=tk.W)
+        ttk.Label(main_frame, text=f"Trigger mode: {self.config_data['trigger_mode']} "
+                                   "(the window only applies to WDG_WINDOW / WDG_BOTH)") \
+            .grid(row=len(setting_vars) + 1, column=0, columnspan=2, padx=10, pady=(10, 5), sticky=tk.W)
+
+        result_text = scrolledtext.ScrolledText(main_frame, height=10, width=80, font=('Courier', 9))
+        result_text.grid(row=len(setting_vars) + 2, column=0, columnspan=2, padx=10, pady=(10, 0), sticky='nsew')
+
+        def solve():
+            try:
+                prescalers = tuple(int(p) for p in setting_vars['prescalers'].get().replace(';', ',').split(',')
+                                   if p.strip())
+                new_settings = {
+                    'clock_hz': int(float(setting_vars['clock_hz'].get())),
+                    'prescalers': prescalers,
+                    'counter_bits': int(setting_vars['counter_bits'].get()),
+                    'windowed': bool(windowed_var.get()),
+                    'slow_timeout_ms': float(setting_vars['slow_timeout_ms'].get()),
+                    'fast_timeout_ms': float(setting_vars['fast_timeout_ms'].get()),
+                    'window_open_percent': float(setting_vars['window_open_percent'].get()),
+                }
+                if not prescalers or min(prescalers) < 1 or new_settings['clock_hz'] <= 0:
+                    raise ValueError("clock and prescalers must be positive")
+                if not 0 <= new_settings['window_open_percent'] < 100:
+                    raise ValueError("window must be between 0 and 100 %")
+            except ValueError as e:
+                messagebox.showerror("Error", f"Invalid input: {str(e)}", parent=dialog)
+                return False
+
+            self.timeout_settings = new_settings
+            modes, violations = self.solve_mode_timings()
+            result_text.delete(1.0, tk.END)
+            for mode, timing in modes.items():
+                if not timing['enabled']:
+                    result_text.insert(tk.END, f"{mode}: watchdog disabled\n")
+                    continue
+                line = f"{mode}: prescaler /{timing['prescaler']}, reload {timing['reload']}, "
+                if 'window' in timing:
+                    line += f"window {timing['window']}, "
+                line += f"timeout {timing['timeout_us'] / 1000:g} ms"
+                if 'window' in timing:
+                    line += f", trigger after {timing['window_open_us'] / 1000:g} ms"
+                result_text.insert(tk.END, line + "\n")
+            for violation in violations:
+                result_text.insert(tk.END, f"    INFEASIBLE {violation}\n")
+            return True
+
+        def apply():
+            if solve():
+                dialog.destroy()
+                self.generate_wdg_cfg_h()
+
+        button_frame = ttk.Frame(main_frame)
+        button_frame.grid(row=len(setting_vars) + 3, column=0, columnspan=2, pady=(10, 0))
+        ttk.Button(button_frame, text="Solve", command=solve).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Apply & Generate", command=apply).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Cancel", command=dialog.destroy).pack(side=tk.LEFT, padx=5)
+
+    def solve_mode_timings(self):
+        """Return ({mode: timing}, violations) for the current timeout settings"""
+        settings = self.timeout_settings
+        solver = WdgTimingSolver(settings['clock_hz'], settings['prescalers'], settings['counter_bits'],
+                                 settings['windowed'])
+        window = settings['window_open_percent'] if self.config_data['trigger_mode'] != 'WDG_TOGGLE' else 0.0
+        return solver.solve(self.config_data, settings['slow_timeout_ms'], settings['fast_timeout_ms'], window)
+
+    def generate_mode_timing_defines(self):
+        """Reload/window constants per WdgIf mode so the driver does not derive them at runtime"""
+        settings = self.timeout_settings
+        if settings['slow_timeout_ms'] is None or settings['fast_timeout_ms'] is None:
+            return "", []
+
+        modes, violations = self.solve_mode_timings()
+        lines = [f"/* WDG Mode Timing (clock {settings['clock_hz']} Hz, "
+                 f"{settings['counter_bits']}-bit reload counter) */"]
+        for mode, timing in modes.items():
+            name = mode.replace('WDGIF_', 'WDG_')
+            lines.append(f"#define {name + '_ENABLED':<32} {'STD_ON' if timing['enabled'] else 'STD_OFF'}")
+            if not timing['enabled']:
+                continue
+            lines.append(f"#define {name + '_PRESCALER':<32} ({timing['prescaler']}U)")
+            lines.append(f"#define {name + '_PRESCALER_INDEX':<32} ({timing['prescaler_index']}U)")
+            lines.append(f"#define {name + '_RELOAD':<32} ({timing['reload']}U)")
+            if 'window' in timing:
+                lines.append(f"#define {name + '_WINDOW':<32} ({timing['window']}U)")
+            lines.append(f"#define {name + '_TIMEOUT_US':<32} ({timing['timeout_us']}UL)")
+            if 'window' in timing:
+                lines.append(f"#define {name + '_WINDOW_OPEN_US':<32} ({timing['window_open_us']}UL)")
+        return "\n".join(lines) + "\n\n", violations
+
+    @profiler.timed('codegen.wdg')
+    def generate_wdg_cfg_h(self, interactive=True):
+        """Generate the WDG_CFG.H file content; False when the user declined to after infeasible timeouts"""
+        timing_defines, violations = self.generate_mode_timing_defines()
+        self.generation_warnings = violations
+        if violations:
+            self.status_var.set("Infeasible watchdog timeout settings found")
+            if interactive and not messagebox.askyesno("Infeasible Timeouts",
+                                       "The watchdog settings cannot meet the requested timeouts:\n\n"
+                                       + "\n".join(violations) + "\n\nGenerate WDG_CFG.H anyway?"):
+                return False
+
         content = f"""#ifndef WDG_CFG_H_
 #define WDG_CFG_H_
 
@@ -343,15 +509,20 @@ class ARXMLtoWDGGenerator(ttk.Frame):
 #define WDG_WINDOW                       (0x01U)
 #define WDG_BOTH                         (0x02U)
 
-#endif /* WDG_CFG_H_ */
+{timing_defines}#endif /* WDG_CFG_H_ */
 """
         
         # Display generated code
         self.code_text.delete(1.0, tk.END)
         self.code_text.insert(1.0, content)
+        return True
         
         # messagebox.showinfo("Success", "WDG_CFG.H generated successfully!")
 
+    def driver_files(self):
+        """(file name, content) of each WDG output file: the generated Wdg_Cfg.h"""
+        return [('Wdg_Cfg.h', self.code_text.get(1.0, tk.END))]
+
     def save_wdg_cfg_h(self):
         if not self.code_text.get(1.0, tk.END).strip():
             messagebox.showwarning("Warning", "Please generate the code first")
@@ -366,7 +537,8 @@ class ARXMLtoWDGGenerator(ttk.Frame):
         
         if file_path:
             try:
-                with open(file_path, 'w', encoding='utf-8') as f:
+                with profiler.span('write.wdg', file=os.path.basename(file_path)), \
+                        open(file_path, 'w', encoding='utf-8') as f:
                     f.write(self.code_text.get(1.0, tk.END))
                 messagebox.showinfo("Success", f"WDG_CFG.H saved successfully!\n\nLocation: {file_path}")
             except Exception as e:
@@ -0,0 +1,103 @@
+# wdg_timing.py
+
+import math
+
+# STM32F407 IWDG: ~32 kHz LSI, /4../256 prescaler, 12-bit reload register, no window
+DEFAULT_WDG_CLOCK_HZ = 32_000
+DEFAULT_WDG_PRESCALERS = (4, 8, 16, 32, 64, 128, 256)
+DEFAULT_WDG_COUNTER_BITS = 12
+DEFAULT_WDG_WINDOWED = False
+
+
+class WdgTimingSolver:
+    """Compute reload values and trigger windows for the WdgIf modes.
+
+    For SLOW and FAST mode the smallest prescaler whose counter can still
+    hold the requested timeout is chosen (finest trigger resolution). The
+    window value is the counter level below which a trigger is accepted;
+    triggering while the counter is above it (too early) resets the MCU.
+    Watchdogs without a window (`windowed` False) get no window values.
+    """
+
+    def __init__(self, clock_hz=DEFAULT_WDG_CLOCK_HZ, prescalers=DEFAULT_WDG_PRESCALERS,
+                 counter_bits=DEFAULT_WDG_COUNTER_BITS, windowed=DEFAULT_WDG_WINDOWED):
+        self.clock_hz = clock_hz
+        self.prescalers = sorted(prescalers)
+        self.counter_max = (1 << counter_bits) - 1
+        self.windowed = windowed
+
+    def solve(self, config_data, slow_timeout_ms, fast_timeout_ms, window_open_percent=0.0):
+        """Return ({mode: settings}, [violation, ...]) for OFF, SLOW and FAST mode"""
+        violations = []
+        if window_open_percent and not self.windowed:
+            violations.append("this watchdog has no trigger window; the window setting is ignored")
+            window_open_percent = 0.0
+        modes = {'WDGIF_OFF_MODE': {'enabled': False}}
+        requested = (('WDGIF_SLOW_MODE', 'settings_slow', slow_timeout_ms),
+                     ('WDGIF_FAST_MODE', 'settings_fast', fast_timeout_ms))
+
+        for mode, setting_key, timeout_ms in requested:
+            if not config_data.get(setting_key, True):
+                modes[mode] = {'enabled': False}
+                continue
+            settings, problems = self.solve_mode(timeout_ms, window_open_percent)
+            modes[mode] = settings
+            violations.extend(f"{mode}: {problem}" for problem in problems)
+            max_timeout = config_data.get('max_timeout')
+            if max_timeout and timeout_ms > max_timeout:
+                violations.append(f"{mode}: {timeout_ms:g} ms exceeds WdgMaxTimeout ({max_timeout} ms)")
+
+        if fast_timeout_ms >= slow_timeout_ms and modes['WDGIF_SLOW_MODE']['enabled'] \
+                and modes['WDGIF_FAST_MODE']['enabled']:
+            violations.append("WDGIF_FAST_MODE timeout must be shorter than WDGIF_SLOW_MODE timeout")
+        default_mode = config_data.get('default_mode', 'WDGIF_SLOW_MODE')
+        # Configuring OFF mode is fine; starting in it means the watchdog is disabled at init
+        if default_mode == 'WDGIF_OFF_MODE' and not config_data.get('disable_allowed'):
+            violations.append("WdgDefaultMode WDGIF_OFF_MODE requires WdgDisableAllowed")
+        if default_mode in modes and default_mode != 'WDGIF_OFF_MODE' and not modes[default_mode]['enabled']:
+            violations.append(f"WdgDefaultMode {default_mode} is not enabled in WdgSettingsConfig")
+        initial = config_data.get('initial_timeout')
+        if initial and default_mode in ('WDGIF_SLOW_MODE', 'WDGIF_FAST_MODE') and modes[default_mode]['enabled'] \
+                and modes[default_mode]['timeout_us'] > initial * 1000:
+            violations.append(f"{default_mode} timeout is longer than WdgInitialTimeout ({initial} ms)")
+        return modes, violations
+
+    def solve_mode(self, timeout_ms, window_open_percent=0.0):
+        problems = []
+        timeout_s = timeout_ms / 1000.0
+        if timeout_s <= 0:
+            return {'enabled': False}, ["timeout must be positive"]
+
+        prescaler = next((p for p in self.prescalers
+                          if math.ceil(timeout_s * self.clock_hz / p) - 1 <= self.counter_max),
+                         self.prescalers[-1])
+        tick_s = prescaler / self.clock_hz
+        reload = math.ceil(timeout_s / tick_s) - 1
+        if reload > self.counter_max:
+            longest = (self.counter_max + 1) * self.prescalers[-1] / self.clock_hz * 1000
+            problems.append(f"{timeout_ms:g} ms exceeds the longest reachable timeout ({longest:g} ms)")
+            reload = self.counter_max
+        if reload < 1:
+            problems.append(f"{timeout_ms:g} ms is shorter than two watchdog ticks ({tick_s * 2000:g} ms)")
+            reload = 1
+
+        settings = {
+            'enabled': True,
+            'prescaler': prescaler,
+            'prescaler_index': self.prescalers.index(prescaler),
+            'reload': reload,
+            'timeout_us': round((reload + 1) * tick_s * 1e6),
+        }
+        if not self.windowed:
+            return settings, problems
+
+        # Counter level below which a trigger is accepted (counter counts down from reload)
+        closed_ticks = math.ceil((reload + 1) * window_open_percent / 100.0)
+        window = reload - closed_ticks
+        if window_open_percent and window < 1:
+            problems.append(f"window opening at {window_open_percent:g}% leaves no time to trigger")
+            window = 1
+
+        settings['window'] = window if window_open_percent else reload
+        settings['window_open_us'] = round(closed_ticks * tick_s * 1e6)
+        return settings, problems
@@ -0,0 +1,169 @@
+# codegen_service.py
+
+import inspect
+import os
+import time
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+
+from .ecuc_tree import read_ecuc_tree
+from .profiling import profiler
+from .watch import generate_module
+
+
+@dataclass(slots=True)
+class CachedDocument:
+    path: str
+    signature: tuple  # (st_mtime_ns, st_size) the document was read at
+    root: object  # EcucNode tree, elements kept
+    modules: dict  # module definition name -> digest
+    generated: dict = field(default_factory=dict)  # (module, output dir) -> (digest, written paths)
+
+
+class CodegenService:
+    """Parsed documents and generator panels kept warm between requests.
+
+    Every request stats its file first: a document whose modification
+    time or size changed since it was read is dropped and read again, so
+    the cache never serves a stale file. `generate` additionally skips a
+    module whose digest matches the last run into the same output
+    directory, leaving those files (and their timestamps) untouched.
+    Methods take and return JSON-ready dicts; bad arguments raise
+    ValueError.
+    """
+
+    def __init__(self, get_panel):
+        self.get_panel = get_panel
+        self.documents = {}
+        self.started = time.time()
+        self.requests = 0
+        self.parses = 0
+
+    def document(self, path):
+        if not path:
+            raise ValueError("'file' is required")
+        path = os.path.abspath(path)
+        st = os.stat(path)
+        signature = (st.st_mtime_ns, st.st_size)
+        doc = self.documents.get(path)
+        if doc is None or doc.signature != signature:
+            self.documents.pop(path, None)
+            with profiler.span('parse.ecuc_tree', file=os.path.basename(path)):
+                root = read_ecuc_tree(path, keep_elements=True)
+            # What was generated carries over: modules whose digest survived the edit stay up to date
+            generated = doc.generated if doc is not None else {}
+            doc = CachedDocument(path, signature, root, root.module_digests(), generated)
+            self.documents[path] = doc
+            self.parses += 1
+        return doc
+
+    # ---------- methods ----------
+    def generate(self, file=None, output=None, modules=None, force=False):
+        """Generate driver files for the modules in `file` into output/<Module>/"""
+        if not output:
+            raise ValueError("'output' is required")
+        doc = self.document(file)
+        if modules:
+            names = {name.lower(): name for name in doc.modules}
+            wanted = {names.get(name.lower(), name): doc.modules.get(names.get(name.lower())) for name in modules}
+        else:
+            wanted = doc.modules
+        output = os.path.abspath(output)
+        result = {'generated': [], 'up_to_date': [], 'skipped': {}, 'warnings': {}}
+        tree = None
+        for module, digest in wanted.items():
+            panel = self.get_panel(module.upper())
+            if digest is None or panel is None:
+                result['skipped'][module] = "not in file" if digest is None else "no generator"
+                continue
+            key = (module, output)
+            previous = doc.generated.get(key)
+            if not force and previous and previous[0] == digest and all(map(os.path.exists, previous[1])):
+                result['up_to_date'].append(module)
+                continue
+            if tree is None:
+                tree = ET.ElementTree(doc.root.element)
+            with profiler.span('daemon.generate', module=module):
+                generated = generate_module(panel, doc.path, tree, os.path.join(output, module))
+            if generated is None:
+                result['skipped'][module] = "nothing generated"
+                continue
+            doc.generated[key] = (digest, generated[0])
+            result['generated'].append(module)
+            if generated[3]:
+                result['warnings'][module] = generated[3]
+        return result
+
+    def validate(self, file=None):
+        """Structural checks on the ECUC content: [(severity, message)], as the Raw XML view reports them"""
+        doc = self.document(file)
+        results = []
+        root_tag = doc.root.element.tag if doc.root.element is not None else ""
+        if not root_tag.endswith("AUTOSAR"):
+            results.append(("Warning", "Root element is not AUTOSAR"))
+        packages = duplicates = 0
+        missing_definition = []
+        for path, node in doc.root.walk():
+            if node.kind == "package":
+                packages += 1
+            elif node.kind in ("module", "container") and not node.definition:
+                missing_definition.append(path)
+            duplicates += sum(1 for name in node.children if "#" in name)
+        if not packages:
+            results.append(("Warning", "No AR-PACKAGE elements found"))
+        if doc.modules:
+            results.append(("Info", f"Module configurations: {', '.join(doc.modules)}"))
+        else:
+            results.append(("Warning", "No ECUC module configurations found"))
+        for path in missing_definition[:20]:
+            results.append(("Warning", f"No DEFINITION-REF: {path}"))
+        if len(missing_definition) > 20:
+            results.append(("Warning", f"... and {len(missing_definition) - 20} more without DEFINITION-REF"))
+        if duplicates:
+            results.append(("Error", f"{duplicates} duplicate SHORT-NAME(s) among siblings"))
+        valid = not any(severity == "Error" for severity, _ in results)
+        return {'valid': valid, 'results': [list(r) for r in results]}
+
+    def query(self, file=None, path=""):
+        """A node by AUTOSAR path (default: the document root) with its parameters and children"""
+        doc = self.document(file)
+        node = doc.root
+        for name in filter(None, (path or "").split("/")):
+            node = node.children.get(name)
+            if node is None:
+                raise ValueError(f"No such AUTOSAR path: {path}")
+        return {
+            'path': path or "/",
+            'kind': node.kind,
+            'name': node.name,
+            'definition': node.definition,
+            'digest': node.digest.hex(),
+            'parameters': {name: list(value) if isinstance(value, tuple) else value
+                           for name, value in node.params.items()},
+            'children': [{'name': name, 'kind': child.kind, 'definition': child.definition}
+                         for name, child in node.children.items()],
+        }
+
+    def status(self):
+        return {
+            'uptime_s': round(time.time() - self.started, 1),
+            'requests': self.requests,
+            'parses': self.parses,
+            'documents': {path: {'modules': {name: digest.hex() for name, digest in doc.modules.items()}}
+                          for path, doc in self.documents.items()},
+        }
+
+    METHODS = ('generate', 'validate', 'query', 'status')
+
+    def call(self, method, params):
+        if method not in self.METHODS:
+            raise LookupError(method)
+        if not isinstance(params, dict):
+            raise ValueError("params must be an object")
+        handler = getattr(self, method)
+        try:
+            inspect.signature(handler).bind(**params)
+        except TypeError as e:
+            raise ValueError(str(e)) from None
+        self.requests += 1
+        return handler(**params)
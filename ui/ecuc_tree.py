@@ -0,0 +1,194 @@
+# ecuc_tree.py
+
+import gc
+import hashlib
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+
+from .merkle import DIGEST_SIZE
+
+# Identifiable elements that make up an AUTOSAR path, by local tag name
+NODE_KINDS = {
+    "AUTOSAR": "root",
+    "AR-PACKAGE": "package",
+    "ECUC-MODULE-CONFIGURATION-VALUES": "module",
+    "ECUC-CONTAINER-VALUE": "container",
+}
+VALUE_LISTS = ("PARAMETER-VALUES", "REFERENCE-VALUES")
+
+
+@dataclass(slots=True)
+class EcucNode:
+    """One package, module configuration or container of an ECUC document.
+
+    `params` maps parameter / reference name (last segment of its
+    DEFINITION-REF, else its SHORT-NAME) to the value text, or to a tuple of
+    texts for a parameter given more than once. `children` are keyed by
+    SHORT-NAME, so a node's AUTOSAR path is the chain of keys down to it.
+    `digest` covers the definition, parameters and child digests, in any
+    order; equal digests mean equal subtrees. `element` is the XML element
+    the node was read from, kept only when the caller asked for it.
+    """
+    kind: str
+    name: str = ""
+    definition: str = ""
+    params: dict = field(default_factory=dict)
+    children: dict = field(default_factory=dict)
+    digest: bytes = b""
+    element: object = None
+
+    def walk(self, path=""):
+        """Yield (AUTOSAR path, node) for this node and every node below it"""
+        yield path, self
+        for name, child in self.children.items():
+            yield from child.walk(f"{path}/{name}")
+
+    def modules(self, path=""):
+        """Yield (AUTOSAR path, node) for every module configuration in this subtree"""
+        if self.kind == "module":
+            yield path, self
+            return
+        for name, child in self.children.items():
+            yield from child.modules(f"{path}/{name}")
+
+    def module_digests(self):
+        """{module definition name: digest} for the module configurations in this subtree.
+
+        Codegen for a module whose digest is unchanged can be skipped.
+        """
+        modules = {}
+        for _, module in self.modules():
+            name = module.definition or module.name
+            digest = module.digest
+            if name in modules:
+                # Several configurations of one module change together
+                digest = hashlib.blake2b(modules[name] + digest, digest_size=DIGEST_SIZE).digest()
+            modules[name] = digest
+        return modules
+
+    def rehash(self):
+        """Recompute `digest` from this node's content and its children's digests"""
+        h = hashlib.blake2b(f"{self.kind}\0{self.definition}\0".encode(), digest_size=DIGEST_SIZE)
+        for name in sorted(self.params):
+            value = self.params[name]
+            if isinstance(value, tuple):
+                value = "\1".join(value)
+            h.update(f"{name}\0{value}\0".encode())
+        h.update(b"\2")
+        for name in sorted(self.children):
+            h.update(f"{name}\0".encode())
+            h.update(self.children[name].digest)
+        self.digest = h.digest()
+        return self.digest
+
+
+def _last_segment(text):
+    return text.strip().rsplit("/", 1)[-1] if text else ""
+
+
+_LOCAL_NAMES = {}
+
+
+def _local(tag):
+    name = _LOCAL_NAMES.get(tag)
+    if name is None:
+        name = _LOCAL_NAMES[tag] = tag[tag.rfind("}") + 1:] if isinstance(tag, str) else ""
+    return name
+
+
+def read_value(elem):
+    """(name, value text) of one parameter or reference value element"""
+    name = definition = value = None
+    for child in elem:
+        tag = _local(child.tag)
+        if tag == "DEFINITION-REF":
+            definition = _last_segment(child.text)
+        elif tag == "SHORT-NAME":
+            name = (child.text or "").strip()
+        elif tag in ("VALUE", "VALUE-REF"):
+            value = (child.text or "").strip()
+    return definition or name, value
+
+
+def _add_param(params, name, value):
+    if name not in params:
+        params[name] = value
+    else:
+        previous = params[name]
+        params[name] = (previous if isinstance(previous, tuple) else (previous,)) + (value,)
+
+
+def _add_child(children, child):
+    # SHORT-NAMEs are unique per level in valid ARXML; keep duplicates apart anyway
+    name, index = child.name, 2
+    while name in children:
+        name = f"{child.name}#{index}"
+        index += 1
+    children[name] = child
+
+
+def _build_node(elem, kind, pending):
+    node = EcucNode(kind)
+    for child in elem:
+        tag = _local(child.tag)
+        if tag == "SHORT-NAME":
+            node.name = (child.text or "").strip()
+        elif tag == "DEFINITION-REF":
+            node.definition = _last_segment(child.text)
+        elif tag in VALUE_LISTS:
+            for value_elem in child:
+                name, value = read_value(value_elem)
+                if name and value is not None:
+                    _add_param(node.params, name, value)
+        else:
+            # SUB-CONTAINERS, CONTAINERS, ELEMENTS, AR-PACKAGES: nodes built on their own end events
+            for sub in child:
+                sub_node = pending.pop(sub, None)
+                if sub_node is not None:
+                    _add_child(node.children, sub_node)
+    node.rehash()
+    return node
+
+
+def read_ecuc_tree(source, keep_elements=False):
+    """Stream an ARXML file (path or file object) into a tree of EcucNodes.
+
+    Only packages, module configurations and containers become nodes;
+    each is built when its end tag is read and its element cleared, so
+    memory follows the node tree rather than the XML. With `keep_elements`
+    the XML is kept instead and every node links its element; the root
+    node's element is then the document root.
+    """
+    pending = {}
+    root = None
+    # Elements and nodes form no reference cycles; letting the cyclic
+    # collector rescan millions of fresh objects only costs time
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+        events = ET.iterparse(source, events=("end",))
+        for _, elem in events:
+            kind = NODE_KINDS.get(_local(elem.tag))
+            if kind is None:
+                continue
+            node = _build_node(elem, kind, pending)
+            if keep_elements:
+                node.element = elem
+            else:
+                elem.clear()
+            if kind == "root":
+                root = node
+            else:
+                pending[elem] = node
+    finally:
+        if collecting:
+            gc.enable()
+    if root is None:
+        # A fragment without the AUTOSAR root: adopt whatever was left over
+        root = EcucNode("root")
+        for node in pending.values():
+            _add_child(root.children, node)
+        root.rehash()
+        if keep_elements:
+            root.element = events.root
+    return root
@@ -2,15 +2,35 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import os
 import json
+from collections import OrderedDict
+from dataclasses import fields
 from datetime import datetime
 
-
-from .peripheral_config.dio_config import DioConfiguratorApp
-from .peripheral_config.adc_config import AdcConfiguratorApp
-from .peripheral_config.gpt_config import GptConfiguratorApp
-from .peripheral_config.spi_config import SpiConfiguratorApp
-from .peripheral_config.wdg_config import WdgConfiguratorApp
-from .peripheral_config.can_config import CanConfiguratorApp
+from ..lazy_registry import LazyRegistry
+
+# Configurator modules are imported when their module is first selected
+CONFIGURATOR_REGISTRY = LazyRegistry({
+    "ADC": ("ui.editor.peripheral_config.adc_config", "AdcConfiguratorApp"),
+    "DIO": ("ui.editor.peripheral_config.dio_config", "DioConfiguratorApp"),
+    "GPT": ("ui.editor.peripheral_config.gpt_config", "GptConfiguratorApp"),
+    "WDG": ("ui.editor.peripheral_config.wdg_config", "WdgConfiguratorApp"),
+    "CAN": ("ui.editor.peripheral_config.can_config", "CanConfiguratorApp"),
+    "SPI": ("ui.editor.peripheral_config.spi_config", "SpiConfiguratorApp"),
+})
+
+# Attribute holding each module's configurator while it is shown
+MODULE_FRAME_ATTRS = {
+    "ADC": "adc_config_frame",
+    "DIO": "dio_config_frame",
+    "GPT": "gpt_frame",
+    "WDG": "wdg_frame",
+    "CAN": "can_frame",
+    "SPI": "spi_frame",
+}
+
+# Built configurator forms kept alive (hidden) across module switches;
+# the state of forms evicted beyond this is kept and restored on rebuild
+FORM_CACHE_SIZE = 3
 
 class AutosarDriverPanel:
     def __init__(self, parent, status_logger=None):
@@ -23,8 +43,13 @@ class AutosarDriverPanel:
         
         self.current_module_vars = {}
         self.current_module = None
-        self.dio_config_frame = None
-        self.adc_config_frame = None
+        for attr in MODULE_FRAME_ATTRS.values():
+            setattr(self, attr, None)
+
+        # module -> configurator frame, least recently used first
+        self.module_forms = OrderedDict()
+        self.form_cache_size = FORM_CACHE_SIZE
+        self.evicted_form_states = {}  # module -> (model, {variable attribute: value})
 
         self.output_path_var.set(os.path.abspath("output"))
         
@@ -41,7 +66,7 @@ class AutosarDriverPanel:
             control_frame,
             textvariable=self.module_var,
             state="readonly",
-            values=["ADC", "DIO", "GPT", "WDG", "CAN", "SPI"],
+            values=CONFIGURATOR_REGISTRY.names(),
             width=15
         )
         self.combo.set("Select Module")
@@ -71,34 +96,84 @@ class AutosarDriverPanel:
         self.build_dynamic_ui()
 
     def build_dynamic_ui(self):
-        for widget in self.dynamic_frame.winfo_children():
-            widget.destroy()
-        
+        """Show the selected module's form, reusing the cached one if it was built before"""
+        for form in self.module_forms.values():
+            form.pack_forget()
+
         self.current_module_vars = {}
-        self.dio_config_frame = None
-        self.adc_config_frame = None
-        self.gpt_frame = None
-        self.spi_frame = None
-        self.wdg_frame = None
-        self.can_frame = None
+        for attr in MODULE_FRAME_ATTRS.values():
+            setattr(self, attr, None)
         module = self.current_module
 
-        if not module:
+        if module not in MODULE_FRAME_ATTRS:
             return
 
-        if module == "DIO":
-            self.show_dio_options()
-        elif module == "ADC":
-            self.show_adc_options()
-        elif module == "GPT":
-            self.show_gpt_options()
-        elif module == "WDG":
-            self.show_wdg_options()
-        elif module == "CAN":
-            self.show_can_options()
-        elif module == "SPI":
-            self.show_spi_options()
-        
+        form = self.module_forms.get(module)
+        if form is not None:
+            form.pack(fill="both", expand=True)
+            # The mouse wheel is bound globally to the most recently built form's canvas
+            canvas = getattr(form, "scroll_canvas", None)
+            if canvas is not None:
+                canvas.bind_all("<MouseWheel>", lambda event: canvas.yview_scroll(int(-1*(event.delta/120)), "units"))
+        else:
+            try:
+                getattr(self, f"show_{module.lower()}_options")()
+            except ImportError as e:
+                self.status_var.set(f"Error - {module} configurator unavailable")
+                messagebox.showerror("Error", f"Cannot load {module} configurator: {e}")
+                return
+            form = getattr(self, MODULE_FRAME_ATTRS[module])
+            self.module_forms[module] = form
+            state = self.evicted_form_states.pop(module, None)
+            if state is not None:
+                self.restore_form_state(form, *state)
+
+        setattr(self, MODULE_FRAME_ATTRS[module], form)
+        self.module_forms.move_to_end(module)
+        self.evict_cached_forms()
+
+    def evict_cached_forms(self):
+        """Destroy the least recently used hidden forms beyond the cache size, keeping their edits"""
+        while len(self.module_forms) > max(1, self.form_cache_size):
+            module, form = self.module_forms.popitem(last=False)
+            self.evicted_form_states[module] = self.capture_form_state(form)
+            form.destroy()
+            if self.status_logger:
+                self.status_logger.log(f"Released cached {module} configuration form", "DEBUG")
+
+    @staticmethod
+    def capture_form_state(form):
+        """The form's model plus every Tk variable on it, including edits not yet written to the model"""
+        for table in getattr(form, "instance_tables", {}).values():
+            table.commit_edit()
+        values = {}
+        for name, var in vars(form).items():
+            if isinstance(var, tk.Variable):
+                try:
+                    values[name] = var.get()
+                except tk.TclError:
+                    values[name] = form.getvar(str(var))  # e.g. half-typed text in an int field
+        return form.model, values
+
+    @staticmethod
+    def restore_form_state(form, model, values):
+        """Load a captured state into a freshly built form of the same module"""
+        for f in fields(model):
+            value = getattr(model, f.name)
+            current = getattr(form.model, f.name)
+            if isinstance(current, list):
+                current[:] = value  # the instance tables hold on to these lists
+            else:
+                setattr(form.model, f.name, value)
+        form._load_form()
+        for name, value in values.items():
+            var = getattr(form, name, None)
+            if isinstance(var, tk.Variable):
+                try:
+                    var.set(value)
+                except tk.TclError:
+                    pass
+
     def create_scrollable_frame(self, parent):
         main_frame = ttk.Frame(parent)
         main_frame.pack(fill="both", expand=True)
@@ -130,27 +205,27 @@ class AutosarDriverPanel:
         return canvas, scrollbar, scroll_frame
 
     def show_dio_options(self):
-        self.dio_config_frame = DioConfiguratorApp(self.dynamic_frame)
+        self.dio_config_frame = CONFIGURATOR_REGISTRY.load("DIO")(self.dynamic_frame)
         self.dio_config_frame.pack(fill="both", expand=True)
 
     def show_adc_options(self):
-        self.adc_config_frame = AdcConfiguratorApp(self.dynamic_frame)
+        self.adc_config_frame = CONFIGURATOR_REGISTRY.load("ADC")(self.dynamic_frame)
         self.adc_config_frame.pack(fill="both", expand=True)
 
     def show_gpt_options(self):
-        self.gpt_frame = GptConfiguratorApp(self.dynamic_frame)
+        self.gpt_frame = CONFIGURATOR_REGISTRY.load("GPT")(self.dynamic_frame)
         self.gpt_frame.pack(fill="both", expand=True)
 
     def show_can_options(self):
-        self.can_frame = CanConfiguratorApp(self.dynamic_frame)
+        self.can_frame = CONFIGURATOR_REGISTRY.load("CAN")(self.dynamic_frame)
         self.can_frame.pack(fill="both", expand=True)
 
     def show_wdg_options(self):
-        self.wdg_frame = WdgConfiguratorApp(self.dynamic_frame)
+        self.wdg_frame = CONFIGURATOR_REGISTRY.load("WDG")(self.dynamic_frame)
         self.wdg_frame.pack(fill="both", expand=True)
 
     def show_spi_options(self):
-        self.spi_frame = SpiConfiguratorApp(self.dynamic_frame)
+        self.spi_frame = CONFIGURATOR_REGISTRY.load("SPI")(self.dynamic_frame)
         self.spi_frame.pack(fill="both", expand=True)
 
     def collect_user_inputs(self):
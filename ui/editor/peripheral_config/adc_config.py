@@ -3,8 +3,12 @@
 import os
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import xml.etree.ElementTree as ET
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, is_dataclass
+
+from .arxml_reader import import_module
+from .arxml_writer import export_module, model_params
+from .instance_table import InstanceTable
+from .table_csv import in_range, not_above
 
 # -------------------- Data Models --------------------
 @dataclass
@@ -78,79 +82,67 @@ class AdcAppModel:
     AdcConfigSet: AdcConfigSetModel = field(default_factory=AdcConfigSetModel)  # Fixed: Should be model, not bool
     AdcGeneral: AdcGeneralModel = field(default_factory=AdcGeneralModel)
     AdcPowerStateConfig: AdcPowerStateConfigModel = field(default_factory=AdcPowerStateConfigModel)
-    AdcChannel: AdcChannelModel = field(default_factory=AdcChannelModel)
-    AdcGroup: AdcGroupModel = field(default_factory=AdcGroupModel)
-    AdcHwUnit: AdcHwUnitModel = field(default_factory=AdcHwUnitModel)
+    AdcChannel: list = field(default_factory=lambda: [AdcChannelModel()])
+    AdcGroup: list = field(default_factory=lambda: [AdcGroupModel()])
+    AdcHwUnit: list = field(default_factory=lambda: [AdcHwUnitModel()])
     AdcPublishedInformation: AdcPublishedInformationModel = field(default_factory=AdcPublishedInformationModel)
 
+# Fields edited through dropdowns; exported as ECUC enumeration values
+DROPDOWNS = {
+    "AdcPriorityImplementation": ["ADC_PRIORITY_HW", "ADC_PRIORITY_HW_SW", "ADC_PRIORITY_NONE"],
+    "AdcResultAlignment": ["ADC_ALIGN_LEFT", "ADC_ALIGN_RIGHT"],
+    "AdcChannelRangeSelect": [
+        "ADC_RANGE_ALWAYS", "ADC_RANGE_BETWEEN", "ADC_RANGE_NOT_BETWEEN", 
+        "ADC_RANGE_NOT_OVER_HIGH", "ADC_RANGE_NOT_UNDER_LOW", 
+        "ADC_RANGE_OVER_HIGH", "ADC_RANGE_UNDER_LOW"
+    ],
+    "AdcGroupAccessMode": ["ADC_ACCESS_MODE_SINGLE", "ADC_ACCESS_MODE_STREAMING"],
+    "AdcGroupConversionMode": ["ADC_CONV_MODE_CONTINUOUS", "ADC_CONV_MODE_ONESHOT"],
+    "AdcGroupReplacement": ["ADC_GROUP_REPL_ABORT_RESTART", "ADC_GROUP_REPL_SUSPEND_RESUME"],
+    "AdcGroupTriggSrc": ["ADC_TRIGG_SRC_HW", "ADC_TRIGG_SRC_SW"],
+    "AdcHwTrigSignal": [
+        "ADC_HW_TRIG_BOTH_EDGES", "ADC_HW_TRIG_FALLING_EDGE", "ADC_HW_TRIG_RISING_EDGE"
+    ],
+    "AdcStreamingBufferMode": ["ADC_STREAM_BUFFER_CIRCULAR", "ADC_STREAM_BUFFER_LINEAR"]
+}
+
+# Containers with multiplicity > 1, edited as a table of instances
+INSTANCE_MODELS = {
+    "AdcChannel": AdcChannelModel,
+    "AdcGroup": AdcGroupModel,
+    "AdcHwUnit": AdcHwUnitModel,
+}
+
+# Extra validation for CSV/TSV table imports (ID uniqueness and dropdowns are always checked)
+TABLE_CHECKS = {
+    "AdcChannel": [
+        in_range("AdcChannelId", 0, 0xFFFF),
+        in_range("AdcChannelResolution", 1, 32),
+        in_range("AdcChannelLowLimit", 0, 0xFFFFFFFF),
+        in_range("AdcChannelHighLimit", 0, 0xFFFFFFFF),
+        not_above("AdcChannelLowLimit", "AdcChannelHighLimit"),
+    ],
+    "AdcGroup": [
+        in_range("AdcGroupId", 0, 0xFFFF),
+        in_range("AdcGroupPriority", 0, 255),
+        in_range("AdcStreamingNumSamples", 1, 255),
+    ],
+    "AdcHwUnit": [in_range("AdcHwUnitId", 0, 0xFF)],
+}
+
 # -------------------- ARXML Exporter --------------------
 class AdcArxmlExporter:
     @staticmethod
     def export(model: AdcAppModel, filepath: str):
-        AUTOSAR = ET.Element("AUTOSAR")
-        ar_packages = ET.SubElement(AUTOSAR, "AR-PACKAGES")
-        ar_package = ET.SubElement(ar_packages, "AR-PACKAGE")
-        ET.SubElement(ar_package, "SHORT-NAME").text = "AdcPackage"
-        elements = ET.SubElement(ar_package, "ELEMENTS")
-
-        # Module configuration values
-        module_vals = ET.SubElement(elements, "ECUC-MODULE-CONFIGURATION-VALUES")
-        ET.SubElement(module_vals, "SHORT-NAME").text = "AdcConfig"
-        def_ref = ET.SubElement(module_vals, "DEFINITION-REF", {"DEST": "ECUC-MODULE-DEF"})
-        def_ref.text = "/AUTOSAR/EcucDefs/Adc"
-
-        containers = ET.SubElement(module_vals, "CONTAINERS")
-
-        def container_from_obj(short_name: str, obj):
-            cont = ET.SubElement(containers, "ECUC-CONTAINER-VALUE")
-            ET.SubElement(cont, "SHORT-NAME").text = short_name
-            ET.SubElement(cont, "DEFINITION-REF", {"DEST": "ECUC-PARAM-CONF-CONTAINER-DEF"}).text = f"/AUTOSAR/EcucDefs/Adc/{short_name}"
-            pvals = ET.SubElement(cont, "PARAMETER-VALUES")
-            
-            # Define which fields are enumerations
-            enum_fields = {
-                'AdcPriorityImplementation', 'AdcResultAlignment',
-                'AdcChannelRangeSelect', 'AdcGroupAccessMode', 
-                'AdcGroupConversionMode', 'AdcGroupReplacement',
-                'AdcGroupTriggSrc', 'AdcHwTrigSignal', 'AdcStreamingBufferMode'
-            }
-            
-            for key, val in obj.__dict__.items():
-                if isinstance(val, bool):
-                    p = ET.SubElement(pvals, "ECUC-BOOLEAN-PARAM-VALUE")
-                elif isinstance(val, int):
-                    p = ET.SubElement(pvals, "ECUC-NUMERICAL-PARAM-VALUE")
-                elif key in enum_fields:
-                    p = ET.SubElement(pvals, "ECUC-ENUMERATION-PARAM-VALUE")  # ✅ FIXED
-                else:
-                    p = ET.SubElement(pvals, "ECUC-TEXTUAL-PARAM-VALUE")
-                ET.SubElement(p, "SHORT-NAME").text = key
-                ET.SubElement(p, "VALUE").text = str(val)
-        # Add all containers
-        container_from_obj("AdcConfigSet", model.AdcConfigSet)
-        container_from_obj("AdcGeneral", model.AdcGeneral)
-        container_from_obj("AdcPowerStateConfig", model.AdcPowerStateConfig)
-        container_from_obj("AdcChannel", model.AdcChannel)
-        container_from_obj("AdcGroup", model.AdcGroup)
-        container_from_obj("AdcHwUnit", model.AdcHwUnit)
-        container_from_obj("AdcPublishedInformation", model.AdcPublishedInformation)
-
-        AdcArxmlExporter._indent(AUTOSAR)
-        tree = ET.ElementTree(AUTOSAR)
-        tree.write(filepath, encoding="utf-8", xml_declaration=True)
+        def containers():
+            for name in ("AdcConfigSet", "AdcGeneral", "AdcPowerStateConfig"):
+                yield name, name, model_params(getattr(model, name))
+            for name in INSTANCE_MODELS:
+                for index, obj in enumerate(getattr(model, name)):
+                    yield f"{name}_{index}", name, model_params(obj)
+            yield "AdcPublishedInformation", "AdcPublishedInformation", model_params(model.AdcPublishedInformation)
 
-    @staticmethod
-    def _indent(elem, level=0):
-        i = "\n" + level * "  "
-        if len(elem):
-            if not elem.text or not elem.text.strip():
-                elem.text = i + "  "
-            for e in elem:
-                AdcArxmlExporter._indent(e, level + 1)
-            if not e.tail or not e.tail.strip():
-                e.tail = i
-        elif level and (not elem.tail or not elem.tail.strip()):
-            elem.tail = i
+        export_module(filepath, "Adc", containers(), DROPDOWNS)
 
 # -------------------- GUI Widgets --------------------
 class CollapsibleFrame(ttk.Frame):
@@ -177,6 +169,7 @@ class AdcConfiguratorApp(tk.Frame):
         super().__init__(parent)
         self.model = AdcAppModel()
         self.var_output_filepath = tk.StringVar(value=self.model.output_filepath)
+        self.instance_tables = {}  # section name -> InstanceTable
         self._build_ui()
 
     def _build_ui(self):
@@ -194,6 +187,7 @@ class AdcConfiguratorApp(tk.Frame):
         main.pack(fill="both", expand=True, padx=8, pady=8)
 
         canvas = tk.Canvas(main)
+        self.scroll_canvas = canvas
         canvas.pack(side="left", fill="both", expand=True)
 
         vsb = ttk.Scrollbar(main, orient="vertical", command=canvas.yview)
@@ -222,29 +216,18 @@ class AdcConfiguratorApp(tk.Frame):
         btn_frm = ttk.Frame(self)
         btn_frm.pack(fill="x", pady=(0,10))
         ttk.Button(btn_frm, text="Generate ADC ARXML", command=self.on_generate).pack(side="left", padx=8, pady=6)
+        ttk.Button(btn_frm, text="Import ADC ARXML", command=self.on_import).pack(side="left", padx=8, pady=6)
 
     def _build_section(self, name, obj):
         sec = CollapsibleFrame(self.content, text=f"{name}")
         sec.pack(fill="x", pady=4)
 
-        # Fields that should be dropdowns and their options
-        dropdowns = {
-            "AdcPriorityImplementation": ["ADC_PRIORITY_HW", "ADC_PRIORITY_HW_SW", "ADC_PRIORITY_NONE"],
-            "AdcResultAlignment": ["ADC_ALIGN_LEFT", "ADC_ALIGN_RIGHT"],
-            "AdcChannelRangeSelect": [
-                "ADC_RANGE_ALWAYS", "ADC_RANGE_BETWEEN", "ADC_RANGE_NOT_BETWEEN", 
-                "ADC_RANGE_NOT_OVER_HIGH", "ADC_RANGE_NOT_UNDER_LOW", 
-                "ADC_RANGE_OVER_HIGH", "ADC_RANGE_UNDER_LOW"
-            ],
-            "AdcGroupAccessMode": ["ADC_ACCESS_MODE_SINGLE", "ADC_ACCESS_MODE_STREAMING"],
-            "AdcGroupConversionMode": ["ADC_CONV_MODE_CONTINUOUS", "ADC_CONV_MODE_ONESHOT"],
-            "AdcGroupReplacement": ["ADC_GROUP_REPL_ABORT_RESTART", "ADC_GROUP_REPL_SUSPEND_RESUME"],
-            "AdcGroupTriggSrc": ["ADC_TRIGG_SRC_HW", "ADC_TRIGG_SRC_SW"],
-            "AdcHwTrigSignal": [
-                "ADC_HW_TRIG_BOTH_EDGES", "ADC_HW_TRIG_FALLING_EDGE", "ADC_HW_TRIG_RISING_EDGE"
-            ],
-            "AdcStreamingBufferMode": ["ADC_STREAM_BUFFER_CIRCULAR", "ADC_STREAM_BUFFER_LINEAR"]
-        }
+        if isinstance(obj, list):
+            table = InstanceTable(sec.content, obj, INSTANCE_MODELS[name], choices=DROPDOWNS,
+                                  checks=TABLE_CHECKS.get(name, ()))
+            table.pack(fill="x", padx=4, pady=2)
+            self.instance_tables[name] = table
+            return
 
         for key, val in obj.__dict__.items():
             widget_row = ttk.Frame(sec.content)
@@ -252,9 +235,9 @@ class AdcConfiguratorApp(tk.Frame):
             ttk.Label(widget_row, text=key, width=36, anchor="w").pack(side="left")
 
             var_name = f"var_{name}_{key}"
-            if key in dropdowns:
+            if key in DROPDOWNS:
                 var = tk.StringVar(value=str(val))
-                cb = ttk.Combobox(widget_row, textvariable=var, values=dropdowns[key], state="readonly")
+                cb = ttk.Combobox(widget_row, textvariable=var, values=DROPDOWNS[key], state="readonly")
                 cb.pack(side="left", fill="x", expand=True)
             elif isinstance(val, bool):
                 var = tk.BooleanVar(value=val)
@@ -298,6 +281,8 @@ class AdcConfiguratorApp(tk.Frame):
         
         for sec in sections:
             obj = getattr(self.model, sec)
+            if isinstance(obj, list):
+                continue  # instance tables write straight into the model
             for key in obj.__dict__.keys():
                 var_name = f"var_{sec}_{key}"
                 if not hasattr(self, var_name):
@@ -331,6 +316,39 @@ class AdcConfiguratorApp(tk.Frame):
         except Exception as e:
             messagebox.showerror("Error", f"Failed to generate ADC ARXML:\n{e}")
 
+    def on_import(self):
+        filepath = filedialog.askopenfilename(
+            title="Import ARXML file",
+            filetypes=[("ARXML files", "*.arxml"), ("All files", "*.*")])
+        if not filepath:
+            return
+
+        try:
+            loaded = import_module(filepath, self.model, "Adc", INSTANCE_MODELS)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to import ADC ARXML:\n{e}")
+            return
+        if not loaded:
+            messagebox.showwarning("Import", f"No ADC configuration found in:\n{filepath}")
+            return
+
+        self._load_form()
+        messagebox.showinfo("Imported", f"Loaded {loaded} ADC containers from:\n{filepath}")
+
+    def _load_form(self):
+        """Push the whole model into the form widgets in one pass"""
+        for f in fields(self.model):
+            obj = getattr(self.model, f.name)
+            if f.name in self.instance_tables:
+                self.instance_tables[f.name].reload()
+            elif is_dataclass(obj):
+                for key, val in model_params(obj):
+                    var = getattr(self, f"var_{f.name}_{key}", None)
+                    if var is not None:
+                        var.set(val)
+            elif isinstance(obj, bool) and hasattr(self, f"var_{f.name}"):
+                getattr(self, f"var_{f.name}").set(obj)
+
 # -------------------- Standalone App Runner --------------------
 def create_standalone_app():
     """Create a standalone window for ADC configurator"""
@@ -0,0 +1,141 @@
+# arxml_reader.py
+
+import re
+import xml.etree.ElementTree as ET
+from dataclasses import fields, is_dataclass
+
+from ...profiling import profiler
+from .arxml_writer import ECUC_DEFS
+
+PARAM_TAGS = {
+    "ECUC-NUMERICAL-PARAM-VALUE",
+    "ECUC-BOOLEAN-PARAM-VALUE",
+    "ECUC-ENUMERATION-PARAM-VALUE",
+    "ECUC-TEXTUAL-PARAM-VALUE",
+}
+INSTANCE_SUFFIX = re.compile(r"(_\d+)+$")
+
+
+def _local(tag):
+    return tag.rsplit("}", 1)[-1]
+
+
+def _child(elem, name):
+    for child in elem:
+        if _local(child.tag) == name:
+            return child
+    return None
+
+
+def index_containers(source, module):
+    """Map container definition name -> [(short_name, {param: text}), ...].
+
+    Streams `source` (path or file object) with iterparse, keeping only the
+    containers of `module`, in document order. The definition name is the
+    last segment of the container's DEFINITION-REF, so nested layouts such
+    as .../DioConfig/DioPort/DioChannel index the same as flat ones.
+    Containers without a DEFINITION-REF fall back to their SHORT-NAME with
+    any _<n> instance suffix removed.
+    """
+    prefix = f"{ECUC_DEFS}/{module}/"
+    index = {}
+    with profiler.span(f"index.{module.lower()}_import"):
+        for _, elem in ET.iterparse(source, events=("end",)):
+            if _local(elem.tag) != "ECUC-CONTAINER-VALUE":
+                continue
+            entry = _read_container(elem, prefix, module)
+            if entry is not None:
+                index.setdefault(entry[0], []).append(entry[1:])
+            # Sub-containers were indexed on their own end event
+            elem.clear()
+    return index
+
+
+def _read_container(elem, prefix, module):
+    name_elem = _child(elem, "SHORT-NAME")
+    short_name = (name_elem.text or "") if name_elem is not None else ""
+    definition_ref = _child(elem, "DEFINITION-REF")
+    if definition_ref is not None and definition_ref.text:
+        ref = definition_ref.text.strip()
+        if not ref.startswith(prefix):
+            return None
+        definition = ref.rsplit("/", 1)[-1]
+    else:
+        definition = INSTANCE_SUFFIX.sub("", short_name)
+        if not definition.startswith(module):
+            return None
+
+    params = {}
+    values = _child(elem, "PARAMETER-VALUES")
+    if values is not None:
+        for param in values:
+            if _local(param.tag) in PARAM_TAGS:
+                name, value = _child(param, "SHORT-NAME"), _child(param, "VALUE")
+                if name is not None and value is not None:
+                    params[name.text] = value.text or ""
+    return definition, short_name, params
+
+
+def parse_value(current, text):
+    """Convert ARXML text to the type of the model's current value"""
+    text = text.strip()
+    if isinstance(current, bool):
+        return text.lower() in ("true", "1")
+    if isinstance(current, int):
+        try:
+            return int(text, 0)
+        except ValueError:
+            return int(float(text))
+    if isinstance(current, float):
+        return float(text)
+    return text
+
+
+def apply_params(obj, params):
+    """Set the model fields named in `params`; unknown or malformed values are skipped"""
+    for f in fields(obj):
+        text = params.get(f.name)
+        if text is None:
+            continue
+        try:
+            setattr(obj, f.name, parse_value(getattr(obj, f.name), text))
+        except ValueError:
+            continue
+
+
+def import_module(source, model, module, instance_models):
+    """Fill `model` from the `module` containers of an ARXML file.
+
+    Single containers update the existing sub-model, multi-instance ones
+    (`instance_models`: field name -> model class) are rebuilt in place so
+    widgets holding the list keep seeing it, and boolean config-set flags
+    read the <Name>Included parameter. Returns the number of containers
+    loaded; the model is left untouched if the file has none of `module`.
+    """
+    index = index_containers(source, module)
+    if not index:
+        return 0
+    loaded = 0
+    for f in fields(model):
+        entries = index.get(f.name, [])
+        value = getattr(model, f.name)
+        if f.name in instance_models:
+            # The file holds the whole module: no instances means an empty list
+            rows = []
+            for _, params in entries:
+                row = instance_models[f.name]()
+                apply_params(row, params)
+                rows.append(row)
+            value[:] = rows
+            loaded += len(rows)
+        elif not entries:
+            continue
+        elif is_dataclass(value):
+            apply_params(value, entries[0][1])
+            loaded += 1
+        elif isinstance(value, bool):
+            text = entries[0][1].get(f"{f.name}Included")
+            if text is not None:
+                setattr(model, f.name, parse_value(value, text))
+                loaded += 1
+    return loaded
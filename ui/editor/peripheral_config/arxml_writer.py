@@ -0,0 +1,131 @@
+# arxml_writer.py
+
+import os
+from dataclasses import fields
+from xml.sax.saxutils import escape, quoteattr
+
+from ...atomic_file import commit_replacement, open_replacement
+from ...profiling import profiler
+
+AUTOSAR_NS = "http://autosar.org/schema/r4.0"
+ECUC_DEFS = "/AUTOSAR/EcucDefs"
+BUFFER_SIZE = 1 << 16
+
+
+def param_tag(key, value, enum_fields=()):
+    """ECUC parameter value element matching a model field's type"""
+    if isinstance(value, bool):
+        return "ECUC-BOOLEAN-PARAM-VALUE"
+    if isinstance(value, (int, float)):
+        return "ECUC-NUMERICAL-PARAM-VALUE"
+    if key in enum_fields:
+        return "ECUC-ENUMERATION-PARAM-VALUE"
+    return "ECUC-TEXTUAL-PARAM-VALUE"
+
+
+def model_params(obj):
+    """(name, value) pairs of a dataclass model, in field order.
+
+    Goes through the fields rather than obj.__dict__, which would build
+    and keep a dict on every instance it touches.
+    """
+    return ((f.name, getattr(obj, f.name)) for f in fields(obj))
+
+
+def format_value(value):
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+class ArxmlStreamWriter:
+    """Write indented ARXML element by element through a buffered file.
+
+    Only the stack of open tags is kept, so memory stays flat however many
+    containers and parameters are written. Output goes to a temporary file
+    next to `filepath` that replaces it on a clean exit; on error the
+    previous file is left untouched.
+    """
+
+    def __init__(self, filepath, namespace=AUTOSAR_NS, indent="  "):
+        self.filepath = filepath
+        self.namespace = namespace
+        self.indent = indent
+        self._file = None
+        self._tmp_path = None
+        self._stack = []
+
+    def __enter__(self):
+        self._file, self._tmp_path = open_replacement(self.filepath, "w", encoding="utf-8", newline="\n",
+                                                      buffering=BUFFER_SIZE)
+        self._file.write('<?xml version="1.0" encoding="utf-8"?>\n')
+        self.start("AUTOSAR", {"xmlns": self.namespace} if self.namespace else None)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                while self._stack:
+                    self.end()
+            self._file.close()
+            if exc_type is None:
+                commit_replacement(self._tmp_path, self.filepath)
+        finally:
+            if os.path.exists(self._tmp_path):
+                os.remove(self._tmp_path)
+        return False
+
+    def _attrs(self, attrs):
+        if not attrs:
+            return ""
+        return "".join(f" {name}={quoteattr(str(value))}" for name, value in attrs.items())
+
+    def start(self, tag, attrs=None):
+        self._file.write(f"{self.indent * len(self._stack)}<{tag}{self._attrs(attrs)}>\n")
+        self._stack.append(tag)
+
+    def end(self):
+        tag = self._stack.pop()
+        self._file.write(f"{self.indent * len(self._stack)}</{tag}>\n")
+
+    def leaf(self, tag, text, attrs=None):
+        self._file.write(f"{self.indent * len(self._stack)}<{tag}{self._attrs(attrs)}>{escape(str(text))}</{tag}>\n")
+
+    def parameter(self, key, value, enum_fields=()):
+        self.start(param_tag(key, value, enum_fields))
+        self.leaf("SHORT-NAME", key)
+        self.leaf("VALUE", format_value(value))
+        self.end()
+
+    def container(self, short_name, definition_ref, params, enum_fields=()):
+        """One ECUC-CONTAINER-VALUE; `params` is an iterable of (name, value)"""
+        self.start("ECUC-CONTAINER-VALUE")
+        self.leaf("SHORT-NAME", short_name)
+        self.leaf("DEFINITION-REF", definition_ref, {"DEST": "ECUC-PARAM-CONF-CONTAINER-DEF"})
+        self.start("PARAMETER-VALUES")
+        for key, value in params:
+            self.parameter(key, value, enum_fields)
+        self.end()
+        self.end()
+
+
+def export_module(filepath, module, containers, enum_fields=()):
+    """Stream one ECUC module configuration to `filepath`.
+
+    `containers` yields (short_name, definition, params) with `definition`
+    the container definition name under /AUTOSAR/EcucDefs/<module>/ and
+    `params` an iterable of (parameter name, value). It may be a generator,
+    so nothing has to be materialized up front.
+    """
+    with profiler.span(f"write.{module.lower()}_arxml", file=os.path.basename(filepath)), \
+            ArxmlStreamWriter(filepath) as writer:
+        writer.start("AR-PACKAGES")
+        writer.start("AR-PACKAGE")
+        writer.leaf("SHORT-NAME", f"{module}Package")
+        writer.start("ELEMENTS")
+        writer.start("ECUC-MODULE-CONFIGURATION-VALUES")
+        writer.leaf("SHORT-NAME", f"{module}Config")
+        writer.leaf("DEFINITION-REF", f"{ECUC_DEFS}/{module}", {"DEST": "ECUC-MODULE-DEF"})
+        writer.start("CONTAINERS")
+        for short_name, definition, params in containers:
+            writer.container(short_name, f"{ECUC_DEFS}/{module}/{definition}", params, enum_fields)
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+CAN bit-timing solver for CanControllerBaudrateConfig / CanControllerFdBaudrateConfig.
+
+Sweeps every prescaler / time-segment combination allowed by the controller and
+ranks the valid ones by baud rate error and distance from the sample point target.
+"""
+from dataclasses import dataclass
+
+
+# -------------------- Controller Limits --------------------
+@dataclass(frozen=True)
+class BitTimingLimits:
+    prescaler_max: int
+    tseg1_min: int
+    tseg1_max: int
+    tseg2_min: int
+    tseg2_max: int
+    sjw_max: int
+
+
+# bxCAN (STM32F4): BRP 10 bits, TS1 4 bits, TS2 3 bits, SJW 2 bits
+NOMINAL_LIMITS = BitTimingLimits(prescaler_max=1024, tseg1_min=1, tseg1_max=16, tseg2_min=1, tseg2_max=8, sjw_max=4)
+# Typical CAN FD data phase (M_CAN DBTP register ranges)
+FD_DATA_LIMITS = BitTimingLimits(prescaler_max=32, tseg1_min=1, tseg1_max=32, tseg2_min=1, tseg2_max=16, sjw_max=16)
+
+
+@dataclass
+class BitTiming:
+    prescaler: int
+    prop_seg: int
+    seg1: int
+    seg2: int
+    sjw: int
+    baud_rate: float
+    baud_error: float  # relative, e.g. 0.001 = 0.1 %
+    sample_point: float  # fraction of the bit time
+
+    @property
+    def time_quanta(self):
+        return 1 + self.prop_seg + self.seg1 + self.seg2
+
+
+# -------------------- Solver --------------------
+def solve_bit_timing(clock_hz, baud_rate, sample_point=0.875, limits=NOMINAL_LIMITS,
+                     max_baud_error=0.005, max_results=20):
+    """Return valid timings ranked by baud error, sample point error, then more time quanta"""
+    if clock_hz <= 0 or baud_rate <= 0:
+        raise ValueError("Clock frequency and baud rate must be positive")
+    if not 0.5 <= sample_point < 1.0:
+        raise ValueError("Sample point must be between 50 % and 100 %")
+
+    min_tq = 1 + limits.tseg1_min + limits.tseg2_min
+    max_tq = 1 + limits.tseg1_max + limits.tseg2_max
+
+    candidates = []
+    for prescaler in range(1, limits.prescaler_max + 1):
+        tq_rate = clock_hz / prescaler
+        # The bit-time sweep is a single pass over the quanta that can reach the target rate
+        for tq in range(min_tq, max_tq + 1):
+            actual = tq_rate / tq
+            error = (actual - baud_rate) / baud_rate
+            if abs(error) > max_baud_error:
+                continue
+            for tseg2 in range(limits.tseg2_min, limits.tseg2_max + 1):
+                tseg1 = tq - 1 - tseg2
+                if not limits.tseg1_min <= tseg1 <= limits.tseg1_max:
+                    continue
+                point = (1 + tseg1) / tq
+                candidates.append((abs(error), abs(point - sample_point), -tq, prescaler,
+                                   tseg1, tseg2, actual, error, point))
+
+    candidates.sort()
+    return [_to_bit_timing(c, limits) for c in candidates[:max_results]]
+
+
+def _to_bit_timing(candidate, limits):
+    _, _, _, prescaler, tseg1, tseg2, actual, error, point = candidate
+    # AUTOSAR splits TSEG1 into PropSeg + Seg1; keep Seg1 close to Seg2 for a symmetric resync window
+    seg1 = max(1, min(tseg2, tseg1 - 1))
+    prop_seg = tseg1 - seg1
+    return BitTiming(
+        prescaler=prescaler,
+        prop_seg=prop_seg,
+        seg1=seg1,
+        seg2=tseg2,
+        sjw=min(limits.sjw_max, tseg2),
+        baud_rate=actual,
+        baud_error=error,
+        sample_point=point,
+    )
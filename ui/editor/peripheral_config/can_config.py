@@ -7,8 +7,13 @@ Run: python3 can_configurator.py
 import os
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import xml.etree.ElementTree as ET
-from dataclasses import dataclass, field, fields
+from dataclasses import dataclass, field, fields, is_dataclass
+
+from .can_bit_timing import solve_bit_timing, NOMINAL_LIMITS, FD_DATA_LIMITS
+from .arxml_reader import import_module
+from .arxml_writer import export_module, model_params
+from .instance_table import InstanceTable
+from .table_csv import disjoint_filters, in_range, warning
 
 # -------------------- Data Models --------------------
 @dataclass
@@ -203,13 +208,13 @@ class AppModel:
     CanConfigSet: bool = True
     # 18 CAN Sections
     CanGeneral: CanGeneralModel = field(default_factory=CanGeneralModel)
-    CanController: CanControllerModel = field(default_factory=CanControllerModel)
+    CanController: list = field(default_factory=lambda: [CanControllerModel()])
     CanControllerBaudrateConfig: CanControllerBaudrateConfigModel = field(default_factory=CanControllerBaudrateConfigModel)
     CanControllerFdBaudrateConfig: CanControllerFdBaudrateConfigModel = field(default_factory=CanControllerFdBaudrateConfigModel)
     CanPartialNetwork: CanPartialNetworkModel = field(default_factory=CanPartialNetworkModel)
     CanPnFrameDataMaskSpec: CanPnFrameDataMaskSpecModel = field(default_factory=CanPnFrameDataMaskSpecModel)
-    CanHardwareObject: CanHardwareObjectModel = field(default_factory=CanHardwareObjectModel)
-    CanHwFilter: CanHwFilterModel = field(default_factory=CanHwFilterModel)
+    CanHardwareObject: list = field(default_factory=lambda: [CanHardwareObjectModel()])
+    CanHwFilter: list = field(default_factory=lambda: [CanHwFilterModel()])
     CanMainFunctionRWPeriods: CanMainFunctionRWPeriodsModel = field(default_factory=CanMainFunctionRWPeriodsModel)
     CanTTController: CanTTControllerModel = field(default_factory=CanTTControllerModel)
     CanTTHardwareObjectTrigger: CanTTHardwareObjectTriggerModel = field(default_factory=CanTTHardwareObjectTriggerModel)
@@ -219,71 +224,80 @@ class AppModel:
     CanXLBaudrateConfig: CanXLBaudrateConfigModel = field(default_factory=CanXLBaudrateConfigModel)
     CanXLEthEgressFifo: CanXLEthEgressFifoModel = field(default_factory=CanXLEthEgressFifoModel)
     CanIcomGeneral: CanIcomGeneralModel = field(default_factory=CanIcomGeneralModel)
-    CanIcomRxMessage: CanIcomRxMessageModel = field(default_factory=CanIcomRxMessageModel)
+    CanIcomRxMessage: list = field(default_factory=lambda: [CanIcomRxMessageModel()])
     CanIcomRxMessageSignalConfig: CanIcomRxMessageSignalConfigModel = field(default_factory=CanIcomRxMessageSignalConfigModel)
 
 
+# Fields edited through dropdowns; exported as ECUC enumeration values
+DROPDOWNS = {
+    "CanBusoffProcessing": ["INTERRUPT", "POLLING"],
+    "CanRxProcessing": ["INTERRUPT", "MIXED", "POLLING"],
+    "CanTxProcessing": ["INTERRUPT", "MIXED", "POLLING"],
+    "CanWakeupProcessing": ["INTERRUPT", "POLLING"],
+    "CanHandleType": ["BASIC", "FULL"],
+    "CanIdType": ["EXTENDED", "MIXED", "STANDARD"],
+    "CanObjectType": ["RECEIVE", "TRANSMIT"],
+    "CanObjectPayloadLength": [
+        "CAN_OBJECT_PL_8", "CAN_OBJECT_PL_12", "CAN_OBJECT_PL_16",
+        "CAN_OBJECT_PL_20", "CAN_OBJECT_PL_24", "CAN_OBJECT_PL_32",
+        "CAN_OBJECT_PL_48", "CAN_OBJECT_PL_64"
+    ],
+    "CanIcomLevel": ["CAN_ICOM_LEVEL_ONE", "CAN_ICOM_LEVEL_TWO", "CAN_ICOM_LEVEL_THREE"],
+    "CanIcomVariant": ["CAN_ICOM_VARIANT_HW", "CAN_ICOM_VARIANT_NONE", "CAN_ICOM_VARIANT_SW"],
+    "CanIcomSignalOperation": ["AND", "XOR", "EQUAL", "GREATER", "SMALLER"],
+    "CanTTControllerOperationMode": ["CAN_TT_EVENT_SYNC_TIME_TRIGGERED", "CAN_TT_EVENT_TRIGGERED", "CAN_TT_TIME_TRIGGERED"],
+    "CanTTIRQProcessing": ["INTERRUPT", "POLLING"],
+    "CanTTHardwareObjectTriggerType": [
+        "CAN_TT_RX_TRIGGER", "CAN_TT_TX_REF_TRIGGER", "CAN_TT_TX_REF_TRIGGER_GAP",
+        "CAN_TT_TX_TRIGGER_EXCLUSIVE", "CAN_TT_TX_TRIGGER_MERGED", "CAN_TT_TX_TRIGGER_SINGLE"
+    ],
+}
+
+# Containers with multiplicity > 1, edited as a table of instances.
+# The baudrate configs stay single: the bit timing solver reads their widgets.
+INSTANCE_MODELS = {
+    "CanController": CanControllerModel,
+    "CanHardwareObject": CanHardwareObjectModel,
+    "CanHwFilter": CanHwFilterModel,
+    "CanIcomRxMessage": CanIcomRxMessageModel,
+}
+
+# Extra validation for CSV/TSV table imports (ID uniqueness and dropdowns are always checked)
+TABLE_CHECKS = {
+    "CanController": [in_range("CanControllerId", 0, 0xFF)],
+    "CanHardwareObject": [
+        in_range("CanObjectId", 0, 0xFFFF),
+        in_range("CanHwObjectCount", 1, 0xFFFF),
+    ],
+    "CanHwFilter": [
+        in_range("CanHwFilterCode", 0, 0x1FFFFFFF),
+        in_range("CanHwFilterMask", 0, 0x1FFFFFFF),
+        # Filters of different hardware objects may well overlap; the table has no HOH column to tell
+        warning(disjoint_filters("CanHwFilterCode", "CanHwFilterMask")),
+    ],
+}
+
+
 # -------------------- ARXML Exporter (simple) --------------------
 class ArxmlExporter:
     @staticmethod
     def export(model: AppModel, filepath: str):
-        AUTOSAR = ET.Element("AUTOSAR")
-        ar_packages = ET.SubElement(AUTOSAR, "AR-PACKAGES")
-        ar_package = ET.SubElement(ar_packages, "AR-PACKAGE")
-        ET.SubElement(ar_package, "SHORT-NAME").text = "CanPackage"
-        elements = ET.SubElement(ar_package, "ELEMENTS")
-
-        def container_from_obj(short_name: str, obj):
-            cont = ET.SubElement(elements, "ECUC-CONTAINER-VALUE")
-            ET.SubElement(cont, "SHORT-NAME").text = short_name
-            ET.SubElement(cont, "DEFINITION-REF", {"DEST": "ECUC-PARAM-CONF-CONTAINER-DEF"}).text = f"/AUTOSAR/EcucDefs/Can/{short_name}"
-            pvals = ET.SubElement(cont, "PARAMETER-VALUES")
-            for key, val in obj.__dict__.items():
-                if isinstance(val, bool):
-                    tag = "ECUC-BOOLEAN-PARAM-VALUE"
-                elif isinstance(val, int):
-                    tag = "ECUC-NUMERICAL-PARAM-VALUE"
-                else:
-                    tag = "ECUC-TEXTUAL-PARAM-VALUE"
-                p = ET.SubElement(pvals, tag)
-                ET.SubElement(p, "SHORT-NAME").text = key
-                ET.SubElement(p, "VALUE").text = str(val)
-
-        # Config set container
-        cs = ET.SubElement(elements, "ECUC-CONTAINER-VALUE")
-        ET.SubElement(cs, "SHORT-NAME").text = "CanConfigSet"
-        ET.SubElement(cs, "DEFINITION-REF", {"DEST": "ECUC-PARAM-CONF-CONTAINER-DEF"}).text = "/AUTOSAR/EcucDefs/Can/CanConfigSet"
-        p = ET.SubElement(cs, "PARAMETER-VALUES")
-        pv = ET.SubElement(p, "ECUC-BOOLEAN-PARAM-VALUE")
-        ET.SubElement(pv, "SHORT-NAME").text = "CanConfigSetIncluded"
-        ET.SubElement(pv, "VALUE").text = "true" if model.CanConfigSet else "false"
-
-        # Export every dataclass field in AppModel except output_filepath and CanConfigSet
-        for f in fields(model):
-            name = f.name
-            if name in ("output_filepath", "CanConfigSet"):
-                continue
-            obj = getattr(model, name)
-            # Only export dataclass-like containers (safety)
-            if hasattr(obj, "__dict__"):
-                container_from_obj(name, obj)
-
-        ArxmlExporter._indent(AUTOSAR)
-        tree = ET.ElementTree(AUTOSAR)
-        tree.write(filepath, encoding="utf-8", xml_declaration=True)
+        def containers():
+            yield "CanConfigSet", "CanConfigSet", [("CanConfigSetIncluded", model.CanConfigSet)]
+            # Every dataclass field in AppModel except output_filepath and CanConfigSet
+            for f in fields(model):
+                name = f.name
+                if name in ("output_filepath", "CanConfigSet"):
+                    continue
+                obj = getattr(model, name)
+                if isinstance(obj, list):
+                    for index, item in enumerate(obj):
+                        yield f"{name}_{index}", name, model_params(item)
+                # Only export dataclass containers (safety)
+                elif is_dataclass(obj):
+                    yield name, name, model_params(obj)
 
-    @staticmethod
-    def _indent(elem, level=0):
-        i = "\n" + level * "  "
-        if len(elem):
-            if not elem.text or not elem.text.strip():
-                elem.text = i + "  "
-            for e in elem:
-                ArxmlExporter._indent(e, level + 1)
-            if not e.tail or not e.tail.strip():
-                e.tail = i
-        elif level and (not elem.tail or not elem.tail.strip()):
-            elem.tail = i
+        export_module(filepath, "Can", containers(), DROPDOWNS)
 
 
 # -------------------- GUI Widgets --------------------
@@ -311,6 +325,7 @@ class CanConfiguratorApp(tk.Frame):
         super().__init__(parent)
         self.model = AppModel()
         self.var_output_filepath = tk.StringVar(value=self.model.output_filepath)
+        self.instance_tables = {}  # section name -> InstanceTable
         self.all_sections = {}  # name->obj
         self._build_ui()
 
@@ -327,6 +342,7 @@ class CanConfiguratorApp(tk.Frame):
         main.pack(fill="both", expand=True, padx=8, pady=8)
 
         canvas = tk.Canvas(main)
+        self.scroll_canvas = canvas
         canvas.pack(side="left", fill="both", expand=True)
 
         vsb = ttk.Scrollbar(main, orient="vertical", command=canvas.yview)
@@ -347,6 +363,8 @@ class CanConfiguratorApp(tk.Frame):
         btn_frm = ttk.Frame(self)
         btn_frm.pack(fill="x", pady=(0, 10))
         ttk.Button(btn_frm, text="🚀 Generate ARXML", command=self.on_generate).pack(side="left", padx=8, pady=6)
+        ttk.Button(btn_frm, text="📂 Import ARXML", command=self.on_import).pack(side="left", padx=8, pady=6)
+        ttk.Button(btn_frm, text="⏱ Bit Timing Solver", command=self._open_bit_timing_solver).pack(side="left", padx=8, pady=6)
 
     def _build_all_sections(self):
         # Build CanConfigSet checkbox
@@ -391,30 +409,12 @@ class CanConfiguratorApp(tk.Frame):
         sec = CollapsibleFrame(self.content, text=f"📦 {name}")
         sec.pack(fill="x", pady=4)
 
-        # dropdown options for known keys
-        dropdowns = {
-            "CanBusoffProcessing": ["INTERRUPT", "POLLING"],
-            "CanRxProcessing": ["INTERRUPT", "MIXED", "POLLING"],
-            "CanTxProcessing": ["INTERRUPT", "MIXED", "POLLING"],
-            "CanWakeupProcessing": ["INTERRUPT", "POLLING"],
-            "CanHandleType": ["BASIC", "FULL"],
-            "CanIdType": ["EXTENDED", "MIXED", "STANDARD"],
-            "CanObjectType": ["RECEIVE", "TRANSMIT"],
-            "CanObjectPayloadLength": [
-                "CAN_OBJECT_PL_8", "CAN_OBJECT_PL_12", "CAN_OBJECT_PL_16",
-                "CAN_OBJECT_PL_20", "CAN_OBJECT_PL_24", "CAN_OBJECT_PL_32",
-                "CAN_OBJECT_PL_48", "CAN_OBJECT_PL_64"
-            ],
-            "CanIcomLevel": ["CAN_ICOM_LEVEL_ONE", "CAN_ICOM_LEVEL_TWO", "CAN_ICOM_LEVEL_THREE"],
-            "CanIcomVariant": ["CAN_ICOM_VARIANT_HW", "CAN_ICOM_VARIANT_NONE", "CAN_ICOM_VARIANT_SW"],
-            "CanIcomSignalOperation": ["AND", "XOR", "EQUAL", "GREATER", "SMALLER"],
-            "CanTTControllerOperationMode": ["CAN_TT_EVENT_SYNC_TIME_TRIGGERED", "CAN_TT_EVENT_TRIGGERED", "CAN_TT_TIME_TRIGGERED"],
-            "CanTTIRQProcessing": ["INTERRUPT", "POLLING"],
-            "CanTTHardwareObjectTriggerType": [
-                "CAN_TT_RX_TRIGGER", "CAN_TT_TX_REF_TRIGGER", "CAN_TT_TX_REF_TRIGGER_GAP",
-                "CAN_TT_TX_TRIGGER_EXCLUSIVE", "CAN_TT_TX_TRIGGER_MERGED", "CAN_TT_TX_TRIGGER_SINGLE"
-            ],
-        }
+        if isinstance(obj, list):
+            table = InstanceTable(sec.content, obj, INSTANCE_MODELS[name], choices=DROPDOWNS,
+                                  checks=TABLE_CHECKS.get(name, ()))
+            table.pack(fill="x", padx=4, pady=2)
+            self.instance_tables[name] = table
+            return
 
         for key, val in obj.__dict__.items():
             widget_row = ttk.Frame(sec.content)
@@ -422,9 +422,9 @@ class CanConfiguratorApp(tk.Frame):
             ttk.Label(widget_row, text=key, width=36, anchor="w").pack(side="left")
 
             var_name = f"var_{name}_{key}"
-            if key in dropdowns:
+            if key in DROPDOWNS:
                 var = tk.StringVar(value=str(val))
-                cb = ttk.Combobox(widget_row, textvariable=var, values=dropdowns[key], state="readonly")
+                cb = ttk.Combobox(widget_row, textvariable=var, values=DROPDOWNS[key], state="readonly")
                 cb.pack(side="left", fill="x", expand=True)
             elif isinstance(val, bool):
                 var = tk.BooleanVar(value=val)
@@ -441,6 +441,94 @@ class CanConfiguratorApp(tk.Frame):
 
             setattr(self, var_name, var)
 
+    def _open_bit_timing_solver(self):
+        dialog = tk.Toplevel(self)
+        dialog.title("CAN Bit Timing Solver")
+        dialog.geometry("760x560")
+        dialog.transient(self)
+
+        params = ttk.Frame(dialog, padding=8)
+        params.pack(fill="x")
+        inputs = {
+            "clock": ("CAN clock (Hz)", "42000000"),
+            "baud": ("Nominal baud rate", self.var_CanControllerBaudrateConfig_CanControllerBaudRate.get()),
+            "sample": ("Nominal sample point (%)", "87.5"),
+            "fd_baud": ("FD data baud rate", self.var_CanControllerFdBaudrateConfig_CanControllerFdBaudRate.get()),
+            "fd_sample": ("FD sample point (%)", "75"),
+            "tolerance": ("Max baud error (%)", "0.5"),
+        }
+        input_vars = {}
+        for row, (key, (label, default)) in enumerate(inputs.items()):
+            ttk.Label(params, text=label, width=26, anchor="w").grid(row=row // 2, column=(row % 2) * 2, sticky="w", pady=2)
+            input_vars[key] = tk.StringVar(value=default)
+            ttk.Entry(params, textvariable=input_vars[key], width=14).grid(row=row // 2, column=(row % 2) * 2 + 1, sticky="w", padx=(0, 16))
+
+        columns = ("prescaler", "tq", "prop", "seg1", "seg2", "sjw", "baud", "error", "sample")
+        trees = {}
+        for key, title in (("nominal", "Nominal timing"), ("fd", "FD data-phase timing")):
+            frame = ttk.LabelFrame(dialog, text=title, padding=4)
+            frame.pack(fill="both", expand=True, padx=8, pady=4)
+            tree = ttk.Treeview(frame, columns=columns, show="headings", height=6, selectmode="browse")
+            for col in columns:
+                tree.heading(col, text=col.capitalize())
+                tree.column(col, width=75, anchor="center")
+            tree.pack(fill="both", expand=True)
+            trees[key] = tree
+
+        results = {"nominal": [], "fd": []}
+
+        def solve():
+            try:
+                clock = int(float(input_vars["clock"].get()))
+                tolerance = float(input_vars["tolerance"].get()) / 100.0
+                results["nominal"] = solve_bit_timing(clock, int(input_vars["baud"].get()),
+                                                      float(input_vars["sample"].get()) / 100.0,
+                                                      NOMINAL_LIMITS, tolerance)
+                results["fd"] = solve_bit_timing(clock, int(input_vars["fd_baud"].get()),
+                                                 float(input_vars["fd_sample"].get()) / 100.0,
+                                                 FD_DATA_LIMITS, tolerance)
+            except ValueError as e:
+                messagebox.showerror("Error", f"Invalid solver input:\n{e}", parent=dialog)
+                return
+
+            for key, tree in trees.items():
+                tree.delete(*tree.get_children())
+                for index, t in enumerate(results[key]):
+                    tree.insert("", "end", iid=str(index), values=(
+                        t.prescaler, t.time_quanta, t.prop_seg, t.seg1, t.seg2, t.sjw,
+                        f"{t.baud_rate:.0f}", f"{t.baud_error * 100:+.3f}%", f"{t.sample_point * 100:.1f}%"))
+                if results[key]:
+                    tree.selection_set("0")
+            if not results["nominal"]:
+                messagebox.showwarning("No Solution", "No valid nominal timing within the baud error limit.", parent=dialog)
+
+        def apply_and_export():
+            applied = False
+            for key, section in (("nominal", "CanControllerBaudrateConfig"), ("fd", "CanControllerFdBaudrateConfig")):
+                selection = trees[key].selection()
+                if not selection:
+                    continue
+                t = results[key][int(selection[0])]
+                getattr(self, f"var_{section}_CanControllerPropSeg").set(str(t.prop_seg))
+                getattr(self, f"var_{section}_CanControllerSeg1").set(str(t.seg1))
+                getattr(self, f"var_{section}_CanControllerSeg2").set(str(t.seg2))
+                getattr(self, f"var_{section}_CanControllerSyncJumpWidth").set(str(t.sjw))
+                applied = True
+            if not applied:
+                messagebox.showwarning("Warning", "Solve and select a timing first.", parent=dialog)
+                return
+            self.var_CanControllerBaudrateConfig_CanControllerBaudRate.set(input_vars["baud"].get())
+            self.var_CanControllerFdBaudrateConfig_CanControllerFdBaudRate.set(input_vars["fd_baud"].get())
+            dialog.destroy()
+            self.on_generate()
+
+        btns = ttk.Frame(dialog, padding=8)
+        btns.pack(fill="x")
+        ttk.Button(btns, text="Solve", command=solve).pack(side="left", padx=4)
+        ttk.Button(btns, text="Apply & Generate ARXML", command=apply_and_export).pack(side="left", padx=4)
+        ttk.Button(btns, text="Cancel", command=dialog.destroy).pack(side="left", padx=4)
+        solve()
+
     def _browse_output_file(self):
         filepath = filedialog.asksaveasfilename(
             title="Save ARXML file",
@@ -461,6 +549,8 @@ class CanConfiguratorApp(tk.Frame):
 
         # update every section from UI
         for sec_name, obj in self.all_sections.items():
+            if isinstance(obj, list):
+                continue  # instance tables write straight into the model
             for key in obj.__dict__.keys():
                 var_name = f"var_{sec_name}_{key}"
                 if not hasattr(self, var_name):
@@ -500,6 +590,39 @@ class CanConfiguratorApp(tk.Frame):
         except Exception as e:
             messagebox.showerror("Error", f"Failed to generate ARXML:\n{e}")
 
+    def on_import(self):
+        filepath = filedialog.askopenfilename(
+            title="Import ARXML file",
+            filetypes=[("ARXML files", "*.arxml"), ("All files", "*.*")])
+        if not filepath:
+            return
+
+        try:
+            loaded = import_module(filepath, self.model, "Can", INSTANCE_MODELS)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to import CAN ARXML:\n{e}")
+            return
+        if not loaded:
+            messagebox.showwarning("Import", f"No CAN configuration found in:\n{filepath}")
+            return
+
+        self._load_form()
+        messagebox.showinfo("Imported", f"Loaded {loaded} CAN containers from:\n{filepath}")
+
+    def _load_form(self):
+        """Push the whole model into the form widgets in one pass"""
+        for f in fields(self.model):
+            obj = getattr(self.model, f.name)
+            if f.name in self.instance_tables:
+                self.instance_tables[f.name].reload()
+            elif is_dataclass(obj):
+                for key, val in model_params(obj):
+                    var = getattr(self, f"var_{f.name}_{key}", None)
+                    if var is not None:
+                        var.set(val)
+            elif isinstance(obj, bool) and hasattr(self, f"var_{f.name}"):
+                getattr(self, f"var_{f.name}").set(obj)
+
 
 # -------------------- Run App --------------------
 def main():
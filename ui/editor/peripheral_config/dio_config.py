@@ -6,8 +6,12 @@ Converted from original DIO script to match CAN configurator pattern.
 import os
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import xml.etree.ElementTree as ET
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, is_dataclass
+
+from .arxml_reader import import_module
+from .arxml_writer import export_module, model_params
+from .instance_table import InstanceTable
+from .table_csv import disjoint_bits, in_range, warning
 
 # -------------------- Data Models --------------------
 @dataclass
@@ -41,76 +45,48 @@ class DioAppModel:
     output_filepath: str = os.path.abspath(os.path.join("output/DIO", "dio_config.arxml"))
     DioConfigSet: bool = True
     DioGeneral: DioGeneralModel = field(default_factory=DioGeneralModel)
-    DioPort: DioPortModel = field(default_factory=DioPortModel)
-    DioChannel: DioChannelModel = field(default_factory=DioChannelModel)
-    DioChannelGroup: DioChannelGroupModel = field(default_factory=DioChannelGroupModel)
+    DioPort: list = field(default_factory=lambda: [DioPortModel()])
+    DioChannel: list = field(default_factory=lambda: [DioChannelModel()])
+    DioChannelGroup: list = field(default_factory=lambda: [DioChannelGroupModel()])
     DioConfig: DioConfigModel = field(default_factory=DioConfigModel)
 
+# Fields edited through dropdowns; exported as ECUC enumeration values
+DROPDOWNS = {
+    # Add any DIO-specific dropdown fields here if needed
+}
+
+# Containers with multiplicity > 1, edited as a table of instances
+INSTANCE_MODELS = {
+    "DioPort": DioPortModel,
+    "DioChannel": DioChannelModel,
+    "DioChannelGroup": DioChannelGroupModel,
+}
+
+# Extra validation for CSV/TSV table imports (ID uniqueness and dropdowns are always checked)
+TABLE_CHECKS = {
+    "DioPort": [in_range("DioPortId", 0, 0xFFFF)],
+    "DioChannel": [in_range("DioChannelId", 0, 0xFFFF)],
+    "DioChannelGroup": [
+        in_range("DioPortMask", 0, 0xFFFFFFFF),
+        in_range("DioPortOffset", 0, 31),
+        # Groups on different ports, or overlapping ones, legitimately share mask bits
+        warning(disjoint_bits("DioPortMask")),
+    ],
+}
+
 # -------------------- ARXML Exporter --------------------
 class DioArxmlExporter:
     @staticmethod
     def export(model: DioAppModel, filepath: str):
-        AUTOSAR = ET.Element("AUTOSAR")
-        ar_packages = ET.SubElement(AUTOSAR, "AR-PACKAGES")
-        ar_package = ET.SubElement(ar_packages, "AR-PACKAGE")
-        ET.SubElement(ar_package, "SHORT-NAME").text = "DioPackage"
-        elements = ET.SubElement(ar_package, "ELEMENTS")
-
-        # Module configuration values
-        module_vals = ET.SubElement(elements, "ECUC-MODULE-CONFIGURATION-VALUES")
-        ET.SubElement(module_vals, "SHORT-NAME").text = "DioConfig"
-        def_ref = ET.SubElement(module_vals, "DEFINITION-REF", {"DEST": "ECUC-MODULE-DEF"})
-        def_ref.text = "/AUTOSAR/EcucDefs/Dio"
-
-        containers = ET.SubElement(module_vals, "CONTAINERS")
-
-        def container_from_obj(short_name: str, obj):
-            cont = ET.SubElement(containers, "ECUC-CONTAINER-VALUE")
-            ET.SubElement(cont, "SHORT-NAME").text = short_name
-            ET.SubElement(cont, "DEFINITION-REF", {"DEST": "ECUC-PARAM-CONF-CONTAINER-DEF"}).text = f"/AUTOSAR/EcucDefs/Dio/{short_name}"
-            pvals = ET.SubElement(cont, "PARAMETER-VALUES")
-            for key, val in obj.__dict__.items():
-                if isinstance(val, bool):
-                    p = ET.SubElement(pvals, "ECUC-BOOLEAN-PARAM-VALUE")
-                elif isinstance(val, int):
-                    p = ET.SubElement(pvals, "ECUC-NUMERICAL-PARAM-VALUE")
-                else:
-                    p = ET.SubElement(pvals, "ECUC-TEXTUAL-PARAM-VALUE")
-                ET.SubElement(p, "SHORT-NAME").text = key
-                ET.SubElement(p, "VALUE").text = str(val)
-
-        # Config set (boolean container)
-        cs = ET.SubElement(containers, "ECUC-CONTAINER-VALUE")
-        ET.SubElement(cs, "SHORT-NAME").text = "DioConfigSet"
-        ET.SubElement(cs, "DEFINITION-REF", {"DEST":"ECUC-PARAM-CONF-CONTAINER-DEF"}).text = "/AUTOSAR/EcucDefs/Dio/DioConfigSet"
-        p = ET.SubElement(cs, "PARAMETER-VALUES")
-        pv = ET.SubElement(p, "ECUC-BOOLEAN-PARAM-VALUE")
-        ET.SubElement(pv, "SHORT-NAME").text = "DioConfigSetIncluded"
-        ET.SubElement(pv, "VALUE").text = "true" if model.DioConfigSet else "false"
-
-        # Add other containers
-        container_from_obj("DioGeneral", model.DioGeneral)
-        container_from_obj("DioPort", model.DioPort)
-        container_from_obj("DioChannel", model.DioChannel)
-        container_from_obj("DioChannelGroup", model.DioChannelGroup)
-        container_from_obj("DioConfig", model.DioConfig)
-
-        DioArxmlExporter._indent(AUTOSAR)
-        tree = ET.ElementTree(AUTOSAR)
-        tree.write(filepath, encoding="utf-8", xml_declaration=True)
+        def containers():
+            yield "DioConfigSet", "DioConfigSet", [("DioConfigSetIncluded", model.DioConfigSet)]
+            yield "DioGeneral", "DioGeneral", model_params(model.DioGeneral)
+            for name in INSTANCE_MODELS:
+                for index, obj in enumerate(getattr(model, name)):
+                    yield f"{name}_{index}", name, model_params(obj)
+            yield "DioConfig", "DioConfig", model_params(model.DioConfig)
 
-    @staticmethod
-    def _indent(elem, level=0):
-        i = "\n" + level * "  "
-        if len(elem):
-            if not elem.text or not elem.text.strip():
-                elem.text = i + "  "
-            for e in elem:
-                DioArxmlExporter._indent(e, level + 1)
-            if not e.tail or not e.tail.strip():
-                e.tail = i
-        elif level and (not elem.tail or not elem.tail.strip()):
-            elem.tail = i
+        export_module(filepath, "Dio", containers(), DROPDOWNS)
 
 # -------------------- GUI Widgets --------------------
 class CollapsibleFrame(ttk.Frame):
@@ -137,6 +113,7 @@ class DioConfiguratorApp(tk.Frame):
         super().__init__(parent)
         self.model = DioAppModel()
         self.var_output_filepath = tk.StringVar(value=self.model.output_filepath)
+        self.instance_tables = {}  # section name -> InstanceTable
         self._build_ui()
 
     def _build_ui(self):
@@ -154,6 +131,7 @@ class DioConfiguratorApp(tk.Frame):
         main.pack(fill="both", expand=True, padx=8, pady=8)
 
         canvas = tk.Canvas(main)
+        self.scroll_canvas = canvas
         canvas.pack(side="left", fill="both", expand=True)
 
         vsb = ttk.Scrollbar(main, orient="vertical", command=canvas.yview)
@@ -181,6 +159,7 @@ class DioConfiguratorApp(tk.Frame):
         btn_frm = ttk.Frame(self)
         btn_frm.pack(fill="x", pady=(0,10))
         ttk.Button(btn_frm, text="🚀 Generate DIO ARXML", command=self.on_generate).pack(side="left", padx=8, pady=6)
+        ttk.Button(btn_frm, text="📂 Import DIO ARXML", command=self.on_import).pack(side="left", padx=8, pady=6)
 
     def _browse_output_file(self):
         filepath = filedialog.asksaveasfilename(
@@ -201,10 +180,12 @@ class DioConfiguratorApp(tk.Frame):
         sec = CollapsibleFrame(self.content, text=f"📦 {name}")
         sec.pack(fill="x", pady=4)
 
-        # Fields that should be dropdowns and their options (none for DIO)
-        dropdowns = {
-            # Add any DIO-specific dropdown fields here if needed
-        }
+        if isinstance(obj, list):
+            table = InstanceTable(sec.content, obj, INSTANCE_MODELS[name], choices=DROPDOWNS,
+                                  checks=TABLE_CHECKS.get(name, ()))
+            table.pack(fill="x", padx=4, pady=2)
+            self.instance_tables[name] = table
+            return
 
         for key, val in obj.__dict__.items():
             widget_row = ttk.Frame(sec.content)
@@ -212,9 +193,9 @@ class DioConfiguratorApp(tk.Frame):
             ttk.Label(widget_row, text=key, width=36, anchor="w").pack(side="left")
 
             var_name = f"var_{name}_{key}"
-            if key in dropdowns:
+            if key in DROPDOWNS:
                 var = tk.StringVar(value=str(val))
-                cb = ttk.Combobox(widget_row, textvariable=var, values=dropdowns[key], state="readonly")
+                cb = ttk.Combobox(widget_row, textvariable=var, values=DROPDOWNS[key], state="readonly")
                 cb.pack(side="left", fill="x", expand=True)
             elif isinstance(val, bool):
                 var = tk.BooleanVar(value=val)
@@ -250,6 +231,8 @@ class DioConfiguratorApp(tk.Frame):
         
         for sec in sections:
             obj = getattr(self.model, sec)
+            if isinstance(obj, list):
+                continue  # instance tables write straight into the model
             for key in obj.__dict__.keys():
                 var_name = f"var_{sec}_{key}"
                 if not hasattr(self, var_name):
@@ -283,6 +266,39 @@ class DioConfiguratorApp(tk.Frame):
         except Exception as e:
             messagebox.showerror("Error", f"Failed to generate DIO ARXML:\n{e}")
 
+    def on_import(self):
+        filepath = filedialog.askopenfilename(
+            title="Import ARXML file",
+            filetypes=[("ARXML files", "*.arxml"), ("All files", "*.*")])
+        if not filepath:
+            return
+
+        try:
+            loaded = import_module(filepath, self.model, "Dio", INSTANCE_MODELS)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to import DIO ARXML:\n{e}")
+            return
+        if not loaded:
+            messagebox.showwarning("Import", f"No DIO configuration found in:\n{filepath}")
+            return
+
+        self._load_form()
+        messagebox.showinfo("Imported", f"Loaded {loaded} DIO containers from:\n{filepath}")
+
+    def _load_form(self):
+        """Push the whole model into the form widgets in one pass"""
+        for f in fields(self.model):
+            obj = getattr(self.model, f.name)
+            if f.name in self.instance_tables:
+                self.instance_tables[f.name].reload()
+            elif is_dataclass(obj):
+                for key, val in model_params(obj):
+                    var = getattr(self, f"var_{f.name}_{key}", None)
+                    if var is not None:
+                        var.set(val)
+            elif isinstance(obj, bool) and hasattr(self, f"var_{f.name}"):
+                getattr(self, f"var_{f.name}").set(obj)
+
 # -------------------- Standalone App Runner --------------------
 def create_standalone_app():
     """Create a standalone window for DIO configurator"""
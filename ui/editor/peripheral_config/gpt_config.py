@@ -6,8 +6,11 @@ Converted from original GPT script to match CAN configurator pattern.
 import os
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import xml.etree.ElementTree as ET
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, is_dataclass
+
+from .arxml_reader import import_module
+from .arxml_writer import export_module, model_params
+from .instance_table import InstanceTable
 
 # -------------------- Data Models --------------------
 @dataclass
@@ -54,77 +57,41 @@ class GptAppModel:
     GptConfigSet: bool = True
     GptDriverConfiguration: GptDriverConfigurationModel = field(default_factory=GptDriverConfigurationModel)
     GptClockReferencePoint: GptClockReferencePointModel = field(default_factory=GptClockReferencePointModel)
-    GptChannelConfiguration: GptChannelConfigurationModel = field(default_factory=GptChannelConfigurationModel)
+    GptChannelConfiguration: list = field(default_factory=lambda: [GptChannelConfigurationModel()])
     GptChannelConfigSetValue: GptChannelConfigSetValueModel = field(default_factory=GptChannelConfigSetValueModel)
     GptWakeupConfiguration: GptWakeupConfigurationModel = field(default_factory=GptWakeupConfigurationModel)
     GptConfigurationOfOptApiServices: GptConfigurationOfOptApiServicesModel = field(default_factory=GptConfigurationOfOptApiServicesModel)
 
+# Fields edited through dropdowns; exported as ECUC enumeration values
+DROPDOWNS = {
+    "GptPredefTimer1usEnablingGrade": [
+        "GPT_PREDEF_TIMER_1US_16BIT_ENABLED",
+        "GPT_PREDEF_TIMER_1US_16_24BIT_ENABLED", 
+        "GPT_PREDEF_TIMER_1US_16_24_32BIT_ENABLED",
+        "GPT_PREDEF_TIMER_1US_DISABLED"
+    ],
+    "GptChannelMode": ["GPT_CH_MODE_CONTINUOUS", "GPT_CH_MODE_ONESHOT"]
+}
+
+# Containers with multiplicity > 1, edited as a table of instances
+INSTANCE_MODELS = {
+    "GptChannelConfiguration": GptChannelConfigurationModel,
+}
+
 # -------------------- ARXML Exporter --------------------
 class GptArxmlExporter:
     @staticmethod
     def export(model: GptAppModel, filepath: str):
-        AUTOSAR = ET.Element("AUTOSAR")
-        ar_packages = ET.SubElement(AUTOSAR, "AR-PACKAGES")
-        ar_package = ET.SubElement(ar_packages, "AR-PACKAGE")
-        ET.SubElement(ar_package, "SHORT-NAME").text = "GptPackage"
-        elements = ET.SubElement(ar_package, "ELEMENTS")
-
-        # Module configuration values
-        module_vals = ET.SubElement(elements, "ECUC-MODULE-CONFIGURATION-VALUES")
-        ET.SubElement(module_vals, "SHORT-NAME").text = "GptConfig"
-        def_ref = ET.SubElement(module_vals, "DEFINITION-REF", {"DEST": "ECUC-MODULE-DEF"})
-        def_ref.text = "/AUTOSAR/EcucDefs/Gpt"
-
-        containers = ET.SubElement(module_vals, "CONTAINERS")
-
-        def container_from_obj(short_name: str, obj):
-            cont = ET.SubElement(containers, "ECUC-CONTAINER-VALUE")
-            ET.SubElement(cont, "SHORT-NAME").text = short_name
-            ET.SubElement(cont, "DEFINITION-REF", {"DEST": "ECUC-PARAM-CONF-CONTAINER-DEF"}).text = f"/AUTOSAR/EcucDefs/Gpt/{short_name}"
-            pvals = ET.SubElement(cont, "PARAMETER-VALUES")
-            for key, val in obj.__dict__.items():
-                if isinstance(val, bool):
-                    p = ET.SubElement(pvals, "ECUC-BOOLEAN-PARAM-VALUE")
-                elif isinstance(val, int):
-                    p = ET.SubElement(pvals, "ECUC-NUMERICAL-PARAM-VALUE")
-                else:
-                    p = ET.SubElement(pvals, "ECUC-TEXTUAL-PARAM-VALUE")
-                ET.SubElement(p, "SHORT-NAME").text = key
-                ET.SubElement(p, "VALUE").text = str(val)
-
-        # Config set (boolean container)
-        cs = ET.SubElement(containers, "ECUC-CONTAINER-VALUE")
-        ET.SubElement(cs, "SHORT-NAME").text = "GptConfigSet"
-        ET.SubElement(cs, "DEFINITION-REF", {"DEST":"ECUC-PARAM-CONF-CONTAINER-DEF"}).text = "/AUTOSAR/EcucDefs/Gpt/GptConfigSet"
-        p = ET.SubElement(cs, "PARAMETER-VALUES")
-        pv = ET.SubElement(p, "ECUC-BOOLEAN-PARAM-VALUE")
-        ET.SubElement(pv, "SHORT-NAME").text = "GptConfigSetIncluded"
-        ET.SubElement(pv, "VALUE").text = "true" if model.GptConfigSet else "false"
-
-        # Add other containers
-        container_from_obj("GptDriverConfiguration", model.GptDriverConfiguration)
-        container_from_obj("GptClockReferencePoint", model.GptClockReferencePoint)
-        container_from_obj("GptChannelConfiguration", model.GptChannelConfiguration)
-        container_from_obj("GptChannelConfigSetValue", model.GptChannelConfigSetValue)
-        container_from_obj("GptWakeupConfiguration", model.GptWakeupConfiguration)
-        container_from_obj("GptConfigurationOfOptApiServices", model.GptConfigurationOfOptApiServices)
-
-        GptArxmlExporter._indent(AUTOSAR)
-        tree = ET.ElementTree(AUTOSAR)
-        tree.write(filepath, encoding="utf-8", xml_declaration=True)
+        def containers():
+            yield "GptConfigSet", "GptConfigSet", [("GptConfigSetIncluded", model.GptConfigSet)]
+            for name in ("GptDriverConfiguration", "GptClockReferencePoint"):
+                yield name, name, model_params(getattr(model, name))
+            for index, channel in enumerate(model.GptChannelConfiguration):
+                yield f"GptChannelConfiguration_{index}", "GptChannelConfiguration", model_params(channel)
+            for name in ("GptChannelConfigSetValue", "GptWakeupConfiguration", "GptConfigurationOfOptApiServices"):
+                yield name, name, model_params(getattr(model, name))
 
-    @staticmethod
-    def _indent(elem, level=0):
-        i = "\n" + level * "  "
-        if len(elem):
-            if not elem.text or not elem.text.strip():
-                elem.text = i + "  "
-            for e in elem:
-                GptArxmlExporter._indent(e, level + 1)
-            if not e.tail or not e.tail.strip():
-                e.tail = i
-        elif level and (not elem.tail or not elem.tail.strip()):
-            elem.tail = i
+        export_module(filepath, "Gpt", containers(), DROPDOWNS)
 
 # -------------------- GUI Widgets --------------------
 class CollapsibleFrame(ttk.Frame):
@@ -151,6 +118,7 @@ class GptConfiguratorApp(tk.Frame):
         super().__init__(parent)
         self.model = GptAppModel()
         self.var_output_filepath = tk.StringVar(value=self.model.output_filepath)
+        self.instance_tables = {}  # section name -> InstanceTable
         self._build_ui()
 
     def _build_ui(self):
@@ -168,6 +136,7 @@ class GptConfiguratorApp(tk.Frame):
         main.pack(fill="both", expand=True, padx=8, pady=8)
 
         canvas = tk.Canvas(main)
+        self.scroll_canvas = canvas
         canvas.pack(side="left", fill="both", expand=True)
 
         vsb = ttk.Scrollbar(main, orient="vertical", command=canvas.yview)
@@ -196,6 +165,7 @@ class GptConfiguratorApp(tk.Frame):
         btn_frm = ttk.Frame(self)
         btn_frm.pack(fill="x", pady=(0,10))
         ttk.Button(btn_frm, text="🚀 Generate GPT ARXML", command=self.on_generate).pack(side="left", padx=8, pady=6)
+        ttk.Button(btn_frm, text="📂 Import GPT ARXML", command=self.on_import).pack(side="left", padx=8, pady=6)
 
     def _build_section_GptConfigSet(self, parent):
         sec = CollapsibleFrame(parent, text="📦 GptConfigSet")
@@ -207,16 +177,11 @@ class GptConfiguratorApp(tk.Frame):
         sec = CollapsibleFrame(self.content, text=f"📦 {name}")
         sec.pack(fill="x", pady=4)
 
-        # Fields that should be dropdowns and their options
-        dropdowns = {
-            "GptPredefTimer1usEnablingGrade": [
-                "GPT_PREDEF_TIMER_1US_16BIT_ENABLED",
-                "GPT_PREDEF_TIMER_1US_16_24BIT_ENABLED", 
-                "GPT_PREDEF_TIMER_1US_16_24_32BIT_ENABLED",
-                "GPT_PREDEF_TIMER_1US_DISABLED"
-            ],
-            "GptChannelMode": ["GPT_CH_MODE_CONTINUOUS", "GPT_CH_MODE_ONESHOT"]
-        }
+        if isinstance(obj, list):
+            table = InstanceTable(sec.content, obj, INSTANCE_MODELS[name], choices=DROPDOWNS)
+            table.pack(fill="x", padx=4, pady=2)
+            self.instance_tables[name] = table
+            return
 
         for key, val in obj.__dict__.items():
             widget_row = ttk.Frame(sec.content)
@@ -224,9 +189,9 @@ class GptConfiguratorApp(tk.Frame):
             ttk.Label(widget_row, text=key, width=36, anchor="w").pack(side="left")
 
             var_name = f"var_{name}_{key}"
-            if key in dropdowns:
+            if key in DROPDOWNS:
                 var = tk.StringVar(value=str(val))
-                cb = ttk.Combobox(widget_row, textvariable=var, values=dropdowns[key], state="readonly")
+                cb = ttk.Combobox(widget_row, textvariable=var, values=DROPDOWNS[key], state="readonly")
                 cb.pack(side="left", fill="x", expand=True)
             elif isinstance(val, bool):
                 var = tk.BooleanVar(value=val)
@@ -271,6 +236,8 @@ class GptConfiguratorApp(tk.Frame):
         
         for sec in sections:
             obj = getattr(self.model, sec)
+            if isinstance(obj, list):
+                continue  # instance tables write straight into the model
             for key in obj.__dict__.keys():
                 var_name = f"var_{sec}_{key}"
                 if not hasattr(self, var_name):
@@ -304,6 +271,39 @@ class GptConfiguratorApp(tk.Frame):
         except Exception as e:
             messagebox.showerror("Error", f"Failed to generate GPT ARXML:\n{e}")
 
+    def on_import(self):
+        filepath = filedialog.askopenfilename(
+            title="Import ARXML file",
+            filetypes=[("ARXML files", "*.arxml"), ("All files", "*.*")])
+        if not filepath:
+            return
+
+        try:
+            loaded = import_module(filepath, self.model, "Gpt", INSTANCE_MODELS)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to import GPT ARXML:\n{e}")
+            return
+        if not loaded:
+            messagebox.showwarning("Import", f"No GPT configuration found in:\n{filepath}")
+            return
+
+        self._load_form()
+        messagebox.showinfo("Imported", f"Loaded {loaded} GPT containers from:\n{filepath}")
+
+    def _load_form(self):
+        """Push the whole model into the form widgets in one pass"""
+        for f in fields(self.model):
+            obj = getattr(self.model, f.name)
+            if f.name in self.instance_tables:
+                self.instance_tables[f.name].reload()
+            elif is_dataclass(obj):
+                for key, val in model_params(obj):
+                    var = getattr(self, f"var_{f.name}_{key}", None)
+                    if var is not None:
+                        var.set(val)
+            elif isinstance(obj, bool) and hasattr(self, f"var_{f.name}"):
+                getattr(self, f"var_{f.name}").set(obj)
+
 # -------------------- Standalone App Runner --------------------
 def create_standalone_app():
     """Create a standalone window for GPT configurator"""
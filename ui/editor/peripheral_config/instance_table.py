@@ -0,0 +1,294 @@
+# instance_table.py
+
+import tkinter as tk
+from dataclasses import fields, replace
+from tkinter import ttk, messagebox, filedialog
+
+from .table_csv import TableCsvError, default_checks, read_rows, summarize, write_rows
+
+
+class InstanceTable(ttk.Frame):
+    """Editable table over a list of container instances, one dataclass per row.
+
+    Only `visible_rows` Treeview items are ever created; scrolling re-fills
+    them from the list, so a container with thousands of instances costs
+    the same widgets as one with ten. Double-click a cell to edit it in
+    place (booleans toggle). Edits are written straight into `rows`.
+    The whole list can be replaced from, or saved to, a CSV/TSV file;
+    imports are validated by `checks` (see table_csv) on top of the
+    default ID uniqueness and dropdown checks.
+    """
+
+    def __init__(self, master, rows, factory, choices=None, checks=(), visible_rows=8):
+        super().__init__(master)
+        self.rows = rows
+        self.factory = factory
+        self.choices = choices or {}
+        self.checks = default_checks(factory, self.choices) + list(checks)
+        self.visible_rows = visible_rows
+        self.columns = [f.name for f in fields(factory)]
+        defaults = factory()
+        self.types = {name: type(getattr(defaults, name)) for name in self.columns}
+        self.top = 0
+        self.selected = None
+        self.editor = None
+        self._build_ui()
+        self.refresh()
+
+    def _build_ui(self):
+        toolbar = ttk.Frame(self)
+        toolbar.pack(fill="x", pady=(0, 2))
+        ttk.Button(toolbar, text="Add", command=self.add_rows).pack(side="left")
+        self.add_count_var = tk.StringVar(value="1")
+        ttk.Spinbox(toolbar, from_=1, to=4096, textvariable=self.add_count_var, width=6).pack(side="left", padx=(2, 8))
+        ttk.Button(toolbar, text="Duplicate", command=self.duplicate_row).pack(side="left")
+        ttk.Button(toolbar, text="Delete", command=self.delete_row).pack(side="left", padx=4)
+        ttk.Button(toolbar, text="Import CSV...", command=self.import_csv).pack(side="left", padx=(8, 0))
+        ttk.Button(toolbar, text="Export CSV...", command=self.export_csv).pack(side="left", padx=4)
+        self.count_var = tk.StringVar()
+        ttk.Label(toolbar, textvariable=self.count_var).pack(side="right")
+
+        grid = ttk.Frame(self)
+        grid.pack(fill="x")
+        self.tree = ttk.Treeview(grid, columns=self.columns, height=self.visible_rows, selectmode="browse")
+        self.tree.heading("#0", text="#")
+        self.tree.column("#0", width=50, stretch=False, anchor="e")
+        for name in self.columns:
+            self.tree.heading(name, text=name)
+            self.tree.column(name, width=max(80, min(220, len(name) * 8)), stretch=False)
+
+        self.vsb = ttk.Scrollbar(grid, orient="vertical", command=self.on_scroll)
+        hsb = ttk.Scrollbar(grid, orient="horizontal", command=self.tree.xview)
+        self.tree.configure(xscrollcommand=hsb.set)
+        self.tree.grid(row=0, column=0, sticky="ew")
+        self.vsb.grid(row=0, column=1, sticky="ns")
+        hsb.grid(row=1, column=0, sticky="ew")
+        grid.columnconfigure(0, weight=1)
+
+        # Fixed pool of row items, re-filled from the data window on scroll
+        self.slots = [self.tree.insert("", "end", iid=f"slot{i}") for i in range(self.visible_rows)]
+
+        self.tree.bind("<<TreeviewSelect>>", self.on_select)
+        self.tree.bind("<Double-1>", self.on_double_click)
+        self.tree.bind("<MouseWheel>", self.on_mousewheel)
+        self.tree.bind("<Button-4>", lambda e: self.scroll_by(-3))
+        self.tree.bind("<Button-5>", lambda e: self.scroll_by(3))
+        self.tree.bind("<Up>", lambda e: self.move_selection(-1))
+        self.tree.bind("<Down>", lambda e: self.move_selection(1))
+        self.tree.bind("<Prior>", lambda e: self.move_selection(-self.visible_rows))
+        self.tree.bind("<Next>", lambda e: self.move_selection(self.visible_rows))
+        self.tree.bind("<Delete>", lambda e: self.delete_row())
+
+    # ---------- rendering ----------
+    def refresh(self):
+        """Redraw the visible window of rows"""
+        total = len(self.rows)
+        self.top = max(0, min(self.top, total - self.visible_rows))
+        selected_slot = None
+        for slot, iid in enumerate(self.slots):
+            index = self.top + slot
+            if index < total:
+                row = self.rows[index]
+                self.tree.item(iid, text=str(index), values=[self._format(getattr(row, name)) for name in self.columns])
+                self.tree.move(iid, "", slot)
+                if index == self.selected:
+                    selected_slot = iid
+            else:
+                self.tree.detach(iid)
+        self.tree.selection_set((selected_slot,) if selected_slot else ())
+
+        if total > self.visible_rows:
+            self.vsb.set(self.top / total, (self.top + self.visible_rows) / total)
+        else:
+            self.vsb.set(0.0, 1.0)
+        self.count_var.set(f"{total} instance{'s' if total != 1 else ''}")
+
+    def reload(self):
+        """Show `rows` from the top again after the list was replaced in place"""
+        self.cancel_edit()
+        self.top = 0
+        self.selected = None
+        self.refresh()
+
+    @staticmethod
+    def _format(value):
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        return str(value)
+
+    # ---------- scrolling / selection ----------
+    def on_scroll(self, *args):
+        self.commit_edit()
+        if args[0] == "moveto":
+            self.top = int(float(args[1]) * len(self.rows))
+        elif args[0] == "scroll":
+            step = self.visible_rows if args[2] == "pages" else 1
+            self.top += int(args[1]) * step
+        self.refresh()
+
+    def scroll_by(self, rows):
+        self.commit_edit()
+        self.top += rows
+        self.refresh()
+        return "break"
+
+    def on_mousewheel(self, event):
+        # Keep the wheel from also scrolling the configurator canvas (bind_all)
+        return self.scroll_by(-3 if event.delta > 0 else 3)
+
+    def on_select(self, event=None):
+        selection = self.tree.selection()
+        if selection:
+            self.selected = self.top + self.slots.index(selection[0])
+
+    def move_selection(self, delta):
+        if not self.rows:
+            return "break"
+        current = self.selected if self.selected is not None else self.top
+        self.selected = max(0, min(len(self.rows) - 1, current + delta))
+        if self.selected < self.top:
+            self.top = self.selected
+        elif self.selected >= self.top + self.visible_rows:
+            self.top = self.selected - self.visible_rows + 1
+        self.refresh()
+        return "break"
+
+    # ---------- row operations ----------
+    def add_rows(self):
+        try:
+            count = max(1, int(self.add_count_var.get()))
+        except ValueError:
+            count = 1
+        next_ids = self._next_ids()
+        for offset in range(count):
+            row = self.factory()
+            for name, value in next_ids.items():
+                setattr(row, name, value + offset)
+            self.rows.append(row)
+        self.selected = len(self.rows) - 1
+        self.top = len(self.rows)
+        self.refresh()
+
+    def duplicate_row(self):
+        if self.selected is None or self.selected >= len(self.rows):
+            return
+        row = replace(self.rows[self.selected], **self._next_ids())
+        self.rows.insert(self.selected + 1, row)
+        self.selected += 1
+        self.move_selection(0)
+
+    def delete_row(self):
+        if self.selected is None or self.selected >= len(self.rows):
+            return
+        del self.rows[self.selected]
+        self.selected = min(self.selected, len(self.rows) - 1) if self.rows else None
+        self.refresh()
+
+    def _next_ids(self):
+        # Numeric *Id fields get the next free value so new instances stay unique
+        return {name: max((getattr(row, name) for row in self.rows), default=-1) + 1
+                for name in self.columns
+                if self.types[name] is int and name.lower().endswith("id")}
+
+    # ---------- bulk CSV/TSV ----------
+    def import_csv(self):
+        filepath = filedialog.askopenfilename(
+            title="Import table",
+            filetypes=[("CSV/TSV files", "*.csv *.tsv *.tab"), ("All files", "*.*")])
+        if not filepath:
+            return
+        warnings = []
+        try:
+            rows = read_rows(filepath, self.factory, self.checks, warnings)
+        except TableCsvError as e:
+            messagebox.showerror("Import", f"{e}, nothing imported:\n\n{e.summary()}")
+            return
+        except Exception as e:
+            messagebox.showerror("Import", f"Failed to read table:\n{e}")
+            return
+        self.rows[:] = rows
+        self.reload()
+        if warnings:
+            messagebox.showwarning("Import", f"Imported {len(rows)} rows with {len(warnings)} "
+                                             f"warning{'s' if len(warnings) != 1 else ''}:\n\n{summarize(warnings)}")
+
+    def export_csv(self):
+        self.commit_edit()
+        filepath = filedialog.asksaveasfilename(
+            title="Export table",
+            defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv"), ("TSV files", "*.tsv"), ("All files", "*.*")])
+        if not filepath:
+            return
+        try:
+            write_rows(filepath, self.rows, self.factory)
+        except Exception as e:
+            messagebox.showerror("Export", f"Failed to write table:\n{e}")
+
+    # ---------- in-place editing ----------
+    def on_double_click(self, event):
+        if self.tree.identify_region(event.x, event.y) != "cell":
+            return
+        iid = self.tree.identify_row(event.y)
+        column = self.tree.identify_column(event.x)
+        if not iid or column == "#0":
+            return
+        index = self.top + self.slots.index(iid)
+        name = self.columns[int(column[1:]) - 1]
+        row = self.rows[index]
+
+        if self.types[name] is bool:
+            setattr(row, name, not getattr(row, name))
+            self.refresh()
+            return "break"
+
+        x, y, width, height = self.tree.bbox(iid, column)
+        if name in self.choices:
+            editor = ttk.Combobox(self.tree, values=self.choices[name], state="readonly")
+            editor.set(getattr(row, name))
+            editor.bind("<<ComboboxSelected>>", lambda e: self.commit_edit())
+        else:
+            editor = ttk.Entry(self.tree)
+            editor.insert(0, str(getattr(row, name)))
+            editor.select_range(0, "end")
+        editor.place(x=x, y=y, width=width, height=height)
+        editor.focus_set()
+        editor.bind("<Return>", lambda e: self.commit_edit())
+        editor.bind("<Escape>", lambda e: self.cancel_edit())
+        editor.bind("<FocusOut>", lambda e: self.commit_edit())
+        self.editor = (editor, index, name)
+        return "break"
+
+    def commit_edit(self):
+        if self.editor is None:
+            return
+        editor, index, name = self.editor
+        self.editor = None
+        text = editor.get().strip()
+        editor.destroy()
+        try:
+            value = self.parse_value(name, text)
+        except ValueError:
+            self.bell()
+            return
+        if index < len(self.rows):
+            setattr(self.rows[index], name, value)
+        self.refresh()
+
+    def cancel_edit(self):
+        if self.editor is not None:
+            self.editor[0].destroy()
+            self.editor = None
+
+    def parse_value(self, name, text):
+        kind = self.types[name]
+        if kind is int:
+            if not text:
+                return 0
+            try:
+                return int(text, 0)  # accepts 0x7FF style hex
+            except ValueError:
+                return int(text)
+        if kind is float:
+            return float(text) if text else 0.0
+        return text
@@ -6,8 +6,11 @@ Converted from original SPI script to match CAN configurator pattern.
 import os
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import xml.etree.ElementTree as ET
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, is_dataclass
+
+from .arxml_reader import import_module
+from .arxml_writer import export_module, model_params
+from .instance_table import InstanceTable
 
 # -------------------- Data Models --------------------
 @dataclass
@@ -88,75 +91,49 @@ class SpiAppModel:
     SpiConfigSet: bool = True
     SpiDemEventParameterRefs: SpiDemEventParameterRefsModel = field(default_factory=SpiDemEventParameterRefsModel)
     SpiGeneral: SpiGeneralModel = field(default_factory=SpiGeneralModel)
-    SpiSequence: SpiSequenceModel = field(default_factory=SpiSequenceModel)
-    SpiChannel: SpiChannelModel = field(default_factory=SpiChannelModel)
-    SpiChannelList: SpiChannelListModel = field(default_factory=SpiChannelListModel)
-    SpiJob: SpiJobModel = field(default_factory=SpiJobModel)
-    SpiExternalDevice: SpiExternalDeviceModel = field(default_factory=SpiExternalDeviceModel)
+    SpiSequence: list = field(default_factory=lambda: [SpiSequenceModel()])
+    SpiChannel: list = field(default_factory=lambda: [SpiChannelModel()])
+    SpiChannelList: list = field(default_factory=lambda: [SpiChannelListModel()])
+    SpiJob: list = field(default_factory=lambda: [SpiJobModel()])
+    SpiExternalDevice: list = field(default_factory=lambda: [SpiExternalDeviceModel()])
     SpiDriver: SpiDriverModel = field(default_factory=SpiDriverModel)
     SpiPublishedInformation: SpiPublishedInformationModel = field(default_factory=SpiPublishedInformationModel)
 
+# Fields edited through dropdowns; exported as ECUC enumeration values
+DROPDOWNS = {
+    "SpiHwUnitSynchronous": ["SYNCHRONOUS", "ASYNCHRONOUS"],
+    "SpiCsPolarity": ["HIGH", "LOW"],
+    "SpiCsSelection": ["CS_VIA_GPIO", "CS_VIA_PERIPHERAL_ENGINE"],
+    "SpiDataShiftEdge": ["LEADING", "TRAILING"],
+    "SpiHwUnit": ["CSIB0", "CSIB1", "CSIB2", "CSIB3"],
+    "SpiShiftClockIdleLevel": ["HIGH", "LOW"],
+    "SpiCsBehavior": ["CS_KEEP_ASSERTED", "CS_TOGGLE"]
+}
+
+# Containers with multiplicity > 1, edited as a table of instances
+INSTANCE_MODELS = {
+    "SpiSequence": SpiSequenceModel,
+    "SpiChannel": SpiChannelModel,
+    "SpiChannelList": SpiChannelListModel,
+    "SpiJob": SpiJobModel,
+    "SpiExternalDevice": SpiExternalDeviceModel,
+}
+
 # -------------------- ARXML Exporter --------------------
 class SpiArxmlExporter:
     @staticmethod
     def export(model: SpiAppModel, filepath: str):
-        AUTOSAR = ET.Element("AUTOSAR")
-        ar_packages = ET.SubElement(AUTOSAR, "AR-PACKAGES")
-        ar_package = ET.SubElement(ar_packages, "AR-PACKAGE")
-        ET.SubElement(ar_package, "SHORT-NAME").text = "SpiPackage"
-        elements = ET.SubElement(ar_package, "ELEMENTS")
-
-        def container_from_obj(short_name: str, obj):
-            cont = ET.SubElement(elements, "ECUC-CONTAINER-VALUE")
-            ET.SubElement(cont, "SHORT-NAME").text = short_name
-            ET.SubElement(cont, "DEFINITION-REF", {"DEST": "ECUC-PARAM-CONF-CONTAINER-DEF"}).text = f"/AUTOSAR/EcucDefs/Spi/{short_name}"
-            pvals = ET.SubElement(cont, "PARAMETER-VALUES")
-            for key, val in obj.__dict__.items():
-                if isinstance(val, bool):
-                    p = ET.SubElement(pvals, "ECUC-BOOLEAN-PARAM-VALUE")
-                elif isinstance(val, int):
-                    p = ET.SubElement(pvals, "ECUC-NUMERICAL-PARAM-VALUE")
-                else:
-                    p = ET.SubElement(pvals, "ECUC-TEXTUAL-PARAM-VALUE")
-                ET.SubElement(p, "SHORT-NAME").text = key
-                ET.SubElement(p, "VALUE").text = str(val)
-
-        # Config set (boolean container)
-        cs = ET.SubElement(elements, "ECUC-CONTAINER-VALUE")
-        ET.SubElement(cs, "SHORT-NAME").text = "SpiConfigSet"
-        ET.SubElement(cs, "DEFINITION-REF", {"DEST":"ECUC-PARAM-CONF-CONTAINER-DEF"}).text = "/AUTOSAR/EcucDefs/Spi/SpiConfigSet"
-        p = ET.SubElement(cs, "PARAMETER-VALUES")
-        pv = ET.SubElement(p, "ECUC-BOOLEAN-PARAM-VALUE")
-        ET.SubElement(pv, "SHORT-NAME").text = "SpiConfigSetIncluded"
-        ET.SubElement(pv, "VALUE").text = "true" if model.SpiConfigSet else "false"
-
-        # Add other containers
-        container_from_obj("SpiDemEventParameterRefs", model.SpiDemEventParameterRefs)
-        container_from_obj("SpiGeneral", model.SpiGeneral)
-        container_from_obj("SpiSequence", model.SpiSequence)
-        container_from_obj("SpiChannel", model.SpiChannel)
-        container_from_obj("SpiChannelList", model.SpiChannelList)
-        container_from_obj("SpiJob", model.SpiJob)
-        container_from_obj("SpiExternalDevice", model.SpiExternalDevice)
-        container_from_obj("SpiDriver", model.SpiDriver)
-        container_from_obj("SpiPublishedInformation", model.SpiPublishedInformation)
-
-        SpiArxmlExporter._indent(AUTOSAR)
-        tree = ET.ElementTree(AUTOSAR)
-        tree.write(filepath, encoding="utf-8", xml_declaration=True)
-
-    @staticmethod
-    def _indent(elem, level=0):
-        i = "\n" + level * "  "
-        if len(elem):
-            if not elem.text or not elem.text.strip():
-                elem.text = i + "  "
-            for e in elem:
-                SpiArxmlExporter._indent(e, level + 1)
-            if not e.tail or not e.tail.strip():
-                e.tail = i
-        elif level and (not elem.tail or not elem.tail.strip()):
-            elem.tail = i
+        def containers():
+            yield "SpiConfigSet", "SpiConfigSet", [("SpiConfigSetIncluded", model.SpiConfigSet)]
+            for name in ("SpiDemEventParameterRefs", "SpiGeneral"):
+                yield name, name, model_params(getattr(model, name))
+            for name in INSTANCE_MODELS:
+                for index, obj in enumerate(getattr(model, name)):
+                    yield f"{name}_{index}", name, model_params(obj)
+            for name in ("SpiDriver", "SpiPublishedInformation"):
+                yield name, name, model_params(getattr(model, name))
+
+        export_module(filepath, "Spi", containers(), DROPDOWNS)
 
 # -------------------- GUI Widgets --------------------
 class CollapsibleFrame(ttk.Frame):
@@ -183,6 +160,7 @@ class SpiConfiguratorApp(tk.Frame):
         super().__init__(parent)
         self.model = SpiAppModel()
         self.var_output_filepath = tk.StringVar(value=self.model.output_filepath)
+        self.instance_tables = {}  # section name -> InstanceTable
         self._build_ui()
 
     def _build_ui(self):
@@ -200,6 +178,7 @@ class SpiConfiguratorApp(tk.Frame):
         main.pack(fill="both", expand=True, padx=8, pady=8)
 
         canvas = tk.Canvas(main)
+        self.scroll_canvas = canvas
         canvas.pack(side="left", fill="both", expand=True)
 
         vsb = ttk.Scrollbar(main, orient="vertical", command=canvas.yview)
@@ -231,6 +210,7 @@ class SpiConfiguratorApp(tk.Frame):
         btn_frm = ttk.Frame(self)
         btn_frm.pack(fill="x", pady=(0,10))
         ttk.Button(btn_frm, text="🚀 Generate SPI ARXML", command=self.on_generate).pack(side="left", padx=8, pady=6)
+        ttk.Button(btn_frm, text="📂 Import SPI ARXML", command=self.on_import).pack(side="left", padx=8, pady=6)
 
     def _build_section_SpiConfigSet(self, parent):
         sec = CollapsibleFrame(parent, text="📦 SpiConfigSet")
@@ -242,16 +222,11 @@ class SpiConfiguratorApp(tk.Frame):
         sec = CollapsibleFrame(self.content, text=f"📦 {name}")
         sec.pack(fill="x", pady=4)
 
-        # Fields that should be dropdowns and their options
-        dropdowns = {
-            "SpiHwUnitSynchronous": ["SYNCHRONOUS", "ASYNCHRONOUS"],
-            "SpiCsPolarity": ["HIGH", "LOW"],
-            "SpiCsSelection": ["CS_VIA_GPIO", "CS_VIA_PERIPHERAL_ENGINE"],
-            "SpiDataShiftEdge": ["LEADING", "TRAILING"],
-            "SpiHwUnit": ["CSIB0", "CSIB1", "CSIB2", "CSIB3"],
-            "SpiShiftClockIdleLevel": ["HIGH", "LOW"],
-            "SpiCsBehavior": ["CS_KEEP_ASSERTED", "CS_TOGGLE"]
-        }
+        if isinstance(obj, list):
+            table = InstanceTable(sec.content, obj, INSTANCE_MODELS[name], choices=DROPDOWNS)
+            table.pack(fill="x", padx=4, pady=2)
+            self.instance_tables[name] = table
+            return
 
         for key, val in obj.__dict__.items():
             widget_row = ttk.Frame(sec.content)
@@ -259,9 +234,9 @@ class SpiConfiguratorApp(tk.Frame):
             ttk.Label(widget_row, text=key, width=36, anchor="w").pack(side="left")
 
             var_name = f"var_{name}_{key}"
-            if key in dropdowns:
+            if key in DROPDOWNS:
                 var = tk.StringVar(value=str(val))
-                cb = ttk.Combobox(widget_row, textvariable=var, values=dropdowns[key], state="readonly")
+                cb = ttk.Combobox(widget_row, textvariable=var, values=DROPDOWNS[key], state="readonly")
                 cb.pack(side="left", fill="x", expand=True)
             elif isinstance(val, bool):
                 var = tk.BooleanVar(value=val)
@@ -309,6 +284,8 @@ class SpiConfiguratorApp(tk.Frame):
         
         for sec in sections:
             obj = getattr(self.model, sec)
+            if isinstance(obj, list):
+                continue  # instance tables write straight into the model
             for key in obj.__dict__.keys():
                 var_name = f"var_{sec}_{key}"
                 if not hasattr(self, var_name):
@@ -342,6 +319,39 @@ class SpiConfiguratorApp(tk.Frame):
         except Exception as e:
             messagebox.showerror("Error", f"Failed to generate SPI ARXML:\n{e}")
 
+    def on_import(self):
+        filepath = filedialog.askopenfilename(
+            title="Import ARXML file",
+            filetypes=[("ARXML files", "*.arxml"), ("All files", "*.*")])
+        if not filepath:
+            return
+
+        try:
+            loaded = import_module(filepath, self.model, "Spi", INSTANCE_MODELS)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to import SPI ARXML:\n{e}")
+            return
+        if not loaded:
+            messagebox.showwarning("Import", f"No SPI configuration found in:\n{filepath}")
+            return
+
+        self._load_form()
+        messagebox.showinfo("Imported", f"Loaded {loaded} SPI containers from:\n{filepath}")
+
+    def _load_form(self):
+        """Push the whole model into the form widgets in one pass"""
+        for f in fields(self.model):
+            obj = getattr(self.model, f.name)
+            if f.name in self.instance_tables:
+                self.instance_tables[f.name].reload()
+            elif is_dataclass(obj):
+                for key, val in model_params(obj):
+                    var = getattr(self, f"var_{f.name}_{key}", None)
+                    if var is not None:
+                        var.set(val)
+            elif isinstance(obj, bool) and hasattr(self, f"var_{f.name}"):
+                getattr(self, f"var_{f.name}").set(obj)
+
 # -------------------- Standalone App Runner --------------------
 def create_standalone_app():
     """Create a standalone window for SPI configurator"""
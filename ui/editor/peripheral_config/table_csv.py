@@ -0,0 +1,284 @@
+# table_csv.py
+
+import csv
+import os
+from collections import Counter
+from dataclasses import fields
+
+from ...profiling import profiler
+from .arxml_writer import format_value
+
+TAB_EXTENSIONS = (".tsv", ".tab")
+TRUE_TEXT = {"true", "1", "yes", "on"}
+FALSE_TEXT = {"false", "0", "no", "off", ""}
+
+
+def summarize(problems, limit=20):
+    """'line N: message' text for a list of (file line, message)"""
+    lines = [f"line {line}: {message}" for line, message in problems[:limit]]
+    if len(problems) > limit:
+        lines.append(f"... and {len(problems) - limit} more")
+    return "\n".join(lines)
+
+
+class TableCsvError(ValueError):
+    """Rejected import; `errors` lists (file line, message) for every bad cell or row"""
+
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__(f"{len(errors)} error{'s' if len(errors) != 1 else ''} in table file")
+
+    def summary(self, limit=20):
+        return summarize(self.errors, limit)
+
+
+def delimiter_for(filepath):
+    return "\t" if filepath.lower().endswith(TAB_EXTENSIONS) else ","
+
+
+# ---------- column parsing ----------
+def _parse_int(text):
+    try:
+        return int(text, 0)  # accepts 0x7FF style hex
+    except ValueError:
+        return int(text)
+
+
+def _parse_bool(text):
+    text = text.lower()
+    if text in TRUE_TEXT:
+        return True
+    if text in FALSE_TEXT:
+        return False
+    raise ValueError
+
+
+def _parse_column(cells, default):
+    """Typed values for one column plus the indexes of cells that did not parse.
+
+    Plain decimal columns convert in a single map(); only a column that
+    fails that falls back to cell-by-cell parsing. Empty cells take the
+    model default.
+    """
+    kind = type(default)
+    if kind is str:
+        return cells, []
+    if kind is int:
+        try:
+            return [int(text) if text else default for text in cells], []
+        except ValueError:
+            parse = _parse_int
+    elif kind is float:
+        parse = float
+    elif kind is bool:
+        parse = _parse_bool
+    else:
+        return cells, []
+
+    values, bad = [], []
+    for index, text in enumerate(cells):
+        if not text:
+            values.append(default)
+            continue
+        try:
+            values.append(parse(text))
+        except ValueError:
+            values.append(None)
+            bad.append(index)
+    return values, bad
+
+
+# ---------- column checks ----------
+# A check takes {column name: [values]} and yields (row index, message),
+# or (row index, message, other row index) when the row clashes with an
+# earlier one. Cells that failed to parse hold None and are skipped.
+# Checks wrapped in warning() report without rejecting the import.
+
+def warning(check):
+    """Report what `check` finds as warnings rather than errors"""
+    check.warning = True
+    return check
+
+
+def unique(name):
+    def check(columns):
+        values = columns[name]
+        counts = Counter(values)
+        for index, value in enumerate(values):
+            if value is not None and counts[value] > 1:
+                yield index, f"{name} {value} is not unique"
+    return check
+
+
+def in_range(name, low, high):
+    def check(columns):
+        for index, value in enumerate(columns[name]):
+            if value is not None and not low <= value <= high:
+                yield index, f"{name} {value} outside {low}..{high}"
+    return check
+
+
+def one_of(name, choices):
+    allowed = set(choices)
+
+    def check(columns):
+        for index, value in enumerate(columns[name]):
+            if value not in allowed:
+                yield index, f"{name} '{value}' is not one of {', '.join(choices)}"
+    return check
+
+
+def not_above(low_name, high_name):
+    def check(columns):
+        for index, (low, high) in enumerate(zip(columns[low_name], columns[high_name])):
+            if low is not None and high is not None and low > high:
+                yield index, f"{low_name} {low} above {high_name} {high}"
+    return check
+
+
+def disjoint_bits(name, width=32):
+    """Rows whose bit masks share a bit with an earlier row"""
+    def check(columns):
+        owner = {}
+        for index, mask in enumerate(columns[name]):
+            if not mask:
+                continue
+            shared = {owner[bit] for bit in range(width) if mask >> bit & 1 and bit in owner}
+            for bit in range(width):
+                if mask >> bit & 1:
+                    owner.setdefault(bit, index)
+            if shared:
+                yield index, f"{name} 0x{mask:X} shares bits with the mask", min(shared)
+    return check
+
+
+def disjoint_filters(code_name, mask_name):
+    """Acceptance filters (code, mask) that accept an identifier an earlier filter accepts.
+
+    Two filters overlap when their codes agree on every bit both masks
+    compare. Filters go into a trie keyed by bit, most significant first,
+    with a third branch for bits the mask ignores; a lookup follows only
+    the branches a filter could share, so the check stays close to linear
+    in the number of rows.
+    """
+    def check(columns):
+        rows = [(index, code, mask) for index, (code, mask) in enumerate(zip(columns[code_name], columns[mask_name]))
+                if code is not None and mask is not None]
+        width = max((max(code, mask).bit_length() for _, code, mask in rows), default=0)
+        root = {}
+        for index, code, mask in rows:
+            keys = [(code >> bit & 1) if mask >> bit & 1 else 2 for bit in range(width - 1, -1, -1)]
+            match = _trie_overlap(root, keys)
+            if match is not None:
+                yield index, "filter shares accepted IDs with the filter", match
+            node = root
+            for key in keys:
+                node = node.setdefault(key, {})
+            node.setdefault(None, index)  # leaf: first row with this pattern
+    return check
+
+
+def _trie_overlap(root, keys):
+    """A row stored in the filter trie that shares an ID with pattern `keys`, or None"""
+    stack = [(root, 0)]
+    while stack:
+        node, depth = stack.pop()
+        if depth == len(keys):
+            if None in node:
+                return node[None]
+            continue
+        key = keys[depth]
+        # A fixed bit meets the same bit or a don't-care; a don't-care meets anything
+        for branch in ((0, 1, 2) if key == 2 else (key, 2)):
+            child = node.get(branch)
+            if child is not None:
+                stack.append((child, depth + 1))
+    return None
+
+
+def default_checks(factory, choices=None):
+    """Checks every table gets: numeric *Id columns unique, dropdown values valid"""
+    checks = []
+    defaults = factory()
+    for f in fields(factory):
+        value = getattr(defaults, f.name)
+        if type(value) is int and f.name.lower().endswith("id"):
+            checks.append(unique(f.name))
+        if choices and f.name in choices:
+            checks.append(one_of(f.name, choices[f.name]))
+    return checks
+
+
+# ---------- import / export ----------
+def read_rows(filepath, factory, checks=(), warnings=None):
+    """Model instances for every data row of a CSV/TSV file.
+
+    The header names model fields (any order, missing ones keep their
+    defaults). Each column is parsed and checked as a whole; if any cell
+    or row is invalid nothing is returned and TableCsvError carries all
+    the problems by file line. What warning() checks find is appended to
+    the `warnings` list, if given, as (file line, message).
+    """
+    names = [f.name for f in fields(factory)]
+    defaults = factory()
+    with profiler.span("read.table_csv", file=os.path.basename(filepath)):
+        with open(filepath, newline="", encoding="utf-8-sig") as f:
+            header_line = f.readline()
+            delimiter = "\t" if "\t" in header_line else ","
+            f.seek(0)
+            reader = csv.reader(f, delimiter=delimiter)
+            header = [name.strip() for name in next(reader, [])]
+            records, lines = [], []
+            for record in reader:
+                if any(cell.strip() for cell in record):
+                    records.append(record)
+                    lines.append(reader.line_num)
+
+        errors = []
+        unknown = [name for name in header if name not in names]
+        if unknown:
+            errors.append((1, f"unknown column{'s' if len(unknown) > 1 else ''} {', '.join(unknown)}"))
+        if not header or unknown:
+            raise TableCsvError(errors or [(1, "missing header row")])
+
+        position = {name: header.index(name) for name in names if name in header}
+        width = len(header)
+        for record, line in zip(records, lines):
+            if len(record) > width:
+                errors.append((line, f"{len(record)} cells for {width} columns"))
+
+        columns = {}
+        for name in names:
+            default = getattr(defaults, name)
+            if name not in position:
+                columns[name] = [default] * len(records)
+                continue
+            col = position[name]
+            cells = [record[col].strip() if col < len(record) else "" for record in records]
+            columns[name], bad = _parse_column(cells, default)
+            errors.extend((lines[index], f"{name} '{cells[index]}' is not a valid {type(default).__name__}")
+                          for index in bad)
+
+        for check in checks:
+            found = warnings if getattr(check, "warning", False) else errors
+            if found is None:
+                continue
+            for index, message, *other in check(columns):
+                if other:
+                    message = f"{message} on line {lines[other[0]]}"
+                found.append((lines[index], message))
+        if errors:
+            errors.sort(key=lambda error: error[0])
+            raise TableCsvError(errors)
+
+        return [factory(*values) for values in zip(*(columns[name] for name in names))] if records else []
+
+
+def write_rows(filepath, rows, factory):
+    """Write `rows` as CSV, or TSV for a .tsv/.tab path, one column per model field"""
+    names = [f.name for f in fields(factory)]
+    with profiler.span("write.table_csv", file=os.path.basename(filepath), rows=len(rows)):
+        with open(filepath, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f, delimiter=delimiter_for(filepath), lineterminator="\n")
+            writer.writerow(names)
+            writer.writerows([format_value(getattr(row, name)) for name in names] for row in rows)
@@ -6,8 +6,10 @@ Converted from original WDG script to match CAN configurator pattern.
 import os
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import xml.etree.ElementTree as ET
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, is_dataclass
+
+from .arxml_reader import import_module
+from .arxml_writer import export_module, model_params
 
 # -------------------- Data Models --------------------
 @dataclass
@@ -40,61 +42,23 @@ class WdgAppModel:
     WdgPublishedInformation: WdgPublishedInformationModel = field(default_factory=WdgPublishedInformationModel)
     WdgConfigSet: bool = True
 
+# Fields edited through dropdowns; exported as ECUC enumeration values
+DROPDOWNS = {
+    "WdgRunArea": ["RAM", "ROM"],
+    "WdgDefaultMode": ["WDGIF_FAST_MODE", "WDGIF_OFF_MODE", "WDGIF_SLOW_MODE"],
+    "WdgTriggerMode": ["DG_BOTH", "WDG_TOGGLE", "WDG_WINDOW"]
+}
+
 # -------------------- ARXML Exporter --------------------
 class WdgArxmlExporter:
     @staticmethod
     def export(model: WdgAppModel, filepath: str):
-        AUTOSAR = ET.Element("AUTOSAR")
-        ar_packages = ET.SubElement(AUTOSAR, "AR-PACKAGES")
-        ar_package = ET.SubElement(ar_packages, "AR-PACKAGE")
-        ET.SubElement(ar_package, "SHORT-NAME").text = "WdgPackage"
-        elements = ET.SubElement(ar_package, "ELEMENTS")
-
-        def container_from_obj(short_name: str, obj):
-            cont = ET.SubElement(elements, "ECUC-CONTAINER-VALUE")
-            ET.SubElement(cont, "SHORT-NAME").text = short_name
-            ET.SubElement(cont, "DEFINITION-REF", {"DEST": "ECUC-PARAM-CONF-CONTAINER-DEF"}).text = f"/AUTOSAR/EcucDefs/Wdg/{short_name}"
-            pvals = ET.SubElement(cont, "PARAMETER-VALUES")
-            for key, val in obj.__dict__.items():
-                if isinstance(val, bool):
-                    p = ET.SubElement(pvals, "ECUC-BOOLEAN-PARAM-VALUE")
-                elif isinstance(val, int):
-                    p = ET.SubElement(pvals, "ECUC-NUMERICAL-PARAM-VALUE")
-                else:
-                    p = ET.SubElement(pvals, "ECUC-TEXTUAL-PARAM-VALUE")
-                ET.SubElement(p, "SHORT-NAME").text = key
-                ET.SubElement(p, "VALUE").text = str(val)
-
-        # Config set (boolean container)
-        cs = ET.SubElement(elements, "ECUC-CONTAINER-VALUE")
-        ET.SubElement(cs, "SHORT-NAME").text = "WdgConfigSet"
-        ET.SubElement(cs, "DEFINITION-REF", {"DEST":"ECUC-PARAM-CONF-CONTAINER-DEF"}).text = "/AUTOSAR/EcucDefs/Wdg/WdgConfigSet"
-        p = ET.SubElement(cs, "PARAMETER-VALUES")
-        pv = ET.SubElement(p, "ECUC-BOOLEAN-PARAM-VALUE")
-        ET.SubElement(pv, "SHORT-NAME").text = "WdgConfigSetIncluded"
-        ET.SubElement(pv, "VALUE").text = "true" if model.WdgConfigSet else "false"
-
-        # Add other containers
-        container_from_obj("WdgGeneral", model.WdgGeneral)
-        container_from_obj("WdgSettingsConfig", model.WdgSettingsConfig)
-        container_from_obj("WdgPublishedInformation", model.WdgPublishedInformation)
-
-        WdgArxmlExporter._indent(AUTOSAR)
-        tree = ET.ElementTree(AUTOSAR)
-        tree.write(filepath, encoding="utf-8", xml_declaration=True)
+        def containers():
+            yield "WdgConfigSet", "WdgConfigSet", [("WdgConfigSetIncluded", model.WdgConfigSet)]
+            for name in ("WdgGeneral", "WdgSettingsConfig", "WdgPublishedInformation"):
+                yield name, name, model_params(getattr(model, name))
 
-    @staticmethod
-    def _indent(elem, level=0):
-        i = "\n" + level * "  "
-        if len(elem):
-            if not elem.text or not elem.text.strip():
-                elem.text = i + "  "
-            for e in elem:
-                WdgArxmlExporter._indent(e, level + 1)
-            if not e.tail or not e.tail.strip():
-                e.tail = i
-        elif level and (not elem.tail or not elem.tail.strip()):
-            elem.tail = i
+        export_module(filepath, "Wdg", containers(), DROPDOWNS)
 
 # -------------------- GUI Widgets --------------------
 class CollapsibleFrame(ttk.Frame):
@@ -138,6 +102,7 @@ class WdgConfiguratorApp(tk.Frame):
         main.pack(fill="both", expand=True, padx=8, pady=8)
 
         canvas = tk.Canvas(main)
+        self.scroll_canvas = canvas
         canvas.pack(side="left", fill="both", expand=True)
 
         vsb = ttk.Scrollbar(main, orient="vertical", command=canvas.yview)
@@ -162,6 +127,7 @@ class WdgConfiguratorApp(tk.Frame):
         btn_frm = ttk.Frame(self)
         btn_frm.pack(fill="x", pady=(0,10))
         ttk.Button(btn_frm, text="🚀 Generate WDG ARXML", command=self.on_generate).pack(side="left", padx=8, pady=6)
+        ttk.Button(btn_frm, text="📂 Import WDG ARXML", command=self.on_import).pack(side="left", padx=8, pady=6)
 
     def _build_section_WdgConfigSet(self, parent):
         sec = CollapsibleFrame(parent, text="📦 WdgConfigSet")
@@ -173,22 +139,15 @@ class WdgConfiguratorApp(tk.Frame):
         sec = CollapsibleFrame(self.content, text=f"📦 {name}")
         sec.pack(fill="x", pady=4)
 
-        # Fields that should be dropdowns and their options
-        dropdowns = {
-            "WdgRunArea": ["RAM", "ROM"],
-            "WdgDefaultMode": ["WDGIF_FAST_MODE", "WDGIF_OFF_MODE", "WDGIF_SLOW_MODE"],
-            "WdgTriggerMode": ["DG_BOTH", "WDG_TOGGLE", "WDG_WINDOW"]
-        }
-
         for key, val in obj.__dict__.items():
             widget_row = ttk.Frame(sec.content)
             widget_row.pack(fill="x", pady=2, padx=4)
             ttk.Label(widget_row, text=key, width=36, anchor="w").pack(side="left")
 
             var_name = f"var_{name}_{key}"
-            if key in dropdowns:
+            if key in DROPDOWNS:
                 var = tk.StringVar(value=str(val))
-                cb = ttk.Combobox(widget_row, textvariable=var, values=dropdowns[key], state="readonly")
+                cb = ttk.Combobox(widget_row, textvariable=var, values=DROPDOWNS[key], state="readonly")
                 cb.pack(side="left", fill="x", expand=True)
             elif isinstance(val, bool):
                 var = tk.BooleanVar(value=val)
@@ -260,6 +219,37 @@ class WdgConfiguratorApp(tk.Frame):
         except Exception as e:
             messagebox.showerror("Error", f"Failed to generate WDG ARXML:\n{e}")
 
+    def on_import(self):
+        filepath = filedialog.askopenfilename(
+            title="Import ARXML file",
+            filetypes=[("ARXML files", "*.arxml"), ("All files", "*.*")])
+        if not filepath:
+            return
+
+        try:
+            loaded = import_module(filepath, self.model, "Wdg", {})
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to import WDG ARXML:\n{e}")
+            return
+        if not loaded:
+            messagebox.showwarning("Import", f"No WDG configuration found in:\n{filepath}")
+            return
+
+        self._load_form()
+        messagebox.showinfo("Imported", f"Loaded {loaded} WDG containers from:\n{filepath}")
+
+    def _load_form(self):
+        """Push the whole model into the form widgets in one pass"""
+        for f in fields(self.model):
+            obj = getattr(self.model, f.name)
+            if is_dataclass(obj):
+                for key, val in model_params(obj):
+                    var = getattr(self, f"var_{f.name}_{key}", None)
+                    if var is not None:
+                        var.set(val)
+            elif isinstance(obj, bool) and hasattr(self, f"var_{f.name}"):
+                getattr(self, f"var_{f.name}").set(obj)
+
 # -------------------- Standalone App Runner --------------------
 def create_standalone_app():
     """Create a standalone window for WDG configurator"""
@@ -1,10 +1,18 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import xml.etree.ElementTree as ET
+import io
+import json
 import os
 from copy import deepcopy
 
+from ..arxml_diff import ADDED, CHANGED, diff_files, format_param_value
+from ..merkle import MerkleIndex
+from ..profiling import profiler
+
 class RawXmlPanel:
+    DIFF_ROW_LIMIT = 5000  # containers listed in the compare dialog
+
     def __init__(self, parent, status_logger=None, on_change_callback=None):
         self.frame = ttk.Frame(parent)
         self.status_logger = status_logger
@@ -13,6 +21,7 @@ class RawXmlPanel:
         self.xml_file_path = None
         self.on_change_callback = on_change_callback
         self.item_to_elem = {}
+        self.merkle = None  # subtree digests of xml_root
         self.is_modified = False
         self.auto_sync = True  # Enable automatic synchronization
         self.suppress_text_events = False  # Flag to prevent recursive events
@@ -39,6 +48,7 @@ class RawXmlPanel:
         
         ttk.Button(xml_frame, text="Format XML", command=self.format_xml).pack(side="left", padx=1)
         ttk.Button(xml_frame, text="Validate XML", command=self.validate_arxml_file).pack(side="left", padx=1)
+        ttk.Button(xml_frame, text="Compare...", command=self.compare_with_file).pack(side="left", padx=1)
 
         # View operations
         view_frame = ttk.LabelFrame(toolbar, text="View Options", padding=2)
@@ -222,14 +232,16 @@ class RawXmlPanel:
                 if selected:
                     parent_elem = self.item_to_elem[selected[0]]
                     parent_elem.append(new_elem)
+                    self.merkle.update(parent_elem)
+                    self._insert_tree_item(selected[0], "end", new_elem)
                 else:
                     # Create new root
                     self.xml_root = new_elem
                     self.xml_tree = ET.ElementTree(self.xml_root)
+                    self.build_tree_from_content(update_text=False)
+                    self.merkle = MerkleIndex(self.xml_root)
 
                 self.set_modified(True)
-                # Rebuild tree and text views to ensure consistency
-                self.build_tree_from_content(update_text=False)
                 self.sync_views_from_tree()
                 self.log_message(f"Added node: {tag_name}")
                 
@@ -272,8 +284,12 @@ class RawXmlPanel:
                     if short_name_elem is None:
                         short_name_elem = ET.SubElement(elem, "SHORT-NAME")
                     short_name_elem.text = new_short_name
+                    if short_name_elem in self.merkle.digests:
+                        self.merkle.update(short_name_elem)
                 elif short_name_elem is not None:
                     elem.remove(short_name_elem)
+                    self.merkle.remove(short_name_elem)
+                self.merkle.update(elem)
 
                 # Update tree display
                 display_name = new_short_name if new_short_name else new_tag
@@ -307,16 +323,16 @@ class RawXmlPanel:
             if elem == self.xml_root:
                 self.xml_root = None
                 self.xml_tree = None
+                self.merkle = None
             else:
-                # Find parent and remove
-                for parent_item, parent_elem in self.item_to_elem.items():
-                    if elem in parent_elem:
-                        parent_elem.remove(elem)
-                        break
+                parent_elem = self.merkle.parents[elem]
+                parent_elem.remove(elem)
+                self.merkle.remove(elem)
+                self.merkle.update(parent_elem)
 
             # Remove from tree view
+            self._forget_tree_item(selected[0])
             self.tree.delete(selected[0])
-            del self.item_to_elem[selected[0]]
             
             self.set_modified(True)
             self.sync_views_from_tree()
@@ -483,6 +499,7 @@ Attributes:
                 self.frame.after_cancel(self._sync_timer)
             self._sync_timer = self.frame.after(1000, self.sync_views_from_text)  # 1 second delay
 
+    @profiler.timed('serialize.raw_xml')
     def _serialize_xml_to_string(self, root_element):
         """Serializes an XML element to a string, handling default namespace."""
         if '}' in root_element.tag:
@@ -505,18 +522,17 @@ Attributes:
         try:
             content = self.get_content()
             if content.strip():
-                self.xml_root = ET.fromstring(content)
-                self.xml_tree = ET.ElementTree(self.xml_root)
-                self.build_tree_from_content(update_text=False)
-                
-                # Notify parent component
-                if self.on_change_callback:
+                with profiler.span('parse.raw_xml', chars=len(content)):
+                    new_root = ET.fromstring(content)
+
+                # Notify parent component, unless only indentation changed
+                if self.apply_parsed_root(new_root) and self.on_change_callback:
                     self.on_change_callback(self.xml_tree)
         except ET.ParseError:
             # Ignore parse errors during typing
             pass
         except Exception as e:
-            self.log_message(f"Sync error: {e}")
+            self.log_message(f"Sync error: {e}", "ERROR")
 
     def sync_views_from_tree(self):
         """Synchronize text editor from tree structure"""
@@ -544,7 +560,7 @@ Attributes:
                     self.on_change_callback(self.xml_tree)
             except Exception as e:
                 self.suppress_text_events = False
-                self.log_message(f"Tree sync error: {e}")
+                self.log_message(f"Tree sync error: {e}", "ERROR")
 
     def set_modified(self, is_modified):
         """Update modification status"""
@@ -580,7 +596,7 @@ Attributes:
             
         except Exception as e:
             messagebox.showerror("Refresh Error", f"Failed to refresh file: {e}")
-            self.log_message(f"Refresh error: {e}")
+            self.log_message(f"Refresh error: {e}", "ERROR")
 
     def open_file(self):
         """Open ARXML file with enhanced error handling"""
@@ -620,7 +636,7 @@ Attributes:
             
         except Exception as e:
             messagebox.showerror("File Open Error", f"Failed to open file: {e}")
-            self.log_message(f"File open error: {e}")
+            self.log_message(f"File open error: {e}", "ERROR")
 
     def set_content(self, content):
         """Set content in text editor and rebuild tree"""
@@ -682,40 +698,134 @@ Attributes:
                 return
             
             if update_text:
-                self.xml_root = ET.fromstring(content)
+                with profiler.span('parse.raw_xml', chars=len(content)):
+                    self.xml_root = ET.fromstring(content)
                 self.xml_tree = ET.ElementTree(self.xml_root)
+                with profiler.span('hash.raw_xml'):
+                    self.merkle = MerkleIndex(self.xml_root)
             
-            root_short = self.get_short_name(self.xml_root)
-            root_label = root_short if root_short else self.localname(self.xml_root.tag)
-            root_item = self.tree.insert("", "end", text=root_label, open=True)
-            self.item_to_elem[root_item] = self.xml_root
+            with profiler.span('treeview.raw_xml'):
+                root_item = self.tree.insert("", "end", text=self._tree_label(self.xml_root), open=True)
+                self.item_to_elem[root_item] = self.xml_root
 
-            self._build_tree_recursive(self.xml_root, root_item)
-            
-            self._restore_expansion_state(expanded_state)
+                self._build_tree_recursive(self.xml_root, root_item)
+                
+                self._restore_expansion_state(expanded_state)
             
-            self.log_message("Tree view updated from XML content")
+            self.log_message("Tree view updated from XML content", "DEBUG")
             
         except ET.ParseError as e:
             if update_text:  # Only show error if parsing from text
-                self.log_message(f"XML Parse Error: {e}")
+                self.log_message(f"XML Parse Error: {e}", "ERROR")
         except Exception as e:
-            self.log_message(f"Error building tree: {e}")
+            self.log_message(f"Error building tree: {e}", "ERROR")
 
     def _build_tree_recursive(self, elem, parent_item):
         """Recursively build tree structure"""
         for child in elem:
-            # If an element is a SHORT-NAME, but has children, it's probably a structural element
-            # that happens to be named SHORT-NAME. So, only skip it if it's a leaf.
-            if self.localname(child.tag).upper() == "SHORT-NAME" and len(child) == 0:
-                continue
+            if self._is_tree_node(child):
+                self._insert_tree_item(parent_item, "end", child)
+
+    def _is_tree_node(self, elem):
+        # If an element is a SHORT-NAME, but has children, it's probably a structural element
+        # that happens to be named SHORT-NAME. So, only skip it if it's a leaf.
+        return not (self.localname(elem.tag).upper() == "SHORT-NAME" and len(elem) == 0)
+
+    def _tree_label(self, elem):
+        short = self.get_short_name(elem)
+        return short if short else self.localname(elem.tag)
+
+    def _insert_tree_item(self, parent_item, index, elem):
+        """Insert the tree item for `elem` and its subtree"""
+        item = self.tree.insert(parent_item, index, text=self._tree_label(elem), open=False)
+        self.item_to_elem[item] = elem
+        self._build_tree_recursive(elem, item)
+        return item
+
+    def _forget_tree_item(self, item):
+        """Drop `item` and its descendants from item_to_elem (before deleting it)"""
+        self.item_to_elem.pop(item, None)
+        for child in self.tree.get_children(item):
+            self._forget_tree_item(child)
+
+    def apply_parsed_root(self, new_root):
+        """Bring xml_root and the tree view in line with a freshly parsed document.
+
+        Subtrees whose Merkle digest is unchanged keep their elements and
+        tree items (and so their expansion state); only the changed ones are
+        replaced, so the cost follows the size of the edit rather than of
+        the document. Returns False if nothing but indentation changed.
+        """
+        with profiler.span('hash.raw_xml'):
+            new_index = MerkleIndex(new_root)
+
+        root_items = self.tree.get_children("")
+        if self.merkle is None or self.xml_root is None or not root_items:
+            self.xml_root = new_root
+            self.xml_tree = ET.ElementTree(new_root)
+            self.build_tree_from_content(update_text=False)
+            self.merkle = new_index
+            return True
 
-            short = self.get_short_name(child)
-            display_name = short if short else self.localname(child.tag)
-            
-            item = self.tree.insert(parent_item, "end", text=display_name, open=False)
-            self.item_to_elem[item] = child
-            self._build_tree_recursive(child, item)
+        if new_index.root_digest == self.merkle.root_digest:
+            return False
+        with profiler.span('treeview.raw_xml_patch'):
+            self._graft(self.xml_root, new_root, root_items[0], new_index)
+        self.log_message("Tree view patched from XML content", "DEBUG")
+        return True
+
+    def _graft(self, old, new, item, new_index):
+        """Make `old` (shown as `item`) equal to `new`, reusing unchanged child subtrees.
+
+        Runs of children with equal digests at both ends are kept as they
+        are. If the changed middle pairs up one to one by tag, each pair is
+        grafted recursively; otherwise the old middle is swapped for the new
+        elements. Kept subtrees retain their old indentation whitespace.
+        """
+        old_digests, new_digests = self.merkle.digests, new_index.digests
+        old.tag, old.text = new.tag, new.text
+        old.attrib.clear()
+        old.attrib.update(new.attrib)
+
+        old_children, new_children = list(old), list(new)
+        items = {}
+        if item is not None:
+            items = dict(zip([child for child in old_children if self._is_tree_node(child)],
+                             self.tree.get_children(item)))
+        start, limit = 0, min(len(old_children), len(new_children))
+        while start < limit and old_digests[old_children[start]] == new_digests[new_children[start]]:
+            start += 1
+        old_end, new_end = len(old_children), len(new_children)
+        while (old_end > start and new_end > start
+               and old_digests[old_children[old_end - 1]] == new_digests[new_children[new_end - 1]]):
+            old_end -= 1
+            new_end -= 1
+        removed, added = old_children[start:old_end], new_children[start:new_end]
+
+        if len(removed) == len(added) and all(
+                o.tag == n.tag and self._is_tree_node(o) == self._is_tree_node(n)
+                for o, n in zip(removed, added)):
+            for o, n in zip(removed, added):
+                if old_digests[o] != new_digests[n]:
+                    self._graft(o, n, items.get(o), new_index)
+                o.tail = n.tail
+        else:
+            position = sum(1 for child in old_children[:start] if child in items)
+            for child in removed:
+                if child in items:
+                    self._forget_tree_item(items[child])
+                    self.tree.delete(items[child])
+                self.merkle.remove(child)
+            old[start:old_end] = added
+            for child in added:
+                self.merkle.adopt(child, new_index, old)
+                if self._is_tree_node(child):
+                    self._insert_tree_item(item, position, child)
+                    position += 1
+
+        old_digests[old] = new_digests[new]
+        if item is not None:
+            self.tree.item(item, text=self._tree_label(old))
 
     def on_tree_select(self, event):
         """Handle tree selection - highlight element in text editor without replacing content"""
@@ -784,7 +894,7 @@ Attributes:
             self.suppress_text_events = False
 
         except Exception as e:
-            self.log_message(f"Selection highlight error: {e}")
+            self.log_message(f"Selection highlight error: {e}", "ERROR")
 
     def on_text_cursor(self, event=None):
         if self.suppress_text_events:
@@ -836,7 +946,7 @@ Attributes:
                     self.suppress_text_events = False
                     break
         except Exception as e:
-            self.log_message(f"Text cursor sync error: {e}")
+            self.log_message(f"Text cursor sync error: {e}", "ERROR")
 
     def expand_all(self):
         """Expand all tree nodes"""
@@ -878,8 +988,8 @@ Attributes:
 
             # Parse to validate XML but preserve original formatting
             try:
-                # Just validate, don't change the content
-                ET.fromstring(raw_content)
+                # Validate without changing the content
+                parsed_root = ET.fromstring(raw_content)
             except ET.ParseError as e:
                 messagebox.showerror("XML Error", f"Invalid XML syntax: {e}")
                 return
@@ -902,10 +1012,6 @@ Attributes:
                 with open(self.xml_file_path, 'w', encoding='utf-8') as f:
                     f.write(raw_content)
                 
-                # Update internal XML tree for synchronization
-                self.xml_root = ET.fromstring(raw_content)
-                self.xml_tree = ET.ElementTree(self.xml_root)
-                
                 self.set_modified(False)
                 self.status_var.set(f"Saved: {os.path.basename(self.xml_file_path)}")
                 self.log_message(f"Changes saved to: {os.path.basename(self.xml_file_path)}")
@@ -913,16 +1019,14 @@ Attributes:
                 # No file path, trigger Save As
                 self.download_arxml()
 
-            # Notify parent component
+            # Update the tree view, then notify parent component
+            self.apply_parsed_root(parsed_root)
             if self.on_change_callback:
                 self.on_change_callback(self.xml_tree)
 
-            # Update tree view to reflect changes
-            self.build_tree_from_content()
-
         except Exception as e:
             messagebox.showerror("Save Error", f"Failed to save changes: {e}")
-            self.log_message(f"Save error: {e}")
+            self.log_message(f"Save error: {e}", "ERROR")
 
     def download_arxml(self):
         """Save As functionality preserving content exactly"""
@@ -953,8 +1057,7 @@ Attributes:
 
             # Update internal state
             try:
-                self.xml_root = ET.fromstring(content)
-                self.xml_tree = ET.ElementTree(self.xml_root)
+                self.apply_parsed_root(ET.fromstring(content))
             except ET.ParseError:
                 pass  # Content might be invalid, but still save it
 
@@ -965,7 +1068,7 @@ Attributes:
             
         except Exception as e:
             messagebox.showerror("Save Error", f"Failed to save file: {e}")
-            self.log_message(f"Save error: {e}")
+            self.log_message(f"Save error: {e}", "ERROR")
 
     def format_xml(self):
         """Format XML with improved formatting"""
@@ -984,10 +1087,10 @@ Attributes:
             
         except ET.ParseError as e:
             messagebox.showerror("Format Error", f"Cannot format invalid XML: {e}")
-            self.log_message(f"Format error: {e}")
+            self.log_message(f"Format error: {e}", "ERROR")
         except Exception as e:
             messagebox.showerror("Format Error", f"Formatting failed: {e}")
-            self.log_message(f"Format error: {e}")
+            self.log_message(f"Format error: {e}", "ERROR")
 
     def validate_arxml_file(self):
         """Enhanced ARXML validation"""
@@ -1035,10 +1138,10 @@ Attributes:
                 
         except ET.ParseError as e:
             messagebox.showerror("Validation Error", f"Invalid XML syntax: {e}")
-            self.log_message(f"Validation error: {e}")
+            self.log_message(f"Validation error: {e}", "ERROR")
         except Exception as e:
             messagebox.showerror("Validation Error", f"Validation failed: {e}")
-            self.log_message(f"Validation error: {e}")
+            self.log_message(f"Validation error: {e}", "ERROR")
 
     def show_validation_results(self, results):
         """Display validation results in a dialog"""
@@ -1075,10 +1178,120 @@ Attributes:
         
         ttk.Button(main_frame, text="Close", command=dialog.destroy).pack()
 
-    def log_message(self, message):
+    def compare_with_file(self):
+        """Semantic diff of a baseline ARXML file against the current content"""
+        content = self.get_content()
+        if not content.strip():
+            messagebox.showinfo("No Content", "No content to compare.")
+            return
+
+        baseline = filedialog.askopenfilename(
+            title="Select Baseline ARXML",
+            filetypes=[("ARXML files", "*.arxml"), ("XML files", "*.xml"), ("All files", "*.*")]
+        )
+        if not baseline:
+            return
+
+        try:
+            diff = diff_files(baseline, io.StringIO(content))
+        except ET.ParseError as e:
+            messagebox.showerror("Compare Error", f"Invalid XML syntax: {e}")
+            self.log_message(f"Compare error: {e}", "ERROR")
+            return
+        except Exception as e:
+            messagebox.showerror("Compare Error", f"Comparison failed: {e}")
+            self.log_message(f"Compare error: {e}", "ERROR")
+            return
+
+        current = os.path.basename(self.xml_file_path) if self.xml_file_path else "editor content"
+        self.status_var.set(diff.summary())
+        self.log_message(f"Compared {os.path.basename(baseline)} -> {current}: {diff.summary()}")
+        self.show_diff_results(diff, f"{os.path.basename(baseline)} -> {current}")
+
+    def show_diff_results(self, diff, title):
+        """Display an ArxmlDiff as module / container / parameter rows"""
+        dialog = tk.Toplevel(self.frame)
+        dialog.title(f"ARXML Differences: {title}")
+        dialog.geometry("800x500")
+        dialog.transient(self.frame.winfo_toplevel())
+
+        main_frame = ttk.Frame(dialog, padding=10)
+        main_frame.pack(fill="both", expand=True)
+
+        ttk.Label(main_frame, text=diff.summary(),
+                  font=('TkDefaultFont', 11, 'bold')).pack(anchor="w")
+
+        tree_frame = ttk.Frame(main_frame)
+        tree_frame.pack(fill="both", expand=True, pady=10)
+        tree = ttk.Treeview(tree_frame, columns=("change", "old", "new"))
+        tree.heading("#0", text="Path")
+        tree.heading("change", text="Change")
+        tree.heading("old", text="Baseline")
+        tree.heading("new", text="Current")
+        tree.column("#0", width=340)
+        tree.column("change", width=70, stretch=False)
+        tree.column("old", width=180)
+        tree.column("new", width=180)
+        v_scroll = ttk.Scrollbar(tree_frame, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=v_scroll.set)
+        tree.pack(side="left", fill="both", expand=True)
+        v_scroll.pack(side="right", fill="y")
+
+        # A diff of two unrelated files can run to many thousands of
+        # containers; list the first ones and leave the rest to the report
+        rows = 0
+        for module in diff.modules:
+            module_item = tree.insert("", "end", text=f"{module.name}  {module.path}",
+                                      values=(module.status, "", ""), open=len(diff.modules) == 1)
+            for container in module.containers:
+                if rows >= self.DIFF_ROW_LIMIT:
+                    break
+                rows += 1
+                relative = container.path[len(module.path):] if container.path.startswith(module.path) else container.path
+                container_item = tree.insert(module_item, "end", text=f"{relative or '/'}  [{container.definition}]",
+                                             values=(container.status, "", ""))
+                if container.status == CHANGED:
+                    params = [(p.name, p.status, p.old, p.new) for p in container.parameters]
+                else:
+                    # Whole container added or removed: list the values it carries
+                    added = container.status == ADDED
+                    params = [(name, container.status, None if added else value, value if added else None)
+                              for name, value in container.node.params.items()]
+                for name, status, old, new in params:
+                    tree.insert(container_item, "end", text=name,
+                                values=(status, format_param_value(old), format_param_value(new)))
+        if rows >= self.DIFF_ROW_LIMIT:
+            tree.insert("", "end", text=f"... first {self.DIFF_ROW_LIMIT} containers shown; save the report for all")
+
+        def save_report():
+            path = filedialog.asksaveasfilename(
+                parent=dialog,
+                defaultextension=".txt",
+                filetypes=[("Text files", "*.txt"), ("JSON files", "*.json"), ("All files", "*.*")],
+                initialfile="arxml_diff.txt"
+            )
+            if not path:
+                return
+            try:
+                with open(path, 'w', encoding='utf-8') as f:
+                    if path.lower().endswith(".json"):
+                        json.dump(diff.to_dict(), f, indent=2)
+                    else:
+                        f.write("\n".join(diff.lines()) + "\n")
+                self.log_message(f"Diff report saved to: {os.path.basename(path)}")
+            except Exception as e:
+                messagebox.showerror("Save Error", f"Failed to save report: {e}", parent=dialog)
+                self.log_message(f"Save error: {e}", "ERROR")
+
+        button_frame = ttk.Frame(main_frame)
+        button_frame.pack()
+        ttk.Button(button_frame, text="Save Report...", command=save_report).pack(side="left", padx=5)
+        ttk.Button(button_frame, text="Close", command=dialog.destroy).pack(side="left", padx=5)
+
+    def log_message(self, message, level="INFO"):
         """Log message to status logger if available"""
         if self.status_logger:
-            self.status_logger.log(message)
+            self.status_logger.log(message, level)
 
     # Helper methods
     def localname(self, tag: str) -> str:
@@ -1092,16 +1305,6 @@ Attributes:
                 return (child.text or "").strip()
         return None
 
-    def strip_namespaces(self, elem: ET.Element):
-        """Return copy of element with namespaces removed"""
-        new_elem = deepcopy(elem)
-        def _strip(e):
-            e.tag = self.localname(e.tag)
-            for child in e:
-                _strip(child)
-        _strip(new_elem)
-        return new_elem
-
     def strip_whitespace(self, elem):
         """Recursively strip whitespace from text/tail"""
         if elem.text:
@@ -1143,7 +1346,7 @@ Attributes:
             
         except Exception as e:
             messagebox.showerror("Load Error", f"Failed to load ARXML file: {e}")
-            self.log_message(f"Load error: {e}")
+            self.log_message(f"Load error: {e}", "ERROR")
             return False
 
     def get_xml_tree(self):
@@ -1199,6 +1402,7 @@ Attributes:
         self.item_to_elem.clear()
         self.xml_tree = None
         self.xml_root = None
+        self.merkle = None
         self.xml_file_path = None
         self.set_modified(False)
         self.status_var.set("No file loaded")
@@ -5,6 +5,8 @@ from tkinter import ttk, filedialog, messagebox
 from pathlib import Path
 from copy import deepcopy
 
+from ..build_edit.arxml_namespace import strip_namespace
+
 def localname(tag: str) -> str:
     """Strip namespace from tag: '{ns}TAG' -> 'TAG'."""
     return tag.split('}', 1)[1] if '}' in tag else tag
@@ -16,16 +18,6 @@ def get_short_name(elem: ET.Element):
             return (child.text or "").strip()
     return None
 
-def strip_namespaces(elem: ET.Element):
-    """Return a deep copy of elem with all namespaces removed."""
-    new_elem = deepcopy(elem)
-    def _strip(e):
-        e.tag = localname(e.tag)
-        for child in e:
-            _strip(child)
-    _strip(new_elem)
-    return new_elem
-
 def strip_whitespace(elem):
     """Recursively strip leading/trailing whitespace from text/tail."""
     if elem.text:
@@ -169,7 +161,8 @@ class ARXMLShortnameViewer:
             return
 
         # Strip namespaces and whitespace
-        clean_elem = strip_namespaces(elem)
+        clean_elem = deepcopy(elem)
+        strip_namespace(clean_elem)
         strip_whitespace(clean_elem)
 
         # Indent clean XML
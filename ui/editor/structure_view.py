@@ -2,6 +2,8 @@ import tkinter as tk
 from tkinter import ttk, messagebox, Menu, simpledialog
 import xml.etree.ElementTree as ET
 
+from ..profiling import profiler
+
 class StructureViewPanel:
     def __init__(self, parent, status_logger=None, on_change_callback=None):
         self.frame = ttk.Frame(parent)
@@ -72,6 +74,7 @@ class StructureViewPanel:
             self.table.delete(item)
         self.element_map.clear()
 
+    @profiler.timed('treeview.structure')
     def populate_table(self, root, parent_item=""):
         self.element_map.clear()
         
@@ -315,7 +318,7 @@ class StructureViewPanel:
                 
         except Exception as e:
             if self.status_logger:
-                self.status_logger.log(f"Edit failed: {e}")
+                self.status_logger.log(f"Edit failed: {e}", "ERROR")
             raise
 
     def update_xml_element(self, element, column_name, new_value):
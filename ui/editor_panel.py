@@ -6,15 +6,25 @@ import os
 from ui.editor.autosar_driver import AutosarDriverPanel
 from ui.editor.raw_xml import RawXmlPanel
 # from ui.editor.structure_view import StructureViewPanel
-from ui.build_edit.dio_build import ARXMLtoDIOConfigGUI
-from ui.build_edit.adc_build import ARXMLtoADCGenerator
-from ui.build_edit.can_build import ARXMLtoCANGenerator
-from ui.build_edit.gpt_build import ARXMLtoGPTConfigGUI
-from ui.build_edit.spi_build import ARXMLtoSPIGenerator
-from ui.build_edit.wdg_build import ARXMLtoWDGGenerator
+from ui.lazy_registry import LazyRegistry
+from ui.profiling import profiler
+from ui.watch import FileWatcher, WatchSession
+
+# Build panels are imported and constructed on first selection
+BUILD_PANEL_REGISTRY = LazyRegistry({
+    "ADC": ("ui.build_edit.adc_build", "ARXMLtoADCGenerator"),
+    "DIO": ("ui.build_edit.dio_build", "ARXMLtoDIOConfigGUI"),
+    "GPT": ("ui.build_edit.gpt_build", "ARXMLtoGPTConfigGUI"),
+    "WDG": ("ui.build_edit.wdg_build", "ARXMLtoWDGGenerator"),
+    "CAN": ("ui.build_edit.can_build", "ARXMLtoCANGenerator"),
+    "SPI": ("ui.build_edit.spi_build", "ARXMLtoSPIGenerator"),
+})
 
 
 class EditorPanel:
+    WATCH_INTERVAL_MS = 500
+    WATCH_DEBOUNCE_S = 1.0
+
     def __init__(self, parent, status_logger=None):
         self.frame = ttk.Frame(parent)
         self.notebook = ttk.Notebook(self.frame)
@@ -27,6 +37,10 @@ class EditorPanel:
         self.build_panels = {}
         self.current_build_panel = None
 
+        self.file_watcher = None
+        self.watch_session = None
+        self.watch_job = None
+
         self.setup_tabs()
 
         self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
@@ -68,22 +82,19 @@ class EditorPanel:
         top_frame.pack(fill="x", pady=5, padx=5)
 
         ttk.Label(top_frame, text="Select Driver:").pack(side="left", padx=(0, 5))
-        self.driver_selector = ttk.Combobox(top_frame, values=["ADC", "DIO", "GPT", "WDG", "CAN", "SPI"], state="readonly")
+        self.driver_selector = ttk.Combobox(top_frame, values=BUILD_PANEL_REGISTRY.names(), state="readonly")
         self.driver_selector.pack(side="left")
         self.driver_selector.bind("<<ComboboxSelected>>", self.on_driver_selected)
 
+        self.watch_btn = ttk.Button(top_frame, text="Watch ARXML...", command=self.toggle_watch)
+        self.watch_btn.pack(side="left", padx=(10, 5))
+        self.watch_status_var = tk.StringVar(value="")
+        ttk.Label(top_frame, textvariable=self.watch_status_var).pack(side="left")
+
         # Container for the selected build panel
         self.build_panel_container = ttk.Frame(self.build_tab)
         self.build_panel_container.pack(fill="both", expand=True)
 
-        # Initialize panels
-        self.build_panels["ADC"] = ARXMLtoADCGenerator(self.build_panel_container)
-        self.build_panels["DIO"] = ARXMLtoDIOConfigGUI(self.build_panel_container)
-        self.build_panels["CAN"] = ARXMLtoCANGenerator(self.build_panel_container)
-        self.build_panels["GPT"] = ARXMLtoGPTConfigGUI(self.build_panel_container)
-        self.build_panels["SPI"] = ARXMLtoSPIGenerator(self.build_panel_container)
-        self.build_panels["WDG"] = ARXMLtoWDGGenerator(self.build_panel_container)
-
         self.driver_selector.set("Select Peripheral")
         # self.show_build_panel("GPT")
 
@@ -91,15 +102,74 @@ class EditorPanel:
         selected_driver = self.driver_selector.get()
         self.show_build_panel(selected_driver)
 
+    def get_build_panel(self, driver_name):
+        """Return the cached build panel, importing and building it on first use"""
+        panel = self.build_panels.get(driver_name)
+        if panel is None and driver_name in BUILD_PANEL_REGISTRY:
+            try:
+                with profiler.span(f'startup.build_panel.{driver_name.lower()}'):
+                    panel = BUILD_PANEL_REGISTRY.load(driver_name)(self.build_panel_container)
+            except Exception as e:
+                messagebox.showerror("Error", f"Cannot load {driver_name} build panel: {e}")
+                if self.status_logger:
+                    self.status_logger.log(f"Failed to load {driver_name} build panel: {e}", "ERROR")
+                return None
+            self.build_panels[driver_name] = panel
+        return panel
+
     def show_build_panel(self, driver_name):
         if self.current_build_panel:
             self.current_build_panel.pack_forget()
         
-        self.current_build_panel = self.build_panels.get(driver_name)
+        self.current_build_panel = self.get_build_panel(driver_name)
         
         if self.current_build_panel:
             self.current_build_panel.pack(fill="both", expand=True)
 
+    # ---------- watch mode ----------
+    def toggle_watch(self):
+        if self.watch_job is not None:
+            self.stop_watch()
+            return
+
+        paths = filedialog.askopenfilenames(
+            title="Select ARXML Files to Watch",
+            filetypes=[("ARXML files", "*.arxml"), ("XML files", "*.xml"), ("All files", "*.*")])
+        if not paths:
+            return
+        output_dir = filedialog.askdirectory(title="Select Output Directory for Generated Drivers")
+        if not output_dir:
+            return
+
+        self.file_watcher = FileWatcher(paths, debounce=self.WATCH_DEBOUNCE_S)
+        self.watch_session = WatchSession(output_dir, self.get_build_panel, self.log_watch)
+        self.watch_btn.config(text="Stop Watching")
+        self.watch_status_var.set(f"Watching {len(paths)} file(s)")
+        self.log_watch(f"Watching {', '.join(os.path.basename(p) for p in paths)} -> {output_dir}")
+        self.watch_job = self.frame.after(self.WATCH_INTERVAL_MS, self.poll_watch)
+
+    def stop_watch(self):
+        if self.watch_job is not None:
+            self.frame.after_cancel(self.watch_job)
+        self.watch_job = None
+        self.file_watcher = None
+        self.watch_session = None
+        self.watch_btn.config(text="Watch ARXML...")
+        self.watch_status_var.set("")
+        self.log_watch("Watch mode stopped")
+
+    def poll_watch(self):
+        changed = self.file_watcher.poll()
+        if changed:
+            regenerated = self.watch_session.run_cycle(changed)
+            self.watch_status_var.set(
+                f"Cycle {self.watch_session.cycles}: regenerated {', '.join(regenerated) or 'nothing'}")
+        self.watch_job = self.frame.after(self.WATCH_INTERVAL_MS, self.poll_watch)
+
+    def log_watch(self, message, level="INFO"):
+        if self.status_logger:
+            self.status_logger.log(message, level)
+
     def on_raw_xml_change(self, xml_tree):
         self.xml_tree = xml_tree
 
@@ -114,8 +184,9 @@ class EditorPanel:
         self.xml_file_path = file_path
         
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            with profiler.span('read.arxml', file=os.path.basename(file_path)):
+                with open(file_path, "r", encoding="utf-8") as f:
+                    content = f.read()
             
             self.raw_xml_panel.set_content(content)
             
@@ -125,11 +196,12 @@ class EditorPanel:
         except Exception as e:
             messagebox.showerror("Error", f"Cannot load ARXML: {e}")
             if self.status_logger: 
-                self.status_logger.log(f"Failed to load ARXML: {e}")
+                self.status_logger.log(f"Failed to load ARXML: {e}", "ERROR")
             return
 
         try:
-            self.xml_tree = ET.parse(file_path)
+            with profiler.span('parse.arxml', file=os.path.basename(file_path)):
+                self.xml_tree = ET.parse(file_path)
             self.raw_xml_panel.xml_tree = self.xml_tree
             
             if self.status_logger: 
@@ -139,8 +211,8 @@ class EditorPanel:
         except ET.ParseError as e:
             messagebox.showerror("XML Parse Error", f"Invalid XML format: {e}")
             if self.status_logger: 
-                self.status_logger.log(f"XML Parse Error: {e}")
+                self.status_logger.log(f"XML Parse Error: {e}", "ERROR")
         except Exception as e:
             messagebox.showerror("Parse Error", f"Unexpected error: {e}")
             if self.status_logger: 
-                self.status_logger.log(f"Parse Error: {e}")
+                self.status_logger.log(f"Parse Error: {e}", "ERROR")
@@ -0,0 +1,36 @@
+# lazy_registry.py
+
+import importlib
+
+from .profiling import profiler
+
+
+class LazyRegistry:
+    """Ordered name -> (module, class) table that imports a class on first use.
+
+    Keeps the driver modules (and everything they import) out of startup;
+    a driver that is never selected is never imported.
+    """
+
+    def __init__(self, specs):
+        self.specs = dict(specs)
+        self._classes = {}
+
+    def names(self):
+        return list(self.specs)
+
+    def __contains__(self, name):
+        return name in self.specs
+
+    def is_loaded(self, name):
+        return name in self._classes
+
+    def load(self, name):
+        """Import and return the class registered under `name` (cached)"""
+        cls = self._classes.get(name)
+        if cls is None:
+            module_name, class_name = self.specs[name]
+            with profiler.span(f'import.{name.lower()}', module=module_name):
+                cls = getattr(importlib.import_module(module_name), class_name)
+            self._classes[name] = cls
+        return cls
@@ -1,9 +1,11 @@
+import time
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import webbrowser
 # Import ARXML parser + UI panels
 from .editor_panel import EditorPanel
 from .status_panel import StatusPanel
+from .profiling import profiler
 
 class MCALGeneratorApp:
     def __init__(self, root):
@@ -38,17 +40,22 @@ class MCALGeneratorApp:
         self.v_paned = ttk.PanedWindow(self.h_paned, orient="vertical")
         self.h_paned.add(self.v_paned, weight=3)
 
+        started = time.perf_counter()
+
         # Create Logs first
-        self.status_panel = StatusPanel(self.v_paned)
+        with profiler.span('startup.status_panel'):
+            self.status_panel = StatusPanel(self.v_paned)
 
         # Create EditorPanel with log reference
-        self.editor_panel = EditorPanel(self.v_paned, self.status_panel)
+        with profiler.span('startup.editor_panel'):
+            self.editor_panel = EditorPanel(self.v_paned, self.status_panel)
         
         self.v_paned.add(self.editor_panel.frame, weight=3)
         self.v_paned.add(self.status_panel.frame, weight=1)
 
         # Now create menu bar safely
         self.create_menubar()
+        self.status_panel.log(f"UI ready in {(time.perf_counter() - started) * 1000:.0f} ms", "DEBUG")
     
     def open_link(self, url):
         webbrowser.open_new(url)
@@ -0,0 +1,104 @@
+# merkle.py
+
+import hashlib
+
+DIGEST_SIZE = 16
+
+
+def _content(text):
+    # Indentation is not content: whitespace-only text and tails hash as empty
+    return text if text and not text.isspace() else ""
+
+
+class MerkleIndex:
+    """Content digest of every element of an XML tree, computed bottom-up.
+
+    An element's digest covers its tag, attributes, text and the digests
+    (plus tails) of its children, so two subtrees hash the same exactly when
+    they are equal up to indentation. Comparing digests top-down finds what
+    changed between two documents while skipping every unchanged subtree.
+
+    Elements cannot carry extra attributes, so digests and parent links are
+    kept in dicts keyed by element. After an edit, `update()` the edited
+    element: only its new children are hashed and then the ancestor path
+    is re-hashed, stopping as soon as a digest comes out unchanged.
+    """
+
+    def __init__(self, root=None):
+        self.root = root
+        self.digests = {}
+        self.parents = {}
+        if root is not None:
+            self._hash_subtree(root)
+
+    @property
+    def root_digest(self):
+        return self.digests.get(self.root)
+
+    def digest(self, elem):
+        return self.digests.get(elem)
+
+    def _hash_element(self, elem):
+        # NUL cannot occur in XML text, so it terminates fields unambiguously;
+        # the counts fix where attributes and tails end and digests begin
+        digests = self.digests
+        children = []
+        tails = []
+        for child in elem:
+            children.append(digests[child])
+            tail = child.tail
+            if tail and not tail.isspace():
+                tails.append(f"{len(children)}\0{tail}\0")
+        attrib = elem.attrib
+        header = f"{elem.tag}\0{_content(elem.text)}\0{len(attrib)}\0{len(tails)}\0"
+        if attrib:
+            header += "".join(f"{name}\0{attrib[name]}\0" for name in sorted(attrib))
+        if tails:
+            header += "".join(tails)
+        digest = hashlib.blake2b(header.encode() + b"".join(children), digest_size=DIGEST_SIZE).digest()
+        digests[elem] = digest
+        return digest
+
+    def _hash_subtree(self, elem, parent=None):
+        self.parents[elem] = parent
+        for child in elem:
+            self._hash_subtree(child, elem)
+        return self._hash_element(elem)
+
+    def update(self, elem):
+        """Re-hash `elem` after its own content or its list of children changed.
+
+        Children already indexed keep their digests (update those first if
+        they were edited too); children added since are hashed in full.
+        Returns the new digest of the root.
+        """
+        for child in elem:
+            if child in self.digests:
+                self.parents[child] = elem
+            else:
+                self._hash_subtree(child, elem)
+        while elem is not None:
+            old = self.digests.get(elem)
+            if self._hash_element(elem) == old:
+                break
+            elem = self.parents.get(elem)
+        return self.root_digest
+
+    def remove(self, elem):
+        """Forget `elem` and its subtree; update() its former parent afterwards"""
+        for node in elem.iter():
+            self.digests.pop(node, None)
+            self.parents.pop(node, None)
+
+    def adopt(self, elem, other, parent):
+        """Take over the digests of `elem`'s subtree from another index"""
+        for node in elem.iter():
+            self.digests[node] = other.digests[node]
+        for node in elem:
+            self._adopt_parents(node, elem)
+        self.parents[elem] = parent
+
+    def _adopt_parents(self, elem, parent):
+        self.parents[elem] = parent
+        for child in elem:
+            self._adopt_parents(child, elem)
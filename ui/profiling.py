@@ -0,0 +1,158 @@
+# profiling.py
+
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+
+
+class _NullSpan:
+    """Shared no-op span returned while profiling is disabled"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ('profiler', 'name', 'args', 'start_ns', 'depth')
+
+    def __init__(self, profiler, name, args):
+        self.profiler = profiler
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        local = self.profiler._local
+        self.depth = getattr(local, 'depth', 0)
+        local.depth = self.depth + 1
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end_ns = time.perf_counter_ns()
+        self.profiler._local.depth = self.depth
+        if exc_type is not None:
+            self.args = dict(self.args or {}, error=exc_type.__name__)
+        self.profiler._record(self, end_ns)
+        return False
+
+
+class Profiler:
+    """Collect named timing spans for the stages of a load/generate run.
+
+    Span names are dotted, the first segment is the stage ('read', 'parse',
+    'extract', 'codegen', 'write', 'treeview', 'serialize', ...) and the rest
+    says what it ran on ('extract.dio'). While disabled `span()` returns a
+    shared no-op context manager and `timed()` wrappers call straight through,
+    so instrumented code pays one attribute check per call.
+    """
+
+    def __init__(self, enabled=False, max_events=100_000):
+        self.enabled = enabled
+        self.events = deque(maxlen=max_events)
+        self.listeners = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._origin_ns = time.perf_counter_ns()
+
+    def span(self, name, **args):
+        """Context manager timing the enclosed block as `name`"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, args or None)
+
+    def timed(self, name=None):
+        """Decorator timing every call of the function (default name: its qualname)"""
+        def decorator(func):
+            span_name = name or func.__qualname__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with _Span(self, span_name, None):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def add_listener(self, callback):
+        """Call `callback(event)` whenever a top-level span on the main thread finishes"""
+        self.listeners.append(callback)
+
+    def remove_listener(self, callback):
+        """Stop calling a callback added with add_listener"""
+        if callback in self.listeners:
+            self.listeners.remove(callback)
+
+    def clear(self):
+        with self._lock:
+            self.events.clear()
+
+    def _record(self, span, end_ns):
+        event = {
+            'name': span.name,
+            'start_ns': span.start_ns - self._origin_ns,
+            'duration_ns': end_ns - span.start_ns,
+            'thread': threading.get_ident(),
+            'depth': span.depth,
+            'args': span.args,
+        }
+        with self._lock:
+            self.events.append(event)
+        # Listeners update Tk widgets, so worker-thread spans (file staging)
+        # are only picked up when the enclosing main-thread span ends
+        if span.depth == 0 and threading.current_thread() is threading.main_thread():
+            for callback in list(self.listeners):
+                callback(event)
+
+    def breakdown(self):
+        """[(name, calls, total_ms, mean_ms, max_ms), ...], slowest total first"""
+        with self._lock:
+            events = list(self.events)
+        totals = {}
+        for event in events:
+            calls, total, longest = totals.get(event['name'], (0, 0, 0))
+            totals[event['name']] = (calls + 1, total + event['duration_ns'],
+                                     max(longest, event['duration_ns']))
+        rows = [(name, calls, total / 1e6, total / calls / 1e6, longest / 1e6)
+                for name, (calls, total, longest) in totals.items()]
+        return sorted(rows, key=lambda row: -row[2])
+
+    def trace_events(self):
+        """Spans as Chrome trace_event complete ('X') events, timestamps in us"""
+        pid = os.getpid()
+        with self._lock:
+            events = list(self.events)
+        trace = []
+        for event in sorted(events, key=lambda e: (e['start_ns'], e['depth'])):
+            entry = {
+                'name': event['name'],
+                'cat': event['name'].split('.', 1)[0],
+                'ph': 'X',
+                'ts': event['start_ns'] / 1000,
+                'dur': event['duration_ns'] / 1000,
+                'pid': pid,
+                'tid': event['thread'],
+            }
+            if event['args']:
+                entry['args'] = {key: str(value) for key, value in event['args'].items()}
+            trace.append(entry)
+        return trace
+
+    def export_chrome_trace(self, path):
+        """Write the collected spans for chrome://tracing / Perfetto"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': self.trace_events(), 'displayTimeUnit': 'ms'}, f)
+        return path
+
+
+# Set ARXML_PROFILE=1 to record spans from startup
+profiler = Profiler(enabled=os.environ.get('ARXML_PROFILE', '') not in ('', '0'))
@@ -1,12 +1,32 @@
+import queue
+import threading
+import time
 import tkinter as tk
-from tkinter import ttk
+from collections import deque
+from tkinter import ttk, filedialog, messagebox
+
+from .profiling import profiler
+
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR")
+LOG_FLUSH_INTERVAL_MS = 100
+LOG_MAX_LINES = 5000
+LOG_LEVEL_COLORS = {"DEBUG": "gray60", "INFO": "yellow", "WARNING": "orange", "ERROR": "red"}
 
 class StatusPanel:
-    def __init__(self, parent):
+    def __init__(self, parent, flush_interval_ms=LOG_FLUSH_INTERVAL_MS, max_lines=LOG_MAX_LINES):
         # Frame should expand fully inside the parent
         self.frame = ttk.Frame(parent)
         self.frame.pack(fill="x", expand=True, side="bottom")
         self.yaxis = 230  # default height
+
+        # log() only queues; the main loop drains the queue every flush_interval_ms
+        self.flush_interval_ms = flush_interval_ms
+        self.pending = queue.SimpleQueue()
+        self.records = deque(maxlen=max_lines)
+        self.filter_level_var = tk.StringVar(value="DEBUG")
+        self.filter_text_var = tk.StringVar()
+        self.setup_filter_bar()
+
         #  Text log now fills entire width + auto expands
         self.text = tk.Text(
             self.frame,
@@ -15,7 +35,8 @@ class StatusPanel:
             fg="yellow",
             wrap="none"           # no auto-wrap (scrollable)
         )
-        self.text.insert("end", "Status log ready...\n")
+        for level, color in LOG_LEVEL_COLORS.items():
+            self.text.tag_configure(level, foreground=color)
         self.text.config(state="disabled")  # read-only mode
 
         #  Scrollbars
@@ -28,17 +49,170 @@ class StatusPanel:
         )
 
         #  Grid layout → allows expansion in both directions
-        self.text.grid(row=0, column=0, sticky="nsew")
-        y_scroll.grid(row=0, column=1, sticky="ns")
-        x_scroll.grid(row=1, column=0, sticky="ew")
+        self.text.grid(row=1, column=0, sticky="nsew")
+        y_scroll.grid(row=1, column=1, sticky="ns")
+        x_scroll.grid(row=2, column=0, sticky="ew")
+
+        self.setup_timings()
 
         # Tell grid to expand fully
-        self.frame.grid_rowconfigure(0, weight=1)
+        self.frame.grid_rowconfigure(1, weight=1)
         self.frame.grid_columnconfigure(0, weight=1)
 
-    def log(self, message: str):
-        """Append a new log line to the status log."""
+        self.log("Status log ready...")
+        self.frame.after(self.flush_interval_ms, self._flush_loop)
+
+    def setup_filter_bar(self):
+        filter_bar = ttk.Frame(self.frame)
+        filter_bar.grid(row=0, column=0, columnspan=2, sticky="ew")
+        ttk.Label(filter_bar, text="Level:").pack(side="left")
+        level_combo = ttk.Combobox(filter_bar, textvariable=self.filter_level_var, values=LOG_LEVELS,
+                                   state="readonly", width=9)
+        level_combo.pack(side="left", padx=(2, 8))
+        level_combo.bind("<<ComboboxSelected>>", lambda e: self.apply_filter())
+        ttk.Label(filter_bar, text="Filter:").pack(side="left")
+        filter_entry = ttk.Entry(filter_bar, textvariable=self.filter_text_var, width=30)
+        filter_entry.pack(side="left", padx=2)
+        filter_entry.bind("<KeyRelease>", lambda e: self.apply_filter())
+        ttk.Button(filter_bar, text="Clear Log", command=self.clear_log).pack(side="left", padx=8)
+
+    def log(self, message: str, level: str = "INFO"):
+        """Queue a log line; safe to call from any thread."""
+        self.pending.put((level if level in LOG_LEVEL_COLORS else "INFO",
+                          f"[{time.strftime('%H:%M:%S')}] {message}"))
+
+    def debug(self, message):
+        self.log(message, "DEBUG")
+
+    def warning(self, message):
+        self.log(message, "WARNING")
+
+    def error(self, message):
+        self.log(message, "ERROR")
+
+    def _flush_loop(self):
+        self.flush()
+        self.frame.after(self.flush_interval_ms, self._flush_loop)
+
+    def flush(self):
+        """Move queued lines into the ring buffer and the Text widget in one batch"""
+        if threading.current_thread() is not threading.main_thread():
+            return
+        batch = []
+        while True:
+            try:
+                batch.append(self.pending.get_nowait())
+            except queue.Empty:
+                break
+        if not batch:
+            return
+        self.records.extend(batch)
+        visible = [record for record in batch[-self.records.maxlen:] if self._matches(*record)]
+        if visible:
+            self._append_lines(visible)
+
+    def _matches(self, level, line):
+        if LOG_LEVELS.index(level) < LOG_LEVELS.index(self.filter_level_var.get()):
+            return False
+        needle = self.filter_text_var.get().strip().lower()
+        return not needle or needle in line.lower()
+
+    def _append_lines(self, records):
+        # Only follow the tail if the user has not scrolled up
+        at_bottom = self.text.yview()[1] >= 1.0
         self.text.config(state="normal")  # enable edit temporarily
-        self.text.insert("end", f"{message}\n")
-        self.text.see("end")  # auto-scroll to latest log
+        for level, line in records:
+            self.text.insert("end", f"{line}\n", level)
+        # Trim the widget to the same cap as the ring buffer
+        excess = int(self.text.index("end-1c").split(".")[0]) - 1 - self.records.maxlen
+        if excess > 0:
+            self.text.delete("1.0", f"{excess + 1}.0")
         self.text.config(state="disabled")
+        if at_bottom:
+            self.text.see("end")
+
+    def apply_filter(self):
+        """Redraw the retained lines that pass the level and text filter"""
+        self.flush()
+        self.text.config(state="normal")
+        self.text.delete("1.0", "end")
+        self.text.config(state="disabled")
+        self._append_lines([record for record in self.records if self._matches(*record)])
+
+    def clear_log(self):
+        self.flush()
+        self.records.clear()
+        self.apply_filter()
+
+    def setup_timings(self):
+        """Per-operation span breakdown next to the log"""
+        timings_frame = ttk.Frame(self.frame)
+        timings_frame.grid(row=0, column=2, rowspan=3, sticky="ns", padx=(5, 0))
+
+        toolbar = ttk.Frame(timings_frame)
+        toolbar.pack(fill="x")
+        self.profile_var = tk.BooleanVar(value=profiler.enabled)
+        ttk.Checkbutton(toolbar, text="Profile", variable=self.profile_var,
+                        command=self.toggle_profiling).pack(side="left")
+        ttk.Button(toolbar, text="Clear", command=self.clear_timings).pack(side="left", padx=2)
+        ttk.Button(toolbar, text="Export Trace...", command=self.export_trace).pack(side="left")
+
+        columns = ("calls", "total", "mean", "max")
+        self.timings_tree = ttk.Treeview(timings_frame, columns=columns, height=7)
+        self.timings_tree.heading("#0", text="Operation")
+        self.timings_tree.column("#0", width=180)
+        for column, heading in zip(columns, ("Calls", "Total ms", "Mean ms", "Max ms")):
+            self.timings_tree.heading(column, text=heading)
+            self.timings_tree.column(column, width=70, anchor="e")
+        self.timings_tree.pack(fill="both", expand=True)
+
+        self._timings_pending = False
+        profiler.add_listener(self._on_span_finished)
+        self.timings_tree.bind("<Destroy>", self._remove_timing_listener, add="+")
+
+    def _remove_timing_listener(self, event=None):
+        profiler.remove_listener(self._on_span_finished)
+
+    def toggle_profiling(self):
+        profiler.enabled = self.profile_var.get()
+        self.log(f"Profiling {'enabled' if profiler.enabled else 'disabled'}")
+
+    def clear_timings(self):
+        profiler.clear()
+        self.refresh_timings()
+
+    def _on_span_finished(self, event):
+        # Coalesce the spans of one operation into a single redraw
+        if not self._timings_pending:
+            try:
+                self.frame.after_idle(self.refresh_timings)
+            except tk.TclError:
+                # The panel is gone (application shutting down)
+                self._remove_timing_listener()
+                return
+            self._timings_pending = True
+
+    def refresh_timings(self):
+        self._timings_pending = False
+        if not self.timings_tree.winfo_exists():
+            return
+        self.timings_tree.delete(*self.timings_tree.get_children())
+        for name, calls, total_ms, mean_ms, max_ms in profiler.breakdown():
+            self.timings_tree.insert("", "end", text=name,
+                                     values=(calls, f"{total_ms:.2f}", f"{mean_ms:.2f}", f"{max_ms:.2f}"))
+
+    def export_trace(self):
+        if not profiler.events:
+            messagebox.showwarning("Warning", "No timings recorded - enable Profile and run an operation first")
+            return
+        path = filedialog.asksaveasfilename(
+            title="Export Chrome Trace",
+            defaultextension=".json",
+            filetypes=[("Trace files", "*.json"), ("All files", "*.*")])
+        if not path:
+            return
+        try:
+            profiler.export_chrome_trace(path)
+            self.log(f"Trace exported: {path} (open in chrome://tracing or ui.perfetto.dev)")
+        except OSError as e:
+            messagebox.showerror("Error", f"Failed to export trace: {e}")
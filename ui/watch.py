@@ -0,0 +1,170 @@
+# watch.py
+
+import os
+import time
+import xml.etree.ElementTree as ET
+
+from .build_edit.output_writer import OutputSetWriter
+from .ecuc_tree import read_ecuc_tree
+from .profiling import profiler
+
+
+class FileWatcher:
+    """Poll a set of files and report each once its changes have settled.
+
+    A file counts as changed when its modification time or size differs
+    from the last poll. It is reported only after `debounce` seconds
+    without further change, so a tool rewriting it in several steps
+    causes one regeneration, not one per write. Polling os.stat() works
+    on every platform and network share and, for a handful of files,
+    costs microseconds per tick.
+    """
+
+    def __init__(self, paths, debounce=1.0):
+        self.debounce = debounce
+        self._stats = {}
+        self._pending = {}  # path -> time of the last change seen
+        for path in paths:
+            self.add(path)
+
+    @property
+    def paths(self):
+        return list(self._stats)
+
+    def add(self, path):
+        """Start watching `path`; it is reported on the next poll"""
+        path = os.path.abspath(path)
+        self._stats[path] = None
+        self._pending[path] = 0.0
+
+    def _stat(self, path):
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None  # being replaced, or gone: wait for it to come back
+        return st.st_mtime_ns, st.st_size
+
+    def poll(self, now=None):
+        """Paths whose changes have settled since they were last reported"""
+        now = time.monotonic() if now is None else now
+        ready = []
+        for path, previous in self._stats.items():
+            current = self._stat(path)
+            if current != previous:
+                self._stats[path] = current
+                self._pending[path] = now
+            elif path in self._pending and current is not None and now - self._pending[path] >= self.debounce:
+                del self._pending[path]
+                ready.append(path)
+        return ready
+
+
+class WatchSession:
+    """Regenerate driver outputs for the modules whose configuration changed.
+
+    Each cycle re-reads only the files the watcher reported, compares their
+    per-module digests with the previous cycle and runs extraction and code
+    generation only for modules that changed, writing each module's files
+    into its own folder under `output_dir`. A module's digest is recorded
+    only once its files are written, so one that failed is tried again on
+    the next cycle. Generation never prompts: problems the panels would ask
+    about are logged as warnings. `get_panel(name)` returns the build panel
+    for a registry name ("DIO", "CAN", ...) or None; `log(message, level)`
+    receives one timing line per cycle.
+    """
+
+    def __init__(self, output_dir, get_panel, log):
+        self.output_dir = output_dir
+        self.get_panel = get_panel
+        self.log = log
+        self.cycles = 0
+        self.digests = {}  # path -> {module name: digest}
+
+    def run_cycle(self, paths):
+        """Process the changed `paths`; returns the names of the regenerated modules"""
+        self.cycles += 1
+        timings = {'parse': 0.0, 'codegen': 0.0, 'write': 0.0}
+        regenerated, unchanged = [], 0
+        started = time.perf_counter()
+        with profiler.span('watch.cycle', cycle=self.cycles):
+            for path in paths:
+                name = os.path.basename(path)
+                t0 = time.perf_counter()
+                try:
+                    with profiler.span('parse.ecuc_tree', file=name):
+                        root = read_ecuc_tree(path, keep_elements=True)
+                except (OSError, ET.ParseError) as e:
+                    # Typically a half-written file; the next change retries it
+                    self.log(f"Watch: cannot read {name}: {e}", "ERROR")
+                    continue
+                timings['parse'] += time.perf_counter() - t0
+
+                digests = root.module_digests()
+                previous = self.digests.get(path, {})
+                changed = [module for module, digest in digests.items() if previous.get(module) != digest]
+                unchanged += len(digests) - len(changed)
+                for module in previous.keys() - digests.keys():
+                    self.log(f"Watch: {module} configuration removed from {name}; its outputs are left as they are",
+                             "WARNING")
+                failed = set()
+                if changed:
+                    tree = ET.ElementTree(root.element)
+                    for module in changed:
+                        panel = self.get_panel(module.upper())
+                        if panel is None:
+                            continue  # no generator for this module (Port, Mcu, ...)
+                        if self._regenerate(module, panel, path, tree, timings):
+                            regenerated.append(module)
+                        else:
+                            failed.add(module)
+                # Failed modules keep their old digest (or none), so they count as changed next time
+                self.digests[path] = {module: previous[module] if module in failed else digest
+                                      for module, digest in digests.items()
+                                      if module not in failed or module in previous}
+
+        elapsed = (time.perf_counter() - started) * 1000
+        files = ", ".join(os.path.basename(path) for path in paths)
+        summary = ", ".join(regenerated) if regenerated else "nothing"
+        self.log(f"Watch cycle {self.cycles} ({files}): regenerated {summary}, {unchanged} module(s) unchanged "
+                 f"in {elapsed:.0f} ms (parse {timings['parse'] * 1000:.0f}, codegen {timings['codegen'] * 1000:.0f}, "
+                 f"write {timings['write'] * 1000:.0f})")
+        return regenerated
+
+    def _regenerate(self, module, panel, path, tree, timings):
+        try:
+            result = generate_module(panel, path, tree, os.path.join(self.output_dir, module))
+        except Exception as e:
+            self.log(f"Watch: {module} generation failed: {e}", "ERROR")
+            return False
+        if result is None:
+            self.log(f"Watch: nothing generated for {module} from {os.path.basename(path)}", "WARNING")
+            return False
+        _, codegen, write, warnings = result
+        for warning in warnings:
+            self.log(f"Watch: {module}: {warning}", "WARNING")
+        timings['codegen'] += codegen
+        timings['write'] += write
+        return True
+
+
+def generate_module(panel, path, tree, output_dir):
+    """Run a build panel on a parsed tree and write its driver files to `output_dir`.
+
+    Returns (written paths, codegen seconds, write seconds, warnings), or
+    None when the tree holds no configuration for the panel's module or
+    the panel generated nothing; the panel's previous output is then not
+    written. Warnings are the problems generation went ahead despite
+    (timing violations and the like), which the GUI would have asked about.
+    """
+    t0 = time.perf_counter()
+    panel.arxml_file_path = path
+    panel.generation_warnings = []
+    if not panel.load_arxml_tree(tree):
+        return None
+    files = panel.driver_files()
+    t1 = time.perf_counter()
+    writer = OutputSetWriter(output_dir)
+    for filename, content in files:
+        writer.add(filename, content)
+    written = writer.commit()
+    return written, t1 - t0, time.perf_counter() - t1, list(panel.generation_warnings)